@@ -0,0 +1,311 @@
+"""Application: Token-budgeted context packs for LLM consumers."""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from tengin_mcp.application.services.semantic_search import (
+    VECTOR_ENTITY_TYPES,
+    primary_entity_type,
+)
+from tengin_mcp.infrastructure.embedding_scheduler import estimate_tokens
+from tengin_mcp.infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+
+PackFormat = Literal["markdown", "json"]
+
+# エンティティタイプごとにコンテキストへ含めるフィールド（重要度順）
+FIELD_PRIORITIES: dict[str, tuple[str, ...]] = {
+    "Theory": (
+        "summary",
+        "core_principle",
+        "description",
+        "keywords",
+        "applications",
+        "limitations",
+    ),
+    "Concept": ("summary", "definition", "examples"),
+    "Principle": ("summary", "description", "application_guide", "examples"),
+    "Methodology": ("summary", "description", "best_for", "procedures", "limitations"),
+    "Evidence": ("summary", "findings", "implications", "evidence_type", "year"),
+    "Context": ("summary", "description", "challenges", "characteristics"),
+    "Theorist": ("summary", "contributions", "field", "major_works", "biography"),
+}
+
+# 未知のエンティティタイプのフィールド
+DEFAULT_FIELDS = ("summary", "description", "definition")
+
+# 見出しに含めるプロパティ
+HEADER_FIELDS = ("name_en", "category", "evidence_level")
+
+# フィールドを切り詰めた後に残す最小トークン数（これ未満なら含めない）
+MIN_FIELD_TOKENS = 16
+
+# 文の区切り（切り詰め時はここで切る）
+_SENTENCE_END = re.compile(r"[。．！？!?]|\.(?=\s)")
+
+
+def format_value(value: Any) -> str:
+    """プロパティ値をテキスト化（リストは「、」区切り, 空白の連続は1つに）。"""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return format_value(value.get("title") or value.get("name"))
+    if isinstance(value, list):
+        return "、".join(text for text in dict.fromkeys(format_value(v) for v in value) if text)
+    return " ".join(str(value).split())
+
+
+def truncate_text(text: str, max_tokens: int) -> str:
+    """
+    テキストをトークン数の上限まで切り詰める（決定的）。
+
+    上限内の最後の文の区切りで切り、区切りがなければ文字単位で切って「…」を付ける。
+
+    Args:
+        text: テキスト
+        max_tokens: 最大トークン数（「…」を含む）
+
+    Returns:
+        切り詰めたテキスト（上限内ならそのまま）
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    # 上限に収まる最長の接頭辞（estimate_tokens は長さに対して単調）を二分探索
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid] + "…") <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    prefix = text[:low]
+
+    ends = [m.end() for m in _SENTENCE_END.finditer(prefix)]
+    if ends and ends[-1] >= len(prefix) // 2:
+        return prefix[: ends[-1]].rstrip()
+    return prefix.rstrip() + "…"
+
+
+@dataclass(frozen=True)
+class PackEntity:
+    """コンテキストパックに含めるエンティティ。"""
+
+    id: str
+    entity_type: str
+    properties: dict[str, Any]
+    note: str | None = None
+
+
+@dataclass
+class ContextPack:
+    """トークン予算内に収めたコンテキスト。"""
+
+    text: str
+    format: PackFormat
+    entity_ids: list[str] = field(default_factory=list)
+    omitted_ids: list[str] = field(default_factory=list)
+    truncated_fields: int = 0
+    token_estimate: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """レスポンス用の辞書に変換。"""
+        return {
+            "format": self.format,
+            "context": self.text,
+            "entity_ids": self.entity_ids,
+            "omitted_ids": self.omitted_ids,
+            "truncated_fields": self.truncated_fields,
+            "token_estimate": self.token_estimate,
+        }
+
+
+@dataclass
+class _Section:
+    """1エンティティ分の出力。"""
+
+    entity: PackEntity
+    header: dict[str, str]
+    fields: list[tuple[str, str]] = field(default_factory=list)
+
+
+class ContextPackBuilder:
+    """
+    エンティティをトークン予算内のコンパクトなコンテキストにまとめるビルダー。
+
+    - エンティティは渡された順（順位順）に並べ、重複IDは最初のものだけを残す
+    - まず全エンティティの見出しを入れ、残りの予算でフィールドを重要度の段ごとに
+      全エンティティへ順に追加する（上位のエンティティだけが予算を使い切らない）
+    - 各フィールドは max_field_tokens で、予算の最後のフィールドは残り予算で文単位に切り詰める
+    - パック内で既出のテキスト（同じ値・既出フィールドに含まれる値）は省略する
+
+    同じ入力と予算からは常に同じ出力になる。
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 1500,
+        format: PackFormat = "markdown",
+        max_field_tokens: int = 200,
+    ) -> None:
+        """
+        ビルダーを初期化。
+
+        Args:
+            max_tokens: トークン予算
+            format: 出力形式（markdown または json）
+            max_field_tokens: 1フィールドの最大トークン数
+        """
+        self._max_tokens = max_tokens
+        self._format = format
+        self._max_field_tokens = max_field_tokens
+
+    def build(self, entities: list[PackEntity]) -> ContextPack:
+        """
+        コンテキストパックを作成。
+
+        Args:
+            entities: 順位順のエンティティ
+
+        Returns:
+            コンテキストパック
+        """
+        unique: dict[str, PackEntity] = {}
+        for entity in entities:
+            unique.setdefault(entity.id, entity)
+        sections: list[_Section] = []
+        omitted: list[str] = []
+        used = 0
+
+        for entity in unique.values():
+            header = self._header(entity)
+            tokens = self._cost(header)
+            if omitted or used + tokens > self._max_tokens:
+                omitted.append(entity.id)
+                continue
+            sections.append(_Section(entity=entity, header=header))
+            used += tokens
+
+        truncated = 0
+        seen: set[str] = {value for s in sections for value in s.header.values()}
+        candidates = [
+            [(key, format_value(value)) for key, value in self._fields(s.entity)] for s in sections
+        ]
+        levels = max((len(c) for c in candidates), default=0)
+        added: list[_Section] = []
+        exhausted = False
+        for level in range(levels):
+            for section, fields in zip(sections, candidates, strict=True):
+                if exhausted or level >= len(fields):
+                    continue
+                key, text = fields[level]
+                if not text or text in seen or any(text in v for _, v in section.fields):
+                    continue
+                text = truncate_text(text, self._max_field_tokens)
+                cost = self._cost({key: text})
+                if used + cost > self._max_tokens:
+                    remaining = self._max_tokens - used - self._cost({key: ""})
+                    if remaining < MIN_FIELD_TOKENS:
+                        exhausted = True
+                        continue
+                    text = truncate_text(text, remaining)
+                    cost = self._cost({key: text})
+                    exhausted = True
+                if text != fields[level][1]:
+                    truncated += 1
+                section.fields.append((key, text))
+                added.append(section)
+                seen.add(text)
+                used += cost
+
+        # 見積もりは断片ごとの概算のため、整形後に予算を超えた場合は最後に追加したフィールドから外す
+        text = self._render(sections)
+        while added and estimate_tokens(text) > self._max_tokens:
+            added.pop().fields.pop()
+            text = self._render(sections)
+        return ContextPack(
+            text=text,
+            format=self._format,
+            entity_ids=[s.entity.id for s in sections],
+            omitted_ids=omitted,
+            truncated_fields=truncated,
+            token_estimate=estimate_tokens(text) if text else 0,
+        )
+
+    @staticmethod
+    def _fields(entity: PackEntity) -> list[tuple[str, Any]]:
+        """エンティティのフィールドを重要度順に取得。"""
+        keys = FIELD_PRIORITIES.get(entity.entity_type, DEFAULT_FIELDS)
+        return [(key, entity.properties.get(key)) for key in keys]
+
+    @staticmethod
+    def _header(entity: PackEntity) -> dict[str, str]:
+        """見出し（名前・タイプ・ID・主要な属性）。"""
+        properties = entity.properties
+        header = {
+            "name": format_value(properties.get("name") or properties.get("title") or entity.id),
+            "type": entity.entity_type,
+            "id": entity.id,
+        }
+        for key in HEADER_FIELDS:
+            value = format_value(properties.get(key))
+            if value:
+                header[key] = value
+        if entity.note:
+            header["note"] = entity.note
+        return header
+
+    def _cost(self, piece: dict[str, str]) -> int:
+        """出力の断片のトークン数（改行・区切りを含めて多めに見積もる）。"""
+        if self._format == "json":
+            return estimate_tokens(json.dumps(piece, ensure_ascii=False, separators=(",", ":")))
+        return sum(estimate_tokens(f"- {key}: {value}\n") for key, value in piece.items())
+
+    def _render(self, sections: list[_Section]) -> str:
+        """セクションを Markdown または JSON に整形。"""
+        if self._format == "json":
+            return json.dumps(
+                [{**s.header, **dict(s.fields)} for s in sections],
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+
+        blocks = []
+        for section in sections:
+            header = section.header
+            attributes = [header["type"], f"id={header['id']}"]
+            attributes += [f"{key}={header[key]}" for key in HEADER_FIELDS if key in header]
+            if "note" in header:
+                attributes.append(header["note"])
+            lines = [f"- **{header['name']}** ({', '.join(attributes)})"]
+            lines += [f"  - {key}: {value}" for key, value in section.fields]
+            blocks.append("\n".join(lines))
+        return "\n".join(blocks)
+
+
+async def load_pack_entities(
+    graph_repository: Neo4jGraphRepository,
+    entity_ids: list[str],
+) -> tuple[list[PackEntity], list[str]]:
+    """
+    IDのエンティティをグラフから1回のクエリで取得（入力順）。
+
+    Args:
+        graph_repository: グラフリポジトリ
+        entity_ids: エンティティID（順位順）
+
+    Returns:
+        (エンティティ, 見つからなかったID)
+    """
+    ids = list(dict.fromkeys(entity_ids))
+    rows = await graph_repository.get_entities_by_ids(ids, list(VECTOR_ENTITY_TYPES))
+    found: dict[str, PackEntity] = {}
+    for row in rows:
+        properties = row["properties"]
+        found[properties["id"]] = PackEntity(
+            id=properties["id"],
+            entity_type=primary_entity_type(row["labels"]),
+            properties=properties,
+        )
+    return [found[i] for i in ids if i in found], [i for i in ids if i not in found]
@@ -0,0 +1,212 @@
+"""Application: Embedding provider benchmark (latency, throughput, recall)."""
+
+import json
+import resource
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from tengin_mcp.application.services.semantic_search import build_where, parse_query_results
+from tengin_mcp.application.services.vector_indexer import EntityDocument
+from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.vector_store import VectorStore
+
+# 遅延の集計に使うパーセンタイル
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+@dataclass(frozen=True)
+class EvalQuery:
+    """評価クエリと、検索結果に含まれるべき理論ID。"""
+
+    query: str
+    expected: tuple[str, ...]
+
+
+@dataclass
+class BenchmarkResult:
+    """1つのプロバイダー・モデルのベンチマーク結果。"""
+
+    provider: str
+    model: str
+    dimensions: int = 0
+    embed_latency_ms: dict[str, float] = field(default_factory=dict)
+    batch_throughput: dict[str, float] = field(default_factory=dict)
+    index_build_seconds: float = 0.0
+    memory_mb: dict[str, float] = field(default_factory=dict)
+    recall: dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON に書き出す辞書。"""
+        return asdict(self)
+
+
+def load_eval_set(path: Path) -> list[EvalQuery]:
+    """
+    評価セット（{"queries": [{"query": ..., "expected": [...]}, ...]}）を読み込む。
+
+    Raises:
+        ValueError: 期待するIDがないクエリがある場合
+    """
+    data = json.loads(path.read_text(encoding="utf-8"))
+    queries = [EvalQuery(q["query"], tuple(q["expected"])) for q in data["queries"]]
+    missing = [q.query for q in queries if not q.expected]
+    if missing:
+        raise ValueError(f"Eval queries without expected IDs: {missing[:3]}")
+    return queries
+
+
+def percentiles(samples: list[float]) -> dict[str, float]:
+    """遅延のサンプルを p50 / p90 / p99 / mean / max に集計。"""
+    if not samples:
+        return {}
+    values = np.asarray(samples, dtype=np.float64)
+    summary = {f"p{p}": float(np.percentile(values, p)) for p in LATENCY_PERCENTILES}
+    summary["mean"] = float(values.mean())
+    summary["max"] = float(values.max())
+    return {key: round(value, 3) for key, value in summary.items()}
+
+
+def recall_at_k(ranked: list[str], expected: tuple[str, ...], k: int) -> float:
+    """上位 k 件に含まれる期待IDの割合。"""
+    return len(set(ranked[:k]) & set(expected)) / len(expected)
+
+
+def max_rss_mb() -> float:
+    """
+    プロセスの最大常駐メモリ（MB, Linux の ru_maxrss は KB）。
+
+    プロセス全体の起動以降の最大値のため、プロバイダーごとに比較する場合はプロセスを分けて計測する。
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class EmbeddingBenchmark:
+    """
+    埋め込みプロバイダーのベンチマーク。
+
+    1. クエリを1件ずつ埋め込んで遅延を計測（最初の1回はウォームアップとして除外）
+    2. コーパスを batch_size 件ずつ埋め込んでスループットを計測し、ベクトルストアに upsert
+    3. クエリのベクトルで理論を検索して recall@k を計算
+
+    ベクトルストアは空の状態で渡す（ローカルストアを一時ディレクトリに作る想定）。
+    memory_mb の index_estimate は件数 x 次元の float32 から求めた推定値で、max_rss / max_rss_growth は
+    プロセスの最大常駐メモリとこの実行での増加分（同じプロセスで先に計測した分を含みうる）。
+    """
+
+    def __init__(
+        self,
+        embedding: EmbeddingAdapter,
+        vector_store: VectorStore,
+        batch_size: int = 64,
+        ks: tuple[int, ...] = (1, 5, 10),
+        entity_types: list[str] | None = None,
+    ) -> None:
+        """
+        ベンチマークを初期化。
+
+        Args:
+            embedding: 接続済みの埋め込みアダプター（キャッシュ無効）
+            vector_store: 接続済みの空のベクトルストア
+            batch_size: コーパスの埋め込み1回あたりの件数（プロバイダー上限で制限）
+            ks: recall@k の k
+            entity_types: 検索対象のエンティティタイプ（デフォルト: Theory）
+        """
+        self._embedding = embedding
+        self._vector_store = vector_store
+        self._batch_size = max(1, min(batch_size, embedding.max_batch_size))
+        self._ks = tuple(sorted(set(ks)))
+        self._where = build_where(entity_types or ["Theory"], None, None)
+
+    async def _measure_latency(
+        self, queries: list[EvalQuery]
+    ) -> tuple[list[list[float]], list[float]]:
+        """クエリを1件ずつ埋め込み、ベクトルと遅延（ミリ秒）を返す。"""
+        await self._embedding.embed_text("warm-up")
+        embeddings: list[list[float]] = []
+        samples: list[float] = []
+        for query in queries:
+            started = time.perf_counter()
+            embeddings.append(await self._embedding.embed_text(query.query))
+            samples.append((time.perf_counter() - started) * 1000)
+        return embeddings, samples
+
+    async def _build_index(self, documents: list[EntityDocument]) -> tuple[dict[str, float], float]:
+        """コーパスをバッチで埋め込んで upsert し、スループットと構築時間を返す。"""
+        vectors: list[list[float]] = []
+        batches = 0
+        started = time.perf_counter()
+        for start in range(0, len(documents), self._batch_size):
+            batch = documents[start : start + self._batch_size]
+            vectors.extend(await self._embedding.embed_texts([d.text for d in batch]))
+            batches += 1
+        embed_seconds = time.perf_counter() - started
+
+        await self._vector_store.upsert_documents(
+            ids=[d.id for d in documents],
+            documents=[d.text for d in documents],
+            embeddings=vectors,
+            metadatas=[d.metadata for d in documents],
+        )
+        await self._vector_store.flush()
+        build_seconds = time.perf_counter() - started
+        throughput = {
+            "documents": len(documents),
+            "batches": batches,
+            "batch_size": self._batch_size,
+            "embed_seconds": round(embed_seconds, 3),
+            "documents_per_second": round(len(documents) / embed_seconds, 1)
+            if embed_seconds
+            else 0.0,
+        }
+        return throughput, round(build_seconds, 3)
+
+    async def _recall(
+        self, queries: list[EvalQuery], embeddings: list[list[float]]
+    ) -> dict[str, float]:
+        """クエリごとの recall@k の平均。"""
+        results = await self._vector_store.search_many(
+            query_embeddings=embeddings, n_results=max(self._ks), where=self._where
+        )
+        totals = dict.fromkeys(self._ks, 0.0)
+        for i, query in enumerate(queries):
+            ranked = [hit.entity_id for hit in parse_query_results(results, i)]
+            for k in self._ks:
+                totals[k] += recall_at_k(ranked, query.expected, k)
+        return {f"@{k}": round(total / len(queries), 4) for k, total in totals.items()}
+
+    async def run(
+        self, documents: list[EntityDocument], queries: list[EvalQuery]
+    ) -> BenchmarkResult:
+        """
+        ベンチマークを実行。
+
+        Args:
+            documents: インデックスに格納するコーパス
+            queries: 評価クエリ
+
+        Returns:
+            ベンチマーク結果
+        """
+        rss_before = max_rss_mb()
+        embeddings, samples = await self._measure_latency(queries)
+        throughput, build_seconds = await self._build_index(documents)
+        recall = await self._recall(queries, embeddings)
+        dimensions = len(embeddings[0]) if embeddings else 0
+        return BenchmarkResult(
+            provider=self._embedding.provider,
+            model=self._embedding.model,
+            dimensions=dimensions,
+            embed_latency_ms=percentiles(samples),
+            batch_throughput=throughput,
+            index_build_seconds=build_seconds,
+            memory_mb={
+                "index_estimate": round(len(documents) * dimensions * 4 / 1024 / 1024, 3),
+                "max_rss": round(max_rss_mb(), 1),
+                "max_rss_growth": round(max_rss_mb() - rss_before, 1),
+            },
+            recall=recall,
+        )
@@ -0,0 +1,349 @@
+"""Application: Offline graph analytics (centrality, communities, similarity)."""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from tengin_mcp.application.services.path_engine import strength_to_cost
+
+# 影響の向き（source が target に影響を与えた）を表すリレーションシップ
+DIRECTED_INFLUENCE_TYPES = frozenset({"INFLUENCED", "EXTENDS", "BUILDS_ON"})
+
+# 対称的な理論間リレーションシップ
+SYMMETRIC_THEORY_TYPES = frozenset({"COMPLEMENTS", "CONTRADICTS", "CONTRASTS_WITH", "RELATED_TO"})
+
+
+def pagerank(
+    nodes: list[str],
+    edges: list[tuple[str, str, float]],
+    damping: float = 0.85,
+    max_iter: int = 100,
+    tol: float = 1.0e-8,
+) -> dict[str, float]:
+    """
+    重み付き有向グラフの PageRank を計算（べき乗法）。
+
+    Args:
+        nodes: ノードIDのリスト
+        edges: (from, to, weight) のリスト。from から to へスコアが流れる
+        damping: ダンピング係数
+        max_iter: 最大反復回数
+        tol: 収束判定の閾値（L1ノルム）
+
+    Returns:
+        ノードID → スコア（合計 1.0）
+    """
+    n = len(nodes)
+    if n == 0:
+        return {}
+
+    node_set = set(nodes)
+    out_weight: dict[str, float] = dict.fromkeys(nodes, 0.0)
+    incoming: dict[str, list[tuple[str, float]]] = {node: [] for node in nodes}
+    for u, v, w in edges:
+        if u in node_set and v in node_set and u != v and w > 0:
+            out_weight[u] += w
+            incoming[v].append((u, w))
+
+    rank = dict.fromkeys(nodes, 1.0 / n)
+    for _ in range(max_iter):
+        # 出次数ゼロのノードのスコアは全ノードに均等配分
+        dangling = sum(rank[u] for u in nodes if out_weight[u] == 0.0)
+        base = (1.0 - damping) / n + damping * dangling / n
+        new_rank = {
+            v: base + damping * sum(rank[u] * w / out_weight[u] for u, w in incoming[v])
+            for v in nodes
+        }
+        delta = sum(abs(new_rank[v] - rank[v]) for v in nodes)
+        rank = new_rank
+        if delta < tol:
+            break
+
+    return rank
+
+
+def betweenness_centrality(
+    adjacency: dict[str, set[str]],
+    normalized: bool = True,
+) -> dict[str, float]:
+    """
+    無向・重みなしグラフの媒介中心性を計算（Brandes のアルゴリズム）。
+
+    Args:
+        adjacency: ノードID → 隣接ノードIDの集合
+        normalized: 0〜1 に正規化するか
+
+    Returns:
+        ノードID → 媒介中心性
+    """
+    centrality = dict.fromkeys(adjacency, 0.0)
+
+    for source in adjacency:
+        stack: list[str] = []
+        predecessors: dict[str, list[str]] = {v: [] for v in adjacency}
+        sigma = dict.fromkeys(adjacency, 0.0)
+        sigma[source] = 1.0
+        distance = dict.fromkeys(adjacency, -1)
+        distance[source] = 0
+
+        queue = deque([source])
+        while queue:
+            v = queue.popleft()
+            stack.append(v)
+            for w in adjacency[v]:
+                if distance[w] < 0:
+                    distance[w] = distance[v] + 1
+                    queue.append(w)
+                if distance[w] == distance[v] + 1:
+                    sigma[w] += sigma[v]
+                    predecessors[w].append(v)
+
+        dependency = dict.fromkeys(adjacency, 0.0)
+        while stack:
+            w = stack.pop()
+            for v in predecessors[w]:
+                dependency[v] += sigma[v] / sigma[w] * (1.0 + dependency[w])
+            if w != source:
+                centrality[w] += dependency[w]
+
+    # 無向グラフでは各ペアを両方向から数えている
+    n = len(adjacency)
+    scale = 0.5
+    if normalized and n > 2:
+        scale = 1.0 / ((n - 1) * (n - 2))
+    return {v: c * scale for v, c in centrality.items()}
+
+
+def louvain_communities(
+    nodes: list[str],
+    edges: list[tuple[str, str, float]],
+    resolution: float = 1.0,
+    max_passes: int = 10,
+) -> dict[str, int]:
+    """
+    Louvain 法でコミュニティを検出。
+
+    局所移動（モジュラリティ利得が最大のコミュニティへ移動）と
+    コミュニティの集約を、改善がなくなるまで繰り返す。
+    ノードは ID 順に処理するため結果は決定的。
+
+    Args:
+        nodes: ノードIDのリスト
+        edges: (u, v, weight) の無向エッジのリスト
+        resolution: 解像度パラメータ（大きいほど小さなコミュニティ）
+        max_passes: 集約の最大回数
+
+    Returns:
+        ノードID → コミュニティID（サイズの大きい順に 0, 1, 2, ...）
+    """
+    adjacency: dict[str, dict[str, float]] = {node: {} for node in nodes}
+    for u, v, w in edges:
+        if u not in adjacency or v not in adjacency or u == v or w <= 0:
+            continue
+        adjacency[u][v] = adjacency[u].get(v, 0.0) + w
+        adjacency[v][u] = adjacency[v].get(u, 0.0) + w
+
+    # 元ノード → 現在の（集約後）ノード
+    membership = {node: node for node in nodes}
+    total_degree = sum(sum(nbrs.values()) for nbrs in adjacency.values())
+
+    if total_degree > 0:
+        for _ in range(max_passes):
+            community, moved = _louvain_local_moving(adjacency, total_degree, resolution)
+            if not moved:
+                break
+            membership = {node: community[current] for node, current in membership.items()}
+            adjacency = _louvain_aggregate(adjacency, community)
+
+    # コミュニティIDをサイズ降順（同サイズは最小ノードID順）で振り直す
+    groups: dict[str, list[str]] = {}
+    for node, current in membership.items():
+        groups.setdefault(current, []).append(node)
+    ordered = sorted(groups.values(), key=lambda members: (-len(members), min(members)))
+    return {node: index for index, members in enumerate(ordered) for node in members}
+
+
+def _louvain_local_moving(
+    adjacency: dict[str, dict[str, float]],
+    total_degree: float,
+    resolution: float,
+) -> tuple[dict[str, str], bool]:
+    """Louvain の局所移動フェーズ。"""
+    community = {node: node for node in adjacency}
+    degree = {node: sum(nbrs.values()) for node, nbrs in adjacency.items()}
+    community_total = dict(degree)
+    moved_any = False
+
+    improved = True
+    while improved:
+        improved = False
+        for node in sorted(adjacency):
+            current = community[node]
+            k = degree[node]
+            community_total[current] -= k
+
+            links: dict[str, float] = {}
+            for nbr, w in adjacency[node].items():
+                if nbr != node:
+                    links[community[nbr]] = links.get(community[nbr], 0.0) + w
+
+            best = current
+            best_gain = (
+                links.get(current, 0.0) - resolution * community_total[current] * k / total_degree
+            )
+            for candidate in sorted(links):
+                gain = links[candidate] - resolution * community_total[candidate] * k / total_degree
+                if gain > best_gain + 1.0e-12:
+                    best, best_gain = candidate, gain
+
+            community_total[best] += k
+            if best != current:
+                community[node] = best
+                improved = True
+                moved_any = True
+
+    return community, moved_any
+
+
+def _louvain_aggregate(
+    adjacency: dict[str, dict[str, float]],
+    community: dict[str, str],
+) -> dict[str, dict[str, float]]:
+    """コミュニティを1ノードに集約したグラフを作成（内部エッジは自己ループ）。"""
+    aggregated: dict[str, dict[str, float]] = {c: {} for c in set(community.values())}
+    for u, nbrs in adjacency.items():
+        cu = community[u]
+        for v, w in nbrs.items():
+            cv = community[v]
+            aggregated[cu][cv] = aggregated[cu].get(cv, 0.0) + w
+    return aggregated
+
+
+def jaccard_similarity(
+    targets: list[str],
+    neighbors: dict[str, set[str]],
+    top_k: int = 5,
+    min_similarity: float = 0.1,
+) -> dict[str, list[tuple[str, float]]]:
+    """
+    近傍集合の Jaccard 係数によるノード類似度（上位 k 件）を計算。
+
+    Args:
+        targets: 類似度を計算するノードIDのリスト
+        neighbors: ノードID → 隣接ノードIDの集合
+        top_k: ノードごとに保持する類似ノード数
+        min_similarity: 保持する最小類似度
+
+    Returns:
+        ノードID → [(類似ノードID, 類似度), ...]（類似度降順）
+    """
+    result: dict[str, list[tuple[str, float]]] = {}
+    for a in targets:
+        na = neighbors.get(a, set())
+        scores: list[tuple[str, float]] = []
+        if na:
+            for b in targets:
+                if a == b:
+                    continue
+                nb = neighbors.get(b, set())
+                union = len(na | nb)
+                if union == 0:
+                    continue
+                score = len(na & nb) / union
+                if score >= min_similarity:
+                    scores.append((b, score))
+        scores.sort(key=lambda item: (-item[1], item[0]))
+        result[a] = scores[:top_k]
+    return result
+
+
+@dataclass
+class TheoryAnalytics:
+    """理論ノードに書き戻す分析結果。"""
+
+    id: str
+    pagerank: float = 0.0
+    betweenness: float = 0.0
+    community_id: int = 0
+    similar_theory_ids: list[str] = field(default_factory=list)
+    similarity_scores: list[float] = field(default_factory=list)
+
+    def to_properties(self) -> dict[str, Any]:
+        """Neo4j ノードプロパティ形式に変換。"""
+        return {
+            "pagerank": round(self.pagerank, 6),
+            "betweenness": round(self.betweenness, 6),
+            "community_id": self.community_id,
+            "similar_theory_ids": self.similar_theory_ids,
+            "similarity_scores": [round(s, 4) for s in self.similarity_scores],
+        }
+
+
+def compute_theory_analytics(
+    nodes: list[dict[str, Any]],
+    edges: list[dict[str, Any]],
+    similarity_top_k: int = 5,
+) -> list[TheoryAnalytics]:
+    """
+    グラフスナップショットから理論ノードの分析指標を計算。
+
+    - PageRank: 理論間の影響関係（INFLUENCED 等）を逆向きに辿り、
+      多くの理論に影響を与えた理論ほど高スコアになるよう計算
+    - 媒介中心性: グラフ全体（概念・理論家等を含む）を無向グラフとして計算
+    - 類似度: 理論ごとの近傍集合（概念・理論家・教授法等）の Jaccard 係数
+    - コミュニティ: 理論間リレーション（強度で重み付け）と類似度を合わせたグラフに Louvain 法
+
+    Args:
+        nodes: ノードのリスト（id, labels）
+        edges: エッジのリスト（source, target, type, properties）
+        similarity_top_k: 理論ごとに保持する類似理論数
+
+    Returns:
+        理論ごとの分析結果
+    """
+    theory_ids = sorted(
+        n["id"] for n in nodes if n.get("id") and "Theory" in (n.get("labels") or [])
+    )
+    theory_set = set(theory_ids)
+    all_ids = {n["id"] for n in nodes if n.get("id")}
+
+    influence_edges: list[tuple[str, str, float]] = []
+    theory_edges: list[tuple[str, str, float]] = []
+    adjacency: dict[str, set[str]] = {node_id: set() for node_id in all_ids}
+
+    for e in edges:
+        source, target = e.get("source"), e.get("target")
+        if source not in all_ids or target not in all_ids or source == target:
+            continue
+        adjacency[source].add(target)
+        adjacency[target].add(source)
+
+        if source in theory_set and target in theory_set:
+            weight = 1.0 / strength_to_cost((e.get("properties") or {}).get("strength"))
+            rel_type = e.get("type", "")
+            theory_edges.append((source, target, weight))
+            if rel_type in DIRECTED_INFLUENCE_TYPES:
+                # 影響を受けた側から与えた側へスコアを流す
+                influence_edges.append((target, source, weight))
+            elif rel_type in SYMMETRIC_THEORY_TYPES:
+                influence_edges.append((source, target, weight))
+                influence_edges.append((target, source, weight))
+
+    ranks = pagerank(theory_ids, influence_edges)
+    betweenness = betweenness_centrality(adjacency)
+    similar = jaccard_similarity(theory_ids, adjacency, top_k=similarity_top_k)
+
+    similarity_edges = [(a, b, score) for a, pairs in similar.items() for b, score in pairs]
+    communities = louvain_communities(theory_ids, theory_edges + similarity_edges)
+
+    return [
+        TheoryAnalytics(
+            id=theory_id,
+            pagerank=ranks.get(theory_id, 0.0),
+            betweenness=betweenness.get(theory_id, 0.0),
+            community_id=communities.get(theory_id, 0),
+            similar_theory_ids=[b for b, _ in similar.get(theory_id, [])],
+            similarity_scores=[s for _, s in similar.get(theory_id, [])],
+        )
+        for theory_id in theory_ids
+    ]
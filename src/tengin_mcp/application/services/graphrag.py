@@ -0,0 +1,283 @@
+"""Application: Hybrid GraphRAG retrieval (vector seeds + weighted graph expansion)."""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from tengin_mcp.application.services.context_pack import (
+    ContextPackBuilder,
+    PackEntity,
+    PackFormat,
+)
+from tengin_mcp.application.services.semantic_search import (
+    VECTOR_ENTITY_TYPES,
+    VectorHit,
+    build_where,
+    parse_query_results,
+    primary_entity_type,
+)
+from tengin_mcp.domain.value_objects import EvidenceLevel
+from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.vector_store import VectorStore
+from tengin_mcp.infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+
+# リレーションシップタイプごとの伝播の重み（0〜1, 含まれないタイプは辿らない）
+DEFAULT_RELATIONSHIP_WEIGHTS: dict[str, float] = {
+    "BUILDS_ON": 0.9,
+    "EXTENDS": 0.9,
+    "COMPLEMENTS": 0.8,
+    "INCLUDES_CONCEPT": 0.8,
+    "HAS_CONCEPT": 0.8,
+    "HAS_PRINCIPLE": 0.8,
+    "THEORETICALLY_GROUNDED_IN": 0.8,
+    "OPERATIONALIZES": 0.8,
+    "RELATED_TO": 0.7,
+    "SUPPORTS": 0.7,
+    "SUPPORTED_BY": 0.7,
+    "EFFECTIVE_FOR": 0.6,
+    "APPLICABLE_IN": 0.6,
+    "CONTRASTS_WITH": 0.5,
+    "CONTRADICTS": 0.5,
+    "CHALLENGES": 0.5,
+    "PROPOSED": 0.4,
+    "PROPOSED_BY": 0.4,
+    "DEVELOPED": 0.4,
+    "INFLUENCED": 0.4,
+}
+
+# リレーションシップ strength ごとの伝播の減衰
+STRENGTH_FACTORS: dict[str, float] = {
+    "strong": 1.0,
+    "moderate": 0.85,
+    "weak": 0.7,
+}
+
+# strength が未設定の場合の減衰（シード時のデフォルト "moderate" に合わせる）
+DEFAULT_STRENGTH_FACTOR = STRENGTH_FACTORS["moderate"]
+
+# 統合スコアの重み（ベクトル類似度, グラフ近接度, エビデンス）
+DEFAULT_FUSION_WEIGHTS: tuple[float, float, float] = (0.5, 0.3, 0.2)
+
+# 1ホップで起点ノードごとに取得するエッジの最大数
+MAX_EDGES_PER_NODE = 50
+
+
+def evidence_score(evidence_level: Any) -> float:
+    """エビデンスレベルを 0〜1 のスコアに変換（未設定・不明は 0）。"""
+    try:
+        return EvidenceLevel(evidence_level).strength_order / len(EvidenceLevel)
+    except ValueError:
+        return 0.0
+
+
+def edge_factor(relationship_type: str, strength: Any, weights: dict[str, float]) -> float:
+    """エッジ1本を辿るときの近接度の減衰率。"""
+    factor = weights.get(relationship_type, 0.0)
+    if isinstance(strength, str):
+        return factor * STRENGTH_FACTORS.get(strength.lower(), DEFAULT_STRENGTH_FACTOR)
+    return factor * DEFAULT_STRENGTH_FACTOR
+
+
+@dataclass
+class Candidate:
+    """GraphRAG の候補エンティティ。"""
+
+    entity_id: str
+    entity_type: str
+    hops: int
+    proximity: float
+    similarity: float | None = None
+    via: dict[str, str] | None = None
+    summary: dict[str, Any] = field(default_factory=dict)
+    score: float = 0.0
+
+
+class GraphRAGService:
+    """
+    ベクトル検索とグラフ展開を組み合わせた検索サービス。
+
+    1. クエリを埋め込み、ベクトル検索の上位をシードノードとする
+    2. シードから重み付きリレーションシップタイプに沿ってグラフを展開する
+       （近接度 = シードの類似度 × 経路上のエッジの重みの積, 最短ホップの経路のうち最大のもの）
+    3. ベクトル類似度・グラフ近接度・エビデンスレベルの加重和で順位付けする
+    4. 上位の候補から ContextPackBuilder でトークン予算内のコンテキストを作成する
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        embedding: EmbeddingAdapter,
+        graph_repository: Neo4jGraphRepository,
+        documents_per_entity: int = 1,
+    ) -> None:
+        """
+        サービスを初期化。
+
+        Args:
+            vector_store: ベクトルストア
+            embedding: 埋め込みアダプター
+            graph_repository: グラフリポジトリ
+            documents_per_entity: 1エンティティあたりのドキュメント数の上限（英語ビューを同じストアに
+                格納する場合は 2, ベクトル検索はこの倍数を取得して重複を除く）
+        """
+        self._vector_store = vector_store
+        self._embedding = embedding
+        self._graph_repository = graph_repository
+        self._documents_per_entity = documents_per_entity
+
+    async def retrieve(
+        self,
+        query: str,
+        seed_limit: int = 5,
+        max_hops: int = 2,
+        limit: int = 15,
+        max_tokens: int = 2000,
+        format: PackFormat = "markdown",
+        entity_types: list[str] | None = None,
+        relationship_weights: dict[str, float] | None = None,
+        fusion_weights: tuple[float, float, float] = DEFAULT_FUSION_WEIGHTS,
+    ) -> dict[str, Any]:
+        """
+        クエリに関連するエンティティをシード + グラフ展開で取得。
+
+        Args:
+            query: 自然言語クエリ
+            seed_limit: シードにするベクトル検索の上位件数
+            max_hops: シードからの最大ホップ数（0 で展開しない）
+            limit: 順位付け後に返す候補の最大数
+            max_tokens: コンテキストパックのトークン予算
+            format: コンテキストパックの形式（markdown または json）
+            entity_types: シードのエンティティタイプでフィルタ
+            relationship_weights: リレーションシップタイプ → 重み（既定値を上書き）
+            fusion_weights: (ベクトル類似度, グラフ近接度, エビデンス) の重み
+
+        Returns:
+            {"seeds", "candidates", "items", "format", "context", "token_estimate", "truncated"}
+        """
+        weights = {**DEFAULT_RELATIONSHIP_WEIGHTS, **(relationship_weights or {})}
+        embedding = await self._embedding.embed_text(query)
+        results = await self._vector_store.search(
+            query_embedding=embedding,
+            n_results=seed_limit * self._documents_per_entity,
+            where=build_where(entity_types),
+        )
+        seeds = parse_query_results(results)[:seed_limit]
+
+        candidates = await self._expand(seeds, max_hops, weights)
+        summaries = await self._graph_repository.get_entity_summaries(
+            _ids_by_label(candidates.values())
+        )
+        for candidate in candidates.values():
+            candidate.summary = summaries.get(candidate.entity_id, {})
+            candidate.score = _fuse(candidate, fusion_weights)
+
+        ranked = sorted(candidates.values(), key=lambda c: (-c.score, c.hops, c.entity_id))
+        items = [_to_item(rank, c) for rank, c in enumerate(ranked[:limit], start=1)]
+        pack = ContextPackBuilder(max_tokens, format=format).build(
+            [_to_pack_entity(c) for c in ranked[:limit]]
+        )
+        included = set(pack.entity_ids)
+        return {
+            "seeds": len(seeds),
+            "candidates": len(candidates),
+            "items": [item for item in items if item["id"] in included],
+            "format": pack.format,
+            "context": pack.text,
+            "token_estimate": pack.token_estimate,
+            "truncated": len(pack.omitted_ids),
+        }
+
+    async def _expand(
+        self,
+        seeds: list[VectorHit],
+        max_hops: int,
+        weights: dict[str, float],
+    ) -> dict[str, Candidate]:
+        """シードから幅優先でグラフを展開（ホップごとに1回のクエリ）。"""
+        candidates = {
+            hit.entity_id: Candidate(
+                entity_id=hit.entity_id,
+                entity_type=hit.entity_type,
+                hops=0,
+                proximity=max(0.0, hit.similarity),
+                similarity=hit.similarity,
+            )
+            for hit in seeds
+        }
+        relationship_types = sorted(t for t, w in weights.items() if w > 0)
+        frontier = list(candidates)
+        for hop in range(1, max_hops + 1):
+            if not frontier:
+                break
+            edges = await self._graph_repository.get_neighbor_edges(
+                frontier, relationship_types, limit_per_node=MAX_EDGES_PER_NODE
+            )
+            reached: list[str] = []
+            for edge in edges:
+                source = candidates[edge["source"]]
+                proximity = source.proximity * edge_factor(
+                    edge["type"], edge.get("strength"), weights
+                )
+                target = candidates.get(edge["target"])
+                if target is None:
+                    labels = [label for label in edge.get("labels") or [] if label]
+                    target = candidates[edge["target"]] = Candidate(
+                        entity_id=edge["target"],
+                        entity_type=primary_entity_type(labels),
+                        hops=hop,
+                        proximity=-1.0,
+                    )
+                    reached.append(target.entity_id)
+                if target.hops == hop and proximity > target.proximity:
+                    target.proximity = proximity
+                    target.via = {"from": source.entity_id, "type": edge["type"]}
+            frontier = reached
+        return candidates
+
+
+def _ids_by_label(candidates: Iterable[Candidate]) -> dict[str, list[str]]:
+    """候補をラベルごとのIDリストにまとめる（要約の一括取得用）。"""
+    ids_by_label: dict[str, list[str]] = {}
+    for candidate in candidates:
+        if candidate.entity_type in VECTOR_ENTITY_TYPES:
+            ids_by_label.setdefault(candidate.entity_type, []).append(candidate.entity_id)
+    return ids_by_label
+
+
+def _fuse(candidate: Candidate, fusion_weights: tuple[float, float, float]) -> float:
+    """ベクトル類似度・グラフ近接度・エビデンスの加重和。"""
+    vector_weight, graph_weight, evidence_weight = fusion_weights
+    return (
+        vector_weight * max(0.0, candidate.similarity or 0.0)
+        + graph_weight * candidate.proximity
+        + evidence_weight * evidence_score(candidate.summary.get("evidence_level"))
+    )
+
+
+def _to_item(rank: int, candidate: Candidate) -> dict[str, Any]:
+    """候補をレスポンス用の辞書に変換。"""
+    summary = candidate.summary
+    return {
+        "rank": rank,
+        "id": candidate.entity_id,
+        "entity_type": candidate.entity_type,
+        "name": summary.get("name"),
+        "score": round(candidate.score, 4),
+        "similarity": None if candidate.similarity is None else round(candidate.similarity, 4),
+        "proximity": round(candidate.proximity, 4),
+        "hops": candidate.hops,
+        "via": candidate.via,
+        "evidence_level": summary.get("evidence_level"),
+        "summary": summary.get("summary"),
+    }
+
+
+def _to_pack_entity(candidate: Candidate) -> PackEntity:
+    """候補をコンテキストパックのエンティティに変換（展開経路を注記）。"""
+    via = candidate.via
+    return PackEntity(
+        id=candidate.entity_id,
+        entity_type=candidate.entity_type,
+        properties=candidate.summary,
+        note=f"via {via['type']} from {via['from']}" if via else None,
+    )
@@ -0,0 +1,196 @@
+"""Application: Hybrid (fulltext + vector) search fused with reciprocal rank fusion."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from typing import Any, TypeVar
+
+from tengin_mcp.application.services.semantic_search import (
+    RRF_K,
+    VECTOR_ENTITY_TYPES,
+    VectorHit,
+    build_where,
+    parse_query_results,
+    primary_entity_type,
+    reciprocal_rank_fusion,
+)
+from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.vector_store import VectorStore
+from tengin_mcp.infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 各ソースから取得する候補数（統合後の limit に対する倍率）
+CANDIDATE_MULTIPLIER = 3
+
+
+async def _timed(awaitable: Awaitable[T]) -> tuple[T, float]:
+    """実行結果と所要時間（ミリ秒）を返す。"""
+    started = time.perf_counter()
+    result = await awaitable
+    return result, (time.perf_counter() - started) * 1000
+
+
+class HybridSearchService:
+    """
+    全文検索（Neo4j）とベクトル検索（k-NN）を並行に実行し、RRF で統合するサービス。
+
+    2つのソースは asyncio.gather で同時に実行するため、レイテンシは合計ではなく
+    遅い方のソースで決まる。片方のソースが失敗した場合はもう片方の結果だけで返す。
+    """
+
+    def __init__(
+        self,
+        vector_store: VectorStore | None,
+        embedding: EmbeddingAdapter | None,
+        graph_repository: Neo4jGraphRepository,
+        documents_per_entity: int = 1,
+    ) -> None:
+        """
+        サービスを初期化。
+
+        Args:
+            vector_store: ベクトルストア（None の場合は全文検索のみ）
+            embedding: 埋め込みアダプター（None の場合は全文検索のみ）
+            graph_repository: グラフリポジトリ
+            documents_per_entity: 1エンティティあたりのドキュメント数の上限（英語ビューを同じストアに
+                格納する場合は 2, ベクトル検索はこの倍数を取得して重複を除く）
+        """
+        self._vector_store = vector_store
+        self._embedding = embedding
+        self._graph_repository = graph_repository
+        self._documents_per_entity = documents_per_entity
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        entity_types: list[str] | None = None,
+        category: str | None = None,
+        evidence_level: str | None = None,
+        k: int = RRF_K,
+    ) -> dict[str, Any]:
+        """
+        全文検索とベクトル検索の結果を RRF で統合して検索。
+
+        Args:
+            query: 検索クエリ（キーワードまたは自然言語）
+            limit: 返す結果の最大数
+            entity_types: エンティティタイプでフィルタ
+            category: カテゴリでフィルタ
+            evidence_level: エビデンスレベルでフィルタ
+            k: RRF の定数
+
+        Returns:
+            {"results": [...], "sources": {"fulltext": {...}, "vector": {...}}}
+        """
+        candidate_limit = limit * CANDIDATE_MULTIPLIER
+        fulltext_task = _timed(
+            self._graph_repository.fulltext_search(
+                query,
+                labels=entity_types,
+                limit=candidate_limit,
+                category=category,
+                evidence_level=evidence_level,
+            )
+        )
+        vector_task = _timed(
+            self._vector_search(query, candidate_limit, entity_types, category, evidence_level)
+        )
+        fulltext_result, vector_result = await asyncio.gather(
+            fulltext_task, vector_task, return_exceptions=True
+        )
+
+        sources: dict[str, dict[str, Any]] = {}
+        fulltext_rows: list[dict[str, Any]] = []
+        vector_hits: list[VectorHit] = []
+        for name, result in (("fulltext", fulltext_result), ("vector", vector_result)):
+            if isinstance(result, BaseException):
+                logger.warning(f"Hybrid search source '{name}' failed: {result}")
+                sources[name] = {"count": 0, "error": str(result)}
+                continue
+            rows, elapsed_ms = result
+            if rows is None:
+                sources[name] = {"count": 0, "error": "not initialized"}
+                continue
+            sources[name] = {"count": len(rows), "elapsed_ms": round(elapsed_ms, 1)}
+            if name == "fulltext":
+                fulltext_rows = rows
+            else:
+                vector_hits = rows
+
+        fulltext_ids = [row["id"] for row in fulltext_rows]
+        vector_ids = [hit.entity_id for hit in vector_hits]
+        scores = reciprocal_rank_fusion([fulltext_ids, vector_ids], k=k)
+
+        fulltext_by_id = {row["id"]: (rank, row) for rank, row in enumerate(fulltext_rows, 1)}
+        vector_by_id = {hit.entity_id: (rank, hit) for rank, hit in enumerate(vector_hits, 1)}
+        entity_types_by_id = {hit.entity_id: hit.entity_type for hit in vector_hits}
+        for row in fulltext_rows:
+            entity_types_by_id.setdefault(row["id"], primary_entity_type(row.get("labels") or []))
+
+        top_ids = list(scores)[:limit]
+        ids_by_label: dict[str, list[str]] = {}
+        for entity_id in top_ids:
+            label = entity_types_by_id[entity_id]
+            if label in VECTOR_ENTITY_TYPES:
+                ids_by_label.setdefault(label, []).append(entity_id)
+        summaries = await self._graph_repository.get_entity_summaries(ids_by_label)
+
+        results = []
+        for rank, entity_id in enumerate(top_ids, start=1):
+            summary = summaries.get(entity_id, {})
+            vector = vector_by_id.get(entity_id)
+            fulltext = fulltext_by_id.get(entity_id)
+            metadata = vector[1].metadata if vector else {}
+            results.append(
+                {
+                    "rank": rank,
+                    "id": entity_id,
+                    "entity_type": entity_types_by_id[entity_id],
+                    "rrf_score": round(scores[entity_id], 6),
+                    "scores": {
+                        "fulltext": (
+                            {"rank": fulltext[0], "score": round(float(fulltext[1]["score"]), 4)}
+                            if fulltext
+                            else None
+                        ),
+                        "vector": (
+                            {"rank": vector[0], "similarity": round(vector[1].similarity, 4)}
+                            if vector
+                            else None
+                        ),
+                    },
+                    "name": summary.get("name") or metadata.get("name"),
+                    "name_en": summary.get("name_en"),
+                    "category": summary.get("category") or metadata.get("category"),
+                    "evidence_level": (
+                        summary.get("evidence_level") or metadata.get("evidence_level")
+                    ),
+                    "summary": summary.get("summary"),
+                }
+            )
+
+        return {"results": results, "sources": sources}
+
+    async def _vector_search(
+        self,
+        query: str,
+        limit: int,
+        entity_types: list[str] | None,
+        category: str | None,
+        evidence_level: str | None,
+    ) -> list[VectorHit] | None:
+        """ベクトル検索（未初期化の場合は None）。"""
+        if not (self._vector_store and self._embedding):
+            return None
+        embedding = await self._embedding.embed_text(query)
+        results = await self._vector_store.search(
+            query_embedding=embedding,
+            n_results=limit * self._documents_per_entity,
+            where=build_where(entity_types, category, evidence_level),
+        )
+        return parse_query_results(results)[:limit]
@@ -0,0 +1,333 @@
+"""Application: In-process path engine for weighted / k-shortest path search."""
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import Any
+
+# リレーションシップ強度 → コスト（強い関係ほど低コスト）
+STRENGTH_COSTS: dict[str, float] = {
+    "strong": 1.0,
+    "moderate": 2.0,
+    "weak": 3.0,
+}
+
+# strength が未設定の場合のコスト（シード時のデフォルト "moderate" に合わせる）
+DEFAULT_STRENGTH_COST = STRENGTH_COSTS["moderate"]
+
+
+def strength_to_cost(strength: Any) -> float:
+    """リレーションシップの strength をパスコストに変換。"""
+    if isinstance(strength, str):
+        return STRENGTH_COSTS.get(strength.lower(), DEFAULT_STRENGTH_COST)
+    return DEFAULT_STRENGTH_COST
+
+
+@dataclass(frozen=True)
+class PathEdge:
+    """パスエンジン内部のエッジ。"""
+
+    source: str
+    target: str
+    type: str
+    properties: dict[str, Any] = field(default_factory=dict, hash=False, compare=False)
+
+    @property
+    def cost(self) -> float:
+        """重み付き探索時のコスト。"""
+        return strength_to_cost(self.properties.get("strength"))
+
+
+@dataclass
+class PathResult:
+    """探索結果のパス。"""
+
+    node_ids: list[str]
+    edges: list[PathEdge]
+    cost: float
+
+    @property
+    def length(self) -> int:
+        """ホップ数。"""
+        return len(self.edges)
+
+
+class PathEngine:
+    """
+    グラフのスナップショットに対する経路探索エンジン。
+
+    Features:
+    - 双方向 Dijkstra による最短パス（両端から探索し中間で合流）
+    - Yen のアルゴリズムによる k 最短単純パス
+    - リレーションシップ strength に基づく重み付き探索
+
+    グラフは無向として扱い（Cypher の ``-[*]-`` と同じ）、
+    同一ノード対の並行エッジは最小コストのものに集約する。
+    """
+
+    def __init__(
+        self,
+        nodes: list[dict[str, Any]],
+        edges: list[dict[str, Any]],
+    ) -> None:
+        """
+        エンジンを初期化。
+
+        Args:
+            nodes: ノードのリスト（id, labels, name）
+            edges: エッジのリスト（source, target, type, properties）
+        """
+        self._nodes: dict[str, dict[str, Any]] = {n["id"]: n for n in nodes if n.get("id")}
+        # (u, v) -> 最小コストのエッジ（無向なので両方向に登録）
+        self._edges: dict[tuple[str, str], PathEdge] = {}
+        self._adjacency: dict[str, dict[str, PathEdge]] = {}
+
+        for e in edges:
+            source, target = e.get("source"), e.get("target")
+            if not source or not target or source == target:
+                continue
+            edge = PathEdge(
+                source=source,
+                target=target,
+                type=e.get("type", ""),
+                properties=dict(e.get("properties") or {}),
+            )
+            for u, v in ((source, target), (target, source)):
+                current = self._adjacency.setdefault(u, {}).get(v)
+                if current is None or edge.cost < current.cost:
+                    self._adjacency[u][v] = edge
+                    self._edges[(u, v)] = edge
+
+    @property
+    def node_count(self) -> int:
+        """ノード数。"""
+        return len(self._nodes)
+
+    @property
+    def edge_count(self) -> int:
+        """（無向に集約した）エッジ数。"""
+        return len(self._edges) // 2
+
+    def has_node(self, node_id: str) -> bool:
+        """ノードが存在するか。"""
+        return node_id in self._nodes or node_id in self._adjacency
+
+    def shortest_path(
+        self,
+        start_id: str,
+        end_id: str,
+        weighted: bool = True,
+        max_depth: int | None = None,
+    ) -> PathResult | None:
+        """
+        最短パスを取得。
+
+        Args:
+            start_id: 開始ノードID
+            end_id: 終了ノードID
+            weighted: strength に基づくコストを使うか（False の場合はホップ数）
+            max_depth: 最大ホップ数
+
+        Returns:
+            最短パス、見つからない場合は None
+        """
+        paths = self.k_shortest_paths(start_id, end_id, k=1, weighted=weighted, max_depth=max_depth)
+        return paths[0] if paths else None
+
+    def k_shortest_paths(
+        self,
+        start_id: str,
+        end_id: str,
+        k: int = 3,
+        weighted: bool = True,
+        max_depth: int | None = None,
+        max_candidates: int | None = None,
+    ) -> list[PathResult]:
+        """
+        Yen のアルゴリズムで k 本の最短単純パスをコスト順に取得。
+
+        Args:
+            start_id: 開始ノードID
+            end_id: 終了ノードID
+            k: 取得するパス数
+            weighted: strength に基づくコストを使うか
+            max_depth: 最大ホップ数（超えるパスは除外）
+            max_candidates: 探索するパス数の上限（デフォルト: k * 20）
+
+        Returns:
+            パスのリスト（コスト昇順）
+        """
+        if k < 1 or not self.has_node(start_id) or not self.has_node(end_id):
+            return []
+
+        first = self._bidirectional_dijkstra(start_id, end_id, weighted, set(), set())
+        if first is None:
+            return []
+
+        limit = max_candidates if max_candidates is not None else k * 20
+        found: list[tuple[float, list[str]]] = [first]
+        seen: set[tuple[str, ...]] = {tuple(first[1])}
+        candidates: list[tuple[float, int, list[str]]] = []
+        counter = 0
+
+        results: list[PathResult] = []
+        self._accept(first, max_depth, weighted, results)
+
+        while len(results) < k and len(found) < limit:
+            last_path = found[-1][1]
+            for i in range(len(last_path) - 1):
+                spur_node = last_path[i]
+                root_path = last_path[: i + 1]
+
+                banned_edges: set[tuple[str, str]] = set()
+                for _, path in found:
+                    if len(path) > i + 1 and path[: i + 1] == root_path:
+                        banned_edges.add((path[i], path[i + 1]))
+                        banned_edges.add((path[i + 1], path[i]))
+                banned_nodes = set(root_path[:-1])
+
+                spur = self._bidirectional_dijkstra(
+                    spur_node, end_id, weighted, banned_nodes, banned_edges
+                )
+                if spur is None:
+                    continue
+
+                total_path = root_path[:-1] + spur[1]
+                key = tuple(total_path)
+                if key in seen:
+                    continue
+                seen.add(key)
+                total_cost = self._path_cost(root_path, weighted) + spur[0]
+                counter += 1
+                heapq.heappush(candidates, (total_cost, counter, total_path))
+
+            if not candidates:
+                break
+
+            cost, _, path = heapq.heappop(candidates)
+            found.append((cost, path))
+            self._accept((cost, path), max_depth, weighted, results)
+
+        return results
+
+    def to_dict(self, path: PathResult) -> dict[str, Any]:
+        """パスを find_path のレスポンス形式に変換。"""
+        nodes = []
+        for node_id in path.node_ids:
+            node = self._nodes.get(node_id, {})
+            nodes.append(
+                {
+                    "id": node_id,
+                    "labels": node.get("labels", []),
+                    "name": node.get("name"),
+                }
+            )
+
+        relationships = [
+            {
+                "type": edge.type,
+                "start_node_id": edge.source,
+                "end_node_id": edge.target,
+                "properties": edge.properties,
+            }
+            for edge in path.edges
+        ]
+
+        return {
+            "nodes": nodes,
+            "relationships": relationships,
+            "length": path.length,
+            "cost": round(path.cost, 4),
+        }
+
+    # --- Internal helpers ---
+
+    def _edge_cost(self, u: str, v: str, weighted: bool) -> float:
+        return self._adjacency[u][v].cost if weighted else 1.0
+
+    def _path_cost(self, node_ids: list[str], weighted: bool) -> float:
+        return sum(
+            self._edge_cost(node_ids[i], node_ids[i + 1], weighted)
+            for i in range(len(node_ids) - 1)
+        )
+
+    def _accept(
+        self,
+        found: tuple[float, list[str]],
+        max_depth: int | None,
+        weighted: bool,
+        results: list[PathResult],
+    ) -> None:
+        """max_depth を満たすパスを結果に追加。"""
+        cost, node_ids = found
+        if max_depth is not None and len(node_ids) - 1 > max_depth:
+            return
+        edges = [self._edges[(node_ids[i], node_ids[i + 1])] for i in range(len(node_ids) - 1)]
+        results.append(PathResult(node_ids=node_ids, edges=edges, cost=cost))
+
+    def _bidirectional_dijkstra(
+        self,
+        source: str,
+        target: str,
+        weighted: bool,
+        banned_nodes: set[str],
+        banned_edges: set[tuple[str, str]],
+    ) -> tuple[float, list[str]] | None:
+        """
+        双方向 Dijkstra で最短パスを探索。
+
+        前方（source から）と後方（target から）を交互に展開し、
+        両フロンティアの最小距離の和が既知の最良値を超えた時点で終了する。
+        """
+        if source in banned_nodes or target in banned_nodes:
+            return None
+        if source == target:
+            return 0.0, [source]
+
+        dist: list[dict[str, float]] = [{source: 0.0}, {target: 0.0}]
+        pred: list[dict[str, str | None]] = [{source: None}, {target: None}]
+        heaps: list[list[tuple[float, str]]] = [[(0.0, source)], [(0.0, target)]]
+        settled: list[set[str]] = [set(), set()]
+        best = math.inf
+        meeting: str | None = None
+
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+
+            side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+            d, u = heapq.heappop(heaps[side])
+            if u in settled[side]:
+                continue
+            settled[side].add(u)
+
+            for v in self._adjacency.get(u, {}):
+                if v in banned_nodes or (u, v) in banned_edges:
+                    continue
+                nd = d + self._edge_cost(u, v, weighted)
+                if nd < dist[side].get(v, math.inf):
+                    dist[side][v] = nd
+                    pred[side][v] = u
+                    heapq.heappush(heaps[side], (nd, v))
+
+                other = dist[1 - side].get(v)
+                if other is not None and dist[side][v] + other < best:
+                    best = dist[side][v] + other
+                    meeting = v
+
+        if meeting is None:
+            return None
+
+        forward: list[str] = []
+        node: str | None = meeting
+        while node is not None:
+            forward.append(node)
+            node = pred[0][node]
+        forward.reverse()
+
+        node = pred[1][meeting]
+        while node is not None:
+            forward.append(node)
+            node = pred[1][node]
+
+        return best, forward
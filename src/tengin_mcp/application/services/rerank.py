@@ -0,0 +1,68 @@
+"""Application: Optional rerank stage for retrieval results."""
+
+import time
+from typing import Any
+
+from tengin_mcp.infrastructure.adapters.reranker_adapter import RerankerAdapter
+
+
+def candidate_text(item: dict[str, Any]) -> str:
+    """検索結果の項目からリランク用のドキュメントを作成（名前・英語名・要約）。"""
+    parts = [item.get("name"), item.get("name_en"), item.get("summary")]
+    return "\n".join(str(part) for part in parts if part) or str(item.get("id", ""))
+
+
+async def rerank_items(
+    reranker: RerankerAdapter,
+    query: str,
+    items: list[dict[str, Any]],
+    limit: int,
+    budget_ms: float = 0,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """
+    検索結果の上位候補をリランカーのスコアで並べ替える。
+
+    予算内に全候補をスコアリングできなかった場合はリランクせず、元の順位の上位を返す
+    （スコアリング済みのペアはキャッシュされ、次回以降の同じクエリで再利用される）。
+
+    Args:
+        reranker: リランカー
+        query: 検索クエリ
+        items: 元の順位順の候補（rank を含む）
+        limit: 返す結果の最大数
+        budget_ms: レイテンシ予算（ミリ秒, 0 で無制限）
+
+    Returns:
+        (結果, リランクの情報)
+    """
+    started = time.perf_counter()
+    scores = await reranker.score(
+        query,
+        [candidate_text(item) for item in items],
+        budget_seconds=budget_ms / 1000 if budget_ms else None,
+    )
+    scored = sum(score is not None for score in scores)
+    info: dict[str, Any] = {
+        "applied": scored == len(items),
+        "model": reranker.model_name,
+        "candidates": len(items),
+        "scored": scored,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+    if not info["applied"]:
+        info["reason"] = "latency budget exceeded"
+        return items[:limit], info
+
+    order = sorted(range(len(items)), key=lambda i: (-(scores[i] or 0.0), i))
+    results = []
+    for rank, i in enumerate(order[:limit], start=1):
+        results.append(
+            {
+                **items[i],
+                "rank": rank,
+                "retrieval_rank": items[i]["rank"],
+                "rerank_score": round(scores[i] or 0.0, 4),
+            }
+        )
+    return results, info
@@ -0,0 +1,381 @@
+"""Application: Semantic (vector) search over graph entities."""
+
+import asyncio
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.vector_store import VectorStore
+from tengin_mcp.infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+from tengin_mcp.infrastructure.search_cache import SemanticSearchCache, search_scope
+
+# Reciprocal Rank Fusion の定数（Cormack et al., 2009 の推奨値）
+RRF_K = 60
+
+# ひらがな・カタカナ・漢字（半角カナを含む）
+_JAPANESE_CHARS = re.compile(r"[\u3040-\u30ff\u3400-\u9fff\uf900-\ufaff\uff66-\uff9f]")
+
+# ベクトルインデックスの対象エンティティ（Neo4j のラベル）
+VECTOR_ENTITY_TYPES = (
+    "Theory",
+    "Concept",
+    "Principle",
+    "Methodology",
+    "Evidence",
+    "Context",
+    "Theorist",
+)
+
+
+def primary_entity_type(labels: list[str]) -> str:
+    """
+    ノードのラベルからエンティティタイプを決定。
+
+    ラベルの順にベクトル対象のタイプ（VECTOR_ENTITY_TYPES）を優先し、該当しなければ先頭のラベル
+    （ラベルがなければ空文字）を返す。
+    """
+    for label in labels:
+        if label in VECTOR_ENTITY_TYPES:
+            return label
+    return labels[0] if labels else ""
+
+
+def build_where(
+    entity_types: list[str] | None = None,
+    category: str | None = None,
+    evidence_level: str | None = None,
+) -> dict[str, Any] | None:
+    """
+    ChromaDB のメタデータフィルタ（where）を構築。
+
+    Args:
+        entity_types: エンティティタイプ（ラベル）
+        category: カテゴリ
+        evidence_level: エビデンスレベル
+
+    Returns:
+        where 条件（条件がなければ None）
+    """
+    conditions: list[dict[str, Any]] = []
+    if entity_types:
+        if len(entity_types) == 1:
+            conditions.append({"entity_type": entity_types[0]})
+        else:
+            conditions.append({"entity_type": {"$in": list(entity_types)}})
+    if category:
+        conditions.append({"category": category})
+    if evidence_level:
+        conditions.append({"evidence_level": evidence_level})
+
+    if not conditions:
+        return None
+    if len(conditions) == 1:
+        return conditions[0]
+    return {"$and": conditions}
+
+
+def detect_language(text: str) -> str:
+    """クエリの言語を判定（日本語の文字を含めば ja, それ以外は en）。"""
+    return "ja" if _JAPANESE_CHARS.search(text) else "en"
+
+
+@dataclass(frozen=True)
+class LanguageView:
+    """別の埋め込みモデルで構築した言語別ビューのベクトルストア。"""
+
+    vector_store: VectorStore
+    embedding: EmbeddingAdapter
+
+
+@dataclass(frozen=True)
+class VectorHit:
+    """ベクトル検索のヒット。"""
+
+    entity_id: str
+    entity_type: str
+    distance: float
+    metadata: dict[str, Any]
+
+    @property
+    def similarity(self) -> float:
+        """コサイン類似度（コレクションはコサイン距離）。"""
+        return 1.0 - self.distance
+
+
+def parse_query_results(results: dict[str, Any], index: int = 0) -> list[VectorHit]:
+    """
+    ChromaDB の query 結果をヒットのリストに変換。
+
+    同一エンティティの複数ドキュメント（言語別ビュー等）は最も近いものだけを残す。
+    ドキュメントIDとエンティティIDが異なる場合に備え、メタデータの entity_id を優先する。
+
+    Args:
+        results: collection.query の結果
+        index: 対象クエリの位置（複数クエリ埋め込みを渡した場合）
+
+    Returns:
+        距離の昇順に並んだヒット
+    """
+    ids = (results.get("ids") or [[]])[index]
+    distances = (results.get("distances") or [[]])[index] or [0.0] * len(ids)
+    metadatas = (results.get("metadatas") or [[]])[index] or [{}] * len(ids)
+
+    hits: dict[str, VectorHit] = {}
+    for doc_id, distance, metadata in zip(ids, distances, metadatas, strict=True):
+        metadata = metadata or {}
+        entity_id = metadata.get("entity_id") or doc_id
+        if entity_id in hits and hits[entity_id].distance <= distance:
+            continue
+        hits[entity_id] = VectorHit(
+            entity_id=entity_id,
+            entity_type=metadata.get("entity_type", ""),
+            distance=float(distance),
+            metadata=metadata,
+        )
+    return sorted(hits.values(), key=lambda hit: hit.distance)
+
+
+def reciprocal_rank_fusion(rankings: list[list[str]], k: int = RRF_K) -> dict[str, float]:
+    """
+    複数のランキングを Reciprocal Rank Fusion で統合。
+
+    各ランキングで順位 r（1始まり）の ID に 1 / (k + r) を加算する。
+
+    Args:
+        rankings: ID のランキング（上位から順）のリスト
+        k: 下位の順位の影響を抑える定数
+
+    Returns:
+        ID → 統合スコア（スコアの降順, 同点は初出順）
+    """
+    scores: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item_id in enumerate(ranking, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    return dict(sorted(scores.items(), key=lambda item: -item[1]))
+
+
+class SemanticSearchService:
+    """クエリを埋め込み、ベクトル検索の結果をグラフの要約と結合するサービス。"""
+
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        embedding: EmbeddingAdapter,
+        graph_repository: Neo4jGraphRepository,
+        cache: SemanticSearchCache | None = None,
+        english: LanguageView | None = None,
+        documents_per_entity: int = 1,
+    ) -> None:
+        """
+        サービスを初期化。
+
+        Args:
+            vector_store: ベクトルストア
+            embedding: 埋め込みアダプター
+            graph_repository: グラフリポジトリ
+            cache: 検索結果のキャッシュ（None の場合はキャッシュしない）
+            english: 英語ビュー（別モデルで構築した場合, 英語のクエリで併用）
+            documents_per_entity: 1エンティティあたりのドキュメント数の上限（英語ビューを同じストアに
+                格納する場合は 2, ベクトル検索はこの倍数を取得して重複を除く）
+        """
+        self._vector_store = vector_store
+        self._embedding = embedding
+        self._graph_repository = graph_repository
+        self._cache = cache
+        self._english = english
+        self._documents_per_entity = documents_per_entity
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 10,
+        entity_types: list[str] | None = None,
+        category: str | None = None,
+        evidence_level: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        意味的に近いエンティティを検索。
+
+        キャッシュがある場合、同じクエリ（正規化後）とフィルタの結果は埋め込みもベクトル検索も
+        行わずに返し、埋め込みが閾値以上に近いクエリの結果はベクトル検索を行わずに返す。
+
+        英語ビューがあり、クエリが英語の場合は通常のストアと英語ビューを並列に検索して
+        Reciprocal Rank Fusion で統合する（日本語のクエリは通常のストアのみ）。
+
+        Args:
+            query: 自然言語クエリ
+            limit: 返す結果の最大数
+            entity_types: エンティティタイプでフィルタ
+            category: カテゴリでフィルタ
+            evidence_level: エビデンスレベルでフィルタ
+
+        Returns:
+            類似度順の結果（グラフの要約を含む）
+        """
+        scope = search_scope(entity_types, category, evidence_level)
+        if self._cache:
+            cached = self._cache.get(query, scope, limit)
+            if cached is not None:
+                return cached
+
+        embedding = await self._embedding.embed_text(query)
+        if self._cache:
+            similar = self._cache.get_similar(embedding, scope, limit)
+            if similar is not None:
+                return similar[0]
+
+        where = build_where(entity_types, category, evidence_level)
+        if self._english and detect_language(query) == "en":
+            hits = await self._search_bilingual(self._english, query, embedding, limit, where)
+        else:
+            results = await self._vector_store.search(
+                query_embedding=embedding,
+                n_results=limit * self._documents_per_entity,
+                where=where,
+            )
+            hits = parse_query_results(results)[:limit]
+        items = await self.join_summaries(hits)
+        if self._cache:
+            self._cache.put(query, scope, embedding, items, limit)
+        return items
+
+    async def _search_bilingual(
+        self,
+        english: LanguageView,
+        query: str,
+        embedding: list[float],
+        limit: int,
+        where: dict[str, Any] | None,
+    ) -> list[VectorHit]:
+        """
+        通常のストアと英語ビューを並列に検索して RRF で統合。
+
+        モデルが異なり距離を比較できないため順位で統合し、各エンティティのヒットは
+        距離の小さい方を残す。
+        """
+
+        async def search_english() -> dict[str, Any]:
+            english_embedding = await english.embedding.embed_text(query)
+            return await english.vector_store.search(
+                query_embedding=english_embedding, n_results=limit, where=where
+            )
+
+        results = await asyncio.gather(
+            self._vector_store.search(
+                query_embedding=embedding,
+                n_results=limit * self._documents_per_entity,
+                where=where,
+            ),
+            search_english(),
+        )
+        hit_lists = [parse_query_results(result)[:limit] for result in results]
+        best: dict[str, VectorHit] = {}
+        for hits in hit_lists:
+            for hit in hits:
+                if hit.entity_id not in best or hit.distance < best[hit.entity_id].distance:
+                    best[hit.entity_id] = hit
+        scores = reciprocal_rank_fusion([[h.entity_id for h in hits] for hits in hit_lists])
+        return [best[entity_id] for entity_id in scores][:limit]
+
+    async def search_many(
+        self,
+        queries: list[str],
+        limit: int = 10,
+        entity_types: list[str] | None = None,
+        category: str | None = None,
+        evidence_level: str | None = None,
+        fuse: bool = False,
+    ) -> dict[str, Any]:
+        """
+        複数クエリをまとめて検索。
+
+        クエリの埋め込み・ベクトル検索・グラフの要約取得をそれぞれ1回で行う。
+
+        Args:
+            queries: 自然言語クエリのリスト
+            limit: クエリごとに返す結果の最大数
+            entity_types: エンティティタイプでフィルタ
+            category: カテゴリでフィルタ
+            evidence_level: エビデンスレベルでフィルタ
+            fuse: True の場合は Reciprocal Rank Fusion で統合した結果も返す
+
+        Returns:
+            {"queries": [{"query": ..., "results": [...]}, ...], "fused": [...] | None}
+        """
+        embeddings = await self._embedding.embed_texts(queries)
+        results = await self._vector_store.search_many(
+            query_embeddings=embeddings,
+            n_results=limit * self._documents_per_entity,
+            where=build_where(entity_types, category, evidence_level),
+        )
+        hit_lists = [parse_query_results(results, i)[:limit] for i in range(len(queries))]
+
+        best: dict[str, VectorHit] = {}
+        for hits in hit_lists:
+            for hit in hits:
+                if hit.entity_id not in best or hit.distance < best[hit.entity_id].distance:
+                    best[hit.entity_id] = hit
+        summaries = await self.fetch_summaries(list(best.values()))
+
+        response: dict[str, Any] = {
+            "queries": [
+                {"query": query, "results": self.to_items(hits, summaries)}
+                for query, hits in zip(queries, hit_lists, strict=True)
+            ],
+            "fused": None,
+        }
+        if fuse:
+            scores = reciprocal_rank_fusion([[h.entity_id for h in hits] for hits in hit_lists])
+            fused_hits = [best[entity_id] for entity_id in scores][:limit]
+            matched = Counter(h.entity_id for hits in hit_lists for h in hits)
+            fused = self.to_items(fused_hits, summaries)
+            for item in fused:
+                item["rrf_score"] = round(scores[item["id"]], 6)
+                item["matched_queries"] = matched[item["id"]]
+            response["fused"] = fused
+        return response
+
+    async def join_summaries(self, hits: list[VectorHit]) -> list[dict[str, Any]]:
+        """
+        ヒットをグラフの要約と結合（1回のクエリで取得）。
+
+        グラフに存在しないエンティティ（インデックスが古い場合）はメタデータで補完する。
+        """
+        return self.to_items(hits, await self.fetch_summaries(hits))
+
+    async def fetch_summaries(self, hits: list[VectorHit]) -> dict[str, dict[str, Any]]:
+        """ヒットしたエンティティの要約をグラフから取得（1回のクエリ）。"""
+        ids_by_label: dict[str, list[str]] = {}
+        for hit in hits:
+            if hit.entity_type in VECTOR_ENTITY_TYPES:
+                ids_by_label.setdefault(hit.entity_type, []).append(hit.entity_id)
+        return await self._graph_repository.get_entity_summaries(ids_by_label)
+
+    @staticmethod
+    def to_items(
+        hits: list[VectorHit], summaries: dict[str, dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """ヒットを要約と結合してレスポンス用の辞書に変換。"""
+        items = []
+        for rank, hit in enumerate(hits, start=1):
+            summary = summaries.get(hit.entity_id, {})
+            items.append(
+                {
+                    "rank": rank,
+                    "id": hit.entity_id,
+                    "entity_type": hit.entity_type,
+                    "similarity": round(hit.similarity, 4),
+                    "name": summary.get("name") or hit.metadata.get("name"),
+                    "name_en": summary.get("name_en"),
+                    "category": summary.get("category") or hit.metadata.get("category"),
+                    "evidence_level": (
+                        summary.get("evidence_level") or hit.metadata.get("evidence_level")
+                    ),
+                    "summary": summary.get("summary"),
+                    "in_graph": bool(summary),
+                }
+            )
+        return items
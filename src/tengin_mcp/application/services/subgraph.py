@@ -0,0 +1,71 @@
+"""Application: Compact columnar encoding of traversed subgraphs."""
+
+from typing import Any
+
+# compact 形式で properties 未指定時に射影するノードプロパティ
+DEFAULT_COMPACT_PROPERTIES = ["name"]
+
+
+def to_columnar(
+    nodes: list[list[Any]],
+    edges: list[list[Any]],
+    properties: list[str],
+) -> dict[str, Any]:
+    """
+    射影済みのノード・エッジ行を列指向の compact 形式に変換。
+
+    ラベルの組み合わせとリレーションシップタイプはルックアップテーブルに
+    インターンし、エッジの端点はノード配列のインデックスで参照する。
+
+    Args:
+        nodes: [[id, labels, [値, ...]], ...]（値は properties の順）
+        edges: [[source_id, target_id, type], ...]
+        properties: 射影したプロパティ名
+
+    Returns:
+        {
+            "labels": ["Theory", ...],
+            "types": ["INFLUENCED", ...],
+            "nodes": {"id": [...], "label": [ラベル番号, ...], "properties": {"name": [...]}},
+            "edges": {"source": [ノード番号, ...], "target": [...], "type": [タイプ番号, ...]}
+        }
+    """
+    label_index: dict[str, int] = {}
+    type_index: dict[str, int] = {}
+    node_index: dict[str, int] = {}
+
+    ids: list[str] = []
+    label_column: list[int] = []
+    value_columns: list[list[Any]] = [[] for _ in properties]
+
+    for node_id, labels, values in nodes:
+        if node_id is None or node_id in node_index:
+            continue
+        node_index[node_id] = len(ids)
+        ids.append(node_id)
+        label_column.append(label_index.setdefault(":".join(sorted(labels)), len(label_index)))
+        for column, value in zip(value_columns, values, strict=True):
+            column.append(value)
+
+    sources: list[int] = []
+    targets: list[int] = []
+    type_column: list[int] = []
+    for source_id, target_id, rel_type in edges:
+        source = node_index.get(source_id)
+        target = node_index.get(target_id)
+        if source is None or target is None:
+            continue
+        sources.append(source)
+        targets.append(target)
+        type_column.append(type_index.setdefault(rel_type, len(type_index)))
+
+    return {
+        "labels": list(label_index),
+        "types": list(type_index),
+        "nodes": {
+            "id": ids,
+            "label": label_column,
+            "properties": dict(zip(properties, value_columns, strict=True)),
+        },
+        "edges": {"source": sources, "target": targets, "type": type_column},
+    }
@@ -0,0 +1,436 @@
+"""Application: Vector index builder for graph entities."""
+
+import asyncio
+import hashlib
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from tengin_mcp.application.services.semantic_search import VECTOR_ENTITY_TYPES
+from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.vector_store import VectorStore
+from tengin_mcp.infrastructure.vector_compression import VectorReducer
+
+# エンティティタイプごとに埋め込みテキストへ含めるプロパティ（記載順）
+DOCUMENT_FIELDS: dict[str, tuple[str, ...]] = {
+    "Theory": (
+        "summary",
+        "description",
+        "core_principle",
+        "keywords",
+        "applications",
+        "limitations",
+    ),
+    "Concept": ("definition", "examples"),
+    "Principle": ("description", "application_guide", "examples"),
+    "Methodology": ("description", "procedures", "best_for", "limitations"),
+    "Evidence": ("title", "findings", "implications"),
+    "Context": ("description", "characteristics", "challenges"),
+    "Theorist": ("field", "biography", "contributions", "major_works"),
+}
+
+# ベクトルストアのメタデータに含めるプロパティ（フィルタ用）
+METADATA_FIELDS = ("category", "evidence_level")
+
+# 英語ビューのドキュメントIDの接尾辞（メタデータの entity_id は元のエンティティID）
+ENGLISH_VIEW_SUFFIX = "#en"
+
+# ラテン文字の語句（英語名・原語・書名など, 区切りの記号を含む）
+_LATIN_PHRASE = re.compile(r"[A-Za-z][\w'’-]*(?:[ ,:/&-]+[A-Za-z0-9][\w'’-]*)*", re.ASCII)
+
+
+@dataclass(frozen=True)
+class EntityDocument:
+    """ベクトルインデックスに格納する1エンティティ分のドキュメント。"""
+
+    id: str
+    entity_type: str
+    text: str
+    metadata: dict[str, Any]
+
+
+@dataclass
+class IndexReport:
+    """インデックス構築の結果。"""
+
+    indexed: int = 0
+    batches: int = 0
+    added: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    rebuilt: bool = False
+    elapsed_seconds: float = 0.0
+
+
+@dataclass
+class SyncPlan:
+    """ベクトルストアとソースの差分。"""
+
+    added: list[EntityDocument] = field(default_factory=list)
+    updated: list[EntityDocument] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    @property
+    def to_embed(self) -> list[EntityDocument]:
+        """埋め込みが必要なドキュメント。"""
+        return self.added + self.updated
+
+
+def content_hash(document: EntityDocument) -> str:
+    """ドキュメントの本文とメタデータのハッシュ（変更検出用）。"""
+    payload = json.dumps(
+        {"text": document.text, "metadata": document.metadata},
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def plan_sync(
+    documents: list[EntityDocument],
+    existing: dict[str, dict[str, Any]],
+    model_id: str,
+    full: bool = False,
+    compression_id: str = "none",
+) -> SyncPlan:
+    """
+    ソースのドキュメントとベクトルストアのメタデータを比較して差分を計算。
+
+    content_hash・embedding_model・vector_compression のいずれかが異なるドキュメントを
+    更新対象とし、ソースに存在しないドキュメントを削除対象とする。
+
+    Args:
+        documents: ソースから作成したドキュメント
+        existing: ベクトルストアのドキュメントID → メタデータ
+        model_id: 現在の埋め込みモデルID
+        full: True の場合は既存ドキュメントもすべて再埋め込み
+        compression_id: 現在の次元削減の識別子
+
+    Returns:
+        差分
+    """
+    plan = SyncPlan()
+    for document in documents:
+        metadata = existing.get(document.id)
+        if metadata is None:
+            plan.added.append(document)
+        elif (
+            full
+            or metadata.get("content_hash") != content_hash(document)
+            or metadata.get("embedding_model") != model_id
+            or metadata.get("vector_compression", "none") != compression_id
+        ):
+            plan.updated.append(document)
+        else:
+            plan.unchanged.append(document.id)
+
+    source_ids = {d.id for d in documents}
+    plan.removed = sorted(doc_id for doc_id in existing if doc_id not in source_ids)
+    return plan
+
+
+def _format_value(value: Any) -> str:
+    """プロパティ値をテキスト化（リストは「、」区切り）。"""
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return str(value.get("title") or value.get("name") or "")
+    if isinstance(value, list):
+        return "、".join(text for text in (_format_value(v) for v in value) if text)
+    return str(value).strip()
+
+
+def build_document(entity_type: str, properties: dict[str, Any]) -> EntityDocument | None:
+    """
+    エンティティのプロパティから埋め込み用ドキュメントを作成。
+
+    Args:
+        entity_type: エンティティタイプ（Neo4j のラベル）
+        properties: ノードプロパティ
+
+    Returns:
+        ドキュメント（ID・名前がない場合は None）
+    """
+    entity_id = properties.get("id")
+    name = properties.get("name") or properties.get("title")
+    if not entity_id or not name or entity_type not in DOCUMENT_FIELDS:
+        return None
+
+    heading = str(name)
+    if properties.get("name_en"):
+        heading = f"{heading} ({properties['name_en']})"
+    lines = [f"[{entity_type}] {heading}"]
+    for key in DOCUMENT_FIELDS[entity_type]:
+        text = _format_value(properties.get(key))
+        if text and text != name:
+            lines.append(text)
+
+    metadata: dict[str, Any] = {
+        "entity_id": entity_id,
+        "entity_type": entity_type,
+        "name": str(name),
+    }
+    for key in METADATA_FIELDS:
+        if isinstance(properties.get(key), str) and properties[key]:
+            metadata[key] = properties[key]
+
+    return EntityDocument(
+        id=entity_id,
+        entity_type=entity_type,
+        text="\n".join(lines),
+        metadata=metadata,
+    )
+
+
+def latin_phrases(text: str) -> list[str]:
+    """テキストからラテン文字の語句（4文字以上）を出現順に抽出。"""
+    phrases = (match.group(0).strip(" ,:/&-") for match in _LATIN_PHRASE.finditer(text))
+    return [phrase for phrase in phrases if len(phrase) >= 4]
+
+
+def build_english_document(entity_type: str, properties: dict[str, Any]) -> EntityDocument | None:
+    """
+    エンティティの英語ビュー（英語名・本文中の原語・書名などの英語の語句）を作成。
+
+    本文の大半が日本語のため、英語のクエリが日本語ビューと一致しにくい場合に
+    英語の語句だけのドキュメントで補う。
+
+    Args:
+        entity_type: エンティティタイプ（Neo4j のラベル）
+        properties: ノードプロパティ
+
+    Returns:
+        ドキュメント（ID は {id}#en, 英語の語句がない場合は None）
+    """
+    document = build_document(entity_type, properties)
+    if document is None:
+        return None
+    phrases: list[str] = []
+    for key in ("name_en", "name", "title", *DOCUMENT_FIELDS[entity_type]):
+        for phrase in latin_phrases(_format_value(properties.get(key))):
+            if phrase not in phrases:
+                phrases.append(phrase)
+    if not phrases:
+        return None
+    return EntityDocument(
+        id=f"{document.id}{ENGLISH_VIEW_SUFFIX}",
+        entity_type=entity_type,
+        text="\n".join([f"[{entity_type}] {phrases[0]}", *phrases[1:]]),
+        metadata={**document.metadata, "language": "en"},
+    )
+
+
+def build_documents(
+    entities: list[dict[str, Any]], languages: tuple[str, ...] = ("ja",)
+) -> list[EntityDocument]:
+    """
+    エンティティのリストからドキュメントを作成（ID重複は後勝ち）。
+
+    Args:
+        entities: [{"entity_type": ..., "properties": {...}}, ...]
+        languages: 作成するビュー（ja: 全文, en: 英語ビュー）
+
+    Returns:
+        ドキュメントのリスト（タイプ・ID順）
+    """
+    builders = {"ja": build_document, "en": build_english_document}
+    documents: dict[str, EntityDocument] = {}
+    for entity in entities:
+        for language in languages:
+            document = builders[language](entity["entity_type"], entity["properties"])
+            if document:
+                documents[document.id] = document
+    order = {t: i for i, t in enumerate(VECTOR_ENTITY_TYPES)}
+    return sorted(documents.values(), key=lambda d: (order.get(d.entity_type, 99), d.id))
+
+
+class VectorIndexer:
+    """ドキュメントをバッチで埋め込み、ベクトルストアに upsert するサービス。"""
+
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        embedding: EmbeddingAdapter,
+        batch_size: int = 64,
+        concurrency: int = 4,
+    ) -> None:
+        """
+        インデクサーを初期化。
+
+        Args:
+            vector_store: ベクトルストア
+            embedding: 埋め込みアダプター
+            batch_size: 1回の埋め込み呼び出しのドキュメント数（プロバイダー上限で制限）
+            concurrency: 同時に実行するバッチ数
+        """
+        self._vector_store = vector_store
+        self._embedding = embedding
+        self._batch_size = max(1, min(batch_size, embedding.max_batch_size))
+        self._concurrency = max(1, concurrency)
+
+    @property
+    def batch_size(self) -> int:
+        """実効バッチサイズ。"""
+        return self._batch_size
+
+    @property
+    def model_id(self) -> str:
+        """メタデータに記録する埋め込みモデルID（provider/model）。"""
+        return f"{self._embedding.provider}/{self._embedding.model}"
+
+    @property
+    def compression_id(self) -> str:
+        """メタデータに記録する次元削減の識別子（ベクトルストアの設定）。"""
+        return self._vector_store.reducer.id
+
+    def _needs_rebuild(self, existing: dict[str, dict[str, Any]], full: bool) -> bool:
+        """
+        ベクトルストアを作り直す必要があるか。
+
+        次元削減が変わると既存ベクトルと次元が合わなくなり、PCA は未学習または
+        full の場合にコーパス全体で学習し直すため、いずれも空のストアから構築する。
+        ベクトルストアが作り直しを要求する場合（コサイン距離でない ChromaDB のコレクション）も同様。
+        """
+        reducer = self._vector_store.reducer
+        if self._vector_store.requires_rebuild:
+            return True
+        if not reducer.fitted or (full and reducer.method == "pca"):
+            return True
+        return any(
+            metadata.get("vector_compression", "none") != reducer.id
+            for metadata in existing.values()
+        )
+
+    async def sync(
+        self,
+        documents: list[EntityDocument],
+        full: bool = False,
+        entity_types: list[str] | None = None,
+    ) -> IndexReport:
+        """
+        差分のみを埋め込んでベクトルストアをソースに同期。
+
+        新規・変更ドキュメントだけを埋め込み、ソースから削除されたドキュメントを削除するため、
+        処理時間はコーパス全体ではなく変更量に比例する。
+
+        次元削減の設定が変わった場合はベクトルストアを空にして全ドキュメントを埋め込む
+        （埋め込みキャッシュが有効なら再計算は発生しない）。
+
+        entity_types を指定した場合はそのタイプのドキュメントだけを同期する
+        （他のタイプは削除対象にならず、full と併用するとタイプ単位で再構築できる）。
+
+        ベクトルストアへの書き込みは最後に1回だけ flush する（ローカルストアのディスクへの保存）。
+
+        Args:
+            documents: ソースから作成したドキュメント
+            full: True の場合は全ドキュメントを再埋め込み
+            entity_types: 同期するエンティティタイプ（None は全タイプ）
+
+        Returns:
+            インデックス構築の結果
+
+        Raises:
+            ValueError: entity_types の指定時にストア全体の再構築が必要な場合
+        """
+        started = time.perf_counter()
+        existing = await self._vector_store.get_metadatas()
+        rebuilt = self._needs_rebuild(existing, full)
+        if rebuilt and entity_types:
+            raise ValueError("The vector store must be rebuilt for all entity types")
+        if entity_types:
+            documents = [d for d in documents if d.entity_type in entity_types]
+            existing = {
+                doc_id: metadata
+                for doc_id, metadata in existing.items()
+                if metadata.get("entity_type") in entity_types
+            }
+        if rebuilt:
+            await self._vector_store.reset()
+            if self._vector_store.reducer.method == "pca":
+                # 学習済みの PCA を破棄し、index で全ドキュメントから学習し直す
+                await self._vector_store.set_reducer(
+                    VectorReducer("pca", self._vector_store.reducer.dimensions)
+                )
+            existing = {}
+        plan = plan_sync(
+            documents, existing, self.model_id, full=full, compression_id=self.compression_id
+        )
+
+        report = await self.index(plan.to_embed)
+        await self._vector_store.delete_documents(plan.removed)
+        await self._vector_store.flush()
+
+        report.rebuilt = rebuilt
+        report.added = len(plan.added)
+        report.updated = len(plan.updated)
+        report.unchanged = len(plan.unchanged)
+        report.deleted = len(plan.removed)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    async def index(self, documents: list[EntityDocument]) -> IndexReport:
+        """
+        ドキュメントを埋め込んでベクトルストアに upsert（ID単位で冪等）。
+
+        メタデータには変更検出用の content_hash・embedding_model・vector_compression を記録する。
+        PCA が未学習の場合は、先に全ドキュメントを埋め込んで学習してから upsert する。
+
+        Args:
+            documents: ドキュメントのリスト
+
+        Returns:
+            インデックス構築の結果
+        """
+        started = time.perf_counter()
+        report = IndexReport()
+        batches = [
+            documents[i : i + self._batch_size] for i in range(0, len(documents), self._batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def embed_batch(batch: list[EntityDocument]) -> list[list[float]]:
+            async with semaphore:
+                return await self._embedding.embed_texts([d.text for d in batch])
+
+        embedded: list[list[list[float]] | None] = [None] * len(batches)
+        reducer = self._vector_store.reducer
+        if documents and not reducer.fitted:
+            embedded = list(await asyncio.gather(*(embed_batch(batch) for batch in batches)))
+            vectors = [vector for embeddings in embedded if embeddings for vector in embeddings]
+            await self._vector_store.set_reducer(VectorReducer.fit_pca(vectors, reducer.dimensions))
+
+        async def run_batch(
+            batch: list[EntityDocument], embeddings: list[list[float]] | None
+        ) -> None:
+            async with semaphore:
+                if embeddings is None:
+                    embeddings = await self._embedding.embed_texts([d.text for d in batch])
+                await self._vector_store.upsert_documents(
+                    ids=[d.id for d in batch],
+                    documents=[d.text for d in batch],
+                    embeddings=embeddings,
+                    metadatas=[
+                        {
+                            **d.metadata,
+                            "content_hash": content_hash(d),
+                            "embedding_model": self.model_id,
+                            "vector_compression": self.compression_id,
+                        }
+                        for d in batch
+                    ],
+                )
+                report.indexed += len(batch)
+                report.batches += 1
+
+        await asyncio.gather(
+            *(
+                run_batch(batch, embeddings)
+                for batch, embeddings in zip(batches, embedded, strict=True)
+            )
+        )
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
@@ -3,7 +3,13 @@
 from tengin_mcp.infrastructure.adapters import (
     ChromaDBAdapter,
     EmbeddingAdapter,
+    LocalVectorAdapter,
     Neo4jAdapter,
+    RerankerAdapter,
+    VectorStore,
+    create_vector_store,
+    documents_per_entity,
+    english_view_settings,
 )
 from tengin_mcp.infrastructure.cache import (
     SimpleCache,
@@ -16,17 +22,25 @@ from tengin_mcp.infrastructure.repositories import (
     Neo4jGraphRepository,
     Neo4jTheoryRepository,
 )
+from tengin_mcp.infrastructure.search_cache import SemanticSearchCache
 
 __all__ = [
     # Adapters
     "ChromaDBAdapter",
     "EmbeddingAdapter",
+    "LocalVectorAdapter",
     "Neo4jAdapter",
+    "RerankerAdapter",
+    "VectorStore",
+    "create_vector_store",
+    "documents_per_entity",
+    "english_view_settings",
     # Cache
     "SimpleCache",
     "get_theory_cache",
     "get_graph_cache",
     "clear_all_caches",
+    "SemanticSearchCache",
     # Repositories
     "Neo4jGraphRepository",
     "Neo4jTheoryRepository",
@@ -2,10 +2,24 @@
 
 from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
 from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.local_vector_adapter import LocalVectorAdapter
 from tengin_mcp.infrastructure.adapters.neo4j_adapter import Neo4jAdapter
+from tengin_mcp.infrastructure.adapters.reranker_adapter import RerankerAdapter
+from tengin_mcp.infrastructure.adapters.vector_store import (
+    VectorStore,
+    create_vector_store,
+    documents_per_entity,
+    english_view_settings,
+)
 
 __all__ = [
     "ChromaDBAdapter",
     "EmbeddingAdapter",
+    "LocalVectorAdapter",
     "Neo4jAdapter",
+    "RerankerAdapter",
+    "VectorStore",
+    "create_vector_store",
+    "documents_per_entity",
+    "english_view_settings",
 ]
@@ -1,21 +1,130 @@
 """Infrastructure: ChromaDB Adapter."""
 
+import asyncio
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlparse
 
 import chromadb
+import numpy as np
+from chromadb.api.models.AsyncCollection import AsyncCollection
 from chromadb.config import Settings as ChromaSettings
 
 from tengin_mcp.infrastructure.config import Settings
+from tengin_mcp.infrastructure.vector_compression import REDUCTION_FILE, VectorReducer
 
 logger = logging.getLogger(__name__)
 
+# query の結果のうちマージするフィールド
+QUERY_FIELDS = ("ids", "documents", "metadatas", "distances")
+
+
+def route_entity_types(where: dict[str, Any] | None) -> set[str] | None:
+    """
+    where 条件から検索対象のエンティティタイプを求める。
+
+    entity_type の等価条件・$eq・$in（$and の中を含む）を解釈し、
+    タイプを限定できない場合は None を返す。
+
+    Args:
+        where: ChromaDB 形式のフィルタ条件
+
+    Returns:
+        エンティティタイプの集合（限定できない場合は None）
+    """
+    if not where:
+        return None
+    routed: set[str] | None = None
+    clauses = where.get("$and", []) if "$and" in where else [where]
+    for clause in clauses:
+        condition = clause.get("entity_type")
+        if condition is None:
+            continue
+        if isinstance(condition, str):
+            types = {condition}
+        elif isinstance(condition, dict) and "$eq" in condition:
+            types = {condition["$eq"]}
+        elif isinstance(condition, dict) and "$in" in condition:
+            types = set(condition["$in"])
+        else:
+            continue
+        routed = types if routed is None else routed & types
+    return routed
+
+
+def collection_space(collection: Any) -> str | None:
+    """
+    コレクションの距離関数（HNSW / SPANN の設定）。
+
+    Returns:
+        "cosine" / "l2" / "ip"（設定を取得できない場合は None）
+    """
+    configuration = getattr(collection, "configuration", None)
+    if not isinstance(configuration, dict):
+        return None
+    for index in ("hnsw", "spann"):
+        space = (configuration.get(index) or {}).get("space")
+        if isinstance(space, str):
+            return space
+    return None
+
+
+def merge_query_results(
+    results: list[dict[str, Any]], n_results: int, n_queries: int
+) -> dict[str, Any]:
+    """
+    複数コレクションの query の結果をクエリごとに距離順でマージ。
+
+    Args:
+        results: コレクションごとの結果
+        n_results: クエリごとに返す結果数
+        n_queries: クエリ数
+
+    Returns:
+        上位 n_results 件にまとめた結果（query と同じ形式）
+    """
+    merged: dict[str, Any] = {key: [] for key in QUERY_FIELDS}
+    for query in range(n_queries):
+        hits = sorted(
+            (
+                (result["distances"][query][j], result, j)
+                for result in results
+                for j in range(len(result["ids"][query]))
+            ),
+            key=lambda hit: hit[0],
+        )[:n_results]
+        for key in QUERY_FIELDS:
+            merged[key].append([result[key][query][j] for _, result, j in hits])
+    return merged
+
 
 class ChromaDBAdapter:
-    """ChromaDB ベクトルデータベースアダプター。"""
+    """
+    ChromaDB ベクトルデータベースアダプター。
+
+    chromadb_url が設定されている場合は AsyncHttpClient でサーバーに接続し、
+    それ以外は永続化クライアントの同期 API をスレッドプールで実行するため、
+    いずれのモードでもイベントループをブロックしない。
 
+    次元削減（VECTOR_REDUCTION）はドキュメントとクエリの両方に適用し、設定をコレクションの
+    メタデータに記録する（PCA の成分は CHROMADB_PATH に保存）。ChromaDB の HNSW は float32 の
+    ベクトルのみを扱うため、量子化（VECTOR_QUANTIZATION）は local バックエンドでのみ有効。
+
+    CHROMADB_COLLECTION_LAYOUT=entity_type では、ドキュメントをメタデータの entity_type ごとの
+    コレクション（education_theories_<type>）に格納する。検索は where 条件のタイプの
+    コレクションだけを並列に検索して距離順にマージし、タイプを限定しない場合は全コレクションを検索する。
+    """
+
+    # 既定のコレクション名（CHROMADB_COLLECTION で変更）
     COLLECTION_NAME = "education_theories"
+    # 類似度（1 - 距離）で扱えるようコサイン距離を使用
+    COLLECTION_CONFIGURATION = {"hnsw": {"space": "cosine"}}
+    # load_vectors の1回の書き込み件数（ChromaDB の最大バッチサイズ未満）
+    LOAD_BATCH_SIZE = 1000
 
     def __init__(self, settings: Settings) -> None:
         """
@@ -25,46 +134,187 @@ class ChromaDBAdapter:
             settings: アプリケーション設定
         """
         self._settings = settings
-        self._client: chromadb.ClientAPI | None = None
-        self._collection: chromadb.Collection | None = None
+        self._client: chromadb.ClientAPI | chromadb.AsyncClientAPI | None = None
+        self._collection: chromadb.Collection | AsyncCollection | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._is_async = bool(settings.chromadb_url)
+        self._layout = settings.chromadb_collection_layout
+        self._typed: dict[str, chromadb.Collection | AsyncCollection] = {}
+        # コサイン距離でない既存のコレクション（コレクション名 → 距離関数）
+        self._mismatched_spaces: dict[str, str] = {}
+        self._collection_name = settings.chromadb_collection or self.COLLECTION_NAME
+        self._reducer = VectorReducer.from_settings(settings)
+        reduction_file = (
+            REDUCTION_FILE
+            if self._collection_name == self.COLLECTION_NAME
+            else f"{self._collection_name}_{REDUCTION_FILE}"
+        )
+        self._reduction_path = Path(settings.chromadb_path) / reduction_file
+        if settings.vector_quantization != "none":
+            logger.warning("VECTOR_QUANTIZATION is ignored by ChromaDB (VECTOR_BACKEND=local only)")
 
     async def connect(self) -> None:
-        """ChromaDBに接続（永続化モード）。"""
+        """ChromaDBに接続（サーバーモードまたは永続化モード）。"""
         try:
-            # ディレクトリを作成
-            db_path = Path(self._settings.chromadb_path)
-            db_path.mkdir(parents=True, exist_ok=True)
-
-            # 永続化クライアントを作成
-            self._client = chromadb.PersistentClient(
-                path=str(db_path),
-                settings=ChromaSettings(anonymized_telemetry=False),
-            )
+            self._reducer = await asyncio.to_thread(self._reducer.load, self._reduction_path)
+            if self._is_async:
+                url = urlparse(self._settings.chromadb_url)
+                self._client = await chromadb.AsyncHttpClient(
+                    host=url.hostname or "localhost",
+                    port=url.port or (443 if url.scheme == "https" else 8000),
+                    ssl=url.scheme == "https",
+                    settings=ChromaSettings(anonymized_telemetry=False),
+                )
+                location = self._settings.chromadb_url
+            else:
+                # ディレクトリを作成
+                db_path = Path(self._settings.chromadb_path)
+                db_path.mkdir(parents=True, exist_ok=True)
+
+                # 永続化クライアントを作成（ディスクI/Oを伴うためスレッドで実行）
+                self._client = await self._run(
+                    chromadb.PersistentClient,
+                    path=str(db_path),
+                    settings=ChromaSettings(anonymized_telemetry=False),
+                )
+                location = str(db_path)
 
             # コレクションを取得または作成
-            self._collection = self._client.get_or_create_collection(
-                name=self.COLLECTION_NAME,
-                metadata={"description": "Education theory embeddings"},
+            self._collection = await self._call(
+                self._client.get_or_create_collection,
+                name=self._collection_name,
+                configuration=self.COLLECTION_CONFIGURATION,
+                metadata=self._collection_metadata(),
             )
+            if self._layout == "entity_type":
+                await self._load_typed_collections()
+            self._check_spaces()
 
-            logger.info("Connected to ChromaDB at %s", db_path)
+            logger.info("Connected to ChromaDB at %s", location)
         except Exception as e:
             logger.error("Failed to connect to ChromaDB: %s", e)
             raise
 
     async def close(self) -> None:
-        """接続を閉じる（ChromaDBは自動永続化）。"""
+        """接続を閉じ、実行中の呼び出しの完了を待ってスレッドプールを停止。"""
         self._collection = None
+        self._typed = {}
         self._client = None
+        if self._executor:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True)
         logger.info("Disconnected from ChromaDB")
 
     @property
-    def collection(self) -> chromadb.Collection:
+    def collection(self) -> chromadb.Collection | AsyncCollection:
         """コレクションを取得。"""
         if not self._collection:
             raise RuntimeError("ChromaDB not connected")
         return self._collection
 
+    @property
+    def reducer(self) -> VectorReducer:
+        """ドキュメントとクエリに適用する次元削減。"""
+        return self._reducer
+
+    @property
+    def requires_rebuild(self) -> bool:
+        """
+        既存のコレクションがコサイン距離でないため作り直しが必要か。
+
+        get_or_create_collection は既存のコレクションの設定を変更しないため、距離関数を指定する前に
+        作成したコレクション（既定の L2）は類似度（1 - 距離）が正しく計算されない。
+        """
+        return bool(self._mismatched_spaces)
+
+    def _check_spaces(self) -> None:
+        """コサイン距離でないコレクションを記録して警告。"""
+        self._mismatched_spaces = {
+            collection.name: space
+            for collection in self._collections()
+            if (space := collection_space(collection)) not in (None, "cosine")
+        }
+        if self._mismatched_spaces:
+            logger.warning(
+                "ChromaDB collections %s do not use cosine distance; "
+                "rebuild the index (build_vector_index --full)",
+                self._mismatched_spaces,
+            )
+
+    def _collection_metadata(self, entity_type: str | None = None) -> dict[str, Any]:
+        """コレクションのメタデータ（次元削減の設定・タイプ別コレクションのタイプを含む）。"""
+        metadata = {"description": "Education theory embeddings", **self._reducer.metadata()}
+        if entity_type:
+            metadata["entity_type"] = entity_type
+        return metadata
+
+    async def _load_typed_collections(self) -> None:
+        """既存のタイプ別コレクションを読み込む。"""
+        for collection in await self._call(self._client.list_collections):
+            entity_type = (collection.metadata or {}).get("entity_type")
+            if entity_type and collection.name == self._typed_name(entity_type):
+                self._typed[entity_type] = collection
+
+    def _typed_name(self, entity_type: str) -> str:
+        """エンティティタイプのコレクション名。"""
+        return f"{self._collection_name}_{entity_type.lower()}"
+
+    async def _typed_collection(self, entity_type: str) -> chromadb.Collection | AsyncCollection:
+        """エンティティタイプのコレクションを取得（初回は作成）。"""
+        collection = self._typed.get(entity_type)
+        if collection is None:
+            collection = await self._call(
+                self._client.get_or_create_collection,
+                name=self._typed_name(entity_type),
+                configuration=self.COLLECTION_CONFIGURATION,
+                metadata=self._collection_metadata(entity_type),
+            )
+            self._typed[entity_type] = collection
+        return collection
+
+    def _collections(self) -> list[chromadb.Collection | AsyncCollection]:
+        """全コレクション（タイプのないドキュメントを格納する既定のコレクションを含む）。"""
+        return [self.collection, *self._typed.values()]
+
+    def _route(self, where: dict[str, Any] | None) -> list[chromadb.Collection | AsyncCollection]:
+        """where 条件に一致し得るドキュメントを含むコレクション。"""
+        if self._layout != "entity_type":
+            return [self.collection]
+        entity_types = route_entity_types(where)
+        if entity_types is None:
+            return self._collections()
+        return [self._typed[t] for t in sorted(entity_types) if t in self._typed]
+
+    def _transform(self, embeddings: list[list[float]]) -> list[list[float]]:
+        """次元削減を適用（none の場合はそのまま）。"""
+        if self._reducer.method == "none":
+            return embeddings
+        return self._reducer.transform(embeddings).tolist()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """同期 API 用のスレッドプールを取得（初回呼び出し時に作成）。"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._settings.chromadb_max_workers,
+                thread_name_prefix="chromadb",
+            )
+        return self._executor
+
+    async def _run(self, fn: Callable[..., Any], /, **kwargs: Any) -> Any:
+        """同期関数をスレッドプールで実行。"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), partial(fn, **kwargs))
+
+    async def _call(self, fn: Callable[..., Any], /, **kwargs: Any) -> Any:
+        """
+        クライアント・コレクションのメソッドを呼び出す。
+
+        サーバーモードではコルーチンを await し、永続化モードではスレッドプールで実行する。
+        """
+        if self._is_async:
+            return await fn(**kwargs)
+        return await self._run(fn, **kwargs)
+
     async def add_documents(
         self,
         ids: list[str],
@@ -86,11 +336,183 @@ class ChromaDBAdapter:
             "documents": documents,
         }
         if embeddings:
-            kwargs["embeddings"] = embeddings
+            kwargs["embeddings"] = self._transform(embeddings)
         if metadatas:
             kwargs["metadatas"] = metadatas
 
-        self.collection.add(**kwargs)
+        await self._write("add", kwargs)
+
+    async def upsert_documents(
+        self,
+        ids: list[str],
+        documents: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        ドキュメントを追加または更新（ID単位で冪等）。
+
+        Args:
+            ids: ドキュメントID
+            documents: ドキュメントテキスト
+            embeddings: 埋め込みベクトル
+            metadatas: メタデータ（オプション）
+        """
+        kwargs: dict[str, Any] = {
+            "ids": ids,
+            "documents": documents,
+            "embeddings": self._transform(embeddings),
+        }
+        if metadatas:
+            kwargs["metadatas"] = metadatas
+
+        await self._write("upsert", kwargs)
+
+    async def _write(self, operation: str, kwargs: dict[str, Any]) -> None:
+        """
+        add / upsert を実行（entity_type レイアウトではタイプ別コレクションに振り分け）。
+
+        タイプ別に格納したIDは既定のコレクションから削除する（single レイアウトからの移行時）。
+        """
+        if self._layout != "entity_type" or not kwargs.get("metadatas"):
+            await self._call(getattr(self.collection, operation), **kwargs)
+            return
+
+        groups: dict[str, list[int]] = {}
+        for i, metadata in enumerate(kwargs["metadatas"]):
+            groups.setdefault(metadata.get("entity_type") or "", []).append(i)
+
+        async def write(entity_type: str, positions: list[int]) -> None:
+            collection = (
+                await self._typed_collection(entity_type) if entity_type else self.collection
+            )
+            part = {key: [values[i] for i in positions] for key, values in kwargs.items()}
+            await self._call(getattr(collection, operation), **part)
+
+        await asyncio.gather(*(write(t, positions) for t, positions in groups.items()))
+        typed_ids = [kwargs["ids"][i] for t, positions in groups.items() if t for i in positions]
+        if typed_ids:
+            await self._call(self.collection.delete, ids=typed_ids)
+
+    async def set_reducer(self, reducer: VectorReducer) -> None:
+        """
+        学習済みの次元削減を設定して保存（reset 後の空のコレクションに対して呼び出す）。
+
+        Args:
+            reducer: 次元削減
+
+        Raises:
+            ValueError: ドキュメントが残っている場合
+        """
+        if await self.get_count():
+            raise ValueError("Reset the vector store before changing the reduction")
+        await asyncio.to_thread(reducer.save, self._reduction_path)
+        self._reducer = reducer
+        await self._call(self.collection.modify, metadata=self._collection_metadata())
+        for entity_type, collection in self._typed.items():
+            await self._call(collection.modify, metadata=self._collection_metadata(entity_type))
+
+    async def reset(self) -> None:
+        """コレクションを作り直す（次元削減の変更時は埋め込みの次元が変わるため）。"""
+        if not self._client:
+            raise RuntimeError("ChromaDB not connected")
+        for collection in self._collections():
+            await self._call(self._client.delete_collection, name=collection.name)
+        self._typed = {}
+        self._collection = await self._call(
+            self._client.create_collection,
+            name=self._collection_name,
+            configuration=self.COLLECTION_CONFIGURATION,
+            metadata=self._collection_metadata(),
+        )
+        self._mismatched_spaces = {}
+
+    async def load_vectors(
+        self,
+        ids: list[str],
+        documents: list[str],
+        vectors: np.ndarray,
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """
+        変換済みのベクトルを空のコレクションに一括で書き込む（スナップショットの読み込み用）。
+
+        次元削減は適用せず、LOAD_BATCH_SIZE 件ずつ書き込む（メモリマップの行列は
+        書き込むバッチの分だけ読み込まれる）。
+
+        Args:
+            ids: ドキュメントID
+            documents: ドキュメントテキスト
+            vectors: 次元削減・正規化済みのベクトル（n x dim）
+            metadatas: メタデータ
+
+        Raises:
+            ValueError: ドキュメントが残っている場合
+        """
+        if await self.get_count():
+            raise ValueError("Reset the vector store before loading vectors")
+        for start in range(0, len(ids), self.LOAD_BATCH_SIZE):
+            end = start + self.LOAD_BATCH_SIZE
+            await self._write(
+                "add",
+                {
+                    "ids": ids[start:end],
+                    "documents": documents[start:end],
+                    "embeddings": np.asarray(vectors[start:end], dtype=np.float32),
+                    "metadatas": metadatas[start:end],
+                },
+            )
+
+    async def get_vectors(self) -> dict[str, Any]:
+        """
+        全ドキュメントのベクトル・本文・メタデータを取得（スナップショットの書き出し用）。
+
+        Returns:
+            {"ids": [...], "embeddings": ndarray, "documents": [...], "metadatas": [...]}
+        """
+        results = await asyncio.gather(
+            *(
+                self._call(c.get, include=["embeddings", "documents", "metadatas"])
+                for c in self._collections()
+            )
+        )
+        results = [result for result in results if result["ids"]]
+        return {
+            "ids": [doc_id for result in results for doc_id in result["ids"]],
+            "embeddings": (
+                np.vstack([np.asarray(r["embeddings"], dtype=np.float32) for r in results])
+                if results
+                else np.zeros((0, 0), dtype=np.float32)
+            ),
+            "documents": [document or "" for r in results for document in r["documents"]],
+            "metadatas": [metadata or {} for r in results for metadata in r["metadatas"]],
+        }
+
+    async def get_metadatas(self) -> dict[str, dict[str, Any]]:
+        """
+        全ドキュメントのメタデータを取得（埋め込み・本文は取得しない）。
+
+        Returns:
+            ドキュメントID → メタデータ
+        """
+        results = await asyncio.gather(
+            *(self._call(c.get, include=["metadatas"]) for c in self._collections())
+        )
+        return {
+            doc_id: metadata or {}
+            for result in results
+            for doc_id, metadata in zip(result["ids"], result["metadatas"], strict=True)
+        }
+
+    async def delete_documents(self, ids: list[str]) -> None:
+        """
+        ドキュメントを削除。
+
+        Args:
+            ids: 削除するドキュメントID
+        """
+        if ids:
+            await asyncio.gather(*(self._call(c.delete, ids=ids) for c in self._collections()))
 
     async def search(
         self,
@@ -109,16 +531,53 @@ class ChromaDBAdapter:
         Returns:
             検索結果
         """
+        return await self.search_many([query_embedding], n_results=n_results, where=where)
+
+    async def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 5,
+        where: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        複数クエリのベクトル検索（1回の query で実行）。
+
+        Args:
+            query_embeddings: クエリの埋め込みベクトル
+            n_results: クエリごとに返す結果数
+            where: フィルタ条件（全クエリ共通）
+
+        Returns:
+            検索結果（ids 等はクエリごとのリスト）
+        """
         kwargs: dict[str, Any] = {
-            "query_embeddings": [query_embedding],
+            "query_embeddings": self._transform(query_embeddings),
             "n_results": n_results,
             "include": ["documents", "metadatas", "distances"],
         }
+        return await self._query(kwargs, where, len(query_embeddings))
+
+    async def _query(
+        self, kwargs: dict[str, Any], where: dict[str, Any] | None, n_queries: int
+    ) -> dict[str, Any]:
+        """
+        where 条件でルーティングしたコレクションを並列に検索してマージ。
+
+        Args:
+            kwargs: query の引数（where 以外）
+            where: フィルタ条件
+            n_queries: クエリ数
+
+        Returns:
+            検索結果
+        """
         if where:
             kwargs["where"] = where
-
-        results = self.collection.query(**kwargs)
-        return results
+        collections = self._route(where)
+        if len(collections) == 1:
+            return await self._call(collections[0].query, **kwargs)
+        results = await asyncio.gather(*(self._call(c.query, **kwargs) for c in collections))
+        return merge_query_results(list(results), kwargs["n_results"], n_queries)
 
     async def search_by_text(
         self,
@@ -142,12 +601,23 @@ class ChromaDBAdapter:
             "n_results": n_results,
             "include": ["documents", "metadatas", "distances"],
         }
-        if where:
-            kwargs["where"] = where
+        return await self._query(kwargs, where, 1)
 
-        results = self.collection.query(**kwargs)
-        return results
+    async def flush(self) -> None:
+        """何もしない（ChromaDB は書き込みごとに永続化する, LocalVectorAdapter と同じインターフェース用）。"""
 
     async def get_count(self) -> int:
-        """コレクション内のドキュメント数を取得。"""
-        return self.collection.count()
+        """コレクション内のドキュメント数を取得（タイプ別コレクションの合計）。"""
+        counts = await asyncio.gather(*(self._call(c.count) for c in self._collections()))
+        return sum(counts)
+
+    async def heartbeat(self) -> int:
+        """
+        ChromaDB のハートビートを取得（データには触れない）。
+
+        Returns:
+            サーバー時刻（ナノ秒）
+        """
+        if not self._client:
+            raise RuntimeError("ChromaDB not connected")
+        return await self._call(self._client.heartbeat)
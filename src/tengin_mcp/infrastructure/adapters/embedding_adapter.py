@@ -1,5 +1,7 @@
 """Infrastructure: Embedding Adapter using esperanto for multi-provider support."""
 
+import asyncio
+import inspect
 import logging
 from typing import Any
 
@@ -7,6 +9,10 @@ from esperanto.factory import AIFactory
 from esperanto.providers.embedding.ollama import OllamaEmbeddingModel
 
 from tengin_mcp.infrastructure.config import Settings
+from tengin_mcp.infrastructure.embedding_batcher import EmbeddingBatcher
+from tengin_mcp.infrastructure.embedding_cache import EmbeddingCache, make_key
+from tengin_mcp.infrastructure.embedding_scheduler import EmbeddingScheduler
+from tengin_mcp.infrastructure.stub_embedding import StubEmbeddingModel
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,7 @@ class EmbeddingAdapter:
     - Voyage (voyage-3, voyage-2, voyage-code-2)
     - Jina (jina-embeddings-v3, jina-embeddings-v2-base-en)
     - Transformers (local models: BAAI/bge-*, sentence-transformers/*)
+    - Stub (offline hashing model for benchmarks and CI: hashing-384)
     """
 
     # プロバイダーごとのデフォルトモデル
@@ -39,6 +46,43 @@ class EmbeddingAdapter:
         "voyage": "voyage-3",
         "jina": "jina-embeddings-v3",
         "transformers": "BAAI/bge-small-en-v1.5",
+        "stub": "hashing-384",
+    }
+
+    # プロバイダーごとの1リクエストあたりの最大入力数
+    MAX_BATCH_SIZES = {
+        "openai": 2048,
+        "openai-compatible": 256,
+        "google": 100,
+        "ollama": 64,
+        "vertex": 250,
+        "azure": 2048,
+        "mistral": 128,
+        "voyage": 128,
+        "jina": 512,
+        "transformers": 32,
+        "stub": 2048,
+    }
+
+    # プロバイダーごとの1リクエストあたりの最大トークン数（合計, 未記載は無制限）
+    MAX_REQUEST_TOKENS = {
+        "openai": 300_000,
+        "azure": 300_000,
+        "mistral": 16_384,
+        "voyage": 120_000,
+    }
+
+    # プロバイダーごとのレート制限の既定値（1分あたりのリクエスト数, トークン数）
+    # 契約プランで異なるため EMBEDDING_REQUESTS_PER_MINUTE / EMBEDDING_TOKENS_PER_MINUTE で上書きする。
+    # ローカル実行のプロバイダー（ollama, transformers, openai-compatible）は制限しない。
+    RATE_LIMITS: dict[str, tuple[int | None, int | None]] = {
+        "openai": (3000, 1_000_000),
+        "azure": (720, 120_000),
+        "google": (1500, None),
+        "vertex": (600, None),
+        "mistral": (60, None),
+        "voyage": (2000, 3_000_000),
+        "jina": (500, 1_000_000),
     }
 
     def __init__(self, settings: Settings) -> None:
@@ -55,6 +99,24 @@ class EmbeddingAdapter:
             self._provider, "text-embedding-3-small"
         )
         self._is_ollama = self._provider == "ollama"
+        self._cache: EmbeddingCache | None = None
+        # プロバイダー呼び出しの分割・流量制御・再試行
+        requests_per_minute, tokens_per_minute = self.RATE_LIMITS.get(self._provider, (None, None))
+        self._scheduler = EmbeddingScheduler(
+            self._call_provider,
+            max_batch_size=self.max_batch_size,
+            max_request_tokens=self.MAX_REQUEST_TOKENS.get(self._provider),
+            requests_per_minute=settings.embedding_requests_per_minute or requests_per_minute,
+            tokens_per_minute=settings.embedding_tokens_per_minute or tokens_per_minute,
+            max_concurrency=settings.embedding_concurrency,
+            max_retries=settings.embedding_max_retries,
+        )
+        # 同時に到着した embed_text の要求をまとめてプロバイダーに送る
+        self._batcher = EmbeddingBatcher(
+            self._embed_and_store,
+            max_batch_size=min(settings.embedding_batch_size, self.max_batch_size),
+            window_seconds=settings.embedding_batch_window_ms / 1000,
+        )
 
     def _get_provider_config(self) -> dict[str, Any]:
         """プロバイダー固有の設定を取得。"""
@@ -97,14 +159,20 @@ class EmbeddingAdapter:
                 if self._settings.jina_api_key:
                     config["api_key"] = self._settings.jina_api_key
 
-            case "transformers":
-                # transformersはローカルモデルを使用（APIキー不要）
+            case "transformers" | "stub":
+                # transformers・stub はローカルで実行（APIキー不要）
                 pass
 
         return config
 
     async def connect(self) -> None:
         """Embeddingクライアントを初期化。"""
+        if self._settings.embedding_cache_path:
+            self._cache = EmbeddingCache(
+                self._settings.embedding_cache_path,
+                max_entries=self._settings.embedding_cache_size,
+            )
+
         try:
             config = self._get_provider_config()
 
@@ -118,6 +186,10 @@ class EmbeddingAdapter:
                 logger.info(
                     f"Ollama Embedding client initialized: model={self._model}, base_url={base_url}"
                 )
+            elif self._provider == "stub":
+                # スタブはオフラインで動く決定的なモデル（esperanto を使用しない）
+                self._embedder = StubEmbeddingModel(self._model)
+                logger.info(f"Stub embedding model initialized: model={self._model}")
             else:
                 # 他のプロバイダーはAIFactoryを使用
                 self._embedder = AIFactory.create_embedding(
@@ -137,6 +209,9 @@ class EmbeddingAdapter:
         """クライアントをクローズ。"""
         # esperantoのembedderは明示的なクローズ不要
         self._embedder = None
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
         logger.info("Embedding client closed")
 
     @property
@@ -149,10 +224,22 @@ class EmbeddingAdapter:
         """現在のモデル名を取得。"""
         return self._model
 
+    @property
+    def cache(self) -> EmbeddingCache | None:
+        """埋め込みキャッシュ（無効時は None）。"""
+        return self._cache
+
+    @property
+    def max_batch_size(self) -> int:
+        """1回の埋め込み呼び出しで渡せる最大テキスト数。"""
+        return self.MAX_BATCH_SIZES.get(self._provider, 64)
+
     async def embed_text(self, text: str) -> list[float]:
         """
         テキストを埋め込みベクトルに変換。
 
+        キャッシュにないテキストは、同時に到着した他の要求とまとめて埋め込む。
+
         Args:
             text: 埋め込むテキスト
 
@@ -161,20 +248,19 @@ class EmbeddingAdapter:
         """
         if not self._embedder:
             raise RuntimeError("Embedding client not initialized. Call connect() first.")
-
-        if self._is_ollama:
-            # Ollamaは同期APIで、list[list[float]]を返す
-            result = self._embedder.embed([text])
-            return result[0]
-        else:
-            # 他のプロバイダーは非同期APIでEmbeddingResponseを返す
-            response = await self._embedder.aembed([text])
-            return response.data[0].embedding
+        if self._cache is not None:
+            vector = (await self._cache.get_many([self._cache_key(text)]))[0]
+            if vector is not None:
+                return vector
+        return await self._batcher.submit(text)
 
     async def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """
         複数テキストを埋め込みベクトルに変換。
 
+        キャッシュが有効な場合は、キャッシュにないテキスト（重複は1回）だけをプロバイダーに送り、
+        結果を入力順に戻す。
+
         Args:
             texts: 埋め込むテキストのリスト
 
@@ -183,14 +269,70 @@ class EmbeddingAdapter:
         """
         if not self._embedder:
             raise RuntimeError("Embedding client not initialized. Call connect() first.")
+        if self._cache is None:
+            return await self._embed_uncached(texts)
+
+        vectors = await self._cache.get_many([self._cache_key(text) for text in texts])
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fetched = await self._embed_and_store([texts[i] for i in missing])
+            for i, vector in zip(missing, fetched, strict=True):
+                vectors[i] = vector
+        return vectors  # type: ignore[return-value]
+
+    def _cache_key(self, text: str) -> str:
+        """埋め込みキャッシュのキー。"""
+        return make_key(self._provider, self._model, text)
+
+    async def _embed_and_store(self, texts: list[str]) -> list[list[float]]:
+        """
+        キャッシュを参照せずに埋め込み、結果をキャッシュに保存。
+
+        正規化後に同じテキストはプロバイダーに1回だけ送る。
+        """
+        if self._cache is None:
+            return await self._embed_uncached(texts)
+
+        keys = [self._cache_key(text) for text in texts]
+        unique = dict(zip(keys, texts, strict=True))
+        fetched = await self._embed_uncached(list(unique.values()))
+        stored = await self._cache.set_many(dict(zip(unique, fetched, strict=True)))
+        return [stored[key] for key in keys]
+
+    async def _embed_uncached(self, texts: list[str]) -> list[list[float]]:
+        """
+        プロバイダーを呼び出してテキストを埋め込む。
+
+        上限を超える入力は分割し、レート制限内で並列に呼び出す（一時的なエラーは再試行）。
+        """
+        return await self._scheduler.run(texts)
+
+    async def _call_provider(self, texts: list[str]) -> list[list[float]]:
+        """
+        プロバイダーを1回呼び出す。
 
-        if self._is_ollama:
-            # Ollamaは同期APIで、list[list[float]]を返す
-            return self._embedder.embed(texts)
+        非同期クライアントを持つプロバイダー（Ollama を含む）は aembed を使用し、
+        持たないプロバイダーは同期 API をスレッドで実行するため、イベントループをブロックしない。
+        """
+        aembed = getattr(self._embedder, "aembed", None)
+        if aembed is not None and inspect.iscoroutinefunction(aembed):
+            response = await aembed(texts)
         else:
-            # 他のプロバイダーは非同期APIでEmbeddingResponseを返す
-            response = await self._embedder.aembed(texts)
-            return [item.embedding for item in response.data]
+            response = await asyncio.to_thread(self._embedder.embed, texts)
+        return self._to_vectors(response)
+
+    @staticmethod
+    def _to_vectors(response: Any) -> list[list[float]]:
+        """
+        埋め込みレスポンスをベクトルのリストに正規化。
+
+        esperanto のバージョンにより、EmbeddingResponse（data[i].embedding）または
+        list[list[float]] が返される。
+        """
+        data = getattr(response, "data", None)
+        if data is not None:
+            return [item.embedding for item in data]
+        return [list(vector) for vector in response]
 
     @classmethod
     def get_available_providers(cls) -> list[str]:
@@ -0,0 +1,635 @@
+"""Infrastructure: In-process vector store (NumPy / HNSW)."""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from tengin_mcp.infrastructure.config import Settings
+from tengin_mcp.infrastructure.vector_compression import (
+    REDUCTION_FILE,
+    VectorReducer,
+    binary_scores,
+    int8_scores,
+    quantize_binary,
+    quantize_int8,
+)
+
+try:
+    import hnswlib
+except ImportError:  # pragma: no cover - オプション依存
+    hnswlib = None
+
+logger = logging.getLogger(__name__)
+
+
+class LocalVectorAdapter:
+    """
+    プロセス内で完結するベクトルストア（ChromaDBAdapter と同じインターフェース, 内蔵の埋め込み関数を
+    使う search_by_text は持たない）。
+
+    埋め込みは正規化済みの float32 行列としてディスクに保存し、起動時はメモリマップで読み込む。
+    検索はコサイン類似度（正規化ベクトルの内積）で、件数が hnsw_threshold 以上かつ hnswlib が
+    利用可能な場合は HNSW グラフ、それ以外は NumPy の行列積による全件比較を使用する。
+    メタデータのフィルタ（where）は ChromaDB と同じ構文で、条件ごとの真偽値マスクをキャッシュする。
+
+    次元削減（VECTOR_REDUCTION）はドキュメントとクエリの両方に適用する。量子化
+    （VECTOR_QUANTIZATION）を有効にすると int8 / バイナリのコードをメモリに持って全件比較し、
+    上位 k x VECTOR_RESCORE_FACTOR 件だけをメモリマップの float ベクトルで再スコアリングする。
+
+    upsert / delete / reset はメモリ上の状態だけを更新し（行列は容量を倍々に拡張して追記）、
+    flush で1回だけディスクに書き込んで量子化のコードを作り直す。flush までの検索は float の
+    全件比較になる。検索は await を挟まずに実行するため、書き込みの途中の状態は参照しない。
+    """
+
+    # 行列ファイル（flush ごとに新しい名前で書き出し、index.json の "matrix" で参照する）
+    MATRIX_FILE = "vectors.f32"
+    INDEX_FILE = "index.json"
+
+    def __init__(self, settings: Settings) -> None:
+        """
+        ローカルベクトルストアを初期化。
+
+        Args:
+            settings: アプリケーション設定
+        """
+        self._path = Path(settings.local_vector_path)
+        self._hnsw_threshold = settings.local_vector_hnsw_threshold
+        self._reducer = VectorReducer.from_settings(settings)
+        self._quantization = settings.vector_quantization
+        self._rescore_factor = settings.vector_rescore_factor
+        self._connected = False
+        self._ids: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._documents: list[str] = []
+        self._metadatas: list[dict[str, Any]] = []
+        self._matrix: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        # 書き込み用の行列のバッファ（None 以外の場合、_matrix は先頭の行のビュー）
+        self._buffer: np.ndarray | None = None
+        self._matrix_file = self.MATRIX_FILE
+        self._version = 0
+        self._dirty = False
+        self._codes: np.ndarray | None = None
+        self._scales: np.ndarray | None = None
+        self._masks: dict[tuple[str, str], np.ndarray] = {}
+        self._hnsw: Any = None
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> None:
+        """ディスクからインデックスを読み込む（行列はメモリマップ）。"""
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._reducer = await asyncio.to_thread(self._reducer.load, self._path / REDUCTION_FILE)
+        index_path = self._path / self.INDEX_FILE
+        if index_path.exists():
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            matrix_file = index.get("matrix", self.MATRIX_FILE)
+            dim = index["dim"]
+            self._check_matrix_file(matrix_file, len(index["ids"]), dim)
+            self._ids = index["ids"]
+            self._documents = index["documents"]
+            self._metadatas = index["metadatas"]
+            self._matrix_file = matrix_file
+            self._version = index.get("version", 0)
+            self._matrix = self._open_matrix(len(self._ids), dim)
+            self._buffer = None
+            self._positions = {doc_id: i for i, doc_id in enumerate(self._ids)}
+            self._codes, self._scales = await asyncio.to_thread(self._quantize, self._matrix)
+            built = index.get("compression", {}).get("vector_reduction", "none")
+            if self._ids and built != self._reducer.method:
+                logger.warning(
+                    "Local vector store was built with VECTOR_REDUCTION=%s; rebuild the index",
+                    built,
+                )
+        self._connected = True
+        logger.info("Loaded local vector store at %s (%d documents)", self._path, len(self._ids))
+
+    async def close(self) -> None:
+        """未保存の変更を書き込んでインデックスを解放。"""
+        if self._connected:
+            async with self._lock:
+                await self._flush()
+        self._connected = False
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._buffer = None
+        self._codes = self._scales = None
+        self._hnsw = None
+        self._masks.clear()
+        logger.info("Closed local vector store")
+
+    def _ensure_connected(self) -> None:
+        """接続済みか確認。"""
+        if not self._connected:
+            raise RuntimeError("Local vector store not connected")
+
+    @property
+    def reducer(self) -> VectorReducer:
+        """ドキュメントとクエリに適用する次元削減。"""
+        return self._reducer
+
+    @property
+    def requires_rebuild(self) -> bool:
+        """作り直しが必要か（常にコサイン類似度で検索するため False）。"""
+        return False
+
+    def _check_matrix_file(self, matrix_file: str, rows: int, dim: int) -> None:
+        """
+        行列ファイルのサイズが index.json の件数 x 次元と一致するか確認。
+
+        Raises:
+            RuntimeError: 一致しない場合（書き込みの中断・ファイルの破損, インデックスの再構築が必要）
+        """
+        if rows == 0:
+            return
+        path = self._path / matrix_file
+        size = path.stat().st_size if path.exists() else 0
+        expected = rows * dim * np.dtype(np.float32).itemsize
+        if size != expected:
+            raise RuntimeError(
+                f"Local vector store at {self._path} is inconsistent: {matrix_file} has "
+                f"{size} bytes, expected {expected} ({rows} x {dim} float32); rebuild the index"
+            )
+
+    def _open_matrix(self, rows: int, dim: int) -> np.ndarray:
+        """保存済みの行列をメモリマップで開く（アクセスした行だけが読み込まれる）。"""
+        if rows == 0:
+            return np.zeros((0, dim), dtype=np.float32)
+        return np.memmap(
+            self._path / self._matrix_file, dtype=np.float32, mode="r", shape=(rows, dim)
+        )
+
+    def _quantize(self, matrix: np.ndarray) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """行列を量子化（量子化しない・空の場合は (None, None)）。"""
+        if self._quantization == "none" or len(matrix) == 0:
+            return None, None
+        matrix = np.asarray(matrix)
+        if self._quantization == "binary":
+            return quantize_binary(matrix), None
+        return quantize_int8(matrix)
+
+    def _reserve(self, rows: int, dim: int) -> np.ndarray:
+        """
+        rows 行を書き込めるメモリ上のバッファを返す。
+
+        容量は倍々に拡張するため、バッチごとの追記で既存の行をコピーし直すことはない。
+        メモリマップの行列は最初の書き込み時に一度だけメモリに読み込む。
+        """
+        buffer = self._buffer
+        if buffer is None or len(buffer) < rows:
+            current = len(self._matrix)
+            buffer = np.empty((max(rows, 2 * current), dim), dtype=np.float32)
+            if current:
+                buffer[:current] = self._matrix
+            self._buffer = buffer
+        return buffer
+
+    def _changed(self) -> None:
+        """書き込み後の状態に切り替える（検索用のキャッシュを破棄し、flush まで未保存）。"""
+        if self._buffer is not None:
+            self._matrix = self._buffer[: len(self._ids)]
+        self._codes = self._scales = None
+        self._masks = {}
+        self._hnsw = None
+        self._dirty = True
+
+    def _persist(self, matrix: np.ndarray) -> None:
+        """
+        現在の状態をディスクに書き込む。
+
+        行列は新しい名前のファイルに書き出し、それを参照する index.json を一時ファイルからの
+        置き換えで切り替えてから古い行列ファイルを削除するため、途中で中断しても index.json は
+        常に書き込みが完了した行列を参照する。
+        """
+        version = self._version + 1
+        matrix_file = f"vectors-{version}.f32"
+        index_tmp = self._path / f"{self.INDEX_FILE}.tmp"
+        matrix.tofile(self._path / matrix_file)
+        with open(index_tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "dim": int(matrix.shape[1]),
+                    "version": version,
+                    "matrix": matrix_file,
+                    "compression": {
+                        **self._reducer.metadata(),
+                        "vector_quantization": self._quantization,
+                    },
+                    "ids": self._ids,
+                    "documents": self._documents,
+                    "metadatas": self._metadatas,
+                },
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(index_tmp, self._path / self.INDEX_FILE)
+        self._matrix_file, self._version = matrix_file, version
+        for path in self._path.glob("vectors*.f32"):
+            if path.name != matrix_file:
+                # Windows ではメモリマップ中のファイルを削除できないため、次回の flush で削除する
+                with contextlib.suppress(OSError):
+                    path.unlink()
+
+    async def _flush(self) -> None:
+        """未保存の変更を書き込む（ロックを取得して呼び出す）。"""
+        if not self._dirty:
+            return
+        matrix = self._matrix
+        codes, scales = await asyncio.to_thread(self._quantize, matrix)
+        await asyncio.to_thread(self._persist, matrix)
+        self._codes, self._scales = codes, scales
+        if codes is not None or self._buffer is None:
+            # 量子化する場合は float の行列をメモリマップに切り替えて再スコアリングにだけ使う
+            self._buffer = None
+            self._matrix = self._open_matrix(*matrix.shape)
+        self._dirty = False
+
+    async def flush(self) -> None:
+        """
+        未保存の変更をディスクに書き込み、量子化する場合はコードを作り直す。
+
+        同期や一括書き込みの最後に1回呼び出す（close 時にも未保存の変更を書き込む）。
+        """
+        self._ensure_connected()
+        async with self._lock:
+            await self._flush()
+
+    async def add_documents(
+        self,
+        ids: list[str],
+        documents: list[str],
+        embeddings: list[list[float]] | None = None,
+        metadatas: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        ドキュメントを追加。
+
+        Args:
+            ids: ドキュメントID
+            documents: ドキュメントテキスト
+            embeddings: 埋め込みベクトル（必須, 内蔵埋め込みはない）
+            metadatas: メタデータ（オプション）
+        """
+        if not embeddings:
+            raise ValueError("Local vector store requires embeddings")
+        existing = [doc_id for doc_id in ids if doc_id in self._positions]
+        if existing:
+            raise ValueError(f"IDs already exist: {existing[:5]}")
+        await self.upsert_documents(ids, documents, embeddings, metadatas)
+
+    async def upsert_documents(
+        self,
+        ids: list[str],
+        documents: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict[str, Any]] | None = None,
+    ) -> None:
+        """
+        ドキュメントを追加または更新（ID単位で冪等, ディスクへの書き込みは flush で行う）。
+
+        Args:
+            ids: ドキュメントID
+            documents: ドキュメントテキスト
+            embeddings: 埋め込みベクトル
+            metadatas: メタデータ（オプション）
+        """
+        self._ensure_connected()
+        vectors = self._reducer.transform(embeddings)
+        metadatas = metadatas or [{} for _ in ids]
+        if not len(ids) == len(documents) == len(metadatas) == len(vectors):
+            raise ValueError("ids, documents, embeddings and metadatas must have the same length")
+        async with self._lock:
+            if self._ids and vectors.shape[1] != self._matrix.shape[1]:
+                raise ValueError(
+                    f"Embedding dimension mismatch: {vectors.shape[1]} != {self._matrix.shape[1]}"
+                )
+            rows: list[int] = []
+            for doc_id, document, metadata in zip(ids, documents, metadatas, strict=True):
+                position = self._positions.get(doc_id)
+                if position is None:
+                    position = self._positions[doc_id] = len(self._ids)
+                    self._ids.append(doc_id)
+                    self._documents.append(document)
+                    self._metadatas.append(dict(metadata))
+                else:
+                    self._documents[position] = document
+                    self._metadatas[position] = dict(metadata)
+                rows.append(position)
+
+            self._reserve(len(self._ids), vectors.shape[1])[rows] = vectors
+            self._changed()
+
+    async def set_reducer(self, reducer: VectorReducer) -> None:
+        """
+        学習済みの次元削減を設定して保存（reset 後の空のストアに対して呼び出す）。
+
+        Args:
+            reducer: 次元削減
+
+        Raises:
+            ValueError: ドキュメントが残っている場合
+        """
+        self._ensure_connected()
+        async with self._lock:
+            if self._ids:
+                raise ValueError("Reset the vector store before changing the reduction")
+            await asyncio.to_thread(reducer.save, self._path / REDUCTION_FILE)
+            self._reducer = reducer
+
+    async def reset(self) -> None:
+        """全ドキュメントを削除（次元削減の変更時にインデックスを作り直す）。"""
+        self._ensure_connected()
+        async with self._lock:
+            self._ids, self._documents, self._metadatas = [], [], []
+            self._positions = {}
+            self._buffer = None
+            self._matrix = np.zeros((0, 0), dtype=np.float32)
+            self._changed()
+
+    async def load_vectors(
+        self,
+        ids: list[str],
+        documents: list[str],
+        vectors: np.ndarray,
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """
+        変換済みのベクトルを空のストアに一括で書き込む（スナップショットの読み込み用）。
+
+        次元削減は適用せず、メモリマップの行列をそのままファイルに書き出して開き直す（flush 済み）。
+
+        Args:
+            ids: ドキュメントID
+            documents: ドキュメントテキスト
+            vectors: 次元削減・正規化済みのベクトル（n x dim）
+            metadatas: メタデータ
+
+        Raises:
+            ValueError: ドキュメントが残っている場合
+        """
+        self._ensure_connected()
+        async with self._lock:
+            if self._ids:
+                raise ValueError("Reset the vector store before loading vectors")
+            self._ids = list(ids)
+            self._documents = list(documents)
+            self._metadatas = [dict(m) for m in metadatas]
+            self._positions = {doc_id: i for i, doc_id in enumerate(self._ids)}
+            self._buffer = None
+            self._matrix = vectors
+            self._changed()
+            await self._flush()
+
+    async def get_vectors(self) -> dict[str, Any]:
+        """
+        全ドキュメントのベクトル・本文・メタデータを取得（スナップショットの書き出し用）。
+
+        Returns:
+            {"ids": [...], "embeddings": ndarray, "documents": [...], "metadatas": [...]}
+        """
+        self._ensure_connected()
+        return {
+            "ids": list(self._ids),
+            "embeddings": self._matrix,
+            "documents": list(self._documents),
+            "metadatas": [dict(m) for m in self._metadatas],
+        }
+
+    async def get_metadatas(self) -> dict[str, dict[str, Any]]:
+        """
+        全ドキュメントのメタデータを取得。
+
+        Returns:
+            ドキュメントID → メタデータ
+        """
+        self._ensure_connected()
+        return {doc_id: dict(m) for doc_id, m in zip(self._ids, self._metadatas, strict=True)}
+
+    async def delete_documents(self, ids: list[str]) -> None:
+        """
+        ドキュメントを削除。
+
+        Args:
+            ids: 削除するドキュメントID
+        """
+        self._ensure_connected()
+        remove = {doc_id for doc_id in ids if doc_id in self._positions}
+        if not remove:
+            return
+        async with self._lock:
+            keep = [i for i, doc_id in enumerate(self._ids) if doc_id not in remove]
+            self._buffer = np.array(self._matrix[keep], dtype=np.float32)
+            self._ids = [self._ids[i] for i in keep]
+            self._documents = [self._documents[i] for i in keep]
+            self._metadatas = [self._metadatas[i] for i in keep]
+            self._positions = {doc_id: i for i, doc_id in enumerate(self._ids)}
+            self._changed()
+
+    def _equals_mask(self, key: str, value: Any) -> np.ndarray:
+        """key == value のマスク（条件ごとにキャッシュ）。"""
+        cache_key = (key, json.dumps(value, sort_keys=True))
+        mask = self._masks.get(cache_key)
+        if mask is None:
+            mask = np.fromiter(
+                (m.get(key) == value for m in self._metadatas), dtype=bool, count=len(self._ids)
+            )
+            self._masks[cache_key] = mask
+        return mask
+
+    def _mask(self, where: dict[str, Any]) -> np.ndarray:
+        """
+        ChromaDB 形式の where 条件を真偽値マスクに変換。
+
+        サポートする演算子: $and, $or, $eq, $ne, $in, $nin, $gt, $gte, $lt, $lte
+        """
+        mask = np.ones(len(self._ids), dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for clause in condition:
+                    mask &= self._mask(clause)
+            elif key == "$or":
+                any_mask = np.zeros(len(self._ids), dtype=bool)
+                for clause in condition:
+                    any_mask |= self._mask(clause)
+                mask &= any_mask
+            elif isinstance(condition, dict):
+                for operator, value in condition.items():
+                    mask &= self._operator_mask(key, operator, value)
+            else:
+                mask &= self._equals_mask(key, condition)
+        return mask
+
+    def _operator_mask(self, key: str, operator: str, value: Any) -> np.ndarray:
+        """演算子付き条件のマスク。"""
+        match operator:
+            case "$eq":
+                return self._equals_mask(key, value)
+            case "$ne":
+                return ~self._equals_mask(key, value)
+            case "$in" | "$nin":
+                mask = np.zeros(len(self._ids), dtype=bool)
+                for item in value:
+                    mask |= self._equals_mask(key, item)
+                return mask if operator == "$in" else ~mask
+            case "$gt" | "$gte" | "$lt" | "$lte":
+                compare = {
+                    "$gt": lambda a: a > value,
+                    "$gte": lambda a: a >= value,
+                    "$lt": lambda a: a < value,
+                    "$lte": lambda a: a <= value,
+                }[operator]
+                return np.fromiter(
+                    (
+                        isinstance(m.get(key), int | float) and compare(m[key])
+                        for m in self._metadatas
+                    ),
+                    dtype=bool,
+                    count=len(self._ids),
+                )
+        raise ValueError(f"Unsupported where operator: {operator}")
+
+    def _use_hnsw(self) -> bool:
+        """HNSW で検索するか（hnswlib が利用可能・量子化なし・件数がしきい値以上）。"""
+        return (
+            hnswlib is not None
+            and self._quantization == "none"
+            and len(self._ids) >= self._hnsw_threshold
+        )
+
+    def _build_hnsw(self) -> None:
+        """
+        現在のスナップショットから HNSW インデックスを構築。
+
+        構築中に更新があった場合、古いインデックスは採用しない。
+        """
+        matrix = self._matrix
+        index = hnswlib.Index(space="ip", dim=matrix.shape[1])
+        index.init_index(max_elements=matrix.shape[0], ef_construction=200, M=16)
+        index.add_items(np.asarray(matrix), np.arange(matrix.shape[0]))
+        if self._matrix is matrix:
+            self._hnsw = index
+
+    def _query(
+        self, queries: np.ndarray, n_results: int, mask: np.ndarray | None
+    ) -> list[tuple[np.ndarray, np.ndarray]]:
+        """
+        クエリごとにk近傍を検索。
+
+        Args:
+            queries: 正規化済みのクエリ行列（クエリ数 x 次元）
+            n_results: クエリごとの結果数
+            mask: 候補のマスク（None は全件）
+
+        Returns:
+            クエリごとの (行番号, コサイン距離)（距離の昇順）
+        """
+        candidates = len(self._ids) if mask is None else int(mask.sum())
+        k = min(n_results, candidates)
+        if k == 0:
+            empty = (np.array([], dtype=np.int64), np.array([], dtype=np.float32))
+            return [empty for _ in range(len(queries))]
+
+        if self._hnsw is not None:
+            index = self._hnsw
+            index.set_ef(max(64, k))
+            filter_fn = None if mask is None else (lambda label: bool(mask[label]))
+            labels, distances = index.knn_query(queries, k=k, filter=filter_fn)
+            return [(labels[i].astype(np.int64), distances[i]) for i in range(len(queries))]
+
+        rows = np.arange(len(self._ids)) if mask is None else np.flatnonzero(mask)
+        codes = self._codes
+        # 候補数 x クエリ数 の類似度を1回の行列積で計算（量子化時は近似値）
+        if codes is None:
+            scores = self._matrix[rows] @ queries.T
+            pool = k
+        else:
+            codes = codes if mask is None else codes[rows]
+            if self._scales is None:
+                scores = binary_scores(codes, queries, queries.shape[1])
+            else:
+                scores = int8_scores(codes, self._scales, queries)
+            pool = min(len(rows), k * self._rescore_factor)
+        results = []
+        for query, column in zip(queries, scores.T, strict=True):
+            if pool < len(rows):
+                top = np.argpartition(-column, pool - 1)[:pool]
+            else:
+                top = np.arange(len(rows))
+            candidates = rows[top]
+            if codes is None:
+                similarities = column[top]
+            else:
+                # 近似スコアの上位候補だけを float ベクトルで再スコアリング
+                similarities = np.asarray(self._matrix[candidates]) @ query
+            order = np.argsort(-similarities, kind="stable")[:k]
+            results.append((candidates[order], 1.0 - similarities[order]))
+        return results
+
+    async def search(
+        self,
+        query_embedding: list[float],
+        n_results: int = 5,
+        where: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        ベクトル検索（ChromaDB の query と同じ形式で返す）。
+
+        Args:
+            query_embedding: クエリの埋め込みベクトル
+            n_results: 返す結果数
+            where: フィルタ条件
+
+        Returns:
+            検索結果
+        """
+        return await self.search_many([query_embedding], n_results=n_results, where=where)
+
+    async def search_many(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 5,
+        where: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        複数クエリのベクトル検索（ChromaDB の query と同じ形式で返す）。
+
+        Args:
+            query_embeddings: クエリの埋め込みベクトル
+            n_results: クエリごとに返す結果数
+            where: フィルタ条件（全クエリ共通）
+
+        Returns:
+            検索結果（ids 等はクエリごとのリスト）
+        """
+        self._ensure_connected()
+        queries = self._reducer.transform(query_embeddings)
+        if self._use_hnsw() and self._hnsw is None:
+            await asyncio.to_thread(self._build_hnsw)
+        mask = self._mask(where) if where else None
+        results: dict[str, Any] = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        for rows, distances in self._query(queries, n_results, mask):
+            results["ids"].append([self._ids[i] for i in rows])
+            results["documents"].append([self._documents[i] for i in rows])
+            results["metadatas"].append([self._metadatas[i] for i in rows])
+            results["distances"].append([float(d) for d in distances])
+        return results
+
+    async def get_count(self) -> int:
+        """ドキュメント数を取得。"""
+        self._ensure_connected()
+        return len(self._ids)
+
+    async def heartbeat(self) -> int:
+        """
+        ハートビートを取得。
+
+        Returns:
+            現在時刻（ナノ秒）
+        """
+        self._ensure_connected()
+        return time.time_ns()
@@ -47,6 +47,22 @@ class Neo4jAdapter:
             self._driver = None
             logger.info("Disconnected from Neo4j")
 
+    async def ping(self) -> None:
+        """
+        プール済みドライバーで `RETURN 1` を実行して疎通を確認。
+
+        Raises:
+            DatabaseConnectionError: 未接続または疎通に失敗した場合
+        """
+        try:
+            async with self.session() as session:
+                result = await session.run("RETURN 1")
+                await result.consume()
+        except DatabaseConnectionError:
+            raise
+        except Exception as e:
+            raise DatabaseConnectionError(f"Neo4j ping failed: {e}") from e
+
     @asynccontextmanager
     async def session(self) -> AsyncIterator[AsyncSession]:
         """セッションのコンテキストマネージャ。"""
@@ -0,0 +1,185 @@
+"""Infrastructure: Reranker Adapter (sentence-transformers cross-encoder or lexical overlap)."""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any
+
+from tengin_mcp.infrastructure.config import Settings
+
+try:
+    from sentence_transformers import CrossEncoder
+except ImportError:  # pragma: no cover - オプション依存（rerank）
+    CrossEncoder = None
+
+logger = logging.getLogger(__name__)
+
+# 英数字の単語
+_WORD = re.compile(r"[a-z0-9]+")
+# 英数字・空白・句読点以外の連続（日本語など, 文字バイグラムに分割する）
+_CJK_RUN = re.compile(r"[^\x00-\x7f\s、。，．・：；！？「」『』（）【】〈〉《》]+")
+
+
+def lexical_terms(text: str) -> set[str]:
+    """テキストを語彙の集合に変換（英数字は単語, それ以外は文字バイグラム）。"""
+    text = text.lower()
+    terms = set(_WORD.findall(text))
+    for run in _CJK_RUN.findall(text):
+        if len(run) == 1:
+            terms.add(run)
+        terms.update(run[i : i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def lexical_score(query: str, document: str) -> float:
+    """クエリの語彙のうちドキュメントに含まれる割合（0〜1）。"""
+    query_terms = lexical_terms(query)
+    if not query_terms:
+        return 0.0
+    return len(query_terms & lexical_terms(document)) / len(query_terms)
+
+
+class RerankerAdapter:
+    """
+    クエリとドキュメントのペアをスコアリングするアダプター。
+
+    - transformers: sentence-transformers の CrossEncoder によるローカル cross-encoder
+      （`uv sync --extra rerank`）
+    - lexical: 語彙の重なりによる軽量なスコア（モデル不要）
+
+    ペアはバッチに分けてスコアリングし、スコアは LRU キャッシュに保存する。
+    レイテンシ予算を超えた場合は残りのバッチをスコアリングせずに打ち切る。
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """
+        Rerankerアダプターを初期化。
+
+        Args:
+            settings: アプリケーション設定
+        """
+        self._provider = settings.rerank_provider
+        self._model_name = settings.rerank_model if self._provider == "transformers" else "lexical"
+        self._batch_size = settings.rerank_batch_size
+        self._cache_size = settings.rerank_cache_size
+        self._cache: OrderedDict[str, float] = OrderedDict()
+        self._model: Any = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def model_name(self) -> str:
+        """スコアリングに使用するモデル名。"""
+        return self._model_name
+
+    async def connect(self) -> None:
+        """cross-encoder モデルを読み込む（lexical の場合は何もしない）。"""
+        if self._provider != "transformers":
+            return
+        if CrossEncoder is None:
+            raise RuntimeError(
+                "Reranker initialization failed: sentence-transformers is not installed "
+                '(pip install "tengin-mcp[rerank]")'
+            )
+        try:
+            # モデルの読み込みは同期処理のためスレッドで実行
+            self._model = await asyncio.to_thread(CrossEncoder, self._model_name)
+            logger.info(f"Reranker initialized: provider=transformers, model={self._model_name}")
+        except Exception as e:
+            logger.error(f"Failed to initialize reranker: {e}")
+            raise RuntimeError(f"Reranker initialization failed: {e}") from e
+
+    async def close(self) -> None:
+        """モデルとキャッシュを解放。"""
+        self._model = None
+        self._cache.clear()
+
+    async def score(
+        self,
+        query: str,
+        documents: list[str],
+        budget_seconds: float | None = None,
+    ) -> list[float | None]:
+        """
+        クエリと各ドキュメントの関連度をスコアリング。
+
+        キャッシュにないペアだけをバッチに分けてスコアリングする。予算を使い切った場合、
+        スコアリングできなかったドキュメントは None になる（完了したバッチはキャッシュされる）。
+
+        Args:
+            query: クエリ
+            documents: ドキュメント
+            budget_seconds: レイテンシ予算（秒, None で無制限）
+
+        Returns:
+            ドキュメントごとのスコア（入力順）
+        """
+        deadline = None if budget_seconds is None else time.monotonic() + budget_seconds
+        keys = [self._key(query, document) for document in documents]
+        scores: list[float | None] = [self._get(key) for key in keys]
+        pending = [i for i, score in enumerate(scores) if score is None]
+
+        for start in range(0, len(pending), self._batch_size):
+            batch = pending[start : start + self._batch_size]
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                batch_scores = await asyncio.wait_for(
+                    self._score_batch(query, [documents[i] for i in batch]), timeout=remaining
+                )
+            except TimeoutError:
+                logger.info(f"Rerank latency budget exceeded after {start} of {len(pending)} pairs")
+                break
+            for i, value in zip(batch, batch_scores, strict=True):
+                scores[i] = value
+                self._put(keys[i], value)
+        return scores
+
+    def cache_stats(self) -> dict[str, Any]:
+        """ペアスコアのキャッシュ統計を取得。"""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total * 100, 2) if total else 0.0,
+            "size": len(self._cache),
+            "max_size": self._cache_size,
+        }
+
+    async def _score_batch(self, query: str, documents: list[str]) -> list[float]:
+        """1バッチをスコアリング。"""
+        if self._model is None:
+            return [lexical_score(query, document) for document in documents]
+        # predict はペアごとのスコアを返し、リクエスト単位の正規化をしないため
+        # バッチ間やキャッシュしたスコアと比較できる
+        pairs = [(query, document) for document in documents]
+        scores = await asyncio.to_thread(self._model.predict, pairs)
+        return [float(score) for score in scores]
+
+    def _key(self, query: str, document: str) -> str:
+        """(モデル, クエリ, ドキュメント) のキャッシュキー。"""
+        digest = hashlib.sha256(f"{query}\x00{document}".encode()).hexdigest()
+        return f"{self._model_name}:{digest}"
+
+    def _get(self, key: str) -> float | None:
+        """キャッシュからスコアを取得（LRU の順序を更新）。"""
+        score = self._cache.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def _put(self, key: str, score: float) -> None:
+        """スコアをキャッシュに保存（上限を超えたら古いものから削除）。"""
+        if self._cache_size <= 0:
+            return
+        self._cache[key] = score
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
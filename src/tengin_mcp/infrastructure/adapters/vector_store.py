@@ -0,0 +1,74 @@
+"""Infrastructure: Vector store selection."""
+
+from pathlib import Path
+
+from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+from tengin_mcp.infrastructure.adapters.local_vector_adapter import LocalVectorAdapter
+from tengin_mcp.infrastructure.config import Settings
+
+# ChromaDBAdapter と LocalVectorAdapter は同じインターフェースを持つ
+# （search_by_text は ChromaDB の内蔵埋め込み専用のため共通のインターフェースに含めない）
+VectorStore = ChromaDBAdapter | LocalVectorAdapter
+
+
+def create_vector_store(settings: Settings) -> VectorStore:
+    """
+    設定（VECTOR_BACKEND）に応じたベクトルストアを作成。
+
+    Args:
+        settings: アプリケーション設定
+
+    Returns:
+        ベクトルストア（未接続）
+    """
+    if settings.vector_backend == "local":
+        return LocalVectorAdapter(settings)
+    return ChromaDBAdapter(settings)
+
+
+def english_view_settings(settings: Settings) -> Settings | None:
+    """
+    英語ビューを別のモデルで埋め込む場合の設定。
+
+    埋め込みモデルを EMBEDDING_PROVIDER_EN / EMBEDDING_MODEL_EN に置き換え、
+    コレクション名に _en を付け、ローカルストアは en サブディレクトリを使用する。
+
+    Args:
+        settings: アプリケーション設定
+
+    Returns:
+        英語ビュー用の設定（MULTILINGUAL_INDEX が無効、または同じモデルの場合は None で、
+        英語ビューは通常のストアに格納する）
+    """
+    if not settings.multilingual_index:
+        return None
+    provider = settings.embedding_provider_en or settings.embedding_provider
+    model = settings.embedding_model_en or settings.embedding_model
+    if (provider, model) == (settings.embedding_provider, settings.embedding_model):
+        return None
+    return settings.model_copy(
+        update={
+            "embedding_provider": provider,
+            "embedding_model": model,
+            "chromadb_collection": f"{settings.chromadb_collection}_en",
+            "local_vector_path": str(Path(settings.local_vector_path) / "en"),
+        }
+    )
+
+
+def documents_per_entity(settings: Settings) -> int:
+    """
+    通常のストアにおける1エンティティあたりのドキュメント数の上限。
+
+    英語ビューを同じモデルで構築する場合は日本語・英語の2件を同じストアに格納するため、
+    検索時は limit の2倍を取得してエンティティ単位に重複を除いた後に limit 件へ切り詰める。
+
+    Args:
+        settings: アプリケーション設定
+
+    Returns:
+        MULTILINGUAL_INDEX が有効で英語ビューを通常のストアに格納する場合は 2, それ以外は 1
+    """
+    if settings.multilingual_index and english_view_settings(settings) is None:
+        return 2
+    return 1
@@ -17,8 +17,22 @@ EmbeddingProvider = Literal[
     "voyage",
     "jina",
     "transformers",
+    "stub",
 ]
 
+# サポートされるベクトルストア
+VectorBackend = Literal["chromadb", "local"]
+
+# ChromaDB のコレクション構成（single: 1コレクション / entity_type: エンティティタイプ別）
+CollectionLayout = Literal["single", "entity_type"]
+
+# 埋め込みの次元削減（none で無効）と量子化（none で無効）
+VectorReduction = Literal["none", "matryoshka", "pca"]
+VectorQuantization = Literal["none", "int8", "binary"]
+
+# サポートされるリランカー（none で無効）
+RerankProvider = Literal["none", "lexical", "transformers"]
+
 
 class Settings(BaseSettings):
     """アプリケーション設定。"""
@@ -34,12 +48,78 @@ class Settings(BaseSettings):
     neo4j_user: str = Field(default="neo4j", alias="NEO4J_USER")
     neo4j_password: str = Field(default="password", alias="NEO4J_PASSWORD")
 
+    # Vector Store Configuration
+    # chromadb: ChromaDB / local: プロセス内のベクトルストア（NumPy / HNSW）
+    vector_backend: VectorBackend = Field(default="chromadb", alias="VECTOR_BACKEND")
+    local_vector_path: str = Field(default="./data/vectors", alias="LOCAL_VECTOR_PATH")
+    # この件数以上で HNSW を使用（hnswlib が必要, 未満は NumPy の全件比較）
+    local_vector_hnsw_threshold: int = Field(
+        default=20000, ge=0, alias="LOCAL_VECTOR_HNSW_THRESHOLD"
+    )
+    # 埋め込みの次元削減（matryoshka: 対応モデルで先頭の次元に切り詰め / pca: 構築時に学習）
+    vector_reduction: VectorReduction = Field(default="none", alias="VECTOR_REDUCTION")
+    vector_dimensions: int = Field(default=0, ge=0, alias="VECTOR_DIMENSIONS")
+    # 量子化したコードで候補を絞り、上位 k x 倍率件を float で再スコアリング（local のみ）
+    vector_quantization: VectorQuantization = Field(default="none", alias="VECTOR_QUANTIZATION")
+    vector_rescore_factor: int = Field(default=4, ge=1, alias="VECTOR_RESCORE_FACTOR")
+
     # ChromaDB Configuration
     chromadb_path: str = Field(default="./data/chromadb", alias="CHROMADB_PATH")
+    chromadb_collection: str = Field(default="education_theories", alias="CHROMADB_COLLECTION")
+    # 設定時は AsyncHttpClient でサーバーに接続（例: http://localhost:8000）
+    chromadb_url: str = Field(default="", alias="CHROMADB_URL")
+    # 永続化モードで同期 API を実行するスレッドプールのサイズ
+    chromadb_max_workers: int = Field(default=4, ge=1, alias="CHROMADB_MAX_WORKERS")
+    # entity_type: タイプ別コレクションに格納し、検索はフィルタのタイプのコレクションだけを並列に検索
+    chromadb_collection_layout: CollectionLayout = Field(
+        default="single", alias="CHROMADB_COLLECTION_LAYOUT"
+    )
 
     # Embedding Provider Configuration (using esperanto)
     embedding_provider: EmbeddingProvider = Field(default="openai", alias="EMBEDDING_PROVIDER")
     embedding_model: str = Field(default="text-embedding-3-small", alias="EMBEDDING_MODEL")
+    # ベクトルインデックス構築時のバッチサイズ（プロバイダー上限で制限）と同時実行バッチ数
+    embedding_batch_size: int = Field(default=64, ge=1, alias="EMBEDDING_BATCH_SIZE")
+    embedding_concurrency: int = Field(default=4, ge=1, alias="EMBEDDING_CONCURRENCY")
+    # 埋め込みのレート制限（1分あたり, 0 でプロバイダーの既定値）と一時的なエラーの再試行回数
+    embedding_requests_per_minute: int = Field(
+        default=0, ge=0, alias="EMBEDDING_REQUESTS_PER_MINUTE"
+    )
+    embedding_tokens_per_minute: int = Field(default=0, ge=0, alias="EMBEDDING_TOKENS_PER_MINUTE")
+    embedding_max_retries: int = Field(default=5, ge=0, alias="EMBEDDING_MAX_RETRIES")
+    # 同時に到着した1件ずつの埋め込み要求をまとめる時間（ミリ秒, 0 でバッチ化しない）
+    embedding_batch_window_ms: float = Field(default=5.0, ge=0, alias="EMBEDDING_BATCH_WINDOW_MS")
+    # 埋め込みベクトルの永続キャッシュ（SQLite, 空文字で無効）とメモリ上の LRU エントリ数
+    embedding_cache_path: str = Field(
+        default="./data/embedding_cache.db", alias="EMBEDDING_CACHE_PATH"
+    )
+    embedding_cache_size: int = Field(default=10000, ge=0, alias="EMBEDDING_CACHE_SIZE")
+    # 各エンティティの英語ビュー（name_en・英語の原語や書名）も埋め込む。
+    # 英語ビュー用のモデル（空文字は EMBEDDING_PROVIDER / EMBEDDING_MODEL と同じ）が異なる場合は
+    # 別のコレクションに格納し、英語のクエリは両方を検索して RRF で統合する
+    multilingual_index: bool = Field(default=False, alias="MULTILINGUAL_INDEX")
+    embedding_provider_en: EmbeddingProvider | Literal[""] = Field(
+        default="", alias="EMBEDDING_PROVIDER_EN"
+    )
+    embedding_model_en: str = Field(default="", alias="EMBEDDING_MODEL_EN")
+    # セマンティック検索の結果キャッシュ（エントリ数, 0 で無効）・有効期間（秒）・
+    # 近似一致とみなすクエリ埋め込みのコサイン類似度
+    search_cache_size: int = Field(default=1000, ge=0, alias="SEARCH_CACHE_SIZE")
+    search_cache_ttl_seconds: float = Field(default=600.0, gt=0, alias="SEARCH_CACHE_TTL_SECONDS")
+    search_cache_similarity: float = Field(
+        default=0.95, gt=0, le=1, alias="SEARCH_CACHE_SIMILARITY"
+    )
+
+    # Reranker Configuration
+    # lexical: 語彙の重なり / transformers: esperanto 経由のローカル cross-encoder
+    rerank_provider: RerankProvider = Field(default="none", alias="RERANK_PROVIDER")
+    rerank_model: str = Field(default="BAAI/bge-reranker-v2-m3", alias="RERANK_MODEL")
+    # リランクする上位候補数と1回のスコアリングのペア数
+    rerank_top_n: int = Field(default=30, ge=1, alias="RERANK_TOP_N")
+    rerank_batch_size: int = Field(default=16, ge=1, alias="RERANK_BATCH_SIZE")
+    # リランクのレイテンシ予算（ミリ秒, 0 で無制限）とペアスコアのキャッシュのエントリ数
+    rerank_latency_budget_ms: float = Field(default=300.0, ge=0, alias="RERANK_LATENCY_BUDGET_MS")
+    rerank_cache_size: int = Field(default=4096, ge=0, alias="RERANK_CACHE_SIZE")
 
     # Provider-specific API Keys (esperanto will use these)
     openai_api_key: str = Field(default="", alias="OPENAI_API_KEY")
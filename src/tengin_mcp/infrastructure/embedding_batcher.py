@@ -0,0 +1,83 @@
+"""Infrastructure: Micro-batching of concurrent single-text embedding requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+EmbedFunction = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+
+class EmbeddingBatcher:
+    """
+    同時に到着した1件ずつの埋め込み要求をまとめて1回の呼び出しにするバッチャー。
+
+    最初の要求から window_seconds 経過するか、max_batch_size 件に達した時点で
+    まとめて埋め込み、結果を各要求の Future に返す。
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFunction,
+        max_batch_size: int = 64,
+        window_seconds: float = 0.005,
+    ) -> None:
+        """
+        バッチャーを初期化。
+
+        Args:
+            embed: テキストのリストを埋め込む関数
+            max_batch_size: 1回の呼び出しにまとめる最大件数
+            window_seconds: 要求を集める時間（0 以下でバッチ化しない）
+        """
+        self._embed = embed
+        self._max_batch_size = max(1, max_batch_size)
+        self._window_seconds = window_seconds
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, text: str) -> list[float]:
+        """
+        テキストを埋め込む（他の要求とまとめて実行）。
+
+        Args:
+            text: 埋め込むテキスト
+
+        Returns:
+            埋め込みベクトル
+        """
+        if self._window_seconds <= 0:
+            return (await self._embed([text]))[0]
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window_seconds, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        """保留中の要求を1回の呼び出しで埋め込む。"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[list[float]]]]) -> None:
+        """バッチを埋め込み、結果（または例外）を各 Future に設定。"""
+        try:
+            vectors = await self._embed([text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors, strict=True):
+            if not future.done():
+                future.set_result(vector)
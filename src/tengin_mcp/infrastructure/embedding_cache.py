@@ -0,0 +1,183 @@
+"""Infrastructure: Persistent embedding cache (SQLite + in-memory LRU)."""
+
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+from tengin_mcp.infrastructure.cache import CacheStats
+
+# 1回の SELECT ... IN (...) に渡すキー数（SQLite のパラメータ数上限対策）
+_READ_CHUNK_SIZE = 500
+
+
+def normalize_text(text: str) -> str:
+    """キャッシュキー用にテキストを正規化（NFKC・空白の連続を1つに）。"""
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def make_key(provider: str, model: str, text: str) -> str:
+    """(プロバイダー, モデル, 正規化テキストのハッシュ) からキャッシュキーを作成。"""
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"{provider}/{model}:{digest}"
+
+
+def _encode(vector: list[float]) -> bytes:
+    """ベクトルを float32 のバイト列に変換。"""
+    return array("f", vector).tobytes()
+
+
+def _decode(blob: bytes) -> list[float]:
+    """float32 のバイト列をベクトルに変換。"""
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector.tolist()
+
+
+class EmbeddingCache:
+    """
+    埋め込みベクトルの永続キャッシュ。
+
+    ベクトルは float32 で SQLite に保存し、直近に使用したエントリはメモリ上の LRU に保持する。
+    ディスク I/O はスレッドで実行するため、イベントループをブロックしない。
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000) -> None:
+        """
+        キャッシュを初期化。
+
+        Args:
+            path: SQLite ファイルのパス
+            max_entries: メモリ上の LRU に保持する最大エントリ数
+        """
+        self._path = path
+        self._max_entries = max(0, max_entries)
+        self._memory: OrderedDict[str, list[float]] = OrderedDict()
+        self._stats = CacheStats()
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        """SQLite 接続を取得（初回はテーブルを作成）。"""
+        if self._conn is None:
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def _read(self, keys: list[str]) -> dict[str, list[float]]:
+        """ディスクからベクトルを読み込む。"""
+        rows: list[tuple[str, bytes]] = []
+        with self._lock:
+            conn = self._connection()
+            for i in range(0, len(keys), _READ_CHUNK_SIZE):
+                chunk = keys[i : i + _READ_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    conn.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                )
+        return {key: _decode(blob) for key, blob in rows}
+
+    def _write(self, items: dict[str, bytes]) -> None:
+        """ディスクにベクトルを書き込む。"""
+        with self._lock:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)", items.items()
+            )
+            conn.commit()
+
+    def _remember(self, key: str, vector: list[float]) -> None:
+        """メモリ上の LRU に追加（上限超過時は最も古いエントリを削除）。"""
+        if self._max_entries == 0:
+            return
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+        self._stats.size = len(self._memory)
+        self._stats.max_size = max(self._stats.max_size, self._stats.size)
+
+    async def get_many(self, keys: list[str]) -> list[list[float] | None]:
+        """
+        キャッシュからベクトルを取得（メモリ → ディスクの順）。
+
+        Args:
+            keys: キャッシュキーのリスト
+
+        Returns:
+            入力順のベクトル（ミスは None）
+        """
+        found: dict[str, list[float]] = {}
+        on_disk: list[str] = []
+        for key in dict.fromkeys(keys):
+            vector = self._memory.get(key)
+            if vector is None:
+                on_disk.append(key)
+            else:
+                self._memory.move_to_end(key)
+                found[key] = vector
+
+        if on_disk:
+            loaded = await asyncio.to_thread(self._read, on_disk)
+            for key, vector in loaded.items():
+                self._remember(key, vector)
+            found.update(loaded)
+
+        results = [found.get(key) for key in keys]
+        hits = sum(1 for vector in results if vector is not None)
+        self._stats.hits += hits
+        self._stats.misses += len(results) - hits
+        return results
+
+    async def set_many(self, items: dict[str, list[float]]) -> dict[str, list[float]]:
+        """
+        ベクトルをキャッシュに保存。
+
+        Args:
+            items: キャッシュキー → ベクトル
+
+        Returns:
+            保存した値（float32 に丸めたベクトル）。キャッシュの有無で結果が変わらないよう、
+            呼び出し側はこちらを返す。
+        """
+        encoded = {key: _encode(vector) for key, vector in items.items()}
+        if encoded:
+            await asyncio.to_thread(self._write, encoded)
+        stored = {key: _decode(blob) for key, blob in encoded.items()}
+        for key, vector in stored.items():
+            self._remember(key, vector)
+        return stored
+
+    async def clear(self) -> None:
+        """メモリとディスクのキャッシュをクリア。"""
+        self._memory.clear()
+        self._stats.size = 0
+
+        def delete_all() -> None:
+            with self._lock:
+                conn = self._connection()
+                conn.execute("DELETE FROM embeddings")
+                conn.commit()
+
+        await asyncio.to_thread(delete_all)
+
+    def get_stats(self) -> CacheStats:
+        """統計情報を取得（size はメモリ上のエントリ数）。"""
+        return self._stats
+
+    def close(self) -> None:
+        """SQLite 接続をクローズ。"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
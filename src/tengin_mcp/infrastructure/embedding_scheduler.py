@@ -0,0 +1,244 @@
+"""Infrastructure: Rate-limit-aware scheduling of embedding provider calls."""
+
+import asyncio
+import logging
+import random
+import re
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+EmbedFunction = Callable[[list[str]], Awaitable[list[list[float]]]]
+
+# 再試行するHTTPステータス
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# ステータスコードを持たない例外（esperanto は RuntimeError でメッセージのみ返す）の判定
+# 数値は "HTTP 503" / "status code: 429" / "Error code: 500" などステータスの文脈でのみ
+# 一致させる（"input exceeds 500 tokens" のような入力エラーを再試行しない）
+_RETRYABLE_MESSAGE = re.compile(
+    r"(?:\bhttp(?:/\d(?:\.\d)?)?|\bstatus(?:[ _]?code)?|\berror[ _]?code)[ :=]*"
+    r"(?:408|429|500|502|503|504)\b"
+    r"|\b(?:408|429|500|502|503|504) (?:request timeout|too many requests"
+    r"|internal server error|bad gateway|service unavailable|gateway timeout)"
+    r"|rate.?limit|too many requests|overloaded"
+    r"|timed? ?out|temporarily unavailable|connection (reset|error|refused)",
+    re.IGNORECASE,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    トークン数を見積もる（トークナイザー非依存の保守的な概算）。
+
+    ASCII は約4文字で1トークン、日本語などの非ASCII文字は1文字1トークンとして数える。
+    """
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return max(1, (ascii_chars + 3) // 4 + (len(text) - ascii_chars))
+
+
+def split_batches(
+    texts: list[str], max_batch_size: int, max_request_tokens: int | None = None
+) -> list[list[int]]:
+    """
+    入力を件数上限とリクエストあたりのトークン上限で分割。
+
+    上限を超える単一テキストは単独のバッチにする（切り詰めはプロバイダーに任せる）。
+
+    Args:
+        texts: 埋め込むテキスト
+        max_batch_size: 1リクエストの最大件数
+        max_request_tokens: 1リクエストの最大トークン数（None で無制限）
+
+    Returns:
+        バッチごとの入力インデックス（入力順）
+    """
+    batches: list[list[int]] = []
+    current: list[int] = []
+    current_tokens = 0
+    for i, text in enumerate(texts):
+        tokens = estimate_tokens(text)
+        over_tokens = (
+            max_request_tokens is not None and current_tokens + tokens > max_request_tokens
+        )
+        if current and (len(current) >= max_batch_size or over_tokens):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(i)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def is_retryable(error: BaseException) -> bool:
+    """一時的なエラー（レート制限・タイムアウト・5xx）かどうか。"""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code in RETRYABLE_STATUS_CODES
+    if isinstance(error, httpx.TransportError | asyncio.TimeoutError | ConnectionError):
+        return True
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code in RETRYABLE_STATUS_CODES
+    return bool(_RETRYABLE_MESSAGE.search(str(error)))
+
+
+def retry_after_seconds(error: BaseException) -> float | None:
+    """Retry-After ヘッダーの秒数（取得できない場合は None）。"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("retry-after", "")))
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """1分あたりの上限を平滑化して払い出すトークンバケット。"""
+
+    def __init__(self, per_minute: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        トークンバケットを初期化。
+
+        Args:
+            per_minute: 1分あたりの上限（バケット容量も同じ）
+            clock: 単調増加する時計（テスト用）
+        """
+        self._capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        """経過時間分のトークンを補充。"""
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """
+        トークンを取得（不足時は補充されるまで待機, 先着順）。
+
+        Args:
+            amount: 取得量（容量を超える場合は容量に切り詰める）
+        """
+        amount = min(amount, self._capacity)
+        async with self._lock:
+            self._refill()
+            while self._tokens < amount:
+                await asyncio.sleep((amount - self._tokens) / self._rate)
+                self._refill()
+            self._tokens -= amount
+
+
+class EmbeddingScheduler:
+    """
+    埋め込みプロバイダー呼び出しのスケジューラー。
+
+    入力を件数・トークン上限でバッチに分割し、リクエスト数とトークン数のトークンバケットで
+    流量を制御しながら、同時実行数の上限内で並列に呼び出す。一時的なエラーは
+    ジッター付きの指数バックオフ（Retry-After があれば優先）で再試行する。
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFunction,
+        max_batch_size: int = 64,
+        max_request_tokens: int | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+        max_concurrency: int = 4,
+        max_retries: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+    ) -> None:
+        """
+        スケジューラーを初期化。
+
+        Args:
+            embed: プロバイダーを1回呼び出す関数
+            max_batch_size: 1リクエストの最大件数
+            max_request_tokens: 1リクエストの最大トークン数（None で無制限）
+            requests_per_minute: 1分あたりのリクエスト数上限（None で無制限）
+            tokens_per_minute: 1分あたりのトークン数上限（None で無制限）
+            max_concurrency: 同時に実行するリクエスト数
+            max_retries: 一時的なエラーの最大再試行回数
+            base_delay: バックオフの基準秒数
+            max_delay: バックオフの最大秒数
+        """
+        self._embed = embed
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_request_tokens = max_request_tokens
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._max_retries = max(0, max_retries)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._retries = 0
+
+    @property
+    def retries(self) -> int:
+        """これまでの再試行回数。"""
+        return self._retries
+
+    async def run(self, texts: list[str]) -> list[list[float]]:
+        """
+        テキストを埋め込む（必要に応じて分割・並列化・再試行）。
+
+        Args:
+            texts: 埋め込むテキスト
+
+        Returns:
+            入力順の埋め込みベクトル
+        """
+        if not texts:
+            return []
+        batches = split_batches(texts, self._max_batch_size, self._max_request_tokens)
+        results = await asyncio.gather(
+            *(self._run_batch([texts[i] for i in batch]) for batch in batches)
+        )
+        vectors: list[list[float]] = [[] for _ in texts]
+        for batch, batch_vectors in zip(batches, results, strict=True):
+            for i, vector in zip(batch, batch_vectors, strict=True):
+                vectors[i] = vector
+        return vectors
+
+    def _backoff(self, attempt: int, error: BaseException) -> float:
+        """再試行までの待機秒数（フルジッター付き指数バックオフ）。"""
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            return min(retry_after, self._max_delay)
+        return random.uniform(0, min(self._max_delay, self._base_delay * 2**attempt))
+
+    async def _run_batch(self, texts: list[str]) -> list[list[float]]:
+        """1バッチを流量制御・再試行付きで実行。"""
+        tokens = sum(estimate_tokens(text) for text in texts)
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                if self._requests:
+                    await self._requests.acquire()
+                if self._tokens:
+                    await self._tokens.acquire(tokens)
+                try:
+                    return await self._embed(texts)
+                except Exception as e:
+                    if attempt >= self._max_retries or not is_retryable(e):
+                        raise
+                    error = e
+            delay = self._backoff(attempt, error)
+            attempt += 1
+            self._retries += 1
+            logger.warning(
+                f"Embedding request failed ({error}); retry {attempt}/{self._max_retries} "
+                f"in {delay:.2f}s"
+            )
+            await asyncio.sleep(delay)
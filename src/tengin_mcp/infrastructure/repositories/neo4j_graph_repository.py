@@ -1,13 +1,34 @@
 """Infrastructure: Neo4j Graph Repository."""
 
+import re
 from typing import Any
 
 from tengin_mcp.infrastructure.adapters.neo4j_adapter import Neo4jAdapter
+from tengin_mcp.infrastructure.cache import get_graph_cache
+
+# Lucene クエリ構文の特殊文字
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/]|&&|\|\|)')
+
+
+def escape_lucene(text: str) -> str:
+    """全文検索クエリの特殊文字をエスケープ（入力をそのまま語として検索）。"""
+    return _LUCENE_SPECIAL.sub(r"\\\1", text)
 
 
 class Neo4jGraphRepository:
     """Neo4j を使用した GraphRepository 実装。"""
 
+    # 統計情報のキャッシュキーとTTL（秒）
+    STATISTICS_CACHE_KEY = "graph_statistics"
+    STATISTICS_CACHE_TTL = 300.0
+
+    # ラベル → (全文検索インデックス名, インデックス対象のプロパティ)（seed_extended_data で作成）
+    FULLTEXT_INDEXES: dict[str, tuple[str, tuple[str, ...]]] = {
+        "Theory": ("theory_search", ("name", "name_en", "description", "core_principle")),
+        "Concept": ("concept_search", ("name", "name_en", "definition")),
+        "Theorist": ("theorist_search", ("name", "name_en", "field")),
+    }
+
     def __init__(self, adapter: Neo4jAdapter) -> None:
         """
         リポジトリを初期化。
@@ -82,33 +103,13 @@ class Neo4jGraphRepository:
 
     async def get_stats(self) -> dict:
         """グラフの統計情報を取得。"""
-        query = """
-        MATCH (n)
-        WITH labels(n)[0] as label, count(*) as count
-        RETURN collect({label: label, count: count}) as node_counts
-        """
-        results = await self._adapter.execute_query(query)
-
-        node_counts = {}
-        if results and results[0].get("node_counts"):
-            for item in results[0]["node_counts"]:
-                if item.get("label"):
-                    node_counts[item["label"]] = item["count"]
-
-        rel_query = """
-        MATCH ()-[r]->()
-        WITH type(r) as type, count(*) as count
-        RETURN collect({type: type, count: count}) as rel_counts
-        """
-        rel_results = await self._adapter.execute_query(rel_query)
-
-        rel_counts = {}
-        if rel_results and rel_results[0].get("rel_counts"):
-            for item in rel_results[0]["rel_counts"]:
-                if item.get("type"):
-                    rel_counts[item["type"]] = item["count"]
-
-        return {"node_counts": node_counts, "relationship_counts": rel_counts}
+        counts = await self._get_counts()
+        return {
+            "node_counts": dict(counts["node_counts"]),
+            "relationship_counts": dict(counts["relationship_counts"]),
+            "total_nodes": counts["total_nodes"],
+            "total_relationships": counts["total_relationships"],
+        }
 
     # --- Extended methods ---
 
@@ -229,6 +230,88 @@ class Neo4jGraphRepository:
 
         return {"nodes": nodes, "relationships": relationships}
 
+    async def traverse_projected(
+        self,
+        start_node_id: str,
+        properties: list[str],
+        relationship_types: list[str] | None = None,
+        max_depth: int = 3,
+        direction: str = "both",
+    ) -> dict[str, list[list[Any]]]:
+        """
+        グラフをトラバースし、指定プロパティのみを射影した行を取得。
+
+        ノード・リレーションシップオブジェクトを返さず、Cypher 側で
+        必要な値だけをリストに射影するため、転送量と Python 側の変換コストが小さい。
+
+        Args:
+            start_node_id: 開始ノードのID
+            properties: 取得するノードプロパティ名
+            relationship_types: フィルタするリレーションシップタイプ
+            max_depth: 最大トラバース深度
+            direction: トラバース方向（outgoing, incoming, both）
+
+        Returns:
+            {
+                "nodes": [[id, labels, [値, ...]], ...],
+                "edges": [[source_id, target_id, type], ...]
+            }
+        """
+        types = relationship_types or []
+        depth = int(max_depth)
+        type_spec = ":" + "|".join(f"`{t.replace('`', '``')}`" for t in types) if types else ""
+        if direction == "outgoing":
+            apoc_filter = "|".join(f"{t}>" for t in types) or ">"
+            rel_pattern = f"-[{type_spec}*1..{depth}]->"
+        elif direction == "incoming":
+            apoc_filter = "|".join(f"<{t}" for t in types) or "<"
+            rel_pattern = f"<-[{type_spec}*1..{depth}]-"
+        else:
+            apoc_filter = "|".join(types)
+            rel_pattern = f"-[{type_spec}*1..{depth}]-"
+
+        projection = """
+        RETURN [n IN nodes | [n.id, labels(n), [p IN $properties | n[p]]]] as nodes,
+               [r IN rels | [startNode(r).id, endNode(r).id, type(r)]] as edges
+        """
+        query = (
+            """
+        MATCH (start {id: $start_id})
+        CALL apoc.path.subgraphAll(start, {
+            maxLevel: $max_depth,
+            relationshipFilter: $rel_filter
+        })
+        YIELD nodes, relationships
+        WITH nodes, relationships as rels
+        """
+            + projection
+        )
+
+        # APOCがない場合の代替クエリ（到達したパス上のリレーションシップとその端点を集約）
+        fallback_query = (
+            f"""
+        MATCH (start {{id: $start_id}})
+        OPTIONAL MATCH path = (start){rel_pattern}()
+        UNWIND coalesce(relationships(path), [null]) as r
+        WITH start, collect(DISTINCT r) as rels
+        UNWIND [start] + reduce(acc = [], r IN rels | acc + [startNode(r), endNode(r)]) as n
+        WITH rels, collect(DISTINCT n) as nodes
+        """
+            + projection
+        )
+
+        params = {"start_id": start_node_id, "max_depth": depth, "properties": properties}
+        try:
+            results = await self._adapter.execute_query(
+                query, {**params, "rel_filter": apoc_filter}
+            )
+        except Exception:
+            results = await self._adapter.execute_query(fallback_query, params)
+
+        if not results:
+            return {"nodes": [], "edges": []}
+        return {"nodes": results[0]["nodes"], "edges": results[0]["edges"]}
+
     async def find_path(
         self,
         start_node_id: str,
@@ -237,10 +320,11 @@ class Neo4jGraphRepository:
     ) -> list[dict[str, Any]]:
         """2ノード間のパスを検索。"""
         # shortestPathは可変パラメータを直接サポートしないため、
-        # max_depthに基づいて動的にクエリを構築
+        # max_depthに基づいて動的にクエリを構築（整数に正規化してから埋め込む）
+        depth = int(max_depth)
         query = f"""
         MATCH path = shortestPath(
-            (start {{id: $start_id}})-[*1..{max_depth}]-(end {{id: $end_id}})
+            (start {{id: $start_id}})-[*1..{depth}]-(end {{id: $end_id}})
         )
         RETURN [n IN nodes(path) | {{
             id: n.id,
@@ -274,6 +358,331 @@ class Neo4jGraphRepository:
 
         return paths
 
+    async def get_graph_snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """
+        経路探索用にグラフ全体の軽量スナップショットを取得。
+
+        Returns:
+            {
+                "nodes": [{"id": ..., "labels": [...], "name": ...}, ...],
+                "edges": [{"source": ..., "target": ..., "type": ..., "properties": {...}}, ...]
+            }
+        """
+        nodes_query = """
+        MATCH (n)
+        WHERE n.id IS NOT NULL
+        RETURN n.id as id, labels(n) as labels, n.name as name
+        """
+        edges_query = """
+        MATCH (a)-[r]->(b)
+        WHERE a.id IS NOT NULL AND b.id IS NOT NULL
+        RETURN a.id as source, b.id as target, type(r) as type, properties(r) as properties
+        """
+        nodes = await self._adapter.execute_query(nodes_query)
+        edges = await self._adapter.execute_query(edges_query)
+        return {"nodes": nodes, "edges": edges}
+
+    async def get_entity_summaries(
+        self,
+        ids_by_label: dict[str, list[str]],
+        summary_length: int = 200,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        エンティティの要約をラベルごとの一意制約インデックス経由で一括取得。
+
+        Args:
+            ids_by_label: ラベル → エンティティIDのリスト
+            summary_length: 要約テキストの最大文字数
+
+        Returns:
+            エンティティID → {"id", "labels", "name", "name_en", "category", "evidence_level", "summary"}
+        """
+        labels = [label for label, ids in ids_by_label.items() if ids]
+        if not labels:
+            return {}
+
+        parts = [
+            f"""
+        MATCH (n:`{label.replace("`", "``")}`) WHERE n.id IN $ids[{i}]
+        RETURN n.id as id, labels(n) as labels,
+               coalesce(n.name, n.title) as name, n.name_en as name_en,
+               n.category as category, n.evidence_level as evidence_level,
+               left(coalesce(n.summary, n.description, n.definition, n.findings,
+                             n.biography, ''), $summary_length) as summary
+        """
+            for i, label in enumerate(labels)
+        ]
+        results = await self._adapter.execute_query(
+            "\nUNION ALL\n".join(parts),
+            {"ids": [ids_by_label[label] for label in labels], "summary_length": summary_length},
+        )
+        return {r["id"]: r for r in results}
+
+    async def fulltext_search(
+        self,
+        query: str,
+        labels: list[str] | None = None,
+        limit: int = 20,
+        category: str | None = None,
+        evidence_level: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        全文検索インデックスでエンティティを検索（全インデックスを1回のクエリで検索）。
+
+        全文検索インデックスがない場合は CONTAINS による部分一致検索にフォールバックする
+        （名前の一致を本文の一致より上位にする）。
+
+        Args:
+            query: 検索テキスト（Lucene の特殊文字はエスケープする）
+            labels: 対象ラベル（None で全文検索インデックスのある全ラベル）
+            limit: 返す結果の最大数
+            category: カテゴリでフィルタ
+            evidence_level: エビデンスレベルでフィルタ
+
+        Returns:
+            スコアの降順の [{"id", "labels", "score"}, ...]
+        """
+        targets = [
+            label
+            for label in labels or list(self.FULLTEXT_INDEXES)
+            if label in self.FULLTEXT_INDEXES
+        ]
+        text = query.strip()
+        if not targets or not text:
+            return []
+
+        filters = """
+        WHERE ($category IS NULL OR node.category = $category)
+          AND ($evidence_level IS NULL OR node.evidence_level = $evidence_level)
+        """
+        parts = [
+            f"""
+        CALL db.index.fulltext.queryNodes('{self.FULLTEXT_INDEXES[label][0]}', $query)
+        YIELD node, score
+        {filters}
+        RETURN node.id as id, labels(node) as labels, score
+        LIMIT $limit
+        """
+            for label in targets
+        ]
+
+        fallback_parts = []
+        for label in targets:
+            fields = self.FULLTEXT_INDEXES[label][1]
+            matches = [f"toLower(coalesce(node.{f}, '')) CONTAINS toLower($text)" for f in fields]
+            fallback_parts.append(
+                f"""
+        MATCH (node:`{label}`)
+        {filters}
+          AND ({" OR ".join(matches)})
+        RETURN node.id as id, labels(node) as labels,
+               CASE WHEN {" OR ".join(matches[:2])} THEN 2.0 ELSE 1.0 END as score
+        ORDER BY score DESC, id
+        LIMIT $limit
+        """
+            )
+
+        params = {
+            "query": escape_lucene(text),
+            "text": text,
+            "limit": int(limit),
+            "category": category,
+            "evidence_level": evidence_level,
+        }
+        try:
+            results = await self._adapter.execute_query("\nUNION ALL\n".join(parts), params)
+        except Exception:
+            # 全文検索インデックスがない場合、部分一致検索を使用
+            results = await self._adapter.execute_query(
+                "\nUNION ALL\n".join(fallback_parts), params
+            )
+
+        rows = sorted(results, key=lambda r: (-r["score"], r["id"] or ""))
+        return [row for row in rows if row["id"]][:limit]
+
+    async def get_neighbor_edges(
+        self,
+        node_ids: list[str],
+        relationship_types: list[str],
+        limit_per_node: int = 50,
+    ) -> list[dict[str, Any]]:
+        """
+        複数ノードに隣接するエッジを1回のクエリで取得（向きは問わない）。
+
+        起点ノードごとに strength の強い順（同順位は隣接ノードのID順）に最大 limit_per_node 件を返すため、
+        ハブノードがあっても他の起点のエッジが欠けず、結果は決定的になる。
+
+        Args:
+            node_ids: 起点ノードのID
+            relationship_types: 辿るリレーションシップタイプ
+            limit_per_node: 起点ノードごとに返すエッジの最大数
+
+        Returns:
+            [{"source", "target", "labels", "type", "strength"}, ...]
+            （source は起点ノード、labels は隣接ノードのラベル）
+        """
+        if not node_ids or not relationship_types:
+            return []
+
+        type_spec = "|".join(f"`{t.replace('`', '``')}`" for t in relationship_types)
+        query = f"""
+        MATCH (a)
+        WHERE a.id IN $node_ids
+        CALL {{
+            WITH a
+            MATCH (a)-[r:{type_spec}]-(b)
+            WHERE b.id IS NOT NULL
+            WITH r, b,
+                 CASE toLower(coalesce(r.strength, 'moderate'))
+                     WHEN 'strong' THEN 0 WHEN 'moderate' THEN 1 WHEN 'weak' THEN 2 ELSE 1
+                 END as strength_rank
+            ORDER BY strength_rank, b.id, type(r)
+            LIMIT $limit_per_node
+            RETURN r, b
+        }}
+        RETURN a.id as source, b.id as target, labels(b) as labels,
+               type(r) as type, r.strength as strength
+        ORDER BY source
+        """
+        return await self._adapter.execute_query(
+            query, {"node_ids": list(node_ids), "limit_per_node": int(limit_per_node)}
+        )
+
+    async def get_entities(self, labels: list[str]) -> list[dict[str, Any]]:
+        """
+        指定ラベルのエンティティを全プロパティ付きで取得（ベクトルインデックス構築用）。
+
+        Args:
+            labels: 対象ラベル
+
+        Returns:
+            [{"labels": [...], "properties": {...}}, ...]
+        """
+        query = """
+        MATCH (n)
+        WHERE n.id IS NOT NULL AND any(label IN labels(n) WHERE label IN $labels)
+        RETURN labels(n) as labels, properties(n) as properties
+        ORDER BY n.id
+        """
+        return await self._adapter.execute_query(query, {"labels": labels})
+
+    async def get_entities_by_ids(
+        self,
+        entity_ids: list[str],
+        labels: list[str],
+    ) -> list[dict[str, Any]]:
+        """
+        IDでエンティティを全プロパティ付きで一括取得（ラベルごとの一意制約インデックスを利用）。
+
+        Args:
+            entity_ids: エンティティID
+            labels: 検索対象のラベル
+
+        Returns:
+            [{"labels": [...], "properties": {...}}, ...]（順序は不定）
+        """
+        if not entity_ids or not labels:
+            return []
+
+        parts = [
+            f"""
+        MATCH (n:`{label.replace("`", "``")}`) WHERE n.id IN $ids
+        RETURN labels(n) as labels, properties(n) as properties
+        """
+            for label in labels
+        ]
+        return await self._adapter.execute_query("\nUNION\n".join(parts), {"ids": list(entity_ids)})
+
+    async def write_theory_analytics(self, rows: list[dict[str, Any]]) -> int:
+        """
+        理論ノードに分析結果のプロパティを書き戻す。
+
+        Args:
+            rows: [{"id": ..., "properties": {...}}, ...]
+
+        Returns:
+            更新したプロパティ数
+        """
+        query = """
+        UNWIND $rows as row
+        MATCH (t:Theory {id: row.id})
+        SET t += row.properties, t.analytics_updated_at = datetime()
+        """
+        summary = await self._adapter.execute_write(query, {"rows": rows})
+        return summary["properties_set"]
+
+    async def get_influential_theories(
+        self,
+        metric: str = "pagerank",
+        limit: int = 10,
+        category: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        事前計算済みの中心性指標で理論をランキング。
+
+        Args:
+            metric: 指標（pagerank, betweenness）
+            limit: 最大件数
+            category: 理論カテゴリでフィルタ（オプション）
+
+        Returns:
+            理論のリスト（指標の降順）
+        """
+        if metric not in ("pagerank", "betweenness"):
+            raise ValueError(f"Unsupported metric: {metric}")
+
+        category_filter = "AND t.category = $category" if category else ""
+        query = f"""
+        MATCH (t:Theory)
+        WHERE t.{metric} IS NOT NULL {category_filter}
+        RETURN t.id as id, t.name as name, t.name_en as name_en, t.category as category,
+               t.pagerank as pagerank, t.betweenness as betweenness,
+               t.community_id as community_id
+        ORDER BY t.{metric} DESC
+        LIMIT $limit
+        """
+        return await self._adapter.execute_query(query, {"limit": limit, "category": category})
+
+    async def get_theory_clusters(self, theory_id: str | None = None) -> list[dict[str, Any]]:
+        """
+        事前計算済みのコミュニティ単位で理論を取得。
+
+        Args:
+            theory_id: 指定した場合はその理論が属するクラスタのみ
+
+        Returns:
+            クラスタのリスト（サイズの降順）
+        """
+        query = """
+        OPTIONAL MATCH (s:Theory {id: $theory_id})
+        WITH s
+        MATCH (t:Theory)
+        WHERE t.community_id IS NOT NULL
+          AND ($theory_id IS NULL OR t.community_id = s.community_id)
+        WITH t ORDER BY t.pagerank DESC
+        WITH t.community_id as community_id,
+             collect({
+                 id: t.id, name: t.name, name_en: t.name_en,
+                 category: t.category, pagerank: t.pagerank
+             }) as theories
+        RETURN community_id, size(theories) as size, theories
+        ORDER BY size DESC, community_id
+        """
+        return await self._adapter.execute_query(query, {"theory_id": theory_id})
+
+    async def get_similar_theories(self, theory_id: str) -> list[dict[str, Any]]:
+        """事前計算済みの類似理論を取得。"""
+        query = """
+        MATCH (t:Theory {id: $theory_id})
+        WHERE t.similar_theory_ids IS NOT NULL
+        UNWIND range(0, size(t.similar_theory_ids) - 1) as i
+        MATCH (s:Theory {id: t.similar_theory_ids[i]})
+        RETURN s.id as id, s.name as name, s.name_en as name_en,
+               t.similarity_scores[i] as similarity
+        ORDER BY similarity DESC
+        """
+        return await self._adapter.execute_query(query, {"theory_id": theory_id})
+
     async def get_related_nodes(
         self,
         node_id: str,
@@ -307,23 +716,98 @@ class Neo4jGraphRepository:
 
     async def get_statistics(self) -> dict[str, Any]:
         """グラフ統計を取得。"""
-        query = """
-        MATCH (n)
-        WITH labels(n) as nodeLabels, count(*) as count
-        UNWIND nodeLabels as label
-        WITH label, sum(count) as nodeCount
-        RETURN collect({label: label, count: nodeCount}) as nodeCounts
+        counts = await self._get_counts()
+        return {
+            "node_counts": [
+                {"label": label, "count": count} for label, count in counts["node_counts"].items()
+            ],
+            "relationship_counts": [
+                {"type": rel_type, "count": count}
+                for rel_type, count in counts["relationship_counts"].items()
+            ],
+            "total_nodes": counts["total_nodes"],
+            "total_relationships": counts["total_relationships"],
+        }
+
+    async def _get_counts(self) -> dict[str, Any]:
         """
-        node_results = await self._adapter.execute_query(query)
+        ラベル別・タイプ別の件数をカウントストアから取得（Graph キャッシュを利用）。
 
-        rel_query = """
-        MATCH ()-[r]->()
-        WITH type(r) as relType, count(*) as count
-        RETURN collect({type: relType, count: count}) as relCounts
+        APOC が利用可能な場合は apoc.meta.stats() の1回の呼び出しで取得し、
+        利用できない場合はラベル・タイプ一覧からリテラルなカウントクエリを
+        組み立てて取得する（いずれもフルスキャンを伴わない）。
         """
-        rel_results = await self._adapter.execute_query(rel_query)
+        cache = get_graph_cache()
+        counts = await cache.get(self.STATISTICS_CACHE_KEY)
+        if counts is not None:
+            return counts
+
+        try:
+            counts = await self._get_counts_from_apoc()
+        except Exception:
+            counts = await self._get_counts_from_count_store()
+
+        await cache.set(self.STATISTICS_CACHE_KEY, counts, self.STATISTICS_CACHE_TTL)
+        return counts
 
+    async def _get_counts_from_apoc(self) -> dict[str, Any]:
+        """apoc.meta.stats() で件数を取得。"""
+        query = """
+        CALL apoc.meta.stats()
+        YIELD labels, relTypesCount, nodeCount, relCount
+        RETURN labels, relTypesCount, nodeCount, relCount
+        """
+        results = await self._adapter.execute_query(query)
+        record = results[0]
         return {
-            "node_counts": node_results[0].get("nodeCounts", []) if node_results else [],
-            "relationship_counts": rel_results[0].get("relCounts", []) if rel_results else [],
+            "node_counts": {k: v for k, v in sorted(record["labels"].items()) if v},
+            "relationship_counts": {k: v for k, v in sorted(record["relTypesCount"].items()) if v},
+            "total_nodes": record["nodeCount"],
+            "total_relationships": record["relCount"],
+        }
+
+    async def _get_counts_from_count_store(self) -> dict[str, Any]:
+        """ラベル・タイプごとのリテラルなカウントクエリ（カウントストア参照）で件数を取得。"""
+        schema_query = """
+        CALL db.labels() YIELD label
+        WITH collect(label) as labels
+        CALL db.relationshipTypes() YIELD relationshipType
+        RETURN labels, collect(relationshipType) as types
+        """
+        schema = await self._adapter.execute_query(schema_query)
+        labels = schema[0]["labels"] if schema else []
+        types = schema[0]["types"] if schema else []
+
+        def quote(name: str) -> str:
+            return "`" + name.replace("`", "``") + "`"
+
+        parts = [
+            "MATCH (n) RETURN 'total' as kind, 'nodes' as name, count(n) as count",
+            "MATCH ()-[r]->() RETURN 'total' as kind, 'relationships' as name, count(r) as count",
+        ]
+        parts.extend(
+            f"MATCH (n:{quote(label)}) RETURN 'label' as kind, $labels[{i}] as name, count(n) as count"
+            for i, label in enumerate(labels)
+        )
+        parts.extend(
+            f"MATCH ()-[r:{quote(rel_type)}]->() "
+            f"RETURN 'type' as kind, $types[{i}] as name, count(r) as count"
+            for i, rel_type in enumerate(types)
+        )
+        results = await self._adapter.execute_query(
+            "\nUNION ALL\n".join(parts), {"labels": labels, "types": types}
+        )
+
+        counts: dict[str, Any] = {
+            "node_counts": {},
+            "relationship_counts": {},
+            "total_nodes": 0,
+            "total_relationships": 0,
         }
+        for r in results:
+            if r["kind"] == "total":
+                counts[f"total_{r['name']}"] = r["count"]
+            elif r["count"]:
+                key = "node_counts" if r["kind"] == "label" else "relationship_counts"
+                counts[key][r["name"]] = r["count"]
+        return counts
@@ -50,6 +50,11 @@ class Neo4jTheoryRepository:
             for r in results
         ]
 
+    async def count_theories(self) -> int:
+        """理論数を取得（カウントストアを参照するためフルスキャンしない）。"""
+        results = await self._adapter.execute_query("MATCH (t:Theory) RETURN count(t) as count")
+        return results[0]["count"] if results else 0
+
     async def get_by_category(self, category: TheoryCategory) -> list[TheorySummary]:
         """カテゴリで理論をフィルタリング（インターフェース実装）。"""
         return await self.get_theories_by_category(category)
@@ -0,0 +1,206 @@
+"""Infrastructure: Semantic search result cache (exact + approximate query match)."""
+
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from tengin_mcp.infrastructure.embedding_cache import normalize_text
+
+
+def search_scope(
+    entity_types: list[str] | None = None,
+    category: str | None = None,
+    evidence_level: str | None = None,
+) -> str:
+    """フィルタからキャッシュのスコープ（同じ結果を共有できる範囲）を作成。"""
+    return json.dumps(
+        {
+            "entity_types": sorted(set(entity_types)) if entity_types else None,
+            "category": category,
+            "evidence_level": evidence_level,
+        },
+        sort_keys=True,
+    )
+
+
+@dataclass
+class _Entry:
+    """キャッシュエントリ（検索時の limit と正規化したクエリ埋め込みを保持）。"""
+
+    results: list[dict[str, Any]]
+    embedding: np.ndarray
+    limit: int
+    scope: str
+    expires_at: float
+
+    def serves(self, limit: int) -> bool:
+        """limit 件の結果を返せるか（より多く検索した結果、または全件を取り切った結果）。"""
+        return self.limit >= limit or len(self.results) < self.limit
+
+
+class SemanticSearchCache:
+    """
+    セマンティック検索の最終結果（順位付け・要約の結合済み）のキャッシュ。
+
+    - 完全一致: 正規化したクエリテキスト + フィルタで検索（埋め込みもベクトル検索も不要）
+    - 近似一致: 同じフィルタのキャッシュ済みクエリのうち、埋め込みのコサイン類似度が
+      閾値以上のものの結果を再利用（ベクトル検索が不要）
+
+    エントリは TTL で失効し、上限を超えたら最も長く使われていないものから削除する。
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 600.0,
+        similarity_threshold: float = 0.95,
+    ) -> None:
+        """
+        キャッシュを初期化。
+
+        Args:
+            max_entries: 最大エントリ数
+            ttl_seconds: エントリの有効期間（秒）
+            similarity_threshold: 近似一致とみなすコサイン類似度
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._threshold = similarity_threshold
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.exact_hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+
+    def get(self, query: str, scope: str, limit: int) -> list[dict[str, Any]] | None:
+        """
+        完全一致するクエリの結果を取得。
+
+        Args:
+            query: 検索クエリ
+            scope: search_scope で作成したスコープ
+            limit: 必要な結果数
+
+        Returns:
+            結果（上位 limit 件）、なければ None
+        """
+        key = self._key(query, scope)
+        entry = self._entries.get(key)
+        if entry is None or not entry.serves(limit):
+            return None
+        if entry.expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        self.exact_hits += 1
+        return self._copy(entry.results[:limit])
+
+    def get_similar(
+        self, embedding: list[float], scope: str, limit: int
+    ) -> tuple[list[dict[str, Any]], float] | None:
+        """
+        埋め込みが近いクエリの結果を取得。
+
+        Args:
+            embedding: クエリの埋め込み
+            scope: search_scope で作成したスコープ
+            limit: 必要な結果数
+
+        Returns:
+            (結果, コサイン類似度)、閾値以上のものがなければ None
+        """
+        query_vector = self._normalize(embedding)
+        now = time.monotonic()
+        candidates = [
+            (key, entry)
+            for key, entry in self._entries.items()
+            if entry.scope == scope
+            and entry.serves(limit)
+            and entry.expires_at >= now
+            and entry.embedding.shape == query_vector.shape
+        ]
+        if not candidates:
+            self.misses += 1
+            return None
+
+        similarities = np.stack([entry.embedding for _, entry in candidates]) @ query_vector
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+        if similarity < self._threshold:
+            self.misses += 1
+            return None
+
+        key, entry = candidates[best]
+        self._entries.move_to_end(key)
+        self.similar_hits += 1
+        return self._copy(entry.results[:limit]), similarity
+
+    def put(
+        self,
+        query: str,
+        scope: str,
+        embedding: list[float],
+        results: list[dict[str, Any]],
+        limit: int,
+    ) -> None:
+        """
+        検索結果を保存。
+
+        Args:
+            query: 検索クエリ
+            scope: search_scope で作成したスコープ
+            embedding: クエリの埋め込み
+            results: 順位順の結果
+            limit: 検索時の limit
+        """
+        if self._max_entries <= 0:
+            return
+        key = self._key(query, scope)
+        self._entries[key] = _Entry(
+            results=self._copy(results),
+            embedding=self._normalize(embedding),
+            limit=limit,
+            scope=scope,
+            expires_at=time.monotonic() + self._ttl,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """キャッシュをクリア。"""
+        self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """統計情報を取得（hit_rate は %）。"""
+        hits = self.exact_hits + self.similar_hits
+        total = hits + self.misses
+        return {
+            "hits": hits,
+            "exact_hits": self.exact_hits,
+            "similar_hits": self.similar_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / total * 100, 2) if total else 0.0,
+            "size": len(self._entries),
+            "max_size": self._max_entries,
+        }
+
+    @staticmethod
+    def _key(query: str, scope: str) -> str:
+        """正規化したクエリテキスト + スコープのキー（同じキーなら埋め込みも同じ）。"""
+        return f"{scope}\x00{normalize_text(query)}"
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        """L2 正規化したベクトル（内積がコサイン類似度になる）。"""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    @staticmethod
+    def _copy(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """呼び出し側での変更がキャッシュに影響しないよう項目をコピー。"""
+        return [dict(item) for item in results]
@@ -0,0 +1,65 @@
+"""Infrastructure: Offline stub embedding model (character n-gram feature hashing)."""
+
+import hashlib
+import re
+import unicodedata
+
+import numpy as np
+
+# モデル名の末尾の数字を次元数とする（例: hashing-384）
+_DIMENSIONS = re.compile(r"(\d+)$")
+
+
+class StubEmbeddingModel:
+    """
+    API キー・ネットワーク・モデルのダウンロードなしで動くスタブの埋め込みモデル。
+
+    NFKC 正規化・小文字化したテキストの文字 1〜3-gram を blake2b で次元に割り当てる
+    （符号付きの特徴ハッシング）決定的な埋め込みで、プロセスをまたいでも同じベクトルを返す。
+    文字の重なりで近さが決まるため、ベンチマークや CI で検索パイプラインを通して動かす用途に使う。
+    """
+
+    DEFAULT_DIMENSIONS = 384
+    NGRAM_SIZES = (1, 2, 3)
+
+    def __init__(self, model_name: str = "hashing-384") -> None:
+        """
+        スタブモデルを初期化。
+
+        Args:
+            model_name: モデル名（末尾の数字を次元数に使用, ない場合は 384）
+        """
+        match = _DIMENSIONS.search(model_name)
+        self.model_name = model_name
+        self.dimensions = int(match.group(1)) if match else self.DEFAULT_DIMENSIONS
+
+    def _bucket(self, ngram: str) -> tuple[int, float]:
+        """n-gram の次元と符号。"""
+        digest = hashlib.blake2b(ngram.encode("utf-8"), digest_size=8).digest()
+        value = int.from_bytes(digest, "little")
+        return value % self.dimensions, 1.0 if value >> 63 else -1.0
+
+    def _embed_one(self, text: str) -> list[float]:
+        """1件のテキストを L2 正規化したベクトルに変換。"""
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        normalized = " ".join(unicodedata.normalize("NFKC", text).lower().split())
+        for n in self.NGRAM_SIZES:
+            for i in range(len(normalized) - n + 1):
+                ngram = normalized[i : i + n]
+                if ngram.strip():
+                    index, sign = self._bucket(ngram)
+                    vector[index] += sign
+        norm = float(np.linalg.norm(vector))
+        return (vector / norm if norm else vector).tolist()
+
+    def embed(self, texts: list[str]) -> list[list[float]]:
+        """
+        テキストを埋め込む（esperanto の埋め込みモデルと同じインターフェース）。
+
+        Args:
+            texts: 埋め込むテキスト
+
+        Returns:
+            埋め込みベクトルのリスト
+        """
+        return [self._embed_one(text) for text in texts]
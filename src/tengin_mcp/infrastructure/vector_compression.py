@@ -0,0 +1,227 @@
+"""Infrastructure: Embedding dimension reduction (Matryoshka / PCA) and quantization."""
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from tengin_mcp.infrastructure.config import Settings, VectorReduction
+
+logger = logging.getLogger(__name__)
+
+# 先頭の次元への切り詰めで品質を保つよう学習された（Matryoshka 表現の）モデル
+MATRYOSHKA_MODELS = (
+    "text-embedding-3-small",
+    "text-embedding-3-large",
+    "text-embedding-004",
+    "gemini-embedding-001",
+    "nomic-embed-text",
+    "mxbai-embed-large",
+    "jina-embeddings-v3",
+    "voyage-3-large",
+    "voyage-3.5",
+)
+
+# PCA の成分を保存するファイル名（ベクトルストアのディレクトリに置く）
+REDUCTION_FILE = "reduction.npz"
+
+# バイト値ごとの立っているビット数（バイナリ量子化のハミング距離用）
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def supports_matryoshka(model: str) -> bool:
+    """モデルが Matryoshka 表現（先頭次元への切り詰め）に対応しているか。"""
+    name = model.rsplit("/", 1)[-1]
+    return any(name.startswith(prefix) for prefix in MATRYOSHKA_MODELS)
+
+
+def normalize_rows(vectors: list[list[float]] | np.ndarray) -> np.ndarray:
+    """行ベクトルを L2 正規化した float32 行列に変換。"""
+    matrix = np.asarray(vectors, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix[np.newaxis, :]
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+@dataclass
+class VectorReducer:
+    """
+    埋め込みの次元削減。
+
+    - none: そのまま（L2 正規化のみ）
+    - matryoshka: 先頭 dimensions 次元に切り詰めて再正規化（対応モデルのみ）
+    - pca: インデックス構築時にコーパスで学習した主成分へ射影して再正規化
+
+    ドキュメントとクエリの両方に同じ変換を適用する。
+    """
+
+    method: VectorReduction = "none"
+    dimensions: int = 0
+    mean: np.ndarray | None = None
+    components: np.ndarray | None = None
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "VectorReducer":
+        """
+        設定から次元削減を作成（PCA は未学習）。
+
+        Raises:
+            ValueError: 次元数が未指定、または Matryoshka 非対応のモデルの場合
+        """
+        method = settings.vector_reduction
+        if method == "none":
+            return cls()
+        if settings.vector_dimensions <= 0:
+            raise ValueError(f"VECTOR_DIMENSIONS is required for VECTOR_REDUCTION={method}")
+        if method == "matryoshka" and not supports_matryoshka(settings.embedding_model):
+            raise ValueError(
+                f"{settings.embedding_model} does not support Matryoshka truncation; "
+                "use VECTOR_REDUCTION=pca"
+            )
+        return cls(method=method, dimensions=settings.vector_dimensions)
+
+    @classmethod
+    def fit_pca(cls, vectors: list[list[float]] | np.ndarray, dimensions: int) -> "VectorReducer":
+        """
+        正規化した埋め込みで PCA を学習。
+
+        Args:
+            vectors: コーパスの埋め込み
+            dimensions: 削減後の次元数
+
+        Returns:
+            学習済みの次元削減
+
+        Raises:
+            ValueError: 次元数がドキュメント数または埋め込みの次元数を超える場合
+        """
+        matrix = normalize_rows(vectors).astype(np.float64)
+        if dimensions > min(matrix.shape):
+            raise ValueError(
+                f"VECTOR_DIMENSIONS {dimensions} exceeds the PCA rank {min(matrix.shape)} "
+                f"({matrix.shape[0]} documents x {matrix.shape[1]} dimensions)"
+            )
+        mean = matrix.mean(axis=0)
+        _, _, vt = np.linalg.svd(matrix - mean, full_matrices=False)
+        components = vt[:dimensions]
+        return cls(
+            method="pca",
+            dimensions=dimensions,
+            mean=mean.astype(np.float32),
+            components=components.astype(np.float32),
+        )
+
+    @property
+    def fitted(self) -> bool:
+        """変換できる状態か（PCA は学習済みか）。"""
+        return self.method != "pca" or self.components is not None
+
+    @property
+    def id(self) -> str:
+        """変換の識別子（ドキュメントのメタデータに記録し、変更を検出する）。"""
+        return "none" if self.method == "none" else f"{self.method}-{self.dimensions}"
+
+    def transform(self, vectors: list[list[float]] | np.ndarray) -> np.ndarray:
+        """
+        埋め込みを変換して L2 正規化した float32 行列を返す。
+
+        Raises:
+            RuntimeError: PCA が未学習の場合
+            ValueError: 入力の次元が足りない場合
+        """
+        matrix = normalize_rows(vectors)
+        if self.method == "matryoshka":
+            if matrix.shape[1] < self.dimensions:
+                raise ValueError(
+                    f"Embedding dimension {matrix.shape[1]} < VECTOR_DIMENSIONS {self.dimensions}"
+                )
+            return normalize_rows(matrix[:, : self.dimensions])
+        if self.method == "pca":
+            if self.components is None or self.mean is None:
+                raise RuntimeError("PCA reduction is not fitted; build the vector index first")
+            return normalize_rows((matrix - self.mean) @ self.components.T)
+        return matrix
+
+    def metadata(self) -> dict[str, Any]:
+        """コレクションのメタデータに記録する設定。"""
+        return {"vector_reduction": self.method, "vector_dimensions": self.dimensions}
+
+    def save(self, path: Path) -> None:
+        """PCA の成分を保存（PCA 以外は保存するものがないためファイルを削除）。"""
+        if self.method != "pca" or self.components is None or self.mean is None:
+            path.unlink(missing_ok=True)
+            return
+        tmp = path.with_suffix(".tmp.npz")
+        np.savez(tmp, mean=self.mean, components=self.components)
+        tmp.replace(path)
+
+    def load(self, path: Path) -> "VectorReducer":
+        """
+        保存済みの PCA の成分を読み込む（設定と一致する場合のみ）。
+
+        Returns:
+            学習済みの次元削減（ファイルがない・設定と異なる場合は自身）
+        """
+        if self.method != "pca" or not path.exists():
+            return self
+        with np.load(path) as data:
+            mean, components = data["mean"], data["components"]
+        if components.shape[0] != self.dimensions:
+            logger.warning(
+                "Ignoring saved PCA (%d dimensions) != VECTOR_DIMENSIONS %d",
+                components.shape[0],
+                self.dimensions,
+            )
+            return self
+        return VectorReducer("pca", self.dimensions, mean, components)
+
+
+def quantize_int8(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    次元ごとの対称スケールで int8 に量子化。
+
+    Returns:
+        (int8 のコード, 次元ごとのスケール)
+    """
+    scales = np.abs(matrix).max(axis=0) / 127
+    scales = np.where(scales == 0, 1, scales).astype(np.float32)
+    codes = np.clip(np.rint(matrix / scales), -127, 127).astype(np.int8)
+    return codes, scales
+
+
+def int8_scores(
+    codes: np.ndarray, scales: np.ndarray, queries: np.ndarray, chunk_size: int = 65536
+) -> np.ndarray:
+    """
+    int8 コードとクエリの近似内積（候補数 x クエリ数）。
+
+    float への変換はチャンク単位で行い、一時的なメモリを chunk_size 行分に抑える。
+    """
+    weighted = (queries * scales).T
+    scores = np.empty((len(codes), len(queries)), dtype=np.float32)
+    for start in range(0, len(codes), chunk_size):
+        chunk = codes[start : start + chunk_size].astype(np.float32)
+        scores[start : start + chunk_size] = chunk @ weighted
+    return scores
+
+
+def quantize_binary(matrix: np.ndarray) -> np.ndarray:
+    """符号ビットに量子化して 8 次元ずつ 1 バイトに詰める。"""
+    return np.packbits(matrix > 0, axis=1)
+
+
+def binary_scores(codes: np.ndarray, queries: np.ndarray, dimensions: int) -> np.ndarray:
+    """
+    符号ビットの一致度（次元数 - 2 x ハミング距離, 候補数 x クエリ数）。
+
+    符号ベクトル同士の内積に等しく、大きいほど近い。
+    """
+    query_codes = quantize_binary(queries)
+    scores = np.empty((len(codes), len(queries)), dtype=np.float32)
+    for i, query_code in enumerate(query_codes):
+        hamming = _POPCOUNT[np.bitwise_xor(codes, query_code)].sum(axis=1, dtype=np.int32)
+        scores[:, i] = dimensions - 2 * hamming
+    return scores
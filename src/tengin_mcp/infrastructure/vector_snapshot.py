@@ -0,0 +1,217 @@
+"""Infrastructure: Vector store snapshot export / import (.npz)."""
+
+import json
+import struct
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from tengin_mcp.infrastructure.adapters.vector_store import VectorStore
+from tengin_mcp.infrastructure.vector_compression import VectorReducer
+
+# スナップショットの形式のバージョン（互換性のない変更で上げる）
+SNAPSHOT_FORMAT = 1
+
+# ZIP のローカルファイルヘッダー（ファイル名長・拡張フィールド長は 26 バイト目から）
+_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+def _json_array(value: Any) -> np.ndarray:
+    """JSON を uint8 配列に変換（pickle を使わずに npz に格納するため）。"""
+    return np.frombuffer(json.dumps(value, ensure_ascii=False).encode("utf-8"), dtype=np.uint8)
+
+
+def _read_json(archive: Any, name: str) -> Any:
+    """uint8 配列に格納した JSON を読み込む。"""
+    return json.loads(archive[name].tobytes().decode("utf-8"))
+
+
+def _memmap_member(path: Path, name: str) -> np.ndarray:
+    """
+    非圧縮の npz のメンバーをメモリマップで開く。
+
+    np.load は npz の mmap_mode を無視するため、ZIP のローカルヘッダーと .npy のヘッダーを読んで
+    配列データの位置を求め、アーカイブ内のデータを直接マップする。
+
+    Raises:
+        ValueError: メンバーが圧縮されている場合
+    """
+    with zipfile.ZipFile(path) as archive:
+        info = archive.getinfo(f"{name}.npy")
+    if info.compress_type != zipfile.ZIP_STORED:
+        raise ValueError(f"Snapshot member {name} is compressed and cannot be memory-mapped")
+    with open(path, "rb") as f:
+        f.seek(info.header_offset)
+        header = _LOCAL_HEADER.unpack(f.read(_LOCAL_HEADER.size))
+        f.seek(header[-2] + header[-1], 1)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if shape[0] == 0:
+        return np.zeros(shape, dtype=dtype)
+    return np.memmap(
+        path, dtype=dtype, mode="r", shape=shape, order="F" if fortran_order else "C", offset=offset
+    )
+
+
+@dataclass
+class VectorSnapshot:
+    """
+    ベクトルストアのスナップショット。
+
+    ベクトルは次元削減を適用した、ストアに格納されている値そのもので、読み込み時は
+    埋め込み・変換をせずにそのまま書き込む。PCA の場合は学習済みの成分も含む。
+    """
+
+    ids: list[str]
+    vectors: np.ndarray
+    documents: list[str]
+    metadatas: list[dict[str, Any]]
+    model_id: str
+    reducer: VectorReducer
+
+    @property
+    def content_hashes(self) -> list[str]:
+        """ドキュメントごとの content_hash（増分同期の変更検出用）。"""
+        return [str(m.get("content_hash", "")) for m in self.metadatas]
+
+    def save(self, path: Path) -> None:
+        """
+        単一の非圧縮 .npz に保存（一時ファイルからの置き換え）。
+
+        ID・content_hash は固定長の文字列配列、本文・メタデータは JSON として格納する。
+        """
+        arrays: dict[str, np.ndarray] = {
+            "header": _json_array(
+                {
+                    "format": SNAPSHOT_FORMAT,
+                    "model_id": self.model_id,
+                    **self.reducer.metadata(),
+                }
+            ),
+            "ids": np.array(self.ids, dtype=str),
+            "content_hashes": np.array(self.content_hashes, dtype=str),
+            "vectors": np.ascontiguousarray(self.vectors, dtype=np.float32),
+            "documents": _json_array(self.documents),
+            "metadatas": _json_array(self.metadatas),
+        }
+        if self.reducer.method == "pca" and self.reducer.fitted:
+            arrays["reduction_mean"] = self.reducer.mean
+            arrays["reduction_components"] = self.reducer.components
+        tmp = path.with_name(f"{path.name}.tmp.npz")
+        np.savez(tmp, **arrays)
+        tmp.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "VectorSnapshot":
+        """
+        スナップショットを読み込む（ベクトルはメモリマップで開き、書き込み時に必要な分だけ読む）。
+
+        Raises:
+            ValueError: 形式のバージョンが異なる場合
+        """
+        with np.load(path) as archive:
+            header = _read_json(archive, "header")
+            if header.get("format") != SNAPSHOT_FORMAT:
+                raise ValueError(
+                    f"Unsupported snapshot format {header.get('format')} (expected {SNAPSHOT_FORMAT})"
+                )
+            reducer = VectorReducer(header["vector_reduction"], header["vector_dimensions"])
+            if "reduction_components" in archive:
+                reducer.mean = archive["reduction_mean"]
+                reducer.components = archive["reduction_components"]
+            ids = archive["ids"].tolist()
+            documents = _read_json(archive, "documents")
+            metadatas = _read_json(archive, "metadatas")
+        return cls(
+            ids=ids,
+            vectors=_memmap_member(path, "vectors"),
+            documents=documents,
+            metadatas=metadatas,
+            model_id=header["model_id"],
+            reducer=reducer,
+        )
+
+
+async def export_snapshot(vector_store: VectorStore, path: Path) -> VectorSnapshot:
+    """
+    ベクトルストアの全ドキュメントをスナップショットに書き出す。
+
+    Args:
+        vector_store: 接続済みのベクトルストア
+        path: 出力先（.npz）
+
+    Returns:
+        書き出したスナップショット
+
+    Raises:
+        ValueError: ストアが空、または複数の埋め込みモデルが混在している場合
+    """
+    data = await vector_store.get_vectors()
+    if not data["ids"]:
+        raise ValueError("Vector store is empty")
+    model_ids = {m.get("embedding_model") for m in data["metadatas"]}
+    if len(model_ids) != 1 or None in model_ids:
+        raise ValueError(
+            f"Vector store has mixed or missing embedding models {sorted(map(str, model_ids))}; "
+            "run build_vector_index before exporting"
+        )
+    snapshot = VectorSnapshot(
+        ids=data["ids"],
+        vectors=data["embeddings"],
+        documents=data["documents"],
+        metadatas=data["metadatas"],
+        model_id=model_ids.pop(),
+        reducer=vector_store.reducer,
+    )
+    snapshot.save(path)
+    return snapshot
+
+
+async def import_snapshot(
+    vector_store: VectorStore, path: Path, model_id: str, replace: bool = False
+) -> VectorSnapshot:
+    """
+    スナップショットをベクトルストアに一括で読み込む。
+
+    埋め込みモデルと次元削減の設定がスナップショットと一致する場合のみ読み込み、
+    ベクトルは再埋め込みせずにそのまま書き込む。
+
+    Args:
+        vector_store: 接続済みのベクトルストア
+        path: スナップショット（.npz）
+        model_id: 現在の埋め込みモデルID（provider/model）
+        replace: True の場合は既存のドキュメントを削除してから読み込む
+
+    Returns:
+        読み込んだスナップショット
+
+    Raises:
+        ValueError: モデル・次元削減が一致しない、またはストアが空でない場合
+    """
+    snapshot = VectorSnapshot.load(path)
+    if snapshot.model_id != model_id:
+        raise ValueError(
+            f"Snapshot embedding model {snapshot.model_id} != current model {model_id}"
+        )
+    if snapshot.reducer.id != vector_store.reducer.id:
+        raise ValueError(
+            f"Snapshot reduction {snapshot.reducer.id} != VECTOR_REDUCTION "
+            f"{vector_store.reducer.id}"
+        )
+    if await vector_store.get_count():
+        if not replace:
+            raise ValueError("Vector store is not empty (use replace to overwrite)")
+        await vector_store.reset()
+    if snapshot.reducer.method == "pca":
+        await vector_store.set_reducer(snapshot.reducer)
+    await vector_store.load_vectors(
+        snapshot.ids, snapshot.documents, snapshot.vectors, snapshot.metadatas
+    )
+    return snapshot
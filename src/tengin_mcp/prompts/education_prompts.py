@@ -40,8 +40,10 @@ async def design_lesson(
 ## 設計に活用すべき教育理論
 以下のツールを使用して、関連する教育理論を検索・参照してください：
 - `search_theories`: トピックに関連する理論を検索
+- `batch_semantic_search`: トピックの言い換えや想定される学習上の課題をまとめて意味検索（fuse=true で統合）
 - `get_theory`: 理論の詳細情報を取得
 - `get_principles`: 理論の実践原則を取得
+- `get_context_pack`: 候補に挙がった理論・概念のIDをまとめて渡し、要点をトークン予算内で取得
 
 ## 出力形式
 1. **学習目標** - 具体的で測定可能な目標（ブルームの分類法に基づく）
@@ -142,6 +144,7 @@ async def explain_theory(
 ## 情報収集
 以下のツールを使用して、理論の詳細情報を取得してください：
 - `search_theories`: "{theory_name}" で検索して理論IDを特定
+- `graphrag_retrieve`: "{theory_name}" の関連概念・エビデンス・提唱者をまとめて取得（以下の個別ツールの前に1回で概観）
 - `get_theory`: 理論の詳細情報を取得
 - `get_concept`: 関連概念を取得
 - `get_theorist`: 提唱者の情報を取得
@@ -187,6 +190,7 @@ async def apply_theory(
 ## 情報収集
 以下のツールを使用して情報を収集してください：
 - `search_theories`: "{theory_name}" で検索
+- `graphrag_retrieve`: 理論と適用文脈に関連する原則・エビデンスをまとめて取得
 - `get_theory`: 理論の詳細を取得
 - `get_principles`: 実践原則を取得
 - `get_evidence`: 類似文脈でのエビデンスを確認
@@ -229,7 +233,9 @@ async def curriculum_plan(
 ## 設計に活用すべき教育理論
 以下のツールを使用して、関連する教育理論を検索・参照してください：
 - `search_theories`: "curriculum" "instructional design" で検索
+- `batch_semantic_search`: 各単元のテーマをまとめて意味検索（単元ごとの関連理論を1回で取得）
 - `get_theories_by_category`: "instructional" カテゴリの理論を取得
+- `get_context_pack`: 各単元で採用する理論のIDをまとめて渡し、要点をトークン予算内で取得
 - `get_principles`: カリキュラム設計の原則を取得
 
 ## 考慮すべき理論的枠組み
@@ -276,6 +282,7 @@ async def troubleshoot_learning(
 ## 分析に活用すべき教育理論
 以下のツールを使用して、関連する教育理論を検索・参照してください：
 - `search_theories`: 問題に関連するキーワードで検索
+- `batch_semantic_search`: 問題の症状を複数の言い方で意味検索（fuse=true で統合）
 - `get_theory`: 理論の詳細情報を取得
 - `get_evidence`: 介入の効果に関するエビデンスを確認
 
@@ -1,5 +1,6 @@
 """MCP Resources: Theory and graph resource handlers."""
 
+from tengin_mcp.application.services.context_pack import ContextPackBuilder, load_pack_entities
 from tengin_mcp.domain.errors import TheoryNotFoundError
 from tengin_mcp.server import app_state, mcp
 
@@ -198,6 +199,28 @@ async def get_evidence_resource(evidence_id: str) -> str:
     return "\n".join(lines)
 
 
+@mcp.resource("context://{entity_ids}")
+async def get_context_pack_resource(entity_ids: str) -> str:
+    """
+    複数エンティティのコンテキストパックを取得します。
+
+    Args:
+        entity_ids: カンマ区切りのエンティティID（重要な順）
+
+    Returns:
+        トークン予算（1500）内に収めたコンテキスト（Markdown形式）
+    """
+    if not app_state.graph_repository:
+        return "Error: Graph repository not initialized"
+
+    ids = [i.strip() for i in entity_ids.split(",") if i.strip()]
+    entities, missing_ids = await load_pack_entities(app_state.graph_repository, ids)
+    if not entities:
+        return f"Error: Entities not found: {', '.join(missing_ids)}"
+
+    return ContextPackBuilder().build(entities).text
+
+
 @mcp.resource("graph://statistics")
 async def get_graph_statistics_resource() -> str:
     """
@@ -0,0 +1,216 @@
+"""
+埋め込みプロバイダーのベンチマークスクリプト
+
+使用方法:
+    uv run python -m tengin_mcp.scripts.benchmark_embeddings
+    uv run python -m tengin_mcp.scripts.benchmark_embeddings \\
+        --provider stub --provider transformers:BAAI/bge-small-en-v1.5 --output bench.json
+
+data/theories/*.json の全エンティティをコーパスとして、プロバイダー・モデルごとに次を計測し、
+JSON で出力します（回帰の追跡用）:
+    - embed_latency_ms: 評価クエリを1件ずつ埋め込んだ遅延のパーセンタイル
+    - batch_throughput: コーパスをバッチで埋め込んだスループット
+    - index_build_seconds: 埋め込み + ローカルベクトルストアへの upsert の時間
+    - memory_mb: インデックスのサイズの推定値（件数 x 次元 x 4 バイト）と最大常駐メモリ
+    - recall: 評価セット（data/benchmarks/embedding_eval.json）の recall@k
+
+デフォルトはオフラインで動くスタブのプロバイダー（stub）です。--provider は
+<provider>[:<model>] の形式で複数指定でき、モデルを省略するとプロバイダーの既定モデルを使用します。
+ベクトルストアは一時ディレクトリのローカルストア（次元削減・量子化なし）を使用します。
+最大常駐メモリ（ru_maxrss）はプロセス全体の最大値のため、プロバイダーごとに子プロセスで計測します。
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from tengin_mcp.application.services.embedding_benchmark import (
+    EmbeddingBenchmark,
+    EvalQuery,
+    load_eval_set,
+)
+from tengin_mcp.application.services.vector_indexer import EntityDocument, build_documents
+from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.local_vector_adapter import LocalVectorAdapter
+from tengin_mcp.infrastructure.config import Settings
+from tengin_mcp.scripts.build_vector_index import DEFAULT_DATA_DIR, load_entities_from_json
+
+DEFAULT_EVAL_SET = DEFAULT_DATA_DIR.parent / "benchmarks" / "embedding_eval.json"
+
+
+def parse_provider(spec: str) -> tuple[str, str]:
+    """<provider>[:<model>] をプロバイダーとモデルに分ける（Ollama のタグを含むモデル名に対応）。"""
+    provider, _, model = spec.partition(":")
+    return provider, model or EmbeddingAdapter.DEFAULT_MODELS.get(provider, "")
+
+
+async def benchmark_provider(
+    settings: Settings,
+    provider: str,
+    model: str,
+    documents: list[EntityDocument],
+    queries: list[EvalQuery],
+    batch_size: int,
+    ks: tuple[int, ...],
+) -> dict[str, Any]:
+    """1つのプロバイダー・モデルを計測（失敗した場合はエラーを記録）。"""
+    with tempfile.TemporaryDirectory(prefix="tengin-bench-") as path:
+        bench_settings = settings.model_copy(
+            update={
+                "embedding_provider": provider,
+                "embedding_model": model,
+                "embedding_cache_path": "",
+                "embedding_batch_window_ms": 0,
+                "local_vector_path": path,
+                "vector_reduction": "none",
+                "vector_quantization": "none",
+            }
+        )
+        embedding = EmbeddingAdapter(bench_settings)
+        vector_store = LocalVectorAdapter(bench_settings)
+        try:
+            await embedding.connect()
+            await vector_store.connect()
+            benchmark = EmbeddingBenchmark(embedding, vector_store, batch_size=batch_size, ks=ks)
+            result = await benchmark.run(documents, queries)
+            return result.to_dict()
+        except Exception as e:
+            return {"provider": provider, "model": model, "error": str(e)}
+        finally:
+            await embedding.close()
+            await vector_store.close()
+
+
+def _run_benchmark(
+    settings: Settings,
+    provider: str,
+    model: str,
+    documents: list[EntityDocument],
+    queries: list[EvalQuery],
+    batch_size: int,
+    ks: tuple[int, ...],
+) -> dict[str, Any]:
+    """子プロセスの入口。"""
+    return asyncio.run(
+        benchmark_provider(settings, provider, model, documents, queries, batch_size, ks)
+    )
+
+
+async def benchmark_isolated(
+    settings: Settings,
+    provider: str,
+    model: str,
+    documents: list[EntityDocument],
+    queries: list[EvalQuery],
+    batch_size: int,
+    ks: tuple[int, ...],
+) -> dict[str, Any]:
+    """
+    1つのプロバイダー・モデルを子プロセス（spawn）で計測。
+
+    先に計測したプロバイダーのモデルやバッファが後のプロバイダーの最大常駐メモリに
+    含まれないよう、プロバイダーごとにプロセスを分ける。
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                executor,
+                _run_benchmark,
+                settings,
+                provider,
+                model,
+                documents,
+                queries,
+                batch_size,
+                ks,
+            )
+        except BrokenProcessPool as e:
+            return {"provider": provider, "model": model, "error": f"worker crashed: {e}"}
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """非同期メイン関数"""
+    settings = Settings()
+    documents = build_documents(load_entities_from_json(Path(args.data_dir)))
+    queries = load_eval_set(Path(args.eval_set))
+    ks = tuple(args.k or (1, 5, 10))
+    providers = [parse_provider(spec) for spec in args.provider or ["stub"]]
+
+    results = []
+    for provider, model in providers:
+        print(f"--- {provider}/{model} ---", file=sys.stderr)
+        result = await benchmark_isolated(
+            settings, provider, model, documents, queries, args.batch_size, ks
+        )
+        if "error" in result:
+            print(f"✗ {result['error']}", file=sys.stderr)
+        else:
+            print(
+                f"✓ p50 {result['embed_latency_ms']['p50']}ms, "
+                f"{result['batch_throughput']['documents_per_second']} docs/s, "
+                f"recall {result['recall']}",
+                file=sys.stderr,
+            )
+        results.append(result)
+
+    report = {
+        "generated_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "corpus_documents": len(documents),
+        "eval_set": str(args.eval_set),
+        "queries": len(queries),
+        "ks": list(ks),
+        "results": results,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+        print(f"✓ {args.output} に書き出しました", file=sys.stderr)
+    else:
+        print(output)
+
+
+def main() -> None:
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description="埋め込みプロバイダーのベンチマークを実行します")
+    parser.add_argument(
+        "--provider",
+        action="append",
+        help="<provider>[:<model>]（複数指定可, デフォルト: stub）",
+    )
+    parser.add_argument(
+        "--eval-set",
+        default=str(DEFAULT_EVAL_SET),
+        help="評価セットの JSON（クエリと期待する理論ID）",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=str(DEFAULT_DATA_DIR),
+        help="コーパスの JSON ディレクトリ",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=64,
+        help="コーパスの埋め込み1回あたりの件数（デフォルト: 64）",
+    )
+    parser.add_argument(
+        "--k",
+        type=int,
+        action="append",
+        help="recall@k の k（複数指定可, デフォルト: 1, 5, 10）",
+    )
+    parser.add_argument("--output", help="結果の JSON の出力先（省略時は標準出力）")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+"""
+ベクトルインデックス構築スクリプト
+
+使用方法:
+    uv run python -m tengin_mcp.scripts.build_vector_index
+    uv run python -m tengin_mcp.scripts.build_vector_index --source json --batch-size 32 --concurrency 2
+
+Theory, Concept, Principle, Methodology, Evidence, Context, Theorist の各エンティティを
+1エンティティ1ドキュメントとして埋め込み、ベクトルストア（VECTOR_BACKEND: ChromaDB の
+education_theories コレクション、または local のプロセス内ストア）に upsert します。ドキュメントIDはエンティティIDのため、何度実行しても結果は同じです（冪等）。
+
+各ドキュメントのメタデータに本文のハッシュ（content_hash）と埋め込みモデル（embedding_model）を
+記録し、再実行時は新規・変更されたエンティティのみを埋め込み、削除されたエンティティを
+コレクションから削除します。--full を指定すると全件を再埋め込みします。
+
+MULTILINGUAL_INDEX=true の場合は各エンティティの英語ビュー（ID: {id}#en）も埋め込みます。
+EMBEDDING_MODEL_EN が異なる場合、英語ビューはそのモデルで別のコレクション（_en）に格納します。
+
+データソース:
+    - neo4j: 投入済みのグラフから読み込む（デフォルト）
+    - json: data/theories/*.json から読み込む（Neo4j なしで構築する場合）
+"""
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+from tengin_mcp.application.services.semantic_search import VECTOR_ENTITY_TYPES
+from tengin_mcp.application.services.vector_indexer import (
+    EntityDocument,
+    VectorIndexer,
+    build_documents,
+)
+from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.neo4j_adapter import Neo4jAdapter
+from tengin_mcp.infrastructure.adapters.vector_store import (
+    create_vector_store,
+    english_view_settings,
+)
+from tengin_mcp.infrastructure.config import Settings
+from tengin_mcp.infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+
+# JSON のトップレベルキー → エンティティタイプ
+JSON_ENTITY_KEYS = {
+    "theories": "Theory",
+    "concepts": "Concept",
+    "principles": "Principle",
+    "methodologies": "Methodology",
+    "evidence": "Evidence",
+    "contexts": "Context",
+    "theorists": "Theorist",
+}
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parent.parent.parent.parent / "data" / "theories"
+
+
+def load_entities_from_json(data_dir: Path) -> list[dict[str, Any]]:
+    """
+    data/theories/*.json からエンティティを読み込む。
+
+    ファイル名順に読み込むため、同じIDは *_extended.json の内容が優先される。
+
+    Args:
+        data_dir: JSON ファイルのディレクトリ
+
+    Returns:
+        [{"entity_type": ..., "properties": {...}}, ...]
+    """
+    entities: list[dict[str, Any]] = []
+    for path in sorted(data_dir.glob("*.json")):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        for key, entity_type in JSON_ENTITY_KEYS.items():
+            items = data.get(key) if isinstance(data, dict) else None
+            if isinstance(items, list):
+                entities.extend(
+                    {"entity_type": entity_type, "properties": item}
+                    for item in items
+                    if isinstance(item, dict)
+                )
+    return entities
+
+
+async def load_entities_from_neo4j(repository: Neo4jGraphRepository) -> list[dict[str, Any]]:
+    """
+    Neo4j からエンティティを読み込む。
+
+    Args:
+        repository: グラフリポジトリ
+
+    Returns:
+        [{"entity_type": ..., "properties": {...}}, ...]
+    """
+    rows = await repository.get_entities(list(VECTOR_ENTITY_TYPES))
+    entities = []
+    for row in rows:
+        entity_type = next((t for t in VECTOR_ENTITY_TYPES if t in row["labels"]), None)
+        if entity_type:
+            entities.append({"entity_type": entity_type, "properties": row["properties"]})
+    return entities
+
+
+async def load_entities(source: str, settings: Settings, data_dir: Path) -> list[dict[str, Any]]:
+    """データソースからエンティティを読み込む。"""
+    if source == "json":
+        return load_entities_from_json(data_dir)
+
+    adapter = Neo4jAdapter(settings)
+    await adapter.connect()
+    try:
+        return await load_entities_from_neo4j(Neo4jGraphRepository(adapter))
+    finally:
+        await adapter.close()
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """非同期メイン関数"""
+    print("=" * 60)
+    print("TENGIN GraphRAG - ベクトルインデックス構築")
+    print("=" * 60)
+
+    settings = Settings()
+    english_settings = english_view_settings(settings)
+    entities = await load_entities(args.source, settings, Path(args.data_dir))
+    if args.entity_type:
+        entities = [e for e in entities if e["entity_type"] in args.entity_type]
+    # 同じモデルの場合は英語ビューも同じストアに格納
+    languages = ("ja", "en") if settings.multilingual_index and not english_settings else ("ja",)
+    documents = build_documents(entities, languages)
+    counts: dict[str, int] = {}
+    for document in documents:
+        counts[document.entity_type] = counts.get(document.entity_type, 0) + 1
+    print(f"✓ {args.source} からドキュメントを作成しました: {len(documents)}件")
+    for entity_type, count in counts.items():
+        print(f"  {entity_type}: {count}件")
+
+    await sync_store(settings, documents, args)
+    if english_settings:
+        english_documents = build_documents(entities, ("en",))
+        print(f"\n✓ 英語ビューを作成しました: {len(english_documents)}件")
+        await sync_store(english_settings, english_documents, args)
+
+
+async def sync_store(
+    settings: Settings, documents: list[EntityDocument], args: argparse.Namespace
+) -> None:
+    """ドキュメントを埋め込んでベクトルストアに同期し、結果を表示。"""
+    vector_store = create_vector_store(settings)
+    embedding = EmbeddingAdapter(settings)
+    await vector_store.connect()
+    await embedding.connect()
+    try:
+        indexer = VectorIndexer(
+            vector_store,
+            embedding,
+            batch_size=args.batch_size or settings.embedding_batch_size,
+            concurrency=args.concurrency or settings.embedding_concurrency,
+        )
+        print(
+            f"\n--- 埋め込み（{embedding.provider}/{embedding.model}, "
+            f"バッチ {indexer.batch_size}件） ---"
+        )
+        report = await indexer.sync(documents, full=args.full, entity_types=args.entity_type)
+        if report.rebuilt:
+            print(
+                f"✓ 次元削減（{indexer.compression_id}）・コサイン距離に合わせて"
+                "インデックスを作り直しました"
+            )
+        print(
+            f"✓ 新規 {report.added}件, 更新 {report.updated}件, 変更なし {report.unchanged}件, "
+            f"削除 {report.deleted}件"
+        )
+        print(
+            f"✓ {report.indexed}件を埋め込んで upsert しました"
+            f"（{report.batches}バッチ, {report.elapsed_seconds:.2f}秒）"
+        )
+        print(f"  コレクション内のドキュメント数: {await vector_store.get_count()}")
+    finally:
+        await embedding.close()
+        await vector_store.close()
+
+
+def main() -> None:
+    """メイン関数"""
+    parser = argparse.ArgumentParser(description="ベクトルインデックスを構築します")
+    parser.add_argument(
+        "--source",
+        choices=["neo4j", "json"],
+        default="neo4j",
+        help="エンティティの読み込み元（デフォルト: neo4j）",
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=str(DEFAULT_DATA_DIR),
+        help="--source json の場合の JSON ディレクトリ",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="1回の埋め込み呼び出しのドキュメント数（デフォルト: EMBEDDING_BATCH_SIZE）",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="同時に実行するバッチ数（デフォルト: EMBEDDING_CONCURRENCY）",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="変更の有無に関わらず全ドキュメントを再埋め込みする",
+    )
+    parser.add_argument(
+        "--entity-type",
+        action="append",
+        choices=VECTOR_ENTITY_TYPES,
+        help="指定したエンティティタイプだけを同期する（複数指定可, --full と併用でタイプ単位の再構築）",
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+グラフ分析指標の事前計算スクリプト
+
+使用方法:
+    uv run python -m tengin_mcp.scripts.compute_graph_analytics
+
+データ投入（seed_data / seed_extended_data）の後に実行し、
+理論ノードに以下のプロパティを書き戻します:
+    - pagerank: 影響度（PageRank）
+    - betweenness: 媒介中心性
+    - community_id: Louvain 法によるコミュニティ
+    - similar_theory_ids / similarity_scores: 近傍の Jaccard 類似度による類似理論
+
+書き戻した値は get_influential_theories / get_theory_clusters ツールから参照されます。
+"""
+
+import asyncio
+import time
+
+from tengin_mcp.application.services.graph_analytics import compute_theory_analytics
+from tengin_mcp.infrastructure.adapters.neo4j_adapter import Neo4jAdapter
+from tengin_mcp.infrastructure.config import Settings
+from tengin_mcp.infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+
+
+async def run_analytics(repository: Neo4jGraphRepository) -> int:
+    """
+    分析指標を計算して理論ノードに書き戻す。
+
+    Args:
+        repository: グラフリポジトリ
+
+    Returns:
+        更新した理論数
+    """
+    started = time.perf_counter()
+    snapshot = await repository.get_graph_snapshot()
+    print(
+        f"✓ グラフを読み込みました: ノード {len(snapshot['nodes'])}件, "
+        f"エッジ {len(snapshot['edges'])}件"
+    )
+
+    analytics = compute_theory_analytics(snapshot["nodes"], snapshot["edges"])
+    rows = [{"id": a.id, "properties": a.to_properties()} for a in analytics]
+    await repository.write_theory_analytics(rows)
+
+    communities = {a.community_id for a in analytics}
+    print(
+        f"✓ 理論 {len(analytics)}件に分析指標を書き戻しました（コミュニティ {len(communities)}件）"
+    )
+
+    top = sorted(analytics, key=lambda a: a.pagerank, reverse=True)[:5]
+    print("\n--- PageRank 上位 ---")
+    for a in top:
+        print(f"  {a.id}: {a.pagerank:.4f} (community={a.community_id})")
+
+    print(f"\n✓ 完了しました（{time.perf_counter() - started:.2f}秒）")
+    return len(analytics)
+
+
+async def main_async() -> None:
+    """非同期メイン関数"""
+    print("=" * 60)
+    print("TENGIN GraphRAG - グラフ分析指標の事前計算")
+    print("=" * 60)
+
+    adapter = Neo4jAdapter(Settings())
+    await adapter.connect()
+    try:
+        await run_analytics(Neo4jGraphRepository(adapter))
+    finally:
+        await adapter.close()
+
+
+def main() -> None:
+    """メイン関数"""
+    asyncio.run(main_async())
+
+
+if __name__ == "__main__":
+    main()
@@ -370,6 +370,10 @@ class DataSeeder:
                 print(f"  {label}: {count}件")
 
             print("\n✓ データ投入が完了しました！")
+            print("\n次のステップ: グラフ分析指標を事前計算してください")
+            print("  uv run python -m tengin_mcp.scripts.compute_graph_analytics")
+            print("続けてベクトルインデックスを構築してください")
+            print("  uv run python -m tengin_mcp.scripts.build_vector_index")
 
         finally:
             await self.close()
@@ -577,6 +577,10 @@ class ExtendedDataSeeder:
             print("\n" + "=" * 60)
             print("✓ 拡張データ投入が完了しました！")
             print("=" * 60)
+            print("\n次のステップ: グラフ分析指標を事前計算してください")
+            print("  uv run python -m tengin_mcp.scripts.compute_graph_analytics")
+            print("続けてベクトルインデックスを構築してください")
+            print("  uv run python -m tengin_mcp.scripts.build_vector_index")
 
         finally:
             await self.close()
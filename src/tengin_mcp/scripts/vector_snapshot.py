@@ -0,0 +1,94 @@
+"""
+ベクトルインデックスのスナップショット書き出し・読み込みスクリプト
+
+使用方法:
+    uv run python -m tengin_mcp.scripts.vector_snapshot export data/vector_index.npz
+    uv run python -m tengin_mcp.scripts.vector_snapshot import data/vector_index.npz --replace
+
+ベクトルストア（VECTOR_BACKEND）の全ドキュメントの ID・ベクトル・本文・メタデータ・content_hash と
+埋め込みモデルIDを単一の .npz に書き出します。読み込み時は埋め込みモデル（EMBEDDING_PROVIDER /
+EMBEDDING_MODEL）と次元削減（VECTOR_REDUCTION）が一致する場合のみ、再埋め込みせずに一括で書き込むため、
+新しい環境や CI でもインデックスを数秒で用意できます。読み込み後は build_vector_index の増分同期で
+差分だけを埋め込みます。
+
+--english を指定すると英語ビューのストア（EMBEDDING_MODEL_EN が異なる場合）を対象にします。
+"""
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+
+from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.vector_store import (
+    create_vector_store,
+    english_view_settings,
+)
+from tengin_mcp.infrastructure.config import Settings
+from tengin_mcp.infrastructure.vector_snapshot import export_snapshot, import_snapshot
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    """非同期メイン関数"""
+    print("=" * 60)
+    print("TENGIN GraphRAG - ベクトルインデックスのスナップショット")
+    print("=" * 60)
+
+    settings = Settings()
+    if args.english:
+        english_settings = english_view_settings(settings)
+        if english_settings is None:
+            raise SystemExit(
+                "英語ビューは通常のストアに格納されています（MULTILINGUAL_INDEX / EMBEDDING_MODEL_EN）"
+            )
+        settings = english_settings
+
+    path = Path(args.path)
+    vector_store = create_vector_store(settings)
+    await vector_store.connect()
+    started = time.perf_counter()
+    try:
+        if args.command == "export":
+            snapshot = await export_snapshot(vector_store, path)
+            action = "書き出しました"
+        else:
+            embedding = EmbeddingAdapter(settings)
+            snapshot = await import_snapshot(
+                vector_store,
+                path,
+                model_id=f"{embedding.provider}/{embedding.model}",
+                replace=args.replace,
+            )
+            action = "読み込みました"
+        print(
+            f"✓ {len(snapshot.ids)}件（{snapshot.model_id}, {snapshot.reducer.id}, "
+            f"{snapshot.vectors.shape[1]}次元）を{action}（{time.perf_counter() - started:.2f}秒）"
+        )
+        print(f"  ファイル: {path} ({path.stat().st_size / 1024 / 1024:.1f} MB)")
+        print(f"  コレクション内のドキュメント数: {await vector_store.get_count()}")
+    finally:
+        await vector_store.close()
+
+
+def main() -> None:
+    """メイン関数"""
+    parser = argparse.ArgumentParser(
+        description="ベクトルインデックスのスナップショットを書き出し・読み込みます"
+    )
+    parser.add_argument("command", choices=["export", "import"], help="書き出し / 読み込み")
+    parser.add_argument("path", help="スナップショットのファイル（.npz）")
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="import 時に既存のドキュメントを削除してから読み込む",
+    )
+    parser.add_argument(
+        "--english",
+        action="store_true",
+        help="英語ビューのストア（EMBEDDING_MODEL_EN）を対象にする",
+    )
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,11 +8,16 @@ from typing import Any
 from mcp.server.fastmcp import FastMCP
 
 from tengin_mcp.infrastructure import (
-    ChromaDBAdapter,
     EmbeddingAdapter,
     Neo4jAdapter,
     Neo4jGraphRepository,
     Neo4jTheoryRepository,
+    RerankerAdapter,
+    SemanticSearchCache,
+    VectorStore,
+    create_vector_store,
+    documents_per_entity,
+    english_view_settings,
     get_settings,
 )
 
@@ -31,8 +36,18 @@ class AppState:
     def __init__(self) -> None:
         self.settings = get_settings()
         self.neo4j_adapter: Neo4jAdapter | None = None
-        self.chromadb_adapter: ChromaDBAdapter | None = None
+        # VECTOR_BACKEND に応じて ChromaDBAdapter または LocalVectorAdapter
+        self.chromadb_adapter: VectorStore | None = None
         self.embedding_adapter: EmbeddingAdapter | None = None
+        # EMBEDDING_MODEL_EN が異なる場合のみ（英語ビューを別モデル・別コレクションで検索）
+        self.english_vector_store: VectorStore | None = None
+        self.english_embedding: EmbeddingAdapter | None = None
+        # 英語ビューを通常のストアに格納する場合は 2（検索時に多めに取得して重複を除く）
+        self.documents_per_entity = 1
+        # RERANK_PROVIDER=none の場合は None（リランクしない）
+        self.reranker: RerankerAdapter | None = None
+        # SEARCH_CACHE_SIZE=0 の場合は None（セマンティック検索の結果をキャッシュしない）
+        self.search_cache: SemanticSearchCache | None = None
         self.theory_repository: Neo4jTheoryRepository | None = None
         self.graph_repository: Neo4jGraphRepository | None = None
 
@@ -55,14 +70,32 @@ async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
 
     # アダプターを初期化
     app_state.neo4j_adapter = Neo4jAdapter(app_state.settings)
-    app_state.chromadb_adapter = ChromaDBAdapter(app_state.settings)
+    app_state.chromadb_adapter = create_vector_store(app_state.settings)
     app_state.embedding_adapter = EmbeddingAdapter(app_state.settings)
+    english_settings = english_view_settings(app_state.settings)
+    app_state.documents_per_entity = documents_per_entity(app_state.settings)
+    if english_settings:
+        app_state.english_vector_store = create_vector_store(english_settings)
+        app_state.english_embedding = EmbeddingAdapter(english_settings)
+    if app_state.settings.rerank_provider != "none":
+        app_state.reranker = RerankerAdapter(app_state.settings)
+    if app_state.settings.search_cache_size:
+        app_state.search_cache = SemanticSearchCache(
+            max_entries=app_state.settings.search_cache_size,
+            ttl_seconds=app_state.settings.search_cache_ttl_seconds,
+            similarity_threshold=app_state.settings.search_cache_similarity,
+        )
 
     try:
         # 接続
         await app_state.neo4j_adapter.connect()
         await app_state.chromadb_adapter.connect()
         await app_state.embedding_adapter.connect()
+        if app_state.english_vector_store and app_state.english_embedding:
+            await app_state.english_vector_store.connect()
+            await app_state.english_embedding.connect()
+        if app_state.reranker:
+            await app_state.reranker.connect()
 
         # リポジトリを初期化
         app_state.theory_repository = Neo4jTheoryRepository(app_state.neo4j_adapter)
@@ -75,6 +108,7 @@ async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
             "neo4j": app_state.neo4j_adapter,
             "chromadb": app_state.chromadb_adapter,
             "embedding": app_state.embedding_adapter,
+            "reranker": app_state.reranker,
             "theory_repo": app_state.theory_repository,
             "graph_repo": app_state.graph_repository,
         }
@@ -82,6 +116,12 @@ async def lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
     finally:
         # クリーンアップ
         logger.info("Shutting down TENGIN MCP Server...")
+        if app_state.reranker:
+            await app_state.reranker.close()
+        if app_state.english_embedding:
+            await app_state.english_embedding.close()
+        if app_state.english_vector_store:
+            await app_state.english_vector_store.close()
         if app_state.embedding_adapter:
             await app_state.embedding_adapter.close()
         if app_state.chromadb_adapter:
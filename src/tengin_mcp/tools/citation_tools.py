@@ -1,5 +1,6 @@
 """MCP Tools: Citation generation tools."""
 
+from tengin_mcp.application.services.semantic_search import SemanticSearchService
 from tengin_mcp.domain.errors import InvalidQueryError, TheoryNotFoundError
 from tengin_mcp.domain.value_objects import CitationFormat
 from tengin_mcp.server import app_state, mcp
@@ -119,6 +120,7 @@ async def cite_theory(
 @mcp.tool()
 async def compare_theories(
     theory_ids: list[str],
+    related_limit: int = 0,
 ) -> dict:
     """
     複数の教育理論を比較します。
@@ -128,6 +130,8 @@ async def compare_theories(
 
     Args:
         theory_ids: 比較する理論のIDリスト（2〜5個）
+        related_limit: 各理論に意味的に近いエンティティを返す件数（0〜20、0 で無効）。
+                       全理論を1回のベクトル検索で調べ、複数の理論に共通する近傍も返します。
 
     Returns:
         理論の比較結果
@@ -138,6 +142,9 @@ async def compare_theories(
     if len(theory_ids) > 5:
         raise InvalidQueryError("一度に比較できる理論は5つまでです")
 
+    if related_limit < 0 or related_limit > 20:
+        raise InvalidQueryError("related_limitは0〜20の範囲で指定してください")
+
     if not app_state.theory_repository:
         return {"error": "Theory repository not initialized", "theories": []}
 
@@ -170,12 +177,75 @@ async def compare_theories(
         list(set.intersection(*all_keywords)) if all_keywords and len(all_keywords) > 1 else []
     )
 
+    analysis = {
+        "same_category": same_category,
+        "categories": list(set(categories)),
+        "common_keywords": common_keywords,
+    }
+    if related_limit > 0:
+        analysis["shared_related"] = await _attach_related(theories, related_limit)
+
     return {
         "theory_count": len(theories),
         "theories": theories,
-        "analysis": {
-            "same_category": same_category,
-            "categories": list(set(categories)),
-            "common_keywords": common_keywords,
-        },
+        "analysis": analysis,
     }
+
+
+async def _attach_related(theories: list[dict], related_limit: int) -> list[dict]:
+    """
+    各理論に意味的に近いエンティティ（related）を付与し、複数の理論に共通する近傍を返す。
+
+    理論ごとのクエリを1回の埋め込み・1回のベクトル検索でまとめて実行する。
+    ベクトル検索が未初期化の場合は何も付与しない。
+    """
+    found = [t for t in theories if "error" not in t]
+    if not found or not (
+        app_state.chromadb_adapter and app_state.embedding_adapter and app_state.graph_repository
+    ):
+        return []
+
+    service = SemanticSearchService(
+        app_state.chromadb_adapter,
+        app_state.embedding_adapter,
+        app_state.graph_repository,
+        documents_per_entity=app_state.documents_per_entity,
+    )
+    compared = {t["id"] for t in found}
+    response = await service.search_many(
+        queries=[
+            "\n".join(filter(None, [t["name"], t.get("name_en"), t.get("description")]))
+            for t in found
+        ],
+        # 比較対象の理論自身を除いても related_limit 件残るように多めに取得
+        limit=related_limit + len(compared),
+    )
+
+    shared: dict[str, dict] = {}
+    for theory, result in zip(found, response["queries"], strict=True):
+        related = [item for item in result["results"] if item["id"] not in compared]
+        theory["related"] = [
+            {
+                "id": item["id"],
+                "name": item["name"],
+                "entity_type": item["entity_type"],
+                "similarity": item["similarity"],
+            }
+            for item in related[:related_limit]
+        ]
+        for item in theory["related"]:
+            entry = shared.setdefault(
+                item["id"],
+                {
+                    "id": item["id"],
+                    "name": item["name"],
+                    "entity_type": item["entity_type"],
+                    "theory_ids": [],
+                },
+            )
+            entry["theory_ids"].append(theory["id"])
+
+    return sorted(
+        (entry for entry in shared.values() if len(entry["theory_ids"]) > 1),
+        key=lambda entry: -len(entry["theory_ids"]),
+    )
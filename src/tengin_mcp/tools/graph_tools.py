@@ -1,8 +1,24 @@
 """MCP Tools: Graph traversal and analysis tools."""
 
+from tengin_mcp.application.services.path_engine import PathEngine
+from tengin_mcp.application.services.subgraph import DEFAULT_COMPACT_PROPERTIES, to_columnar
 from tengin_mcp.domain.errors import InvalidQueryError
+from tengin_mcp.infrastructure.cache import get_graph_cache
 from tengin_mcp.server import app_state, mcp
 
+PATH_ENGINE_CACHE_KEY = "path_engine"
+
+
+async def _get_path_engine() -> PathEngine:
+    """グラフスナップショットから経路探索エンジンを取得（Graph キャッシュを利用）。"""
+    cache = get_graph_cache()
+    engine = await cache.get(PATH_ENGINE_CACHE_KEY)
+    if engine is None:
+        snapshot = await app_state.graph_repository.get_graph_snapshot()
+        engine = PathEngine(snapshot["nodes"], snapshot["edges"])
+        await cache.set(PATH_ENGINE_CACHE_KEY, engine)
+    return engine
+
 
 @mcp.tool()
 async def traverse_graph(
@@ -10,6 +26,8 @@ async def traverse_graph(
     relationship_types: list[str] | None = None,
     max_depth: int = 3,
     direction: str = "both",
+    format: str = "full",
+    properties: list[str] | None = None,
 ) -> dict:
     """
     知識グラフをトラバースして関連ノードを取得します。
@@ -22,6 +40,10 @@ async def traverse_graph(
         relationship_types: フィルタするリレーションシップタイプ（オプション）
         max_depth: 最大トラバース深度（デフォルト: 3）
         direction: トラバース方向（outgoing, incoming, both）
+        format: レスポンス形式
+                - "full": ノードの全プロパティとリレーションシップのプロパティを返す（デフォルト）
+                - "compact": 指定プロパティのみを列指向配列で返す（大きな近傍向け）
+        properties: compact 形式で返すノードプロパティ（デフォルト: ["name"]）
 
     Returns:
         ノードとリレーションシップを含むグラフ構造
@@ -35,9 +57,32 @@ async def traverse_graph(
     if direction not in ["outgoing", "incoming", "both"]:
         raise InvalidQueryError("directionはoutgoing, incoming, bothのいずれかを指定してください")
 
+    if format not in ["full", "compact"]:
+        raise InvalidQueryError("formatはfull, compactのいずれかを指定してください")
+
     if not app_state.graph_repository:
         return {"error": "Graph repository not initialized", "nodes": [], "relationships": []}
 
+    if format == "compact":
+        projected = list(dict.fromkeys(properties or DEFAULT_COMPACT_PROPERTIES))
+        rows = await app_state.graph_repository.traverse_projected(
+            start_node_id=start_node_id,
+            properties=projected,
+            relationship_types=relationship_types,
+            max_depth=max_depth,
+            direction=direction,
+        )
+        subgraph = to_columnar(rows["nodes"], rows["edges"], projected)
+        return {
+            "start_node_id": start_node_id,
+            "max_depth": max_depth,
+            "direction": direction,
+            "format": "compact",
+            "node_count": len(subgraph["nodes"]["id"]),
+            "relationship_count": len(subgraph["edges"]["type"]),
+            **subgraph,
+        }
+
     result = await app_state.graph_repository.traverse_extended(
         start_node_id=start_node_id,
         relationship_types=relationship_types,
@@ -61,17 +106,23 @@ async def find_path(
     start_node_id: str,
     end_node_id: str,
     max_depth: int = 5,
+    k: int = 1,
+    weighted: bool = False,
 ) -> dict:
     """
     2つのノード間の最短パスを検索します。
 
     理論間、概念間、または異なるタイプのノード間の
-    関係性を探索します。
+    関係性を探索します。k を指定すると k 本の最短単純パス（Yen のアルゴリズム）を、
+    weighted を指定するとリレーションシップの強度（strong/moderate/weak）を
+    コストとした重み付き最短パスを返します。
 
     Args:
         start_node_id: 開始ノードのID
         end_node_id: 終了ノードのID
         max_depth: 最大パス長（デフォルト: 5）
+        k: 取得するパス数（1〜10、デフォルト: 1）
+        weighted: 強度に基づく重み付き探索を行うか（デフォルト: False）
 
     Returns:
         パス情報（ノードとリレーションシップのシーケンス）
@@ -85,18 +136,36 @@ async def find_path(
     if max_depth < 1 or max_depth > 10:
         raise InvalidQueryError("max_depthは1〜10の範囲で指定してください")
 
+    if k < 1 or k > 10:
+        raise InvalidQueryError("kは1〜10の範囲で指定してください")
+
     if not app_state.graph_repository:
         return {"error": "Graph repository not initialized", "paths": []}
 
-    paths = await app_state.graph_repository.find_path(
-        start_node_id=start_node_id,
-        end_node_id=end_node_id,
-        max_depth=max_depth,
-    )
+    if k == 1 and not weighted:
+        algorithm = "shortest_path"
+        paths = await app_state.graph_repository.find_path(
+            start_node_id=start_node_id,
+            end_node_id=end_node_id,
+            max_depth=max_depth,
+        )
+    else:
+        algorithm = "yen_k_shortest" if k > 1 else "bidirectional_dijkstra"
+        engine = await _get_path_engine()
+        results = engine.k_shortest_paths(
+            start_node_id,
+            end_node_id,
+            k=k,
+            weighted=weighted,
+            max_depth=max_depth,
+        )
+        paths = [engine.to_dict(p) for p in results]
 
     return {
         "start_node_id": start_node_id,
         "end_node_id": end_node_id,
+        "algorithm": algorithm,
+        "weighted": weighted,
         "path_found": len(paths) > 0,
         "paths": paths,
     }
@@ -157,6 +226,84 @@ async def get_graph_statistics() -> dict:
     stats = await app_state.graph_repository.get_statistics()
 
     return {
+        "total_nodes": stats.get("total_nodes", 0),
+        "total_relationships": stats.get("total_relationships", 0),
         "node_counts": stats.get("node_counts", []),
         "relationship_counts": stats.get("relationship_counts", []),
     }
+
+
+@mcp.tool()
+async def get_influential_theories(
+    metric: str = "pagerank",
+    limit: int = 10,
+    category: str | None = None,
+) -> dict:
+    """
+    影響力の大きい教育理論をランキングで取得します。
+
+    事前計算済みの中心性指標（compute_graph_analytics で算出）を参照するため、
+    グラフのトラバースを行わずに回答します。
+
+    Args:
+        metric: ランキング指標（pagerank: 影響度, betweenness: 理論間の橋渡し度）
+        limit: 返す結果の最大数（デフォルト: 10）
+        category: 理論カテゴリでフィルタ（オプション）
+
+    Returns:
+        指標の降順に並んだ理論リスト
+    """
+    if metric not in ("pagerank", "betweenness"):
+        raise InvalidQueryError("metricはpagerank, betweennessのいずれかを指定してください")
+
+    if limit < 1 or limit > 100:
+        raise InvalidQueryError("limitは1〜100の範囲で指定してください")
+
+    if not app_state.graph_repository:
+        return {"error": "Graph repository not initialized", "theories": []}
+
+    theories = await app_state.graph_repository.get_influential_theories(
+        metric=metric,
+        limit=limit,
+        category=category,
+    )
+
+    return {
+        "metric": metric,
+        "category": category,
+        "count": len(theories),
+        "theories": theories,
+    }
+
+
+@mcp.tool()
+async def get_theory_clusters(theory_id: str | None = None) -> dict:
+    """
+    一緒にクラスタを形成する教育理論のグループを取得します。
+
+    事前計算済みのコミュニティ（Louvain 法）と類似度を参照します。
+    theory_id を指定すると、その理論が属するクラスタと類似理論を返します。
+
+    Args:
+        theory_id: 対象理論のID（オプション）
+
+    Returns:
+        クラスタのリスト（および指定理論の類似理論）
+    """
+    if not app_state.graph_repository:
+        return {"error": "Graph repository not initialized", "clusters": []}
+
+    clusters = await app_state.graph_repository.get_theory_clusters(theory_id=theory_id)
+
+    result: dict = {
+        "theory_id": theory_id,
+        "cluster_count": len(clusters),
+        "clusters": clusters,
+    }
+
+    if theory_id:
+        result["similar_theories"] = await app_state.graph_repository.get_similar_theories(
+            theory_id
+        )
+
+    return result
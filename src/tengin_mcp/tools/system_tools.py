@@ -1,5 +1,10 @@
 """MCP Tools: システム管理ツール"""
 
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from tengin_mcp.domain.errors import InvalidQueryError
 from tengin_mcp.infrastructure.cache import (
     clear_all_caches,
     get_graph_cache,
@@ -7,6 +12,9 @@ from tengin_mcp.infrastructure.cache import (
 )
 from tengin_mcp.server import app_state, mcp
 
+# liveness プローブで返すプロセス稼働時間の基準
+_STARTED_AT = time.monotonic()
+
 
 @mcp.tool()
 async def get_cache_stats() -> dict:
@@ -22,7 +30,7 @@ async def get_cache_stats() -> dict:
     theory_stats = theory_cache.get_stats()
     graph_stats = graph_cache.get_stats()
 
-    return {
+    stats: dict[str, Any] = {
         "theory_cache": {
             "hits": theory_stats.hits,
             "misses": theory_stats.misses,
@@ -57,6 +65,27 @@ async def get_cache_stats() -> dict:
         },
     }
 
+    # 埋め込みキャッシュは永続化されるため total には含めない
+    embedding_cache = app_state.embedding_adapter.cache if app_state.embedding_adapter else None
+    if embedding_cache is not None:
+        embedding_stats = embedding_cache.get_stats()
+        stats["embedding_cache"] = {
+            "hits": embedding_stats.hits,
+            "misses": embedding_stats.misses,
+            "hit_rate": round(embedding_stats.hit_rate * 100, 2),
+            "size": embedding_stats.size,
+            "max_size_reached": embedding_stats.max_size,
+        }
+
+    # セマンティック検索の結果キャッシュ（完全一致・近似一致のヒット数を含む）
+    if app_state.search_cache:
+        stats["search_cache"] = app_state.search_cache.get_stats()
+
+    # リランクのペアスコアのキャッシュ（RERANK_PROVIDER 設定時のみ）
+    if app_state.reranker:
+        stats["rerank_cache"] = app_state.reranker.cache_stats()
+    return stats
+
 
 @mcp.tool()
 async def clear_cache(cache_type: str | None = None) -> dict:
@@ -67,7 +96,8 @@ async def clear_cache(cache_type: str | None = None) -> dict:
         cache_type: クリアするキャッシュの種類
                    - "theory": Theory キャッシュのみ
                    - "graph": Graph キャッシュのみ
-                   - None または "all": 全キャッシュ
+                   - "search": セマンティック検索の結果キャッシュのみ
+                   - None または "all": 全キャッシュ（埋め込みキャッシュを除く）
 
     Returns:
         クリア結果
@@ -80,82 +110,132 @@ async def clear_cache(cache_type: str | None = None) -> dict:
         graph_cache = get_graph_cache()
         await graph_cache.clear()
         return {"cleared": "graph", "message": "Graph cache cleared"}
+    elif cache_type == "search":
+        if app_state.search_cache:
+            app_state.search_cache.clear()
+        return {"cleared": "search", "message": "Search cache cleared"}
     else:
         await clear_all_caches()
+        if app_state.search_cache:
+            app_state.search_cache.clear()
         return {"cleared": "all", "message": "All caches cleared"}
 
 
+HEALTH_CHECK_MODES = ("liveness", "readiness", "deep")
+
+
+async def _probe(probe: Callable[[], Awaitable[dict[str, Any]]], timed: bool) -> dict[str, Any]:
+    """
+    コンポーネントのプローブを実行し、結果（と任意でレイテンシ）を返す。
+
+    Args:
+        probe: 追加情報の辞書を返すプローブ
+        timed: レイテンシ（ミリ秒）を計測するか
+
+    Returns:
+        コンポーネントの状態
+    """
+    started = time.perf_counter()
+    try:
+        result = {"status": "healthy", **await probe()}
+    except Exception as e:
+        result = {"status": "unhealthy", "error": str(e)}
+    if timed:
+        result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return result
+
+
+async def _probe_neo4j() -> dict[str, Any]:
+    await app_state.neo4j_adapter.ping()
+    return {}
+
+
+async def _probe_chromadb() -> dict[str, Any]:
+    await app_state.chromadb_adapter.heartbeat()
+    return {}
+
+
+async def _probe_theory_repository() -> dict[str, Any]:
+    return {"theory_count": await app_state.theory_repository.count_theories()}
+
+
+async def _probe_graph_repository() -> dict[str, Any]:
+    stats = await app_state.graph_repository.get_statistics()
+    return {
+        "node_count": stats.get("total_nodes", 0),
+        "relationship_count": stats.get("total_relationships", 0),
+    }
+
+
+async def _probe_vector_store() -> dict[str, Any]:
+    return {"document_count": await app_state.chromadb_adapter.get_count()}
+
+
 @mcp.tool()
-async def health_check() -> dict:
+async def health_check(mode: str = "readiness") -> dict:
     """
     システムの健康状態をチェックします。
 
+    Args:
+        mode: チェックの深さ
+              - "liveness": プロセスの生存確認のみ（I/Oなし）
+              - "readiness": Neo4j への `RETURN 1` と ChromaDB のハートビート（デフォルト）
+              - "deep": readiness に加え、件数取得を含む各コンポーネントのレイテンシを計測
+
     Returns:
         各コンポーネントの状態
     """
-    status = {
+    if mode not in HEALTH_CHECK_MODES:
+        raise InvalidQueryError("modeはliveness, readiness, deepのいずれかを指定してください")
+
+    status: dict[str, Any] = {
         "status": "healthy",
-        "components": {},
+        "mode": mode,
+        "uptime_seconds": round(time.monotonic() - _STARTED_AT, 1),
     }
+    if mode == "liveness":
+        return status
 
-    # Theory Repository チェック
-    if app_state.theory_repository:
-        try:
-            theories = await app_state.theory_repository.get_all()
-            status["components"]["theory_repository"] = {
-                "status": "healthy",
-                "theory_count": len(theories),
-            }
-        except Exception as e:
-            status["components"]["theory_repository"] = {
-                "status": "unhealthy",
-                "error": str(e),
+    deep = mode == "deep"
+    probes: dict[str, tuple[object | None, Callable[[], Awaitable[dict[str, Any]]]]] = {
+        "neo4j": (app_state.neo4j_adapter, _probe_neo4j),
+        "chromadb": (app_state.chromadb_adapter, _probe_chromadb),
+    }
+    if deep:
+        probes.update(
+            {
+                "theory_repository": (app_state.theory_repository, _probe_theory_repository),
+                "graph_repository": (app_state.graph_repository, _probe_graph_repository),
+                "vector_store": (app_state.chromadb_adapter, _probe_vector_store),
             }
-            status["status"] = "degraded"
-    else:
-        status["components"]["theory_repository"] = {
-            "status": "not_initialized",
-        }
+        )
 
-    # Graph Repository チェック
-    if app_state.graph_repository:
-        try:
-            stats = await app_state.graph_repository.get_statistics()
-            status["components"]["graph_repository"] = {
-                "status": "healthy",
-                "node_count": stats.get("total_nodes", 0),
-                "relationship_count": stats.get("total_relationships", 0),
-            }
-        except Exception as e:
-            status["components"]["graph_repository"] = {
-                "status": "unhealthy",
-                "error": str(e),
-            }
-            status["status"] = "degraded"
-    else:
-        status["components"]["graph_repository"] = {
-            "status": "not_initialized",
-        }
+    components: dict[str, dict[str, Any]] = {}
+    for name, (dependency, probe) in probes.items():
+        if dependency is None:
+            components[name] = {"status": "not_initialized"}
+        else:
+            components[name] = await _probe(probe, timed=deep)
 
-    # Vector Repository チェック
-    if app_state.vector_repository:
-        status["components"]["vector_repository"] = {
+    if deep:
+        embedding = app_state.embedding_adapter
+        components["embedding"] = (
+            {"status": "configured", "provider": embedding.provider, "model": embedding.model}
+            if embedding
+            else {"status": "not_initialized"}
+        )
+        components["cache"] = {
             "status": "healthy",
+            "theory_cache_size": get_theory_cache().get_stats().size,
+            "graph_cache_size": get_graph_cache().get_stats().size,
         }
-    else:
-        status["components"]["vector_repository"] = {
-            "status": "not_initialized",
-        }
-
-    # Cache チェック
-    theory_cache = get_theory_cache()
-    graph_cache = get_graph_cache()
-    status["components"]["cache"] = {
-        "status": "healthy",
-        "theory_cache_size": theory_cache.get_stats().size,
-        "graph_cache_size": graph_cache.get_stats().size,
-    }
 
+    states = {c["status"] for c in components.values()}
+    if "unhealthy" in states:
+        status["status"] = "degraded"
+    elif "not_initialized" in states:
+        status["status"] = "not_ready"
+    status["components"] = components
     return status
 
 
@@ -174,13 +254,15 @@ async def get_system_info() -> dict:
         "version": __version__,
         "mcp_version": "1.0",
         "features": {
-            "tools": 23,
-            "resources": 5,
+            "tools": 30,
+            "resources": 6,
             "prompts": 3,
         },
         "capabilities": [
             "theory_search",
+            "semantic_search",
             "graph_traversal",
+            "graph_analytics",
             "citation_generation",
             "methodology_recommendation",
             "context_search",
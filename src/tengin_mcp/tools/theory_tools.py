@@ -1,7 +1,16 @@
 """MCP Tools: Theory search and retrieval tools."""
 
+from tengin_mcp.application.services.context_pack import ContextPackBuilder, load_pack_entities
+from tengin_mcp.application.services.graphrag import GraphRAGService
+from tengin_mcp.application.services.hybrid_search import HybridSearchService
+from tengin_mcp.application.services.rerank import rerank_items
+from tengin_mcp.application.services.semantic_search import (
+    VECTOR_ENTITY_TYPES,
+    LanguageView,
+    SemanticSearchService,
+)
 from tengin_mcp.domain.errors import InvalidQueryError, TheoryNotFoundError
-from tengin_mcp.domain.value_objects import TheoryCategory
+from tengin_mcp.domain.value_objects import EvidenceLevel, TheoryCategory
 from tengin_mcp.server import app_state, mcp
 
 
@@ -62,6 +71,415 @@ async def search_theories(
     }
 
 
+# batch_semantic_search で一度に渡せるクエリ数
+MAX_BATCH_QUERIES = 10
+
+# graphrag_retrieve / get_context_pack のトークン予算の上限
+MAX_CONTEXT_TOKENS = 8000
+
+# get_context_pack で一度に渡せるエンティティ数
+MAX_PACK_ENTITIES = 50
+
+# コンテキストパックの出力形式
+PACK_FORMATS = ("markdown", "json")
+
+
+def _validate_pack_options(max_tokens: int, format: str) -> None:
+    """コンテキストパックのトークン予算と形式を検証。"""
+    if max_tokens < 100 or max_tokens > MAX_CONTEXT_TOKENS:
+        raise InvalidQueryError(f"max_tokensは100〜{MAX_CONTEXT_TOKENS}の範囲で指定してください")
+
+    if format not in PACK_FORMATS:
+        raise InvalidQueryError("formatはmarkdown, jsonのいずれかを指定してください")
+
+
+def _validate_vector_filters(
+    entity_types: list[str] | None,
+    category: str | None,
+    evidence_level: str | None,
+) -> None:
+    """ベクトル検索のフィルタを検証。"""
+    invalid_types = [t for t in entity_types or [] if t not in VECTOR_ENTITY_TYPES]
+    if invalid_types:
+        raise InvalidQueryError(
+            f"無効なエンティティタイプ: {invalid_types}。有効な値: {list(VECTOR_ENTITY_TYPES)}"
+        )
+
+    if category:
+        try:
+            TheoryCategory(category)
+        except ValueError:
+            valid_cats = [c.value for c in TheoryCategory]
+            raise InvalidQueryError(f"無効なカテゴリ: {category}。有効な値: {valid_cats}") from None
+
+    if evidence_level:
+        try:
+            EvidenceLevel(evidence_level)
+        except ValueError:
+            valid_levels = [e.value for e in EvidenceLevel]
+            raise InvalidQueryError(
+                f"無効なエビデンスレベル: {evidence_level}。有効な値: {valid_levels}"
+            ) from None
+
+
+def _english_view() -> LanguageView | None:
+    """別モデルで構築した英語ビュー（EMBEDDING_MODEL_EN 未設定の場合は None）。"""
+    if app_state.english_vector_store and app_state.english_embedding:
+        return LanguageView(app_state.english_vector_store, app_state.english_embedding)
+    return None
+
+
+def _rerank_pool(limit: int, rerank: bool) -> int:
+    """リランクする場合は上位 RERANK_TOP_N 件を候補として取得。"""
+    if rerank and app_state.reranker:
+        return max(limit, app_state.settings.rerank_top_n)
+    return limit
+
+
+async def _apply_rerank(
+    query: str,
+    results: list[dict],
+    limit: int,
+) -> tuple[list[dict], dict]:
+    """候補をリランクし、結果とリランクの情報を返す。"""
+    if not app_state.reranker:
+        return results[:limit], {
+            "applied": False,
+            "reason": "Reranker not configured (RERANK_PROVIDER=none)",
+        }
+    return await rerank_items(
+        app_state.reranker,
+        query,
+        results,
+        limit,
+        budget_ms=app_state.settings.rerank_latency_budget_ms,
+    )
+
+
+@mcp.tool()
+async def semantic_search(
+    query: str,
+    entity_types: list[str] | None = None,
+    category: str | None = None,
+    evidence_level: str | None = None,
+    limit: int = 10,
+    rerank: bool = False,
+) -> dict:
+    """
+    自然言語の質問に意味的に近い理論・概念などをベクトル検索します。
+
+    クエリを埋め込みベクトルに変換して1回のベクトル検索を行い、
+    類似度順のエンティティIDをグラフ上の要約と結合して返します。
+    キーワードが定まらない曖昧な質問に適しています。
+    同じ質問やほぼ同じ意味の質問の結果はキャッシュから返します。
+
+    Args:
+        query: 自然言語の質問・説明文
+        entity_types: エンティティタイプでフィルタ（Theory, Concept, Principle, Methodology, Evidence, Context, Theorist）
+        category: カテゴリでフィルタ（learning, instructional, developmental, motivation, edtech など）
+        evidence_level: エビデンスレベルでフィルタ（strong, moderate, limited, theoretical, emerging）
+        limit: 返す結果の最大数（1〜50、デフォルト: 10）
+        rerank: 上位候補をリランカーで並べ替える（RERANK_PROVIDER の設定が必要、デフォルト: false）
+
+    Returns:
+        類似度順の検索結果
+    """
+    if not query or len(query.strip()) < 2:
+        raise InvalidQueryError("検索クエリは2文字以上必要です")
+
+    if limit < 1 or limit > 50:
+        raise InvalidQueryError("limitは1〜50の範囲で指定してください")
+
+    _validate_vector_filters(entity_types, category, evidence_level)
+
+    if not (
+        app_state.chromadb_adapter and app_state.embedding_adapter and app_state.graph_repository
+    ):
+        return {"error": "Vector search not initialized", "results": []}
+
+    service = SemanticSearchService(
+        app_state.chromadb_adapter,
+        app_state.embedding_adapter,
+        app_state.graph_repository,
+        documents_per_entity=app_state.documents_per_entity,
+        cache=app_state.search_cache,
+        english=_english_view(),
+    )
+    results = await service.search(
+        query=query.strip(),
+        limit=_rerank_pool(limit, rerank),
+        entity_types=entity_types,
+        category=category,
+        evidence_level=evidence_level,
+    )
+
+    response: dict = {
+        "query": query,
+        "filters": {
+            "entity_types": entity_types,
+            "category": category,
+            "evidence_level": evidence_level,
+        },
+    }
+    if rerank:
+        results, response["rerank"] = await _apply_rerank(query.strip(), results, limit)
+
+    return {**response, "count": len(results), "results": results}
+
+
+@mcp.tool()
+async def batch_semantic_search(
+    queries: list[str],
+    entity_types: list[str] | None = None,
+    category: str | None = None,
+    evidence_level: str | None = None,
+    limit: int = 5,
+    fuse: bool = False,
+) -> dict:
+    """
+    複数の質問・言い換えをまとめてベクトル検索します。
+
+    全クエリを1回で埋め込み、1回のベクトル検索でクエリごとの結果を返します。
+    fuse=True の場合は Reciprocal Rank Fusion で統合したランキングも返すため、
+    同じ意図の言い換えを複数渡して取りこぼしを減らす用途に適しています。
+
+    Args:
+        queries: 自然言語の質問・説明文のリスト（1〜10件）
+        entity_types: エンティティタイプでフィルタ（Theory, Concept, Principle, Methodology, Evidence, Context, Theorist）
+        category: カテゴリでフィルタ（learning, instructional, developmental, motivation, edtech など）
+        evidence_level: エビデンスレベルでフィルタ（strong, moderate, limited, theoretical, emerging）
+        limit: クエリごとに返す結果の最大数（1〜50、デフォルト: 5）
+        fuse: 全クエリの結果を統合したランキング（fused）も返す
+
+    Returns:
+        クエリごとの検索結果（fuse=True の場合は統合結果を含む）
+    """
+    queries = [q.strip() for q in queries or []]
+    if not queries or len(queries) > MAX_BATCH_QUERIES:
+        raise InvalidQueryError(f"queriesは1〜{MAX_BATCH_QUERIES}件で指定してください")
+
+    if any(len(q) < 2 for q in queries):
+        raise InvalidQueryError("検索クエリは2文字以上必要です")
+
+    if limit < 1 or limit > 50:
+        raise InvalidQueryError("limitは1〜50の範囲で指定してください")
+
+    _validate_vector_filters(entity_types, category, evidence_level)
+
+    if not (
+        app_state.chromadb_adapter and app_state.embedding_adapter and app_state.graph_repository
+    ):
+        return {"error": "Vector search not initialized", "queries": [], "fused": None}
+
+    service = SemanticSearchService(
+        app_state.chromadb_adapter,
+        app_state.embedding_adapter,
+        app_state.graph_repository,
+        documents_per_entity=app_state.documents_per_entity,
+    )
+    response = await service.search_many(
+        queries=queries,
+        limit=limit,
+        entity_types=entity_types,
+        category=category,
+        evidence_level=evidence_level,
+        fuse=fuse,
+    )
+
+    return {
+        "filters": {
+            "entity_types": entity_types,
+            "category": category,
+            "evidence_level": evidence_level,
+        },
+        **response,
+    }
+
+
+@mcp.tool()
+async def hybrid_search(
+    query: str,
+    entity_types: list[str] | None = None,
+    category: str | None = None,
+    evidence_level: str | None = None,
+    limit: int = 10,
+    rerank: bool = False,
+) -> dict:
+    """
+    キーワード（全文検索）と意味（ベクトル検索）を組み合わせてエンティティを検索します。
+
+    Neo4j の全文検索インデックスとベクトル検索を並行に実行し、Reciprocal Rank Fusion で
+    1つのランキングに統合します。理論名や専門用語の完全一致と、言い換え・説明文での
+    意味的な一致の両方を拾えます。各結果にはソースごとの順位とスコアが含まれます。
+
+    Args:
+        query: 検索クエリ（キーワードまたは自然言語の説明文）
+        entity_types: エンティティタイプでフィルタ（Theory, Concept, Principle, Methodology, Evidence, Context, Theorist）
+        category: 理論カテゴリでフィルタ（learning, instructional, developmental, motivation, edtech）
+        evidence_level: エビデンスレベルでフィルタ（strong, moderate, limited, theoretical, emerging）
+        limit: 返す結果の最大数（1〜50、デフォルト: 10）
+        rerank: 統合後の上位候補をリランカーで並べ替える（RERANK_PROVIDER の設定が必要、デフォルト: false）
+
+    Returns:
+        統合スコア順の検索結果とソースごとの件数・所要時間
+    """
+    if not query or len(query.strip()) < 2:
+        raise InvalidQueryError("検索クエリは2文字以上必要です")
+
+    if limit < 1 or limit > 50:
+        raise InvalidQueryError("limitは1〜50の範囲で指定してください")
+
+    _validate_vector_filters(entity_types, category, evidence_level)
+
+    if not app_state.graph_repository:
+        return {"error": "Graph repository not initialized", "results": []}
+
+    # ベクトル検索が未初期化の場合は全文検索のみで返す
+    service = HybridSearchService(
+        app_state.chromadb_adapter,
+        app_state.embedding_adapter,
+        app_state.graph_repository,
+        documents_per_entity=app_state.documents_per_entity,
+    )
+    response = await service.search(
+        query=query.strip(),
+        limit=_rerank_pool(limit, rerank),
+        entity_types=entity_types,
+        category=category,
+        evidence_level=evidence_level,
+    )
+    if rerank:
+        response["results"], response["rerank"] = await _apply_rerank(
+            query.strip(), response["results"], limit
+        )
+
+    return {
+        "query": query,
+        "filters": {
+            "entity_types": entity_types,
+            "category": category,
+            "evidence_level": evidence_level,
+        },
+        "total": len(response["results"]),
+        **response,
+    }
+
+
+@mcp.tool()
+async def graphrag_retrieve(
+    query: str,
+    entity_types: list[str] | None = None,
+    seed_limit: int = 5,
+    max_hops: int = 2,
+    limit: int = 15,
+    max_tokens: int = 2000,
+    format: str = "markdown",
+    relationship_weights: dict[str, float] | None = None,
+) -> dict:
+    """
+    ベクトル検索とグラフ展開を組み合わせて、質問に答えるためのコンテキストを取得します。
+
+    クエリに意味的に近いエンティティをシードとして、重み付きのリレーションシップに沿って
+    グラフを展開し、ベクトル類似度・グラフ近接度・エビデンスレベルを統合したスコアで
+    順位付けします。結果はトークン予算内に収めた Markdown のコンテキストとして返すため、
+    semantic_search → get_theory → traverse_graph といった複数回の呼び出しを1回で置き換えられます。
+
+    Args:
+        query: 自然言語の質問・説明文
+        entity_types: シードのエンティティタイプでフィルタ（Theory, Concept, Principle, Methodology, Evidence, Context, Theorist）
+        seed_limit: シードにするベクトル検索の上位件数（1〜20、デフォルト: 5）
+        max_hops: シードからの最大ホップ数（0〜3、デフォルト: 2）
+        limit: 返す候補の最大数（1〜50、デフォルト: 15）
+        max_tokens: コンテキストのトークン予算（100〜8000、デフォルト: 2000）
+        format: コンテキストの形式（markdown または json、デフォルト: markdown）
+        relationship_weights: リレーションシップタイプごとの重み（0〜1）。既定の重みを上書きし、0 のタイプは辿りません
+
+    Returns:
+        統合スコア順の候補とコンテキスト
+    """
+    if not query or len(query.strip()) < 2:
+        raise InvalidQueryError("検索クエリは2文字以上必要です")
+
+    if seed_limit < 1 or seed_limit > 20:
+        raise InvalidQueryError("seed_limitは1〜20の範囲で指定してください")
+
+    if max_hops < 0 or max_hops > 3:
+        raise InvalidQueryError("max_hopsは0〜3の範囲で指定してください")
+
+    if limit < 1 or limit > 50:
+        raise InvalidQueryError("limitは1〜50の範囲で指定してください")
+
+    _validate_pack_options(max_tokens, format)
+
+    invalid_weights = {t: w for t, w in (relationship_weights or {}).items() if not 0 <= w <= 1}
+    if invalid_weights:
+        raise InvalidQueryError(
+            f"relationship_weightsは0〜1の範囲で指定してください: {invalid_weights}"
+        )
+
+    _validate_vector_filters(entity_types, None, None)
+
+    if not (
+        app_state.chromadb_adapter and app_state.embedding_adapter and app_state.graph_repository
+    ):
+        return {"error": "Vector search not initialized", "items": [], "context": ""}
+
+    service = GraphRAGService(
+        app_state.chromadb_adapter,
+        app_state.embedding_adapter,
+        app_state.graph_repository,
+        documents_per_entity=app_state.documents_per_entity,
+    )
+    result = await service.retrieve(
+        query=query.strip(),
+        seed_limit=seed_limit,
+        max_hops=max_hops,
+        limit=limit,
+        max_tokens=max_tokens,
+        format=format,
+        entity_types=entity_types,
+        relationship_weights=relationship_weights,
+    )
+
+    return {"query": query, "max_tokens": max_tokens, **result}
+
+
+@mcp.tool()
+async def get_context_pack(
+    entity_ids: list[str],
+    max_tokens: int = 1500,
+    format: str = "markdown",
+) -> dict:
+    """
+    複数のエンティティをトークン予算内のコンパクトなコンテキストにまとめて取得します。
+
+    get_theory などで全フィールドを個別に取得する代わりに、重要度の高いフィールドから
+    全エンティティに均等に予算を配分し、長い説明文は文単位で切り詰め、重複するテキストを
+    省いた Markdown または JSON を返します。同じ入力からは常に同じ出力になります。
+
+    Args:
+        entity_ids: エンティティIDのリスト（1〜50件、重要な順）
+        max_tokens: トークン予算（100〜8000、デフォルト: 1500）
+        format: 出力形式（markdown または json、デフォルト: markdown）
+
+    Returns:
+        コンテキストと、予算の都合で省略したエンティティ・見つからなかったID
+    """
+    entity_ids = [i.strip() for i in entity_ids or [] if i and i.strip()]
+    if not entity_ids or len(entity_ids) > MAX_PACK_ENTITIES:
+        raise InvalidQueryError(f"entity_idsは1〜{MAX_PACK_ENTITIES}件で指定してください")
+
+    _validate_pack_options(max_tokens, format)
+
+    if not app_state.graph_repository:
+        return {"error": "Graph repository not initialized", "context": ""}
+
+    entities, missing_ids = await load_pack_entities(app_state.graph_repository, entity_ids)
+    pack = ContextPackBuilder(max_tokens, format=format).build(entities)
+
+    return {"max_tokens": max_tokens, **pack.to_dict(), "missing_ids": missing_ids}
+
+
 @mcp.tool()
 async def get_theory(theory_id: str) -> dict:
     """
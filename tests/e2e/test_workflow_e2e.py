@@ -5,6 +5,8 @@ E2E Tests: Full Workflow Integration Tests
 ユーザーシナリオに基づいた統合テスト。
 """
 
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from tengin_mcp.infrastructure.config import Settings
@@ -14,6 +16,14 @@ from tengin_mcp.infrastructure.repositories.neo4j_theory_repository import Neo4j
 from tengin_mcp.server import app_state
 
 
+def create_vector_store_stub() -> MagicMock:
+    """ヘルスチェック用のベクトルストアのスタブ（ハートビート・件数のみ）"""
+    vector_store = MagicMock()
+    vector_store.heartbeat = AsyncMock(return_value=0)
+    vector_store.get_count = AsyncMock(return_value=0)
+    return vector_store
+
+
 class TestEducatorWorkflow:
     """教育者ワークフローのE2Eテスト"""
 
@@ -225,12 +235,17 @@ class TestAPIWorkflow:
         self.theory_repository = Neo4jTheoryRepository(self.adapter)
         app_state.graph_repository = self.graph_repository
         app_state.theory_repository = self.theory_repository
+        # readiness は Neo4j と ベクトルストアの両方を確認する（ベクトルストアはスタブ）
+        app_state.neo4j_adapter = self.adapter
+        app_state.chromadb_adapter = create_vector_store_stub()
         
         yield
         
         await self.adapter.close()
         app_state.graph_repository = None
         app_state.theory_repository = None
+        app_state.neo4j_adapter = None
+        app_state.chromadb_adapter = None
 
     @pytest.mark.asyncio
     async def test_complete_tool_chain(self):
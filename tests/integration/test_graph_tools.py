@@ -137,6 +137,36 @@ class TestTraverseGraphTool:
                 direction="invalid",
             )
 
+    @pytest.mark.asyncio
+    async def test_traverse_graph_compact(self, setup_graph_tools):
+        """compact 形式でのトラバース"""
+        from tengin_mcp.tools.graph_tools import traverse_graph
+
+        result = await traverse_graph(
+            start_node_id="cognitive-load-theory",
+            max_depth=2,
+            format="compact",
+            properties=["name", "category"],
+        )
+
+        assert result["format"] == "compact"
+        assert "cognitive-load-theory" in result["nodes"]["id"]
+        assert set(result["nodes"]["properties"]) == {"name", "category"}
+        node_count = len(result["nodes"]["id"])
+        assert all(0 <= i < node_count for i in result["edges"]["source"])
+        assert all(0 <= i < len(result["types"]) for i in result["edges"]["type"])
+
+    @pytest.mark.asyncio
+    async def test_traverse_graph_invalid_format(self, setup_graph_tools):
+        """無効なレスポンス形式でのエラー"""
+        from tengin_mcp.tools.graph_tools import traverse_graph
+
+        with pytest.raises(InvalidQueryError):
+            await traverse_graph(
+                start_node_id="cognitive-load-theory",
+                format="invalid",
+            )
+
     @pytest.mark.asyncio
     async def test_traverse_graph_no_repository(self):
         """リポジトリなしでのトラバース"""
@@ -178,6 +208,50 @@ class TestFindPathTool:
 
         assert "error" not in result
 
+    @pytest.mark.asyncio
+    async def test_find_path_k_shortest(self, setup_graph_tools):
+        """k 最短パス検索"""
+        from tengin_mcp.tools.graph_tools import find_path
+
+        result = await find_path(
+            start_node_id="cognitive-load-theory",
+            end_node_id="multimedia-learning-theory",
+            k=3,
+        )
+
+        assert "error" not in result
+        assert result["algorithm"] == "yen_k_shortest"
+        assert len(result["paths"]) <= 3
+        costs = [p["cost"] for p in result["paths"]]
+        assert costs == sorted(costs)
+
+    @pytest.mark.asyncio
+    async def test_find_path_weighted(self, setup_graph_tools):
+        """重み付き最短パス検索"""
+        from tengin_mcp.tools.graph_tools import find_path
+
+        result = await find_path(
+            start_node_id="cognitive-load-theory",
+            end_node_id="multimedia-learning-theory",
+            weighted=True,
+        )
+
+        assert "error" not in result
+        assert result["weighted"] is True
+        assert len(result["paths"]) <= 1
+
+    @pytest.mark.asyncio
+    async def test_find_path_invalid_k(self, setup_graph_tools):
+        """k が範囲外の場合のエラー"""
+        from tengin_mcp.tools.graph_tools import find_path
+
+        with pytest.raises(InvalidQueryError):
+            await find_path(
+                start_node_id="cognitive-load-theory",
+                end_node_id="multimedia-learning-theory",
+                k=0,
+            )
+
     @pytest.mark.asyncio
     async def test_find_path_invalid_start(self, setup_graph_tools):
         """開始ノードIDがない場合のエラー"""
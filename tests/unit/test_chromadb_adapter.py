@@ -8,6 +8,14 @@ def create_mock_settings(**kwargs):
     """テスト用のモックSettings作成"""
     settings = MagicMock()
     settings.chromadb_path = kwargs.get("chromadb_path", "./data/chromadb")
+    settings.chromadb_url = kwargs.get("chromadb_url", "")
+    settings.chromadb_max_workers = kwargs.get("chromadb_max_workers", 2)
+    settings.vector_reduction = kwargs.get("vector_reduction", "none")
+    settings.vector_dimensions = kwargs.get("vector_dimensions", 0)
+    settings.vector_quantization = kwargs.get("vector_quantization", "none")
+    settings.embedding_model = kwargs.get("embedding_model", "text-embedding-3-small")
+    settings.chromadb_collection_layout = kwargs.get("chromadb_collection_layout", "single")
+    settings.chromadb_collection = kwargs.get("chromadb_collection", "education_theories")
     return settings
 
 
@@ -55,7 +63,12 @@ class TestChromaDBAdapterConnection:
             mock_persistent.assert_called_once()
             mock_client.get_or_create_collection.assert_called_once_with(
                 name="education_theories",
-                metadata={"description": "Education theory embeddings"},
+                configuration={"hnsw": {"space": "cosine"}},
+                metadata={
+                    "description": "Education theory embeddings",
+                    "vector_reduction": "none",
+                    "vector_dimensions": 0,
+                },
             )
             assert adapter._client == mock_client
             assert adapter._collection == mock_collection
@@ -257,6 +270,29 @@ class TestChromaDBAdapterSearch:
             where={"category": "learning"},
         )
 
+    @pytest.mark.asyncio
+    async def test_search_many(self):
+        """複数クエリを1回の query で検索"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        settings = create_mock_settings()
+        adapter = ChromaDBAdapter(settings)
+        mock_collection = MagicMock()
+        mock_collection.query.return_value = {"ids": [["id1"], ["id2"]]}
+        adapter._collection = mock_collection
+
+        result = await adapter.search_many(
+            query_embeddings=[[0.1, 0.2], [0.3, 0.4]],
+            n_results=3,
+        )
+
+        mock_collection.query.assert_called_once_with(
+            query_embeddings=[[0.1, 0.2], [0.3, 0.4]],
+            n_results=3,
+            include=["documents", "metadatas", "distances"],
+        )
+        assert result == {"ids": [["id1"], ["id2"]]}
+
     @pytest.mark.asyncio
     async def test_search_by_text_basic(self):
         """基本的なテキスト検索"""
@@ -304,6 +340,43 @@ class TestChromaDBAdapterSearch:
         )
 
 
+class TestChromaDBAdapterSync:
+    """差分同期用メソッドのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_get_metadatas(self):
+        """ID → メタデータのマップ"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        adapter = ChromaDBAdapter(create_mock_settings())
+        mock_collection = MagicMock()
+        mock_collection.get.return_value = {
+            "ids": ["a", "b"],
+            "metadatas": [{"content_hash": "h1"}, None],
+        }
+        adapter._collection = mock_collection
+
+        metadatas = await adapter.get_metadatas()
+
+        mock_collection.get.assert_called_once_with(include=["metadatas"])
+        assert metadatas == {"a": {"content_hash": "h1"}, "b": {}}
+
+    @pytest.mark.asyncio
+    async def test_delete_documents(self):
+        """ID指定の削除（空なら呼び出さない）"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        adapter = ChromaDBAdapter(create_mock_settings())
+        mock_collection = MagicMock()
+        adapter._collection = mock_collection
+
+        await adapter.delete_documents([])
+        mock_collection.delete.assert_not_called()
+
+        await adapter.delete_documents(["a"])
+        mock_collection.delete.assert_called_once_with(ids=["a"])
+
+
 class TestChromaDBAdapterCount:
     """カウントのテスト"""
 
@@ -322,3 +395,242 @@ class TestChromaDBAdapterCount:
 
         mock_collection.count.assert_called_once()
         assert count == 42
+
+    @pytest.mark.asyncio
+    async def test_heartbeat(self):
+        """ハートビート（コレクションに触れない）"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        settings = create_mock_settings()
+        adapter = ChromaDBAdapter(settings)
+        adapter._client = MagicMock()
+        adapter._client.heartbeat.return_value = 1234567890
+
+        assert await adapter.heartbeat() == 1234567890
+        adapter._client.heartbeat.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_not_connected(self):
+        """未接続時のハートビート"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        adapter = ChromaDBAdapter(create_mock_settings())
+        with pytest.raises(RuntimeError):
+            await adapter.heartbeat()
+
+
+class TestChromaDBAdapterNonBlocking:
+    """イベントループをブロックしない呼び出しのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_sync_calls_run_in_executor(self):
+        """永続化モードではコレクション操作をスレッドプールで実行"""
+        import threading
+
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        adapter = ChromaDBAdapter(create_mock_settings())
+        threads = []
+        mock_collection = MagicMock()
+        mock_collection.count.side_effect = lambda: threads.append(threading.current_thread()) or 7
+        adapter._collection = mock_collection
+
+        assert await adapter.get_count() == 7
+        assert threads[0] is not threading.main_thread()
+        assert threads[0].name.startswith("chromadb")
+
+        await adapter.close()
+        assert adapter._executor is None
+
+    @pytest.mark.asyncio
+    async def test_executor_size_from_settings(self):
+        """スレッドプールのサイズは設定値"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        adapter = ChromaDBAdapter(create_mock_settings(chromadb_max_workers=3))
+
+        assert adapter._get_executor()._max_workers == 3
+        await adapter.close()
+
+    @pytest.mark.asyncio
+    async def test_connect_with_server_url(self):
+        """URL設定時は AsyncHttpClient で接続"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        settings = create_mock_settings(chromadb_url="http://chroma.local:9000")
+        adapter = ChromaDBAdapter(settings)
+
+        mock_client = MagicMock()
+        mock_collection = MagicMock()
+        mock_collection.count = AsyncMock(return_value=5)
+        mock_client.get_or_create_collection = AsyncMock(return_value=mock_collection)
+
+        with patch(
+            "tengin_mcp.infrastructure.adapters.chromadb_adapter.chromadb.AsyncHttpClient",
+            new=AsyncMock(return_value=mock_client),
+        ) as mock_http:
+            await adapter.connect()
+
+            assert mock_http.await_args.kwargs["host"] == "chroma.local"
+            assert mock_http.await_args.kwargs["port"] == 9000
+            assert mock_http.await_args.kwargs["ssl"] is False
+            assert await adapter.get_count() == 5
+            assert adapter._executor is None
+
+
+def query_result(ids, distances):
+    """1クエリ分の query の結果"""
+    return {
+        "ids": [ids],
+        "documents": [[f"doc {i}" for i in ids]],
+        "metadatas": [[{"entity_id": i} for i in ids]],
+        "distances": [distances],
+    }
+
+
+class TestEntityTypeCollectionLayout:
+    """エンティティタイプ別コレクションのテスト"""
+
+    def create_adapter(self):
+        """タイプ別コレクション（Theory, Concept）を持つアダプター"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+
+        adapter = ChromaDBAdapter(create_mock_settings(chromadb_collection_layout="entity_type"))
+        adapter._collection = MagicMock(name="default")
+        adapter._typed = {"Theory": MagicMock(name="theory"), "Concept": MagicMock(name="concept")}
+        return adapter
+
+    def test_route_entity_types(self):
+        """where 条件からエンティティタイプを求める"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import route_entity_types
+
+        assert route_entity_types({"entity_type": "Theory"}) == {"Theory"}
+        assert route_entity_types({"entity_type": {"$in": ["Theory", "Concept"]}}) == {
+            "Theory",
+            "Concept",
+        }
+        assert route_entity_types(
+            {"$and": [{"entity_type": {"$eq": "Theory"}}, {"category": "learning"}]}
+        ) == {"Theory"}
+        assert route_entity_types({"category": "learning"}) is None
+        assert route_entity_types({"entity_type": {"$ne": "Theory"}}) is None
+        assert route_entity_types(None) is None
+
+    def test_merge_query_results(self):
+        """クエリごとに距離順でマージして上位を返す"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import merge_query_results
+
+        merged = merge_query_results(
+            [query_result(["t1", "t2"], [0.1, 0.4]), query_result(["c1"], [0.2])],
+            n_results=2,
+            n_queries=1,
+        )
+
+        assert merged["ids"] == [["t1", "c1"]]
+        assert merged["distances"] == [[0.1, 0.2]]
+        assert merged["documents"] == [["doc t1", "doc c1"]]
+        assert merge_query_results([], 5, 2)["ids"] == [[], []]
+
+    @pytest.mark.asyncio
+    async def test_typed_query_searches_only_matching_collections(self):
+        """タイプを限定した検索は該当コレクションだけを検索"""
+        adapter = self.create_adapter()
+        adapter._typed["Theory"].query.return_value = query_result(["t1"], [0.3])
+
+        results = await adapter.search([0.1], n_results=3, where={"entity_type": "Theory"})
+
+        assert results["ids"] == [["t1"]]
+        adapter._typed["Concept"].query.assert_not_called()
+        adapter._collection.query.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_query_merges_all_collections(self):
+        """タイプを限定しない検索は全コレクションを並列に検索してマージ"""
+        adapter = self.create_adapter()
+        adapter._collection.query.return_value = query_result([], [])
+        adapter._typed["Theory"].query.return_value = query_result(["t1", "t2"], [0.3, 0.5])
+        adapter._typed["Concept"].query.return_value = query_result(["c1"], [0.1])
+
+        results = await adapter.search([0.1], n_results=2)
+
+        assert results["ids"] == [["c1", "t1"]]
+        assert results["distances"] == [[0.1, 0.3]]
+
+    @pytest.mark.asyncio
+    async def test_upsert_routes_by_entity_type(self):
+        """upsert はメタデータの entity_type のコレクションに振り分け"""
+        adapter = self.create_adapter()
+        methodology = MagicMock(name="methodology")
+        adapter._client = MagicMock()
+        adapter._client.get_or_create_collection.return_value = methodology
+
+        await adapter.upsert_documents(
+            ids=["t1", "m1", "x"],
+            documents=["a", "b", "c"],
+            embeddings=[[0.1], [0.2], [0.3]],
+            metadatas=[{"entity_type": "Theory"}, {"entity_type": "Methodology"}, {}],
+        )
+
+        assert adapter._typed["Theory"].upsert.call_args.kwargs["ids"] == ["t1"]
+        assert methodology.upsert.call_args.kwargs["ids"] == ["m1"]
+        assert adapter._typed["Methodology"] is methodology
+        assert (
+            adapter._client.get_or_create_collection.call_args.kwargs["name"]
+            == "education_theories_methodology"
+        )
+        assert adapter._collection.upsert.call_args.kwargs["ids"] == ["x"]
+        # タイプ別に格納したIDは既定のコレクションから削除（single からの移行）
+        adapter._collection.delete.assert_called_once_with(ids=["t1", "m1"])
+
+    @pytest.mark.asyncio
+    async def test_count_and_metadatas_span_collections(self):
+        """件数・メタデータは全コレクションの合計"""
+        adapter = self.create_adapter()
+        adapter._collection.count.return_value = 1
+        adapter._typed["Theory"].count.return_value = 2
+        adapter._typed["Concept"].count.return_value = 3
+        adapter._collection.get.return_value = {"ids": ["x"], "metadatas": [None]}
+        adapter._typed["Theory"].get.return_value = {"ids": ["t1"], "metadatas": [{"a": 1}]}
+        adapter._typed["Concept"].get.return_value = {"ids": [], "metadatas": []}
+
+        assert await adapter.get_count() == 6
+        assert await adapter.get_metadatas() == {"x": {}, "t1": {"a": 1}}
+
+
+class TestCollectionSpace:
+    """コレクションの距離関数のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_l2_collection_requires_rebuild(self, tmp_path):
+        """距離関数を指定する前に作成した L2 のコレクションは作り直しが必要（reset でコサインに）"""
+        import chromadb
+        from chromadb.config import Settings as ChromaSettings
+
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import (
+            ChromaDBAdapter,
+            collection_space,
+        )
+
+        chromadb.PersistentClient(
+            path=str(tmp_path), settings=ChromaSettings(anonymized_telemetry=False)
+        ).get_or_create_collection("education_theories")
+        adapter = ChromaDBAdapter(create_mock_settings(chromadb_path=str(tmp_path)))
+        await adapter.connect()
+        try:
+            assert collection_space(adapter.collection) == "l2"
+            assert adapter.requires_rebuild
+
+            await adapter.reset()
+
+            assert collection_space(adapter.collection) == "cosine"
+            assert not adapter.requires_rebuild
+        finally:
+            await adapter.close()
+
+    def test_collection_space_unknown(self):
+        """設定を取得できない場合は None"""
+        from tengin_mcp.infrastructure.adapters.chromadb_adapter import collection_space
+
+        assert collection_space(MagicMock()) is None
+        spann = MagicMock(configuration={"hnsw": None, "spann": {"space": "ip"}})
+        assert collection_space(spann) == "ip"
@@ -0,0 +1,213 @@
+"""Unit Tests: context_pack - トークン予算付きコンテキストパックのユニットテスト"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tengin_mcp.application.services.context_pack import (
+    ContextPackBuilder,
+    PackEntity,
+    format_value,
+    load_pack_entities,
+    truncate_text,
+)
+from tengin_mcp.domain.errors import InvalidQueryError
+from tengin_mcp.infrastructure.embedding_scheduler import estimate_tokens
+
+LONG_DESCRIPTION = (
+    "学習者の認知負荷を内在的・外在的・学習関連の3種類に分類する。" * 5
+    + "外在的負荷を減らす設計を提案する。" * 5
+)
+
+CLT = PackEntity(
+    id="clt",
+    entity_type="Theory",
+    properties={
+        "id": "clt",
+        "name": "認知負荷理論",
+        "name_en": "Cognitive Load Theory",
+        "evidence_level": "strong",
+        "summary": "ワーキングメモリの容量制限を考慮した教授設計の理論。",
+        "core_principle": "外在的負荷を減らす",
+        "description": LONG_DESCRIPTION,
+        "keywords": ["認知負荷", "ワーキングメモリ", "認知負荷"],
+    },
+)
+
+WM = PackEntity(
+    id="wm",
+    entity_type="Concept",
+    properties={
+        "id": "wm",
+        "name": "ワーキングメモリ",
+        "definition": "情報を一時的に保持する記憶。",
+    },
+    note="via INCLUDES_CONCEPT from clt",
+)
+
+
+class TestTextHelpers:
+    """テキスト整形のテスト"""
+
+    def test_format_value(self):
+        """リストは重複を除いて「、」区切り、空白は正規化"""
+        assert format_value(["a", "b", "a", None]) == "a、b"
+        assert format_value("  複数の\n 空白  ") == "複数の 空白"
+        assert format_value({"title": "論文"}) == "論文"
+        assert format_value(None) == ""
+
+    def test_truncate_at_sentence(self):
+        """上限内の最後の文の区切りで切る"""
+        text = "一文目です。二文目です。三文目です。"
+
+        truncated = truncate_text(text, 13)
+
+        assert truncated == "一文目です。二文目です。"
+        assert truncate_text(text, 100) == text
+
+    def test_truncate_without_sentence_end(self):
+        """区切りがなければ文字単位で切って「…」を付ける"""
+        truncated = truncate_text("a" * 400, 10)
+
+        assert truncated.endswith("…")
+        assert estimate_tokens(truncated) <= 10
+
+
+class TestContextPackBuilder:
+    """ContextPackBuilder のテスト"""
+
+    def test_markdown_with_dedup(self):
+        """重複IDは最初のものだけ、既出テキストは省略"""
+        pack = ContextPackBuilder(max_tokens=2000).build([CLT, WM, CLT])
+
+        assert pack.entity_ids == ["clt", "wm"]
+        assert pack.omitted_ids == []
+        lines = pack.text.splitlines()
+        assert lines[0] == (
+            "- **認知負荷理論** (Theory, id=clt, name_en=Cognitive Load Theory, "
+            "evidence_level=strong)"
+        )
+        assert "  - keywords: 認知負荷、ワーキングメモリ" in lines
+        assert "- **ワーキングメモリ** (Concept, id=wm, via INCLUDES_CONCEPT from clt)" in lines
+        assert pack.token_estimate == estimate_tokens(pack.text)
+
+    def test_budget_spreads_across_entities(self):
+        """予算が少ない場合は上位エンティティの長いフィールドより他エンティティの要点を優先"""
+        pack = ContextPackBuilder(max_tokens=130).build([CLT, WM])
+
+        assert "definition: 情報を一時的に保持する記憶。" in pack.text
+        assert "description:" not in pack.text
+        assert pack.token_estimate <= 130
+
+    def test_last_field_fills_remaining_budget(self):
+        """予算の最後のフィールドは残り予算に収まるよう切り詰める"""
+        pack = ContextPackBuilder(max_tokens=150).build([CLT, WM])
+
+        description = next(
+            line for line in pack.text.splitlines() if line.startswith("  - description:")
+        )
+        assert description.endswith("…")
+        assert pack.truncated_fields == 1
+        assert pack.token_estimate <= 150
+
+    def test_long_field_truncated(self):
+        """長いフィールドは max_field_tokens で文単位に切り詰める"""
+        pack = ContextPackBuilder(max_tokens=2000, max_field_tokens=60).build([CLT])
+
+        description = next(
+            line for line in pack.text.splitlines() if line.startswith("  - description:")
+        )
+        assert description.endswith("。")
+        assert len(description) < len(LONG_DESCRIPTION)
+        assert pack.truncated_fields == 1
+
+    def test_omits_entities_over_budget(self):
+        """見出しも入らないエンティティは omitted_ids に入る"""
+        entities = [
+            PackEntity(id=f"e{i}", entity_type="Concept", properties={"name": f"概念{i}"})
+            for i in range(50)
+        ]
+
+        pack = ContextPackBuilder(max_tokens=100).build(entities)
+
+        assert pack.entity_ids == [f"e{i}" for i in range(len(pack.entity_ids))]
+        assert pack.omitted_ids == [f"e{i}" for i in range(len(pack.entity_ids), 50)]
+        assert pack.token_estimate <= 100
+
+    def test_json_format(self):
+        """JSON 形式はコンパクトな配列"""
+        pack = ContextPackBuilder(max_tokens=2000, format="json").build([WM])
+
+        assert json.loads(pack.text) == [
+            {
+                "name": "ワーキングメモリ",
+                "type": "Concept",
+                "id": "wm",
+                "note": "via INCLUDES_CONCEPT from clt",
+                "definition": "情報を一時的に保持する記憶。",
+            }
+        ]
+        assert ", " not in pack.text
+
+    @pytest.mark.parametrize("max_tokens", [100, 180, 260, 400])
+    def test_deterministic_and_within_budget(self, max_tokens):
+        """同じ入力からは同じ出力、予算を超えない"""
+        builder = ContextPackBuilder(max_tokens=max_tokens)
+
+        first = builder.build([CLT, WM])
+        second = builder.build([CLT, WM])
+
+        assert first == second
+        assert first.token_estimate <= max_tokens
+
+
+class TestLoadPackEntities:
+    """エンティティ取得のテスト"""
+
+    async def test_input_order_and_missing(self):
+        """入力順に並べ、見つからないIDを返す"""
+        graph = MagicMock()
+        graph.get_entities_by_ids = AsyncMock(
+            return_value=[
+                {"labels": ["Concept"], "properties": {"id": "wm", "name": "ワーキングメモリ"}},
+                {"labels": ["Theory"], "properties": {"id": "clt", "name": "認知負荷理論"}},
+            ]
+        )
+
+        entities, missing = await load_pack_entities(graph, ["clt", "missing", "wm", "clt"])
+
+        assert [(e.id, e.entity_type) for e in entities] == [("clt", "Theory"), ("wm", "Concept")]
+        assert missing == ["missing"]
+        assert graph.get_entities_by_ids.await_args.args[0] == ["clt", "missing", "wm"]
+
+
+class TestGetContextPackTool:
+    """get_context_pack ツールのテスト"""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"entity_ids": []},
+            {"entity_ids": ["clt"] * 51},
+            {"entity_ids": ["clt"], "max_tokens": 50},
+            {"entity_ids": ["clt"], "format": "yaml"},
+        ],
+    )
+    async def test_invalid_parameters(self, kwargs):
+        """パラメータの検証"""
+        from tengin_mcp.tools.theory_tools import get_context_pack
+
+        with pytest.raises(InvalidQueryError):
+            await get_context_pack(**kwargs)
+
+    async def test_not_initialized(self):
+        """未初期化時はエラーを返す"""
+        from tengin_mcp.tools.theory_tools import get_context_pack
+
+        with patch("tengin_mcp.tools.theory_tools.app_state") as mock_state:
+            mock_state.graph_repository = None
+            result = await get_context_pack(["clt"])
+
+        assert result["context"] == ""
+        assert "error" in result
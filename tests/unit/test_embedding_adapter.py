@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from esperanto.providers.embedding.ollama import OllamaEmbeddingModel
+
 
 def create_mock_settings(**kwargs):
     """テスト用のモックSettings作成"""
@@ -19,6 +21,14 @@ def create_mock_settings(**kwargs):
     settings.ollama_base_url = kwargs.get("ollama_base_url", "http://localhost:11434")
     settings.openai_compatible_base_url = kwargs.get("openai_compatible_base_url", "")
     settings.openai_compatible_api_key = kwargs.get("openai_compatible_api_key", "")
+    settings.embedding_cache_path = kwargs.get("embedding_cache_path", "")
+    settings.embedding_cache_size = kwargs.get("embedding_cache_size", 100)
+    settings.embedding_batch_size = kwargs.get("embedding_batch_size", 64)
+    settings.embedding_batch_window_ms = kwargs.get("embedding_batch_window_ms", 0)
+    settings.embedding_concurrency = kwargs.get("embedding_concurrency", 4)
+    settings.embedding_max_retries = kwargs.get("embedding_max_retries", 0)
+    settings.embedding_requests_per_minute = kwargs.get("embedding_requests_per_minute", 0)
+    settings.embedding_tokens_per_minute = kwargs.get("embedding_tokens_per_minute", 0)
     return settings
 
 
@@ -322,12 +332,13 @@ class TestEmbeddingAdapterEmbed:
 
         settings = create_mock_settings(embedding_provider="ollama")
         adapter = EmbeddingAdapter(settings)
-        adapter._embedder = MagicMock()
-        adapter._embedder.embed.return_value = [[0.1, 0.2, 0.3]]
+        adapter._embedder = MagicMock(spec=OllamaEmbeddingModel)
+        adapter._embedder.aembed.return_value = [[0.1, 0.2, 0.3]]
 
         result = await adapter.embed_text("test text")
 
-        adapter._embedder.embed.assert_called_once_with(["test text"])
+        adapter._embedder.aembed.assert_awaited_once_with(["test text"])
+        adapter._embedder.embed.assert_not_called()
         assert result == [0.1, 0.2, 0.3]
 
     @pytest.mark.asyncio
@@ -337,12 +348,13 @@ class TestEmbeddingAdapterEmbed:
 
         settings = create_mock_settings(embedding_provider="ollama")
         adapter = EmbeddingAdapter(settings)
-        adapter._embedder = MagicMock()
-        adapter._embedder.embed.return_value = [[0.1, 0.2], [0.3, 0.4]]
+        adapter._embedder = MagicMock(spec=OllamaEmbeddingModel)
+        adapter._embedder.aembed.return_value = [[0.1, 0.2], [0.3, 0.4]]
 
         result = await adapter.embed_texts(["text1", "text2"])
 
-        adapter._embedder.embed.assert_called_once_with(["text1", "text2"])
+        adapter._embedder.aembed.assert_awaited_once_with(["text1", "text2"])
+        adapter._embedder.embed.assert_not_called()
         assert result == [[0.1, 0.2], [0.3, 0.4]]
 
     @pytest.mark.asyncio
@@ -392,6 +404,134 @@ class TestEmbeddingAdapterEmbed:
         assert result == [[0.1, 0.2], [0.3, 0.4]]
 
 
+    @pytest.mark.asyncio
+    async def test_embed_texts_sync_only_provider(self):
+        """非同期APIを持たないプロバイダーはスレッドで実行"""
+        import threading
+
+        from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+
+        settings = create_mock_settings(embedding_provider="transformers")
+        adapter = EmbeddingAdapter(settings)
+        threads = []
+
+        def embed(texts):
+            threads.append(threading.current_thread())
+            return [[0.5, 0.5] for _ in texts]
+
+        adapter._embedder = MagicMock(spec=["embed"])
+        adapter._embedder.embed.side_effect = embed
+
+        result = await adapter.embed_texts(["text1", "text2"])
+
+        assert result == [[0.5, 0.5], [0.5, 0.5]]
+        assert threads[0] is not threading.main_thread()
+
+
+class TestEmbeddingAdapterCache:
+    """埋め込みキャッシュのテスト"""
+
+    @pytest.mark.asyncio
+    async def test_only_misses_sent_to_provider(self, tmp_path):
+        """キャッシュにないテキストのみをプロバイダーに送り、入力順に結合"""
+        from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+        from tengin_mcp.infrastructure.embedding_cache import EmbeddingCache
+
+        adapter = EmbeddingAdapter(create_mock_settings(embedding_provider="openai"))
+        adapter._cache = EmbeddingCache(str(tmp_path / "cache.db"))
+        adapter._embedder = AsyncMock()
+        adapter._embedder.aembed.side_effect = lambda texts: [
+            [float(len(text))] for text in texts
+        ]
+
+        assert await adapter.embed_texts(["a", "bb"]) == [[1.0], [2.0]]
+        result = await adapter.embed_texts(["bb", "ccc", "a", "ccc"])
+
+        assert result == [[2.0], [3.0], [1.0], [3.0]]
+        assert adapter._embedder.aembed.await_args_list[-1].args == (["ccc"],)
+        assert adapter._embedder.aembed.await_count == 2
+
+        await adapter.embed_texts(["a", "bb", "ccc"])
+        assert adapter._embedder.aembed.await_count == 2
+        await adapter.close()
+        assert adapter.cache is None
+
+    @pytest.mark.asyncio
+    async def test_cache_enabled_by_settings(self, tmp_path):
+        """EMBEDDING_CACHE_PATH 設定時は connect でキャッシュを作成"""
+        from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+
+        settings = create_mock_settings(
+            embedding_provider="ollama", embedding_cache_path=str(tmp_path / "cache.db")
+        )
+        adapter = EmbeddingAdapter(settings)
+        await adapter.connect()
+
+        assert adapter.cache is not None
+        await adapter.close()
+
+
+    @pytest.mark.asyncio
+    async def test_concurrent_embed_text_batched(self, tmp_path):
+        """同時の embed_text はキャッシュミスのみを1回の呼び出しにまとめる"""
+        import asyncio
+
+        from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+        from tengin_mcp.infrastructure.embedding_cache import EmbeddingCache
+
+        settings = create_mock_settings(embedding_provider="openai", embedding_batch_window_ms=10)
+        adapter = EmbeddingAdapter(settings)
+        adapter._cache = EmbeddingCache(str(tmp_path / "cache.db"))
+        adapter._embedder = AsyncMock()
+        adapter._embedder.aembed.side_effect = lambda texts: [
+            [float(len(text))] for text in texts
+        ]
+        await adapter.embed_text("a")
+
+        results = await asyncio.gather(*(adapter.embed_text(t) for t in ("a", "bb", "ccc", "bb")))
+
+        assert results == [[1.0], [2.0], [3.0], [2.0]]
+        assert adapter._embedder.aembed.await_count == 2
+        assert adapter._embedder.aembed.await_args.args == (["bb", "ccc"],)
+        await adapter.close()
+
+
+class TestEmbeddingAdapterScheduling:
+    """レート制限・再試行のテスト"""
+
+    @pytest.mark.asyncio
+    async def test_retries_rate_limit(self):
+        """429 は再試行して成功"""
+        from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+
+        adapter = EmbeddingAdapter(
+            create_mock_settings(embedding_provider="openai", embedding_max_retries=3)
+        )
+        adapter._scheduler._base_delay = 0.001
+        adapter._embedder = AsyncMock()
+        adapter._embedder.aembed.side_effect = [
+            RuntimeError("OpenAI API error: Rate limit reached"),
+            [[0.1, 0.2]],
+        ]
+
+        assert await adapter.embed_texts(["text"]) == [[0.1, 0.2]]
+        assert adapter._embedder.aembed.await_count == 2
+
+    def test_rate_limit_override(self):
+        """設定値がプロバイダーの既定値より優先"""
+        from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+
+        default = EmbeddingAdapter(create_mock_settings(embedding_provider="jina"))
+        override = EmbeddingAdapter(
+            create_mock_settings(embedding_provider="jina", embedding_requests_per_minute=100)
+        )
+        local = EmbeddingAdapter(create_mock_settings(embedding_provider="ollama"))
+
+        assert default._scheduler._requests._capacity == 500
+        assert override._scheduler._requests._capacity == 100
+        assert local._scheduler._requests is None
+
+
 class TestEmbeddingAdapterClassMethods:
     """クラスメソッドのテスト"""
 
@@ -0,0 +1,79 @@
+"""Unit Tests: embedding_batcher - 埋め込み要求のマイクロバッチのユニットテスト"""
+
+import asyncio
+
+import pytest
+
+from tengin_mcp.infrastructure.embedding_batcher import EmbeddingBatcher
+
+
+def create_embed(calls: list[list[str]]):
+    """呼び出しを記録する埋め込み関数"""
+
+    async def embed(texts: list[str]) -> list[list[float]]:
+        calls.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+    return embed
+
+
+class TestEmbeddingBatcher:
+    """EmbeddingBatcher のテスト"""
+
+    async def test_concurrent_requests_share_one_call(self):
+        """同時の要求は1回の呼び出しにまとめ、各要求に結果を返す"""
+        calls: list[list[str]] = []
+        batcher = EmbeddingBatcher(create_embed(calls), max_batch_size=10, window_seconds=0.01)
+
+        results = await asyncio.gather(*(batcher.submit("x" * n) for n in (1, 2, 3)))
+
+        assert calls == [["x", "xx", "xxx"]]
+        assert results == [[1.0], [2.0], [3.0]]
+
+    async def test_max_batch_size(self):
+        """最大件数に達した時点で呼び出す"""
+        calls: list[list[str]] = []
+        batcher = EmbeddingBatcher(create_embed(calls), max_batch_size=2, window_seconds=10)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(t) for t in ("a", "b", "c", "d"))), timeout=1
+        )
+
+        assert calls == [["a", "b"], ["c", "d"]]
+        assert len(results) == 4
+
+    async def test_no_window(self):
+        """window_seconds=0 は要求ごとに呼び出す"""
+        calls: list[list[str]] = []
+        batcher = EmbeddingBatcher(create_embed(calls), window_seconds=0)
+
+        await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+        assert calls == [["a"], ["b"]]
+
+    async def test_error_propagates_to_all_waiters(self):
+        """埋め込みの失敗はまとめた全要求に伝える"""
+
+        async def embed(texts):
+            raise RuntimeError("rate limited")
+
+        batcher = EmbeddingBatcher(embed, window_seconds=0.01)
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    async def test_cancelled_waiter(self):
+        """キャンセルされた要求があっても他の要求には結果を返す"""
+        calls: list[list[str]] = []
+        batcher = EmbeddingBatcher(create_embed(calls), window_seconds=0.01)
+
+        cancelled = asyncio.ensure_future(batcher.submit("a"))
+        kept = asyncio.ensure_future(batcher.submit("bb"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        assert await kept == [2.0]
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
@@ -0,0 +1,188 @@
+"""Unit Tests: embedding_benchmark - 埋め込みプロバイダーのベンチマークのユニットテスト"""
+
+import numpy as np
+import pytest
+
+from tengin_mcp.application.services.embedding_benchmark import (
+    EmbeddingBenchmark,
+    EvalQuery,
+    load_eval_set,
+    percentiles,
+    recall_at_k,
+)
+from tengin_mcp.application.services.vector_indexer import build_documents
+from tengin_mcp.infrastructure.adapters.embedding_adapter import EmbeddingAdapter
+from tengin_mcp.infrastructure.adapters.local_vector_adapter import LocalVectorAdapter
+from tengin_mcp.infrastructure.config import Settings
+from tengin_mcp.infrastructure.stub_embedding import StubEmbeddingModel
+from tengin_mcp.scripts.benchmark_embeddings import (
+    DEFAULT_EVAL_SET,
+    benchmark_isolated,
+    benchmark_provider,
+    parse_provider,
+)
+from tengin_mcp.scripts.build_vector_index import DEFAULT_DATA_DIR, load_entities_from_json
+
+
+def create_settings(tmp_path) -> Settings:
+    """スタブのプロバイダーとローカルストアの設定（埋め込みキャッシュなし）"""
+    return Settings(
+        _env_file=None,
+        EMBEDDING_PROVIDER="stub",
+        EMBEDDING_MODEL="hashing-64",
+        LOCAL_VECTOR_PATH=str(tmp_path),
+        EMBEDDING_CACHE_PATH="",
+        EMBEDDING_BATCH_WINDOW_MS=0,
+    )
+
+
+class TestStubEmbeddingModel:
+    """スタブの埋め込みモデルのテスト"""
+
+    def test_deterministic_normalized(self):
+        """同じテキストは同じ正規化済みベクトル、次元数はモデル名の末尾"""
+        model = StubEmbeddingModel("hashing-64")
+
+        first, second, other = model.embed(["認知負荷", "認知負荷", "動機づけ"])
+
+        assert len(first) == 64
+        assert first == second
+        assert np.linalg.norm(first) == pytest.approx(1.0)
+        assert first != other
+        assert StubEmbeddingModel("hashing").dimensions == 384
+
+    def test_similar_text_is_closer(self):
+        """文字が重なるテキストほど近い"""
+        query, near, far = np.array(
+            StubEmbeddingModel("hashing-256").embed(
+                ["working memory load", "working memory capacity", "flow experience"]
+            )
+        )
+
+        assert query @ near > query @ far
+
+    async def test_adapter_connects_offline(self, tmp_path):
+        """EMBEDDING_PROVIDER=stub は API キーなしで接続できる"""
+        adapter = EmbeddingAdapter(create_settings(tmp_path))
+        await adapter.connect()
+        try:
+            vectors = await adapter.embed_texts(["a", "b"])
+        finally:
+            await adapter.close()
+
+        assert adapter.max_batch_size == 2048
+        assert [len(v) for v in vectors] == [64, 64]
+
+
+class TestBenchmarkMetrics:
+    """集計のテスト"""
+
+    def test_percentiles(self):
+        """パーセンタイル・平均・最大"""
+        summary = percentiles([float(i) for i in range(1, 101)])
+
+        assert summary["p50"] == pytest.approx(50.5)
+        assert summary["p99"] == pytest.approx(99.01)
+        assert summary["mean"] == pytest.approx(50.5)
+        assert summary["max"] == 100.0
+        assert percentiles([]) == {}
+
+    def test_recall_at_k(self):
+        """上位 k 件に含まれる期待IDの割合"""
+        ranked = ["a", "b", "c"]
+
+        assert recall_at_k(ranked, ("b", "z"), 1) == 0.0
+        assert recall_at_k(ranked, ("b", "z"), 2) == 0.5
+        assert recall_at_k(ranked, ("a",), 10) == 1.0
+
+    def test_eval_set_ids_exist(self):
+        """評価セットの期待IDはすべてコーパスの理論"""
+        queries = load_eval_set(DEFAULT_EVAL_SET)
+        theory_ids = {
+            e["properties"]["id"]
+            for e in load_entities_from_json(DEFAULT_DATA_DIR)
+            if e["entity_type"] == "Theory"
+        }
+
+        assert queries
+        assert {i for q in queries for i in q.expected} <= theory_ids
+
+    def test_parse_provider(self):
+        """モデルを省略すると既定モデル、Ollama のタグは model に残す"""
+        assert parse_provider("stub") == ("stub", "hashing-384")
+        assert parse_provider("ollama:nomic-embed-text:latest") == (
+            "ollama",
+            "nomic-embed-text:latest",
+        )
+
+
+class TestEmbeddingBenchmark:
+    """ベンチマークの実行のテスト"""
+
+    async def test_run_with_stub(self, tmp_path):
+        """スタブのプロバイダーで全指標を計測"""
+        settings = create_settings(tmp_path)
+        documents = build_documents(
+            [
+                {
+                    "entity_type": "Theory",
+                    "properties": {"id": "clt", "name": "Cognitive Load Theory"},
+                },
+                {"entity_type": "Theory", "properties": {"id": "flow", "name": "Flow Theory"}},
+                {"entity_type": "Concept", "properties": {"id": "c", "name": "Cognitive Load"}},
+            ]
+        )
+        queries = [
+            EvalQuery("cognitive load theory", ("clt",)),
+            EvalQuery("flow theory", ("flow",)),
+        ]
+        embedding = EmbeddingAdapter(settings)
+        store = LocalVectorAdapter(settings)
+        await embedding.connect()
+        await store.connect()
+
+        result = await EmbeddingBenchmark(embedding, store, batch_size=2, ks=(1, 2)).run(
+            documents, queries
+        )
+
+        assert (result.provider, result.model, result.dimensions) == ("stub", "hashing-64", 64)
+        assert set(result.embed_latency_ms) == {"p50", "p90", "p99", "mean", "max"}
+        assert result.batch_throughput["documents"] == 3
+        assert result.batch_throughput["batches"] == 2
+        assert result.index_build_seconds > 0
+        assert result.memory_mb["index_estimate"] > 0
+        assert result.recall == {"@1": 1.0, "@2": 1.0}
+        assert await store.get_count() == 3
+
+    async def test_benchmark_provider_records_errors(self):
+        """初期化に失敗したプロバイダーはエラーを記録して続行"""
+        settings = Settings(_env_file=None, OPENAI_API_KEY="")
+        documents = build_documents(
+            [{"entity_type": "Theory", "properties": {"id": "clt", "name": "認知負荷理論"}}]
+        )
+
+        stub = await benchmark_provider(
+            settings, "stub", "hashing-32", documents, [EvalQuery("認知負荷", ("clt",))], 8, (1,)
+        )
+        failed = await benchmark_provider(
+            settings, "voyage", "voyage-3", documents, [EvalQuery("認知負荷", ("clt",))], 8, (1,)
+        )
+
+        assert stub["recall"] == {"@1": 1.0}
+        assert failed["provider"] == "voyage"
+        assert "error" in failed
+
+    async def test_benchmark_isolated(self):
+        """プロバイダーごとに子プロセスで計測（最大常駐メモリは子プロセスの値）"""
+        settings = Settings(_env_file=None, EMBEDDING_CACHE_PATH="")
+        documents = build_documents(
+            [{"entity_type": "Theory", "properties": {"id": "clt", "name": "認知負荷理論"}}]
+        )
+
+        result = await benchmark_isolated(
+            settings, "stub", "hashing-32", documents, [EvalQuery("認知負荷", ("clt",))], 8, (1,)
+        )
+
+        assert result["recall"] == {"@1": 1.0}
+        assert set(result["memory_mb"]) == {"index_estimate", "max_rss", "max_rss_growth"}
+        assert result["memory_mb"]["max_rss"] > 0
@@ -0,0 +1,69 @@
+"""Unit Tests: embedding_cache - 埋め込みキャッシュのユニットテスト"""
+
+import pytest
+
+from tengin_mcp.infrastructure.embedding_cache import EmbeddingCache, make_key
+
+
+class TestMakeKey:
+    """キャッシュキーのテスト"""
+
+    def test_normalized_text(self):
+        """空白・全角半角の違いは同じキー"""
+        assert make_key("openai", "m", "認知負荷  理論\n") == make_key(
+            "openai", "m", "認知負荷 理論"
+        )
+        assert make_key("openai", "m", "ＡＢＣ") == make_key("openai", "m", "ABC")
+
+    def test_provider_and_model(self):
+        """プロバイダー・モデルが異なれば別のキー"""
+        assert make_key("openai", "m1", "text") != make_key("openai", "m2", "text")
+        assert make_key("openai", "m1", "text") != make_key("ollama", "m1", "text")
+
+
+class TestEmbeddingCache:
+    """EmbeddingCache のテスト"""
+
+    async def test_roundtrip_float32(self, tmp_path):
+        """保存したベクトルを float32 で取得"""
+        cache = EmbeddingCache(str(tmp_path / "cache.db"))
+
+        stored = await cache.set_many({"a": [0.1, 0.2]})
+        results = await cache.get_many(["a", "b"])
+
+        assert stored["a"] == pytest.approx([0.1, 0.2], abs=1e-6)
+        assert results == [stored["a"], None]
+        assert cache.get_stats().hits == 1
+        assert cache.get_stats().misses == 1
+        cache.close()
+
+    async def test_persistent(self, tmp_path):
+        """別インスタンスからもディスク経由で取得"""
+        path = str(tmp_path / "cache.db")
+        first = EmbeddingCache(path)
+        await first.set_many({"a": [1.0, 2.0]})
+        first.close()
+
+        second = EmbeddingCache(path)
+        assert await second.get_many(["a"]) == [[1.0, 2.0]]
+        second.close()
+
+    async def test_lru_eviction(self, tmp_path):
+        """メモリ上は最近使用したエントリのみ保持"""
+        cache = EmbeddingCache(str(tmp_path / "cache.db"), max_entries=2)
+        await cache.set_many({"a": [1.0], "b": [2.0]})
+        await cache.get_many(["a"])
+        await cache.set_many({"c": [3.0]})
+
+        assert list(cache._memory) == ["a", "c"]
+        assert await cache.get_many(["b"]) == [[2.0]]
+        cache.close()
+
+    async def test_clear(self, tmp_path):
+        """メモリとディスクをクリア"""
+        cache = EmbeddingCache(str(tmp_path / "cache.db"))
+        await cache.set_many({"a": [1.0]})
+        await cache.clear()
+
+        assert await cache.get_many(["a"]) == [None]
+        cache.close()
@@ -0,0 +1,164 @@
+"""Unit Tests: embedding_scheduler - 埋め込みスケジューラーのユニットテスト"""
+
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from tengin_mcp.infrastructure.embedding_scheduler import (
+    EmbeddingScheduler,
+    TokenBucket,
+    estimate_tokens,
+    is_retryable,
+    retry_after_seconds,
+    split_batches,
+)
+
+
+class TestSplitBatches:
+    """バッチ分割のテスト"""
+
+    def test_estimate_tokens(self):
+        """ASCII は4文字1トークン, 非ASCII は1文字1トークン"""
+        assert estimate_tokens("abcdefgh") == 2
+        assert estimate_tokens("認知負荷") == 4
+        assert estimate_tokens("") == 1
+
+    def test_by_count(self):
+        """件数上限で分割"""
+        assert split_batches(["a"] * 5, max_batch_size=2) == [[0, 1], [2, 3], [4]]
+
+    def test_by_tokens(self):
+        """トークン上限で分割（上限超えの単一テキストは単独バッチ）"""
+        texts = ["あ" * 6, "い" * 6, "う" * 20, "え"]
+        assert split_batches(texts, max_batch_size=10, max_request_tokens=12) == [
+            [0, 1],
+            [2],
+            [3],
+        ]
+
+
+class TestRetryable:
+    """再試行判定のテスト"""
+
+    def test_status_errors(self):
+        """429 / 5xx は再試行, 4xx は再試行しない"""
+        request = httpx.Request("POST", "https://example.com")
+        rate_limited = httpx.HTTPStatusError(
+            "429",
+            request=request,
+            response=httpx.Response(429, headers={"retry-after": "3"}, request=request),
+        )
+        bad_request = httpx.HTTPStatusError(
+            "400", request=request, response=httpx.Response(400, request=request)
+        )
+
+        assert is_retryable(rate_limited)
+        assert retry_after_seconds(rate_limited) == 3.0
+        assert not is_retryable(bad_request)
+        assert retry_after_seconds(bad_request) is None
+
+    def test_message_only_errors(self):
+        """メッセージのみの例外（esperanto の RuntimeError）"""
+        assert is_retryable(RuntimeError("OpenAI API error: Rate limit reached"))
+        assert is_retryable(RuntimeError("HTTP 503: Service Unavailable"))
+        assert not is_retryable(RuntimeError("OpenAI API error: Invalid API key"))
+        assert is_retryable(httpx.ConnectTimeout("timeout"))
+
+    def test_status_codes_only_in_context(self):
+        """ステータスの文脈にない数値（トークン数・件数）は再試行しない"""
+        assert is_retryable(RuntimeError("Error code: 429 - quota"))
+        assert is_retryable(RuntimeError("status_code=500"))
+        assert is_retryable(RuntimeError("Server returned 502 Bad Gateway"))
+        assert is_retryable(RuntimeError("HTTP/1.1 504"))
+        assert not is_retryable(RuntimeError("Invalid request: input exceeds 500 tokens"))
+        assert not is_retryable(RuntimeError("max batch 500, got 600"))
+        assert not is_retryable(RuntimeError("Error code: 400 - 429 items is too many"))
+
+
+class TestTokenBucket:
+    """TokenBucket のテスト"""
+
+    async def test_waits_for_refill(self):
+        """不足分が補充されるまで待機"""
+        now = 0.0
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay):
+            nonlocal now
+            sleeps.append(delay)
+            now += delay
+
+        bucket = TokenBucket(per_minute=60, clock=lambda: now)
+        with patch("tengin_mcp.infrastructure.embedding_scheduler.asyncio.sleep", fake_sleep):
+            await bucket.acquire(60)
+            await bucket.acquire(2)
+
+        assert sleeps == [pytest.approx(2.0)]
+
+
+class TestEmbeddingScheduler:
+    """EmbeddingScheduler のテスト"""
+
+    async def test_order_preserved_across_batches(self):
+        """分割したバッチの結果を入力順に結合"""
+
+        async def embed(texts):
+            await asyncio.sleep(0.001 * (3 - len(texts)))
+            return [[float(text)] for text in texts]
+
+        scheduler = EmbeddingScheduler(embed, max_batch_size=2)
+        texts = [str(i) for i in range(5)]
+
+        assert await scheduler.run(texts) == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+
+    async def test_retries_transient_errors(self):
+        """一時的なエラーは再試行"""
+        calls = 0
+
+        async def embed(texts):
+            nonlocal calls
+            calls += 1
+            if calls < 3:
+                raise RuntimeError("HTTP 429: Too Many Requests")
+            return [[1.0] for _ in texts]
+
+        scheduler = EmbeddingScheduler(embed, max_retries=5, base_delay=0.001)
+
+        assert await scheduler.run(["a"]) == [[1.0]]
+        assert scheduler.retries == 2
+
+    async def test_gives_up_on_permanent_errors(self):
+        """恒久的なエラーと再試行上限超過は送出"""
+
+        async def invalid(texts):
+            raise ValueError("invalid input")
+
+        async def rate_limited(texts):
+            raise RuntimeError("rate limit exceeded")
+
+        with pytest.raises(ValueError):
+            await EmbeddingScheduler(invalid, base_delay=0.001).run(["a"])
+        scheduler = EmbeddingScheduler(rate_limited, max_retries=2, base_delay=0.001)
+        with pytest.raises(RuntimeError):
+            await scheduler.run(["a"])
+        assert scheduler.retries == 2
+
+    async def test_bounded_concurrency(self):
+        """同時実行数は max_concurrency 以下"""
+        in_flight = 0
+        peak = 0
+
+        async def embed(texts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.005)
+            in_flight -= 1
+            return [[0.0] for _ in texts]
+
+        scheduler = EmbeddingScheduler(embed, max_batch_size=1, max_concurrency=2)
+        await scheduler.run(["a"] * 6)
+
+        assert peak == 2
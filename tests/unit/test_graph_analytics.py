@@ -0,0 +1,138 @@
+"""Unit Tests: graph_analytics - グラフ分析指標のユニットテスト"""
+
+import pytest
+
+from tengin_mcp.application.services.graph_analytics import (
+    betweenness_centrality,
+    compute_theory_analytics,
+    jaccard_similarity,
+    louvain_communities,
+    pagerank,
+)
+
+
+class TestPageRank:
+    """PageRank のテスト"""
+
+    def test_sum_to_one(self):
+        """スコアの合計が1"""
+        ranks = pagerank(["a", "b", "c"], [("a", "b", 1.0), ("b", "c", 1.0)])
+        assert sum(ranks.values()) == pytest.approx(1.0)
+
+    def test_sink_receives_most(self):
+        """多くのリンクを受けるノードが最上位"""
+        ranks = pagerank(
+            ["a", "b", "c", "hub"],
+            [("a", "hub", 1.0), ("b", "hub", 1.0), ("c", "hub", 1.0)],
+        )
+        assert max(ranks, key=ranks.get) == "hub"
+
+    def test_empty(self):
+        """空グラフ"""
+        assert pagerank([], []) == {}
+
+
+class TestBetweenness:
+    """媒介中心性のテスト"""
+
+    def test_path_graph(self):
+        """パスグラフでは中央ノードが最大"""
+        adjacency = {"a": {"b"}, "b": {"a", "c"}, "c": {"b"}}
+        scores = betweenness_centrality(adjacency)
+
+        assert scores["b"] == pytest.approx(1.0)
+        assert scores["a"] == 0.0
+        assert scores["c"] == 0.0
+
+    def test_unnormalized(self):
+        """正規化なしでは経由するペア数"""
+        adjacency = {"a": {"b"}, "b": {"a", "c"}, "c": {"b"}}
+        scores = betweenness_centrality(adjacency, normalized=False)
+
+        assert scores["b"] == pytest.approx(1.0)
+
+
+class TestLouvain:
+    """Louvain 法のテスト"""
+
+    def test_two_cliques(self):
+        """弱く接続した2つのクリークを分離"""
+        left = ["a1", "a2", "a3"]
+        right = ["b1", "b2", "b3"]
+        edges = [(u, v, 1.0) for group in (left, right) for u in group for v in group if u < v]
+        edges.append(("a1", "b1", 0.1))
+
+        communities = louvain_communities(left + right, edges)
+
+        assert len({communities[n] for n in left}) == 1
+        assert len({communities[n] for n in right}) == 1
+        assert communities["a1"] != communities["b1"]
+
+    def test_isolated_nodes(self):
+        """孤立ノードはそれぞれ単独のコミュニティ"""
+        communities = louvain_communities(["a", "b"], [])
+        assert communities["a"] != communities["b"]
+
+    def test_deterministic(self):
+        """同じ入力に対して同じ結果"""
+        nodes = ["a", "b", "c", "d"]
+        edges = [("a", "b", 1.0), ("c", "d", 1.0), ("b", "c", 0.2)]
+        assert louvain_communities(nodes, edges) == louvain_communities(nodes, edges)
+
+
+class TestJaccardSimilarity:
+    """Jaccard 類似度のテスト"""
+
+    def test_shared_neighbors(self):
+        """近傍を共有する理論が類似"""
+        neighbors = {
+            "t1": {"c1", "c2", "c3"},
+            "t2": {"c1", "c2"},
+            "t3": {"c9"},
+        }
+        similar = jaccard_similarity(["t1", "t2", "t3"], neighbors)
+
+        assert similar["t1"] == [("t2", pytest.approx(2 / 3))]
+        assert similar["t3"] == []
+
+    def test_top_k(self):
+        """上位 k 件に制限"""
+        neighbors = {f"t{i}": {"c"} for i in range(10)}
+        similar = jaccard_similarity(list(neighbors), neighbors, top_k=3)
+        assert len(similar["t0"]) == 3
+
+
+class TestComputeTheoryAnalytics:
+    """理論分析指標の統合計算のテスト"""
+
+    def test_influencer_ranks_highest(self):
+        """多くの理論に影響を与えた理論の PageRank が最大"""
+        nodes = [{"id": t, "labels": ["Theory"]} for t in ("root", "x", "y", "z")]
+        nodes.append({"id": "concept", "labels": ["Concept"]})
+        edges = [
+            {
+                "source": "root",
+                "target": t,
+                "type": "INFLUENCED",
+                "properties": {"strength": "strong"},
+            }
+            for t in ("x", "y", "z")
+        ]
+        edges.append(
+            {"source": "x", "target": "concept", "type": "INCLUDES_CONCEPT", "properties": {}}
+        )
+
+        analytics = {a.id: a for a in compute_theory_analytics(nodes, edges)}
+
+        assert set(analytics) == {"root", "x", "y", "z"}
+        assert max(analytics.values(), key=lambda a: a.pagerank).id == "root"
+        assert analytics["root"].betweenness > 0
+
+        props = analytics["root"].to_properties()
+        assert set(props) == {
+            "pagerank",
+            "betweenness",
+            "community_id",
+            "similar_theory_ids",
+            "similarity_scores",
+        }
@@ -0,0 +1,185 @@
+"""Unit Tests: Neo4jGraphRepository - グラフ統計取得のユニットテスト"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from tengin_mcp.infrastructure.cache import get_graph_cache
+from tengin_mcp.infrastructure.repositories.neo4j_graph_repository import Neo4jGraphRepository
+
+
+@pytest.fixture(autouse=True)
+async def clear_graph_cache():
+    """テストごとに Graph キャッシュをクリア"""
+    await get_graph_cache().clear()
+    yield
+    await get_graph_cache().clear()
+
+
+def create_repository(side_effect) -> tuple[Neo4jGraphRepository, MagicMock]:
+    """モックアダプタ付きのリポジトリを作成"""
+    adapter = MagicMock()
+    adapter.execute_query = AsyncMock(side_effect=side_effect)
+    return Neo4jGraphRepository(adapter), adapter
+
+
+APOC_RECORD = {
+    "labels": {"Theory": 38, "Concept": 25, "Unused": 0},
+    "relTypesCount": {"PROPOSED": 38, "INCLUDES_CONCEPT": 45},
+    "nodeCount": 63,
+    "relCount": 83,
+}
+
+
+class TestGraphStatistics:
+    """グラフ統計のテスト"""
+
+    async def test_statistics_from_apoc(self):
+        """apoc.meta.stats() の1回のクエリで取得"""
+        repo, adapter = create_repository([[APOC_RECORD]])
+
+        stats = await repo.get_statistics()
+
+        assert adapter.execute_query.await_count == 1
+        assert stats["total_nodes"] == 63
+        assert stats["total_relationships"] == 83
+        assert stats["node_counts"] == [
+            {"label": "Concept", "count": 25},
+            {"label": "Theory", "count": 38},
+        ]
+        assert {"type": "PROPOSED", "count": 38} in stats["relationship_counts"]
+
+    async def test_fallback_to_count_store(self):
+        """APOC が利用できない場合はカウントストアのクエリにフォールバック"""
+        repo, adapter = create_repository(
+            [
+                Exception("There is no procedure with the name `apoc.meta.stats`"),
+                [{"labels": ["Theory"], "types": ["PROPOSED"]}],
+                [
+                    {"kind": "total", "name": "nodes", "count": 40},
+                    {"kind": "total", "name": "relationships", "count": 38},
+                    {"kind": "label", "name": "Theory", "count": 38},
+                    {"kind": "type", "name": "PROPOSED", "count": 38},
+                ],
+            ]
+        )
+
+        stats = await repo.get_stats()
+
+        assert adapter.execute_query.await_count == 3
+        count_query = adapter.execute_query.await_args_list[2].args[0]
+        assert "MATCH (n:`Theory`)" in count_query
+        assert "UNION ALL" in count_query
+        assert stats == {
+            "node_counts": {"Theory": 38},
+            "relationship_counts": {"PROPOSED": 38},
+            "total_nodes": 40,
+            "total_relationships": 38,
+        }
+
+    async def test_statistics_are_cached(self):
+        """2回目以降はキャッシュから返す"""
+        repo, adapter = create_repository([[APOC_RECORD]])
+
+        first = await repo.get_statistics()
+        second = await repo.get_stats()
+
+        assert adapter.execute_query.await_count == 1
+        assert first["total_nodes"] == second["total_nodes"] == 63
+
+
+class TestNeighborEdges:
+    """隣接エッジ取得のテスト"""
+
+    async def test_single_query_for_all_nodes(self):
+        """全起点ノードの隣接エッジを1回のクエリで取得"""
+        rows = [{"source": "clt", "target": "wm", "labels": ["Concept"], "type": "HAS_CONCEPT"}]
+        repo, adapter = create_repository([rows])
+
+        edges = await repo.get_neighbor_edges(["clt", "mayer"], ["HAS_CONCEPT", "RELATED_TO"])
+
+        assert edges == rows
+        query, params = adapter.execute_query.await_args.args
+        assert "[r:`HAS_CONCEPT`|`RELATED_TO`]" in query
+        assert params == {"node_ids": ["clt", "mayer"], "limit_per_node": 50}
+
+    async def test_ordered_limit_per_node(self):
+        """上限は起点ノードごとのサブクエリで strength の強い順に適用（決定的な順序）"""
+        repo, adapter = create_repository([[]])
+
+        await repo.get_neighbor_edges(["clt"], ["HAS_CONCEPT"], limit_per_node=5)
+
+        query, params = adapter.execute_query.await_args.args
+        subquery = query[query.index("CALL {") : query.index("}")]
+        assert "ORDER BY strength_rank, b.id" in subquery
+        assert "LIMIT $limit_per_node" in subquery
+        assert "LIMIT" not in query[query.index("}") :]
+        assert params["limit_per_node"] == 5
+
+    async def test_empty_input(self):
+        """起点またはタイプがなければクエリしない"""
+        repo, adapter = create_repository([])
+
+        assert await repo.get_neighbor_edges([], ["HAS_CONCEPT"]) == []
+        assert await repo.get_neighbor_edges(["clt"], []) == []
+        adapter.execute_query.assert_not_awaited()
+
+
+class TestEntitiesByIds:
+    """IDによるエンティティ取得のテスト"""
+
+    async def test_union_per_label(self):
+        """ラベルごとのインデックス検索を UNION で1回のクエリにまとめる"""
+        rows = [{"labels": ["Theory"], "properties": {"id": "clt"}}]
+        repo, adapter = create_repository([rows])
+
+        entities = await repo.get_entities_by_ids(["clt", "wm"], ["Theory", "Concept"])
+
+        assert entities == rows
+        query, params = adapter.execute_query.await_args.args
+        assert "MATCH (n:`Theory`) WHERE n.id IN $ids" in query
+        assert "MATCH (n:`Concept`) WHERE n.id IN $ids" in query
+        assert "UNION" in query
+        assert params == {"ids": ["clt", "wm"]}
+
+
+class TestFulltextSearch:
+    """全文検索のテスト"""
+
+    async def test_union_of_fulltext_indexes(self):
+        """対象ラベルの全文検索インデックスを1回のクエリで検索し、スコア順に並べる"""
+        rows = [
+            {"id": "wm", "labels": ["Concept"], "score": 1.2},
+            {"id": "clt", "labels": ["Theory"], "score": 3.4},
+        ]
+        repo, adapter = create_repository([rows])
+
+        results = await repo.fulltext_search("認知負荷 (CLT)", labels=["Theory", "Concept"])
+
+        assert [r["id"] for r in results] == ["clt", "wm"]
+        adapter.execute_query.assert_awaited_once()
+        query, params = adapter.execute_query.await_args.args
+        assert "queryNodes('theory_search', $query)" in query
+        assert "queryNodes('concept_search', $query)" in query
+        assert "theorist_search" not in query
+        assert params["query"] == r"認知負荷 \(CLT\)"
+
+    async def test_fallback_without_index(self):
+        """全文検索インデックスがない場合は部分一致検索にフォールバック"""
+        rows = [{"id": "clt", "labels": ["Theory"], "score": 2.0}]
+        repo, adapter = create_repository([Exception("no such index"), rows])
+
+        results = await repo.fulltext_search("認知負荷", labels=["Theory"], category="learning")
+
+        assert results == rows
+        query, params = adapter.execute_query.await_args.args
+        assert "CONTAINS toLower($text)" in query
+        assert params["text"] == "認知負荷"
+        assert params["category"] == "learning"
+
+    async def test_unsupported_labels(self):
+        """全文検索インデックスのないラベルだけの場合はクエリを実行しない"""
+        repo, adapter = create_repository([])
+
+        assert await repo.fulltext_search("認知負荷", labels=["Evidence"]) == []
+        adapter.execute_query.assert_not_awaited()
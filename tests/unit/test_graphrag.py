@@ -0,0 +1,194 @@
+"""Unit Tests: graphrag - ベクトル検索 + グラフ展開のユニットテスト"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tengin_mcp.application.services.graphrag import (
+    GraphRAGService,
+    edge_factor,
+    evidence_score,
+)
+from tengin_mcp.domain.errors import InvalidQueryError
+
+SEED_RESULTS = {
+    "ids": [["clt", "mayer"]],
+    "distances": [[0.2, 0.4]],
+    "metadatas": [[{"entity_type": "Theory"}, {"entity_type": "Theory"}]],
+}
+
+SUMMARIES = {
+    "clt": {"id": "clt", "name": "認知負荷理論", "evidence_level": "strong", "summary": "WM"},
+    "mayer": {"id": "mayer", "name": "マルチメディア学習", "evidence_level": "moderate"},
+    "wm": {"id": "wm", "name": "ワーキングメモリ", "summary": "容量に制限がある"},
+    "schema": {"id": "schema", "name": "スキーマ"},
+}
+
+
+def create_service(edges_by_hop):
+    """ホップごとのエッジを返すモック付きのサービスを作成"""
+    vector_store = MagicMock()
+    vector_store.search = AsyncMock(return_value=SEED_RESULTS)
+    embedding = MagicMock()
+    embedding.embed_text = AsyncMock(return_value=[0.1, 0.2])
+    graph = MagicMock()
+    graph.get_neighbor_edges = AsyncMock(side_effect=edges_by_hop)
+    graph.get_entity_summaries = AsyncMock(return_value=SUMMARIES)
+    return GraphRAGService(vector_store, embedding, graph), graph
+
+
+def edge(source, target, rel_type, strength=None, labels=("Concept",)):
+    """get_neighbor_edges の1行"""
+    return {
+        "source": source,
+        "target": target,
+        "labels": list(labels),
+        "type": rel_type,
+        "strength": strength,
+    }
+
+
+class TestScoring:
+    """スコア計算のテスト"""
+
+    def test_evidence_score(self):
+        """エビデンスレベルの順序を 0〜1 に正規化"""
+        assert evidence_score("strong") == 1.0
+        assert evidence_score("emerging") == pytest.approx(0.2)
+        assert evidence_score(None) == 0.0
+        assert evidence_score("unknown") == 0.0
+
+    def test_edge_factor(self):
+        """タイプの重み × strength の減衰（未登録のタイプは辿らない）"""
+        weights = {"INCLUDES_CONCEPT": 0.8}
+        assert edge_factor("INCLUDES_CONCEPT", "strong", weights) == pytest.approx(0.8)
+        assert edge_factor("INCLUDES_CONCEPT", None, weights) == pytest.approx(0.8 * 0.85)
+        assert edge_factor("PROPOSED", "strong", weights) == 0.0
+
+
+class TestGraphRAGService:
+    """GraphRAGService のテスト"""
+
+    async def test_retrieve_expands_and_fuses(self):
+        """シードから展開し、類似度・近接度・エビデンスの加重和で順位付け"""
+        service, graph = create_service(
+            [
+                [
+                    edge("clt", "wm", "INCLUDES_CONCEPT", "strong"),
+                    edge("mayer", "wm", "INCLUDES_CONCEPT", "strong"),
+                    edge("clt", "mayer", "COMPLEMENTS", labels=("Theory",)),
+                ],
+                [edge("wm", "schema", "RELATED_TO", "weak")],
+            ]
+        )
+
+        result = await service.retrieve("覚えることが多すぎる", seed_limit=2, max_hops=2)
+
+        assert graph.get_neighbor_edges.await_count == 2
+        assert graph.get_neighbor_edges.await_args_list[1].args[0] == ["wm"]
+        graph.get_entity_summaries.assert_awaited_once_with(
+            {"Theory": ["clt", "mayer"], "Concept": ["wm", "schema"]}
+        )
+        items = {item["id"]: item for item in result["items"]}
+        assert [item["id"] for item in result["items"]] == ["clt", "mayer", "wm", "schema"]
+        assert items["clt"]["score"] == pytest.approx(0.5 * 0.8 + 0.3 * 0.8 + 0.2 * 1.0)
+        # 同じホップで複数の経路がある場合は近接度が最大の経路を採用
+        assert items["wm"]["proximity"] == pytest.approx(0.8 * 0.8)
+        assert items["wm"]["via"] == {"from": "clt", "type": "INCLUDES_CONCEPT"}
+        assert items["wm"]["similarity"] is None
+        assert items["schema"]["hops"] == 2
+        assert items["schema"]["proximity"] == pytest.approx(0.64 * 0.7 * 0.7)
+        # シード同士のエッジでシードの近接度は変わらない
+        assert items["mayer"]["hops"] == 0
+        assert items["mayer"]["via"] is None
+        assert result["seeds"] == 2
+        assert result["candidates"] == 4
+        assert (
+            "- **ワーキングメモリ** (Concept, id=wm, via INCLUDES_CONCEPT from clt)"
+            in result["context"].splitlines()
+        )
+
+    async def test_shared_english_view_seeds(self):
+        """英語ビューを同じストアに格納する場合は多めに取得し、重複を除いて seed_limit 件をシードにする"""
+        vector_store = MagicMock()
+        vector_store.search = AsyncMock(
+            return_value={
+                "ids": [["clt", "clt#en", "mayer#en", "mayer"]],
+                "distances": [[0.2, 0.25, 0.3, 0.4]],
+                "metadatas": [
+                    [
+                        {"entity_id": "clt", "entity_type": "Theory"},
+                        {"entity_id": "clt", "entity_type": "Theory"},
+                        {"entity_id": "mayer", "entity_type": "Theory"},
+                        {"entity_id": "mayer", "entity_type": "Theory"},
+                    ]
+                ],
+            }
+        )
+        embedding = MagicMock()
+        embedding.embed_text = AsyncMock(return_value=[0.1])
+        graph = MagicMock()
+        graph.get_entity_summaries = AsyncMock(return_value=SUMMARIES)
+        service = GraphRAGService(vector_store, embedding, graph, documents_per_entity=2)
+
+        result = await service.retrieve("cognitive load", seed_limit=2, max_hops=0)
+
+        assert vector_store.search.await_args.kwargs["n_results"] == 4
+        assert result["seeds"] == 2
+        assert [item["id"] for item in result["items"]] == ["clt", "mayer"]
+
+    async def test_relationship_weights_override(self):
+        """重み 0 のタイプは辿らない"""
+        service, graph = create_service([[]])
+
+        await service.retrieve("学習意欲", max_hops=1, relationship_weights={"PROPOSED_BY": 0})
+
+        relationship_types = graph.get_neighbor_edges.await_args.args[1]
+        assert "PROPOSED_BY" not in relationship_types
+        assert "INCLUDES_CONCEPT" in relationship_types
+
+    async def test_token_budget(self):
+        """トークン予算を超える候補はコンテキストに含めない"""
+        edges = [edge("clt", "wm", "INCLUDES_CONCEPT")]
+        service, _ = create_service([edges, edges])
+
+        full = await service.retrieve("覚えることが多すぎる", max_hops=1, max_tokens=2000)
+        tight = await service.retrieve("覚えることが多すぎる", max_hops=1, max_tokens=30)
+
+        assert full["truncated"] == 0
+        assert len(tight["items"]) < len(full["items"])
+        assert tight["truncated"] == len(full["items"]) - len(tight["items"])
+        assert 0 < tight["token_estimate"] <= 30
+
+
+class TestGraphRAGRetrieveTool:
+    """graphrag_retrieve ツールのテスト"""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"seed_limit": 0},
+            {"max_hops": 4},
+            {"limit": 51},
+            {"max_tokens": 50},
+            {"relationship_weights": {"RELATED_TO": 1.5}},
+            {"entity_types": ["Person"]},
+        ],
+    )
+    async def test_invalid_parameters(self, kwargs):
+        """パラメータの検証"""
+        from tengin_mcp.tools.theory_tools import graphrag_retrieve
+
+        with pytest.raises(InvalidQueryError):
+            await graphrag_retrieve("学習意欲", **kwargs)
+
+    async def test_not_initialized(self):
+        """未初期化時はエラーを返す"""
+        from tengin_mcp.tools.theory_tools import graphrag_retrieve
+
+        with patch("tengin_mcp.tools.theory_tools.app_state") as mock_state:
+            mock_state.chromadb_adapter = None
+            result = await graphrag_retrieve("学習意欲")
+
+        assert result["items"] == []
+        assert "error" in result
@@ -0,0 +1,143 @@
+"""Unit Tests: hybrid_search - 全文検索 + ベクトル検索のユニットテスト"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tengin_mcp.application.services.hybrid_search import HybridSearchService
+from tengin_mcp.domain.errors import InvalidQueryError
+
+VECTOR_RESULTS = {
+    "ids": [["clt", "wm"]],
+    "distances": [[0.2, 0.4]],
+    "metadatas": [
+        [
+            {"entity_type": "Theory", "name": "認知負荷理論"},
+            {"entity_type": "Concept", "name": "ワーキングメモリ"},
+        ]
+    ],
+}
+
+FULLTEXT_ROWS = [
+    {"id": "clt", "labels": ["Theory"], "score": 3.5},
+    {"id": "schema", "labels": ["Concept"], "score": 1.25},
+]
+
+SUMMARIES = {
+    "clt": {"id": "clt", "name": "認知負荷理論", "evidence_level": "strong"},
+    "schema": {"id": "schema", "name": "スキーマ"},
+}
+
+
+def create_service(fulltext=None, vector=None):
+    """モック付きのサービスを作成"""
+    vector_store = MagicMock()
+    vector_store.search = AsyncMock(return_value=VECTOR_RESULTS, side_effect=vector)
+    embedding = MagicMock()
+    embedding.embed_text = AsyncMock(return_value=[0.1, 0.2])
+    graph = MagicMock()
+    graph.fulltext_search = AsyncMock(return_value=FULLTEXT_ROWS, side_effect=fulltext)
+    graph.get_entity_summaries = AsyncMock(return_value=SUMMARIES)
+    return HybridSearchService(vector_store, embedding, graph), graph
+
+
+class TestHybridSearchService:
+    """HybridSearchService のテスト"""
+
+    async def test_fuses_with_per_source_scores(self):
+        """両方のソースの結果を RRF で統合し、ソースごとの順位とスコアを返す"""
+        service, graph = create_service()
+
+        response = await service.search("認知負荷", limit=5, category="learning")
+
+        results = response["results"]
+        # 同点（片方のソースで同じ順位）の場合は全文検索の結果が先
+        assert [r["id"] for r in results] == ["clt", "schema", "wm"]
+        assert results[0]["rrf_score"] == pytest.approx(2 / 61, abs=1e-6)
+        assert results[0]["scores"] == {
+            "fulltext": {"rank": 1, "score": 3.5},
+            "vector": {"rank": 1, "similarity": 0.8},
+        }
+        assert results[1]["scores"]["vector"] is None
+        assert results[1]["entity_type"] == "Concept"
+        assert results[2]["scores"]["fulltext"] is None
+        assert results[2]["name"] == "ワーキングメモリ"
+        assert graph.fulltext_search.await_args.kwargs["category"] == "learning"
+        graph.get_entity_summaries.assert_awaited_once_with(
+            {"Theory": ["clt"], "Concept": ["schema", "wm"]}
+        )
+        assert response["sources"]["fulltext"]["count"] == 2
+        assert response["sources"]["vector"]["count"] == 2
+
+    async def test_sources_run_concurrently(self):
+        """全文検索の完了を待たずにベクトル検索を実行する"""
+        vector_started = asyncio.Event()
+
+        async def fulltext(*args, **kwargs):
+            await vector_started.wait()
+            return FULLTEXT_ROWS
+
+        async def vector(*args, **kwargs):
+            vector_started.set()
+            return VECTOR_RESULTS
+
+        service, _ = create_service(fulltext=fulltext, vector=vector)
+
+        response = await asyncio.wait_for(service.search("認知負荷"), timeout=1)
+
+        assert len(response["results"]) == 3
+
+    async def test_degrades_when_source_fails(self):
+        """片方のソースが失敗した場合はもう片方の結果だけで返す"""
+        service, _ = create_service(vector=RuntimeError("vector store down"))
+
+        response = await service.search("認知負荷")
+
+        assert [r["id"] for r in response["results"]] == ["clt", "schema"]
+        assert response["sources"]["vector"] == {"count": 0, "error": "vector store down"}
+        assert response["sources"]["fulltext"]["count"] == 2
+
+    async def test_fulltext_only_without_vector_store(self):
+        """ベクトルストアがない場合は全文検索のみ"""
+        graph = MagicMock()
+        graph.fulltext_search = AsyncMock(return_value=FULLTEXT_ROWS)
+        graph.get_entity_summaries = AsyncMock(return_value=SUMMARIES)
+        service = HybridSearchService(None, None, graph)
+
+        response = await service.search("認知負荷", limit=1)
+
+        assert [r["id"] for r in response["results"]] == ["clt"]
+        assert response["sources"]["vector"]["error"] == "not initialized"
+
+
+class TestHybridSearchTool:
+    """hybrid_search ツールのテスト"""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"query": "a"},
+            {"query": "認知負荷", "limit": 0},
+            {"query": "認知負荷", "limit": 51},
+            {"query": "認知負荷", "entity_types": ["Person"]},
+            {"query": "認知負荷", "category": "invalid"},
+        ],
+    )
+    async def test_invalid_parameters(self, kwargs):
+        """パラメータの検証"""
+        from tengin_mcp.tools.theory_tools import hybrid_search
+
+        with pytest.raises(InvalidQueryError):
+            await hybrid_search(**kwargs)
+
+    async def test_not_initialized(self):
+        """未初期化時はエラーを返す"""
+        from tengin_mcp.tools.theory_tools import hybrid_search
+
+        with patch("tengin_mcp.tools.theory_tools.app_state") as mock_state:
+            mock_state.graph_repository = None
+            result = await hybrid_search("認知負荷")
+
+        assert result["results"] == []
+        assert "error" in result
@@ -0,0 +1,273 @@
+"""Unit Tests: local_vector_adapter - プロセス内ベクトルストアのユニットテスト"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+from tengin_mcp.infrastructure.adapters.local_vector_adapter import LocalVectorAdapter
+from tengin_mcp.infrastructure.adapters.vector_store import (
+    create_vector_store,
+    documents_per_entity,
+    english_view_settings,
+)
+from tengin_mcp.infrastructure.config import Settings
+
+
+def create_mock_settings(path, **kwargs):
+    """テスト用のモックSettings作成"""
+    settings = MagicMock()
+    settings.vector_backend = kwargs.get("vector_backend", "local")
+    settings.local_vector_path = str(path)
+    settings.local_vector_hnsw_threshold = kwargs.get("local_vector_hnsw_threshold", 20000)
+    settings.chromadb_url = ""
+    settings.chromadb_max_workers = 2
+    settings.chromadb_path = str(path)
+    settings.chromadb_collection = "education_theories"
+    settings.chromadb_collection_layout = "single"
+    settings.vector_reduction = kwargs.get("vector_reduction", "none")
+    settings.vector_dimensions = kwargs.get("vector_dimensions", 0)
+    settings.vector_quantization = kwargs.get("vector_quantization", "none")
+    settings.vector_rescore_factor = kwargs.get("vector_rescore_factor", 4)
+    settings.embedding_model = kwargs.get("embedding_model", "text-embedding-3-small")
+    return settings
+
+
+async def create_store(path) -> LocalVectorAdapter:
+    """テスト用ドキュメントを格納したストアを作成"""
+    store = LocalVectorAdapter(create_mock_settings(path))
+    await store.connect()
+    await store.upsert_documents(
+        ids=["clt", "schema", "zpd"],
+        documents=["認知負荷理論", "スキーマ", "最近接発達領域"],
+        embeddings=[[1.0, 0.0, 0.0], [0.8, 0.6, 0.0], [0.0, 0.0, 2.0]],
+        metadatas=[
+            {"entity_type": "Theory", "category": "learning"},
+            {"entity_type": "Concept", "category": "learning"},
+            {"entity_type": "Theory", "category": "developmental"},
+        ],
+    )
+    return store
+
+
+class TestLocalVectorAdapterSearch:
+    """検索のテスト"""
+
+    async def test_search_cosine(self, tmp_path):
+        """コサイン距離の昇順（ChromaDB と同じ形式）"""
+        store = await create_store(tmp_path)
+
+        results = await store.search(query_embedding=[2.0, 0.0, 0.0], n_results=2)
+
+        assert results["ids"] == [["clt", "schema"]]
+        assert results["distances"][0] == pytest.approx([0.0, 0.2], abs=1e-6)
+        assert results["documents"] == [["認知負荷理論", "スキーマ"]]
+        assert results["metadatas"][0][0]["entity_type"] == "Theory"
+
+    async def test_where_filters(self, tmp_path):
+        """メタデータフィルタ"""
+        store = await create_store(tmp_path)
+        query = [1.0, 0.0, 0.0]
+
+        single = await store.search(query, n_results=5, where={"entity_type": "Theory"})
+        combined = await store.search(
+            query,
+            n_results=5,
+            where={
+                "$and": [
+                    {"entity_type": {"$in": ["Theory", "Concept"]}},
+                    {"category": {"$ne": "developmental"}},
+                ]
+            },
+        )
+        empty = await store.search(query, n_results=5, where={"category": "social"})
+
+        assert single["ids"] == [["clt", "zpd"]]
+        assert combined["ids"] == [["clt", "schema"]]
+        assert empty["ids"] == [[]]
+
+    async def test_search_many(self, tmp_path):
+        """複数クエリを1回で検索（クエリごとの結果は search と同じ）"""
+        store = await create_store(tmp_path)
+        queries = [[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]
+
+        results = await store.search_many(queries, n_results=2, where={"entity_type": "Theory"})
+
+        assert results["ids"] == [["clt", "zpd"], ["zpd", "clt"]]
+        for i, query in enumerate(queries):
+            single = await store.search(query, n_results=2, where={"entity_type": "Theory"})
+            assert results["distances"][i] == pytest.approx(single["distances"][0])
+
+    async def test_unsupported_operator(self, tmp_path):
+        """未対応の演算子"""
+        store = await create_store(tmp_path)
+        with pytest.raises(ValueError):
+            await store.search([1.0, 0.0, 0.0], where={"name": {"$contains": "理論"}})
+
+    async def test_matches_chromadb(self, tmp_path):
+        """ChromaDB（コサイン距離）と同じ順位・距離"""
+        import chromadb
+
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(50, 8)).tolist()
+        ids = [f"d{i}" for i in range(50)]
+        metadatas = [{"entity_type": "Theory" if i % 2 else "Concept"} for i in range(50)]
+        query = rng.normal(size=8).tolist()
+
+        store = LocalVectorAdapter(create_mock_settings(tmp_path))
+        await store.connect()
+        await store.upsert_documents(ids, ids, vectors, metadatas)
+        collection = chromadb.EphemeralClient().get_or_create_collection(
+            "parity", configuration=ChromaDBAdapter.COLLECTION_CONFIGURATION
+        )
+        collection.upsert(ids=ids, documents=ids, embeddings=vectors, metadatas=metadatas)
+
+        local = await store.search(query, n_results=5, where={"entity_type": "Theory"})
+        chroma = collection.query(
+            query_embeddings=[query], n_results=5, where={"entity_type": "Theory"}
+        )
+
+        assert local["ids"] == chroma["ids"]
+        assert local["distances"][0] == pytest.approx(chroma["distances"][0], abs=1e-4)
+
+    async def test_hnsw_matches_exact(self, tmp_path):
+        """しきい値以上では HNSW で検索（全件比較と同じ結果）"""
+        pytest.importorskip("hnswlib")
+        rng = np.random.default_rng(1)
+        vectors = rng.normal(size=(500, 16)).tolist()
+        ids = [f"d{i}" for i in range(500)]
+        metadatas = [{"group": i % 3} for i in range(500)]
+        query = rng.normal(size=16).tolist()
+
+        results = {}
+        for name, threshold in (("hnsw", 0), ("exact", 10**9)):
+            store = LocalVectorAdapter(
+                create_mock_settings(tmp_path / name, local_vector_hnsw_threshold=threshold)
+            )
+            await store.connect()
+            await store.upsert_documents(ids, ids, vectors, metadatas)
+            results[name] = await store.search(query, n_results=5, where={"group": 1})
+            assert (store._hnsw is not None) == (name == "hnsw")
+
+        assert results["hnsw"]["ids"] == results["exact"]["ids"]
+
+
+class TestLocalVectorAdapterStorage:
+    """更新・永続化のテスト"""
+
+    async def test_persisted_and_memory_mapped(self, tmp_path):
+        """flush するまでディスクに書き込まず、再接続時はディスクからメモリマップで読み込む"""
+        created = await create_store(tmp_path)
+        assert not (tmp_path / LocalVectorAdapter.INDEX_FILE).exists()
+        await created.flush()
+
+        store = LocalVectorAdapter(create_mock_settings(tmp_path))
+        await store.connect()
+
+        assert isinstance(store._matrix, np.memmap)
+        assert await store.get_count() == 3
+        results = await store.search([0.0, 0.0, 1.0], n_results=1)
+        assert results["ids"] == [["zpd"]]
+
+    async def test_upsert_and_delete(self, tmp_path):
+        """ID単位の更新と削除"""
+        store = await create_store(tmp_path)
+
+        await store.upsert_documents(
+            ids=["zpd"],
+            documents=["ZPD"],
+            embeddings=[[0.0, 1.0, 0.0]],
+            metadatas=[{"entity_type": "Concept"}],
+        )
+        await store.delete_documents(["schema", "missing"])
+
+        assert await store.get_count() == 2
+        assert (await store.get_metadatas())["zpd"] == {"entity_type": "Concept"}
+        results = await store.search([0.0, 1.0, 0.0], n_results=1, where={"entity_type": "Concept"})
+        assert results["ids"] == [["zpd"]]
+        assert results["documents"] == [["ZPD"]]
+
+    async def test_append_without_copying(self, tmp_path):
+        """追記はバッファの容量内で行い、flush ごとに行列ファイルを切り替えて古いファイルを削除"""
+        store = await create_store(tmp_path)
+        await store.upsert_documents(["a"], ["a"], [[0.0, 1.0, 0.0]])
+        buffer = store._buffer
+        await store.upsert_documents(["b"], ["b"], [[0.0, 1.0, 1.0]])
+        await store.flush()
+        await store.upsert_documents(["c"], ["c"], [[1.0, 1.0, 0.0]])
+        await store.flush()
+
+        assert store._buffer is buffer
+        assert [p.name for p in tmp_path.glob("vectors*.f32")] == ["vectors-2.f32"]
+        reloaded = LocalVectorAdapter(create_mock_settings(tmp_path))
+        await reloaded.connect()
+        assert await reloaded.get_count() == 6
+        assert (await reloaded.search([0.0, 1.0, 1.0], n_results=1))["ids"] == [["b"]]
+
+    async def test_inconsistent_matrix_refused(self, tmp_path):
+        """行列ファイルのサイズが index.json と一致しない場合は読み込まない"""
+        store = await create_store(tmp_path)
+        await store.close()
+        matrix_path = next(tmp_path.glob("vectors*.f32"))
+        matrix_path.write_bytes(matrix_path.read_bytes()[:-4])
+
+        with pytest.raises(RuntimeError, match="rebuild the index"):
+            await LocalVectorAdapter(create_mock_settings(tmp_path)).connect()
+
+    async def test_dimension_mismatch(self, tmp_path):
+        """次元の異なる埋め込みはエラー"""
+        store = await create_store(tmp_path)
+        with pytest.raises(ValueError):
+            await store.upsert_documents(["x"], ["x"], [[1.0, 0.0]])
+
+    async def test_not_connected(self, tmp_path):
+        """未接続時はエラー"""
+        store = LocalVectorAdapter(create_mock_settings(tmp_path))
+        with pytest.raises(RuntimeError):
+            await store.heartbeat()
+
+
+class TestCreateVectorStore:
+    """バックエンド選択のテスト"""
+
+    def test_backend_selection(self, tmp_path):
+        """VECTOR_BACKEND に応じたアダプター"""
+        local = create_vector_store(create_mock_settings(tmp_path, vector_backend="local"))
+        chroma = create_vector_store(create_mock_settings(tmp_path, vector_backend="chromadb"))
+
+        assert isinstance(local, LocalVectorAdapter)
+        assert isinstance(chroma, ChromaDBAdapter)
+
+    def test_english_view_settings(self, tmp_path):
+        """英語ビューのモデルが異なる場合だけ別のコレクション・パスを使用"""
+        base = {
+            "_env_file": None,
+            "EMBEDDING_PROVIDER": "openai",
+            "EMBEDDING_MODEL": "text-embedding-3-small",
+            "LOCAL_VECTOR_PATH": str(tmp_path),
+        }
+
+        assert english_view_settings(Settings(**base)) is None
+        assert english_view_settings(Settings(**base, MULTILINGUAL_INDEX=True)) is None
+        english = english_view_settings(
+            Settings(**base, MULTILINGUAL_INDEX=True, EMBEDDING_MODEL_EN="text-embedding-3-large")
+        )
+
+        assert english is not None
+        assert (english.embedding_provider, english.embedding_model) == (
+            "openai",
+            "text-embedding-3-large",
+        )
+        assert english.chromadb_collection == "education_theories_en"
+        assert english.local_vector_path == str(tmp_path / "en")
+        assert documents_per_entity(Settings(**base)) == 1
+        assert documents_per_entity(Settings(**base, MULTILINGUAL_INDEX=True)) == 2
+        assert (
+            documents_per_entity(
+                Settings(
+                    **base, MULTILINGUAL_INDEX=True, EMBEDDING_MODEL_EN="text-embedding-3-large"
+                )
+            )
+            == 1
+        )
@@ -0,0 +1,31 @@
+"""Unit Tests: neo4j_adapter - Neo4jアダプターのユニットテスト"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from neo4j.exceptions import ServiceUnavailable
+
+from tengin_mcp.domain.errors import DatabaseConnectionError
+from tengin_mcp.infrastructure.adapters.neo4j_adapter import Neo4jAdapter
+
+
+class TestPing:
+    """ping のテスト"""
+
+    async def test_wraps_driver_errors(self):
+        """ドライバーのエラーは DatabaseConnectionError に変換"""
+        session = MagicMock()
+        session.run = AsyncMock(side_effect=ServiceUnavailable("connection refused"))
+        driver = MagicMock()
+        driver.session.return_value.__aenter__ = AsyncMock(return_value=session)
+        driver.session.return_value.__aexit__ = AsyncMock(return_value=False)
+        adapter = Neo4jAdapter(MagicMock())
+        adapter._driver = driver
+
+        with pytest.raises(DatabaseConnectionError, match="connection refused"):
+            await adapter.ping()
+
+    async def test_not_connected(self):
+        """未接続の場合は DatabaseConnectionError"""
+        with pytest.raises(DatabaseConnectionError, match="Not connected"):
+            await Neo4jAdapter(MagicMock()).ping()
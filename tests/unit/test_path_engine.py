@@ -0,0 +1,147 @@
+"""Unit Tests: path_engine - 経路探索エンジンのユニットテスト"""
+
+from tengin_mcp.application.services.path_engine import (
+    DEFAULT_STRENGTH_COST,
+    PathEngine,
+    strength_to_cost,
+)
+
+
+def create_engine() -> PathEngine:
+    """
+    テスト用グラフ:
+
+        a --strong-- b --strong-- d
+        |                         |
+        +--weak-- c ----weak------+
+        a ----------weak--------- d
+    """
+    nodes = [
+        {"id": "a", "labels": ["Theory"], "name": "A"},
+        {"id": "b", "labels": ["Theory"], "name": "B"},
+        {"id": "c", "labels": ["Concept"], "name": "C"},
+        {"id": "d", "labels": ["Theory"], "name": "D"},
+        {"id": "isolated", "labels": ["Theory"], "name": "Isolated"},
+    ]
+    edges = [
+        {"source": "a", "target": "b", "type": "INFLUENCED", "properties": {"strength": "strong"}},
+        {"source": "b", "target": "d", "type": "EXTENDS", "properties": {"strength": "strong"}},
+        {
+            "source": "a",
+            "target": "c",
+            "type": "INCLUDES_CONCEPT",
+            "properties": {"strength": "weak"},
+        },
+        {
+            "source": "d",
+            "target": "c",
+            "type": "INCLUDES_CONCEPT",
+            "properties": {"strength": "weak"},
+        },
+        {"source": "a", "target": "d", "type": "RELATED_TO", "properties": {"strength": "weak"}},
+    ]
+    return PathEngine(nodes, edges)
+
+
+class TestStrengthToCost:
+    """strength → コスト変換のテスト"""
+
+    def test_known_strengths(self):
+        """既知の強度"""
+        assert strength_to_cost("strong") < strength_to_cost("moderate") < strength_to_cost("weak")
+
+    def test_unknown_strength(self):
+        """未設定・未知の強度はデフォルトコスト"""
+        assert strength_to_cost(None) == DEFAULT_STRENGTH_COST
+        assert strength_to_cost("unknown") == DEFAULT_STRENGTH_COST
+
+
+class TestShortestPath:
+    """最短パスのテスト"""
+
+    def test_unweighted_prefers_fewest_hops(self):
+        """重みなしではホップ数最小のパス"""
+        engine = create_engine()
+        path = engine.shortest_path("a", "d", weighted=False)
+
+        assert path is not None
+        assert path.node_ids == ["a", "d"]
+        assert path.length == 1
+
+    def test_weighted_prefers_strong_relationships(self):
+        """重み付きでは強い関係を経由するパス"""
+        engine = create_engine()
+        path = engine.shortest_path("a", "d", weighted=True)
+
+        assert path is not None
+        assert path.node_ids == ["a", "b", "d"]
+        assert path.cost == 2.0
+
+    def test_reverse_direction(self):
+        """エッジ方向に関係なく探索（無向）"""
+        engine = create_engine()
+        path = engine.shortest_path("d", "a", weighted=True)
+
+        assert path is not None
+        assert path.node_ids == ["d", "b", "a"]
+
+    def test_no_path(self):
+        """到達不能なノード"""
+        engine = create_engine()
+        assert engine.shortest_path("a", "isolated") is None
+
+    def test_unknown_node(self):
+        """存在しないノード"""
+        engine = create_engine()
+        assert engine.shortest_path("a", "missing") is None
+
+    def test_max_depth(self):
+        """max_depth を超えるパスは除外"""
+        engine = create_engine()
+        path = engine.shortest_path("a", "d", weighted=True, max_depth=1)
+
+        assert path is not None
+        assert path.node_ids == ["a", "d"]
+
+
+class TestKShortestPaths:
+    """k 最短パスのテスト"""
+
+    def test_paths_in_cost_order(self):
+        """コスト昇順で k 本のパス"""
+        engine = create_engine()
+        paths = engine.k_shortest_paths("a", "d", k=3, weighted=True)
+
+        assert [p.node_ids for p in paths] == [["a", "b", "d"], ["a", "d"], ["a", "c", "d"]]
+        costs = [p.cost for p in paths]
+        assert costs == sorted(costs)
+
+    def test_paths_are_simple(self):
+        """ループを含まない単純パス"""
+        engine = create_engine()
+        paths = engine.k_shortest_paths("a", "d", k=10, weighted=False)
+
+        for p in paths:
+            assert len(p.node_ids) == len(set(p.node_ids))
+        assert len({tuple(p.node_ids) for p in paths}) == len(paths)
+
+    def test_fewer_paths_than_k(self):
+        """存在するパス数が k 未満"""
+        engine = create_engine()
+        paths = engine.k_shortest_paths("a", "d", k=10, weighted=True)
+
+        # a→d の単純パスは a-b-d, a-d, a-c-d の3本のみ
+        assert len(paths) == 3
+
+    def test_to_dict(self):
+        """レスポンス形式への変換"""
+        engine = create_engine()
+        path = engine.shortest_path("a", "d", weighted=True)
+        result = engine.to_dict(path)
+
+        assert [n["id"] for n in result["nodes"]] == ["a", "b", "d"]
+        assert result["nodes"][0]["name"] == "A"
+        assert result["relationships"][0]["type"] == "INFLUENCED"
+        assert result["relationships"][0]["start_node_id"] == "a"
+        assert result["length"] == 2
+        assert result["cost"] == 2.0
@@ -0,0 +1,194 @@
+"""Unit Tests: Reranker - リランクのユニットテスト"""
+
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tengin_mcp.application.services.rerank import candidate_text, rerank_items
+from tengin_mcp.infrastructure.adapters.reranker_adapter import (
+    RerankerAdapter,
+    lexical_score,
+    lexical_terms,
+)
+
+
+def create_reranker(**kwargs) -> RerankerAdapter:
+    """モック設定でリランカーを作成"""
+    settings = MagicMock()
+    settings.rerank_provider = kwargs.get("rerank_provider", "lexical")
+    settings.rerank_model = kwargs.get("rerank_model", "BAAI/bge-reranker-v2-m3")
+    settings.rerank_batch_size = kwargs.get("rerank_batch_size", 16)
+    settings.rerank_cache_size = kwargs.get("rerank_cache_size", 100)
+    return RerankerAdapter(settings)
+
+
+def fake_model(delay: float = 0.0) -> MagicMock:
+    """ドキュメント長をスコアにする cross-encoder のモック"""
+
+    def predict(pairs):
+        time.sleep(delay)
+        return [float(len(document)) for _, document in pairs]
+
+    model = MagicMock()
+    model.predict = MagicMock(side_effect=predict)
+    return model
+
+
+ITEMS = [
+    {"rank": 1, "id": "mayer", "name": "マルチメディア学習理論", "summary": "言葉と絵で学ぶ"},
+    {"rank": 2, "id": "clt", "name": "認知負荷理論", "name_en": "Cognitive Load Theory"},
+    {"rank": 3, "id": "sdt", "name": "自己決定理論", "summary": "内発的動機づけ"},
+]
+
+
+class TestLexicalScore:
+    """語彙の重なりによるスコアのテスト"""
+
+    def test_terms(self):
+        """英数字は単語、日本語は文字バイグラム"""
+        assert lexical_terms("CLT: 認知負荷、ワ") == {"clt", "認知", "知負", "負荷", "ワ"}
+
+    def test_score_is_query_coverage(self):
+        """クエリの語彙の被覆率（0〜1）"""
+        assert lexical_score("認知負荷", "認知負荷理論") == 1.0
+        assert lexical_score("認知負荷", "自己決定理論") == 0.0
+        assert lexical_score("Cognitive Load", "cognitive development") == 0.5
+        assert lexical_score("、。", "認知負荷") == 0.0
+
+
+class TestRerankerAdapter:
+    """RerankerAdapter のテスト"""
+
+    async def test_batches_and_caches_pair_scores(self):
+        """キャッシュにないペアだけをバッチに分けてスコアリング"""
+        reranker = create_reranker(rerank_provider="transformers", rerank_batch_size=2)
+        reranker._model = fake_model()
+
+        first = await reranker.score("認知負荷", ["a", "bb", "ccc"])
+        second = await reranker.score("認知負荷", ["bb", "dddd"])
+
+        assert first == [1.0, 2.0, 3.0]
+        assert second == [2.0, 4.0]
+        batches = [
+            [document for _, document in call.args[0]]
+            for call in reranker._model.predict.call_args_list
+        ]
+        assert batches == [["a", "bb"], ["ccc"], ["dddd"]]
+        assert reranker.cache_stats()["hits"] == 1
+        assert reranker.cache_stats()["size"] == 4
+
+    async def test_latency_budget(self):
+        """予算を超えた場合は残りのペアをスコアリングしない"""
+        reranker = create_reranker(rerank_provider="transformers", rerank_batch_size=1)
+        reranker._model = fake_model(delay=0.05)
+
+        scores = await reranker.score("認知負荷", ["a", "bb", "ccc"], budget_seconds=0.08)
+
+        assert scores[0] == 1.0
+        assert None in scores
+
+    async def test_lexical_without_model(self):
+        """lexical ではモデルを読み込まない"""
+        reranker = create_reranker()
+        await reranker.connect()
+
+        assert reranker.model_name == "lexical"
+        assert await reranker.score("認知負荷", ["認知負荷理論", "自己決定理論"]) == [1.0, 0.0]
+
+    async def test_connect_loads_cross_encoder(self):
+        """transformers は CrossEncoder を読み込み、未インストールならエラー"""
+        reranker = create_reranker(rerank_provider="transformers")
+        module = "tengin_mcp.infrastructure.adapters.reranker_adapter.CrossEncoder"
+
+        with patch(module) as cross_encoder:
+            await reranker.connect()
+        cross_encoder.assert_called_once_with("BAAI/bge-reranker-v2-m3")
+        with patch(module, None), pytest.raises(RuntimeError, match="rerank"):
+            await create_reranker(rerank_provider="transformers").connect()
+
+    def test_cross_encoder_api(self):
+        """依存する CrossEncoder の公開 API（predict）が存在する"""
+        sentence_transformers = pytest.importorskip("sentence_transformers")
+
+        assert callable(getattr(sentence_transformers.CrossEncoder, "predict", None))
+
+    async def test_cache_eviction(self):
+        """上限を超えたら古いペアから削除"""
+        reranker = create_reranker(rerank_cache_size=2)
+
+        await reranker.score("認知負荷", ["a", "b", "c"])
+
+        assert reranker.cache_stats()["size"] == 2
+
+
+class TestRerankItems:
+    """rerank_items のテスト"""
+
+    def test_candidate_text(self):
+        """名前・英語名・要約を連結"""
+        assert candidate_text(ITEMS[1]) == "認知負荷理論\nCognitive Load Theory"
+        assert candidate_text({"id": "x"}) == "x"
+
+    async def test_reorders_by_rerank_score(self):
+        """リランカーのスコア順に並べ替え、元の順位を残す"""
+        results, info = await rerank_items(create_reranker(), "認知負荷を減らす", ITEMS, limit=2)
+
+        assert [r["id"] for r in results] == ["clt", "mayer"]
+        assert results[0]["rank"] == 1
+        assert results[0]["retrieval_rank"] == 2
+        assert results[0]["rerank_score"] > results[1]["rerank_score"]
+        assert info["applied"] is True
+        assert info["candidates"] == 3
+        assert info["scored"] == 3
+
+    async def test_skips_when_budget_exceeded(self):
+        """全候補をスコアリングできなかった場合は元の順位のまま返す"""
+        reranker = create_reranker(rerank_provider="transformers", rerank_batch_size=1)
+        reranker._model = fake_model(delay=0.05)
+
+        results, info = await rerank_items(reranker, "認知負荷", ITEMS, limit=2, budget_ms=70)
+
+        assert [r["id"] for r in results] == ["mayer", "clt"]
+        assert "rerank_score" not in results[0]
+        assert info["applied"] is False
+        assert info["reason"] == "latency budget exceeded"
+
+
+class TestSemanticSearchRerank:
+    """semantic_search の rerank オプションのテスト"""
+
+    async def test_reranker_not_configured(self):
+        """リランカー未設定の場合は元の順位で返し、理由を記録"""
+        from tengin_mcp.tools import theory_tools
+
+        with (
+            patch.object(theory_tools, "app_state") as mock_state,
+            patch.object(theory_tools, "SemanticSearchService") as mock_service,
+        ):
+            mock_state.reranker = None
+            mock_service.return_value.search = AsyncMock(return_value=ITEMS)
+            result = await theory_tools.semantic_search("認知負荷", limit=2, rerank=True)
+
+        assert mock_service.return_value.search.await_args.kwargs["limit"] == 2
+        assert [r["id"] for r in result["results"]] == ["mayer", "clt"]
+        assert result["rerank"]["applied"] is False
+
+    @pytest.mark.parametrize("top_n, expected", [(30, 30), (1, 2)])
+    async def test_candidate_pool(self, top_n, expected):
+        """リランクする場合は RERANK_TOP_N 件（limit 以上）を候補として取得"""
+        from tengin_mcp.tools import theory_tools
+
+        with (
+            patch.object(theory_tools, "app_state") as mock_state,
+            patch.object(theory_tools, "SemanticSearchService") as mock_service,
+        ):
+            mock_state.reranker = create_reranker()
+            mock_state.settings.rerank_top_n = top_n
+            mock_state.settings.rerank_latency_budget_ms = 0
+            mock_service.return_value.search = AsyncMock(return_value=ITEMS)
+            result = await theory_tools.semantic_search("認知負荷を減らす", limit=2, rerank=True)
+
+        assert mock_service.return_value.search.await_args.kwargs["limit"] == expected
+        assert result["rerank"]["applied"] is True
+        assert result["results"][0]["id"] == "clt"
@@ -0,0 +1,138 @@
+"""Unit Tests: SemanticSearchCache - セマンティック検索の結果キャッシュのユニットテスト"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tengin_mcp.application.services.semantic_search import SemanticSearchService
+from tengin_mcp.infrastructure.search_cache import SemanticSearchCache, search_scope
+
+RESULTS = [
+    {"rank": 1, "id": "clt", "similarity": 0.81},
+    {"rank": 2, "id": "wm", "similarity": 0.74},
+    {"rank": 3, "id": "mayer", "similarity": 0.7},
+]
+
+SCOPE = search_scope()
+
+
+class TestSearchScope:
+    """スコープ作成のテスト"""
+
+    def test_entity_type_order_is_ignored(self):
+        """エンティティタイプの順序・重複は区別しない"""
+        assert search_scope(["Theory", "Concept"]) == search_scope(["Concept", "Theory", "Theory"])
+        assert search_scope(["Theory"]) != search_scope()
+        assert search_scope(category="learning") != search_scope()
+
+
+class TestSemanticSearchCache:
+    """SemanticSearchCache のテスト"""
+
+    def test_exact_match_on_normalized_query(self):
+        """正規化（NFKC・空白）したクエリで完全一致"""
+        cache = SemanticSearchCache()
+        cache.put("認知負荷を減らす方法", SCOPE, [1.0, 0.0], RESULTS, limit=3)
+
+        assert cache.get(" 認知負荷を減らす方法 ", SCOPE, 3) == RESULTS
+        assert cache.get("認知負荷を減らす方法", search_scope(["Theory"]), 3) is None
+        assert cache.get_stats()["exact_hits"] == 1
+
+    def test_limit(self):
+        """少ない limit は上位を返し、多い limit は全件を取り切った場合のみ返す"""
+        cache = SemanticSearchCache()
+        cache.put("認知負荷", SCOPE, [1.0, 0.0], RESULTS, limit=3)
+        cache.put("学習意欲", SCOPE, [0.0, 1.0], RESULTS, limit=10)
+
+        assert cache.get("認知負荷", SCOPE, 2) == RESULTS[:2]
+        assert cache.get("認知負荷", SCOPE, 5) is None
+        assert cache.get("学習意欲", SCOPE, 20) == RESULTS
+
+    def test_similar_query_above_threshold(self):
+        """埋め込みのコサイン類似度が閾値以上なら再利用"""
+        cache = SemanticSearchCache(similarity_threshold=0.95)
+        cache.put("認知負荷を減らす方法", SCOPE, [1.0, 0.0], RESULTS, limit=3)
+
+        hit = cache.get_similar([0.99, 0.1], SCOPE, 3)
+        miss = cache.get_similar([0.7, 0.7], SCOPE, 3)
+
+        assert hit is not None
+        assert hit[0] == RESULTS
+        assert hit[1] > 0.99
+        assert miss is None
+        assert cache.get_similar([1.0, 0.0], search_scope(["Theory"]), 3) is None
+        stats = cache.get_stats()
+        assert (stats["similar_hits"], stats["misses"]) == (1, 2)
+
+    def test_ttl(self):
+        """有効期間を過ぎたエントリは返さない"""
+        cache = SemanticSearchCache(ttl_seconds=10)
+        with patch("tengin_mcp.infrastructure.search_cache.time.monotonic", return_value=0.0):
+            cache.put("認知負荷", SCOPE, [1.0, 0.0], RESULTS, limit=3)
+        with patch("tengin_mcp.infrastructure.search_cache.time.monotonic", return_value=11.0):
+            assert cache.get_similar([1.0, 0.0], SCOPE, 3) is None
+            assert cache.get("認知負荷", SCOPE, 3) is None
+        assert cache.get_stats()["size"] == 0
+
+    def test_lru_eviction(self):
+        """上限を超えたら最も長く使われていないエントリから削除"""
+        cache = SemanticSearchCache(max_entries=2)
+        cache.put("a", SCOPE, [1.0, 0.0], RESULTS, limit=3)
+        cache.put("b", SCOPE, [0.0, 1.0], RESULTS, limit=3)
+        cache.get("a", SCOPE, 3)
+        cache.put("c", SCOPE, [1.0, 1.0], RESULTS, limit=3)
+
+        assert cache.get("a", SCOPE, 3) is not None
+        assert cache.get("b", SCOPE, 3) is None
+
+    def test_results_are_copied(self):
+        """返した結果を変更してもキャッシュに影響しない"""
+        cache = SemanticSearchCache()
+        cache.put("認知負荷", SCOPE, [1.0, 0.0], RESULTS, limit=3)
+
+        cache.get("認知負荷", SCOPE, 3)[0]["rank"] = 99
+
+        assert cache.get("認知負荷", SCOPE, 3)[0]["rank"] == 1
+
+
+class TestSemanticSearchServiceCache:
+    """SemanticSearchService のキャッシュ利用のテスト"""
+
+    def create_service(self, embeddings):
+        """クエリごとの埋め込みを返すモック付きのサービスを作成"""
+        vector_store = MagicMock()
+        vector_store.search = AsyncMock(
+            return_value={
+                "ids": [["clt"]],
+                "distances": [[0.2]],
+                "metadatas": [[{"entity_type": "Theory", "name": "認知負荷理論"}]],
+            }
+        )
+        embedding = MagicMock()
+        embedding.embed_text = AsyncMock(side_effect=lambda query: embeddings[query])
+        graph = MagicMock()
+        graph.get_entity_summaries = AsyncMock(return_value={})
+        service = SemanticSearchService(vector_store, embedding, graph, cache=SemanticSearchCache())
+        return service, vector_store, embedding
+
+    async def test_repeated_query_skips_embedding_and_vector_search(self):
+        """同じクエリは埋め込みもベクトル検索も行わない"""
+        service, vector_store, embedding = self.create_service({"認知負荷を減らす方法": [1.0, 0.0]})
+
+        first = await service.search("認知負荷を減らす方法", limit=5)
+        second = await service.search("認知負荷を減らす方法", limit=5)
+
+        assert first == second
+        assert embedding.embed_text.await_count == 1
+        assert vector_store.search.await_count == 1
+
+    async def test_similar_query_skips_vector_search(self):
+        """埋め込みが近いクエリはベクトル検索を行わない"""
+        service, vector_store, embedding = self.create_service(
+            {"認知負荷を減らす方法": [1.0, 0.0], "認知負荷を下げる方法": [0.99, 0.05]}
+        )
+
+        first = await service.search("認知負荷を減らす方法", limit=5)
+        second = await service.search("認知負荷を下げる方法", limit=5)
+
+        assert first == second
+        assert embedding.embed_text.await_count == 2
+        assert vector_store.search.await_count == 1
@@ -0,0 +1,369 @@
+"""Unit Tests: semantic_search - セマンティック検索のユニットテスト"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from tengin_mcp.application.services.semantic_search import (
+    LanguageView,
+    SemanticSearchService,
+    build_where,
+    detect_language,
+    parse_query_results,
+    primary_entity_type,
+    reciprocal_rank_fusion,
+)
+from tengin_mcp.domain.errors import InvalidQueryError
+
+
+def create_query_results(rows):
+    """(id, distance, metadata) のリストから ChromaDB の query 結果を作成"""
+    return {
+        "ids": [[r[0] for r in rows]],
+        "distances": [[r[1] for r in rows]],
+        "metadatas": [[r[2] for r in rows]],
+        "documents": [[None for _ in rows]],
+    }
+
+
+class TestPrimaryEntityType:
+    """ラベルからのエンティティタイプ決定のテスト"""
+
+    def test_prefers_vector_entity_type(self):
+        """ベクトル対象のタイプを優先"""
+        assert primary_entity_type(["Entity", "Concept"]) == "Concept"
+
+    def test_fallback_to_first_label(self):
+        """ベクトル対象外のみなら先頭のラベル、ラベルなしなら空文字"""
+        assert primary_entity_type(["Category", "Entity"]) == "Category"
+        assert primary_entity_type([]) == ""
+
+
+class TestBuildWhere:
+    """where 条件構築のテスト"""
+
+    def test_no_filters(self):
+        """フィルタなし"""
+        assert build_where() is None
+
+    def test_single_filter(self):
+        """単一条件"""
+        assert build_where(entity_types=["Theory"]) == {"entity_type": "Theory"}
+
+    def test_combined_filters(self):
+        """複数条件は $and で結合"""
+        where = build_where(
+            entity_types=["Theory", "Concept"], category="learning", evidence_level="strong"
+        )
+
+        assert where == {
+            "$and": [
+                {"entity_type": {"$in": ["Theory", "Concept"]}},
+                {"category": "learning"},
+                {"evidence_level": "strong"},
+            ]
+        }
+
+
+class TestParseQueryResults:
+    """query 結果変換のテスト"""
+
+    def test_dedupe_by_entity_id(self):
+        """同一エンティティの複数ドキュメントは最も近いものを残す"""
+        results = create_query_results(
+            [
+                ("clt:ja", 0.2, {"entity_id": "clt", "entity_type": "Theory"}),
+                ("clt:en", 0.1, {"entity_id": "clt", "entity_type": "Theory"}),
+                ("schema", 0.3, {"entity_type": "Concept"}),
+            ]
+        )
+
+        hits = parse_query_results(results)
+
+        assert [h.entity_id for h in hits] == ["clt", "schema"]
+        assert hits[0].distance == 0.1
+        assert hits[0].similarity == pytest.approx(0.9)
+
+    def test_empty(self):
+        """結果なし"""
+        assert parse_query_results({"ids": [[]], "distances": [[]], "metadatas": [[]]}) == []
+
+
+class TestReciprocalRankFusion:
+    """Reciprocal Rank Fusion のテスト"""
+
+    def test_fuse_rankings(self):
+        """複数のランキングで上位の ID ほど高スコア"""
+        scores = reciprocal_rank_fusion([["a", "b", "c"], ["b", "a"], ["b"]], k=60)
+
+        assert list(scores) == ["b", "a", "c"]
+        assert scores["b"] == pytest.approx(1 / 62 + 1 / 61 + 1 / 61)
+        assert scores["c"] == pytest.approx(1 / 63)
+
+    def test_empty(self):
+        """ランキングなし"""
+        assert reciprocal_rank_fusion([]) == {}
+
+
+class TestSemanticSearchService:
+    """SemanticSearchService のテスト"""
+
+    async def test_search_joins_graph_summaries(self):
+        """ベクトル検索結果をグラフの要約と結合"""
+        vector_store = MagicMock()
+        vector_store.search = AsyncMock(
+            return_value=create_query_results(
+                [
+                    ("clt", 0.1, {"entity_type": "Theory", "name": "認知負荷理論"}),
+                    ("stale", 0.4, {"entity_type": "Concept", "name": "削除済み"}),
+                ]
+            )
+        )
+        embedding = MagicMock()
+        embedding.embed_text = AsyncMock(return_value=[0.1, 0.2])
+        graph = MagicMock()
+        graph.get_entity_summaries = AsyncMock(
+            return_value={
+                "clt": {
+                    "id": "clt",
+                    "name": "認知負荷理論",
+                    "name_en": "Cognitive Load Theory",
+                    "category": "learning",
+                    "evidence_level": "strong",
+                    "summary": "ワーキングメモリの制約",
+                }
+            }
+        )
+
+        service = SemanticSearchService(vector_store, embedding, graph)
+        results = await service.search("覚えることが多すぎる", limit=5, category="learning")
+
+        vector_store.search.assert_awaited_once_with(
+            query_embedding=[0.1, 0.2], n_results=5, where={"category": "learning"}
+        )
+        graph.get_entity_summaries.assert_awaited_once_with(
+            {"Theory": ["clt"], "Concept": ["stale"]}
+        )
+        assert [r["id"] for r in results] == ["clt", "stale"]
+        assert results[0]["rank"] == 1
+        assert results[0]["name_en"] == "Cognitive Load Theory"
+        assert results[0]["in_graph"] is True
+        assert results[1]["name"] == "削除済み"
+        assert results[1]["in_graph"] is False
+
+    async def test_search_many_batches_calls(self):
+        """埋め込み・ベクトル検索・要約取得をそれぞれ1回で実行し、RRF で統合"""
+        vector_store = MagicMock()
+        vector_store.search_many = AsyncMock(
+            return_value={
+                "ids": [["clt", "schema"], ["schema", "zpd"]],
+                "distances": [[0.1, 0.3], [0.2, 0.4]],
+                "metadatas": [
+                    [{"entity_type": "Theory"}, {"entity_type": "Concept"}],
+                    [{"entity_type": "Concept"}, {"entity_type": "Theory"}],
+                ],
+            }
+        )
+        embedding = MagicMock()
+        embedding.embed_texts = AsyncMock(return_value=[[0.1], [0.2]])
+        graph = MagicMock()
+        graph.get_entity_summaries = AsyncMock(return_value={})
+
+        service = SemanticSearchService(vector_store, embedding, graph)
+        response = await service.search_many(["覚えられない", "記憶の負荷"], limit=2, fuse=True)
+
+        embedding.embed_texts.assert_awaited_once_with(["覚えられない", "記憶の負荷"])
+        vector_store.search_many.assert_awaited_once_with(
+            query_embeddings=[[0.1], [0.2]], n_results=2, where=None
+        )
+        graph.get_entity_summaries.assert_awaited_once_with(
+            {"Theory": ["clt", "zpd"], "Concept": ["schema"]}
+        )
+        assert [q["query"] for q in response["queries"]] == ["覚えられない", "記憶の負荷"]
+        assert [r["id"] for r in response["queries"][1]["results"]] == ["schema", "zpd"]
+        fused = response["fused"]
+        assert [r["id"] for r in fused] == ["schema", "clt"]
+        assert fused[0]["matched_queries"] == 2
+        assert fused[0]["similarity"] == pytest.approx(0.8)
+
+    async def test_search_many_without_fuse(self):
+        """fuse=False の場合は統合結果を返さない"""
+        vector_store = MagicMock()
+        vector_store.search_many = AsyncMock(
+            return_value={"ids": [[]], "distances": [[]], "metadatas": [[]]}
+        )
+        embedding = MagicMock()
+        embedding.embed_texts = AsyncMock(return_value=[[0.1]])
+        graph = MagicMock()
+        graph.get_entity_summaries = AsyncMock(return_value={})
+
+        service = SemanticSearchService(vector_store, embedding, graph)
+        response = await service.search_many(["学習意欲"])
+
+        assert response == {"queries": [{"query": "学習意欲", "results": []}], "fused": None}
+
+    async def test_english_query_fuses_english_view(self):
+        """英語のクエリは英語ビューも並列に検索して RRF で統合"""
+        vector_store = MagicMock()
+        vector_store.search = AsyncMock(
+            return_value=create_query_results(
+                [
+                    ("clt", 0.3, {"entity_id": "clt", "entity_type": "Theory"}),
+                    ("schema", 0.4, {"entity_id": "schema", "entity_type": "Concept"}),
+                ]
+            )
+        )
+        embedding = MagicMock()
+        embedding.embed_text = AsyncMock(return_value=[0.1])
+        english_store = MagicMock()
+        english_store.search = AsyncMock(
+            return_value=create_query_results(
+                [
+                    ("zpd#en", 0.1, {"entity_id": "zpd", "entity_type": "Theory"}),
+                    ("clt#en", 0.2, {"entity_id": "clt", "entity_type": "Theory"}),
+                ]
+            )
+        )
+        english_embedding = MagicMock()
+        english_embedding.embed_text = AsyncMock(return_value=[0.9])
+        graph = MagicMock()
+        graph.get_entity_summaries = AsyncMock(return_value={})
+
+        service = SemanticSearchService(
+            vector_store, embedding, graph, english=LanguageView(english_store, english_embedding)
+        )
+        results = await service.search("cognitive load", limit=3)
+        await service.search("認知負荷", limit=3)
+
+        english_store.search.assert_awaited_once_with(
+            query_embedding=[0.9], n_results=3, where=None
+        )
+        assert [r["id"] for r in results] == ["clt", "zpd", "schema"]
+        assert results[0]["similarity"] == pytest.approx(0.8)
+
+    async def test_shared_english_view_fills_limit(self):
+        """英語ビューを同じストアに格納する場合は多めに取得し、重複を除いても limit 件を返す"""
+        vector_store = MagicMock()
+        vector_store.search = AsyncMock(
+            return_value=create_query_results(
+                [
+                    ("clt", 0.1, {"entity_id": "clt", "entity_type": "Theory"}),
+                    ("clt#en", 0.15, {"entity_id": "clt", "entity_type": "Theory"}),
+                    ("zpd#en", 0.2, {"entity_id": "zpd", "entity_type": "Theory"}),
+                    ("zpd", 0.25, {"entity_id": "zpd", "entity_type": "Theory"}),
+                    ("schema", 0.3, {"entity_id": "schema", "entity_type": "Concept"}),
+                    ("flow", 0.4, {"entity_id": "flow", "entity_type": "Theory"}),
+                ]
+            )
+        )
+        embedding = MagicMock()
+        embedding.embed_text = AsyncMock(return_value=[0.1])
+        graph = MagicMock()
+        graph.get_entity_summaries = AsyncMock(return_value={})
+
+        service = SemanticSearchService(vector_store, embedding, graph, documents_per_entity=2)
+        results = await service.search("cognitive load", limit=3)
+
+        vector_store.search.assert_awaited_once_with(query_embedding=[0.1], n_results=6, where=None)
+        assert len(results) == 3
+        assert [r["id"] for r in results] == ["clt", "zpd", "schema"]
+
+    def test_detect_language(self):
+        """日本語の文字を含むクエリは ja"""
+        assert detect_language("認知負荷 cognitive load") == "ja"
+        assert detect_language("scaffolding in ZPD") == "en"
+
+
+class TestSemanticSearchTool:
+    """semantic_search ツールのテスト"""
+
+    async def test_invalid_entity_type(self):
+        """無効なエンティティタイプ"""
+        from tengin_mcp.tools.theory_tools import semantic_search
+
+        with pytest.raises(InvalidQueryError):
+            await semantic_search("学習意欲", entity_types=["Person"])
+
+    async def test_invalid_evidence_level(self):
+        """無効なエビデンスレベル"""
+        from tengin_mcp.tools.theory_tools import semantic_search
+
+        with pytest.raises(InvalidQueryError):
+            await semantic_search("学習意欲", evidence_level="very_strong")
+
+    async def test_not_initialized(self):
+        """未初期化時はエラーを返す"""
+        from tengin_mcp.tools.theory_tools import semantic_search
+
+        with patch("tengin_mcp.tools.theory_tools.app_state") as mock_state:
+            mock_state.chromadb_adapter = None
+            result = await semantic_search("学習意欲")
+
+        assert result["results"] == []
+        assert "error" in result
+
+
+class TestBatchSemanticSearchTool:
+    """batch_semantic_search ツールのテスト"""
+
+    async def test_invalid_queries(self):
+        """クエリ数・文字数の検証"""
+        from tengin_mcp.tools.theory_tools import MAX_BATCH_QUERIES, batch_semantic_search
+
+        with pytest.raises(InvalidQueryError):
+            await batch_semantic_search([])
+        with pytest.raises(InvalidQueryError):
+            await batch_semantic_search(["学習意欲"] * (MAX_BATCH_QUERIES + 1))
+        with pytest.raises(InvalidQueryError):
+            await batch_semantic_search(["学習意欲", " a "])
+
+    async def test_invalid_filters(self):
+        """フィルタは semantic_search と同じ検証"""
+        from tengin_mcp.tools.theory_tools import batch_semantic_search
+
+        with pytest.raises(InvalidQueryError):
+            await batch_semantic_search(["学習意欲"], entity_types=["Person"])
+
+    async def test_not_initialized(self):
+        """未初期化時はエラーを返す"""
+        from tengin_mcp.tools.theory_tools import batch_semantic_search
+
+        with patch("tengin_mcp.tools.theory_tools.app_state") as mock_state:
+            mock_state.chromadb_adapter = None
+            result = await batch_semantic_search(["学習意欲", "動機づけ"])
+
+        assert result["queries"] == []
+        assert "error" in result
+
+
+class TestCompareTheoriesRelated:
+    """compare_theories の related_limit のテスト"""
+
+    async def test_invalid_related_limit(self):
+        """範囲外の related_limit"""
+        from tengin_mcp.tools.citation_tools import compare_theories
+
+        with pytest.raises(InvalidQueryError):
+            await compare_theories(["clt", "zpd"], related_limit=21)
+
+    async def test_related_without_vector_search(self):
+        """ベクトル検索が未初期化なら related を付与しない"""
+        from tengin_mcp.tools.citation_tools import compare_theories
+
+        def create_theory(tid):
+            theory = MagicMock(id=tid, name_en=None, description="", year=None, keywords=[])
+            theory.name = tid
+            theory.category.value = "learning"
+            theory.evidence_level.value = "strong"
+            return theory
+
+        theory_repository = MagicMock()
+        theory_repository.get_theory_by_id = AsyncMock(side_effect=create_theory)
+        with patch("tengin_mcp.tools.citation_tools.app_state") as mock_state:
+            mock_state.theory_repository = theory_repository
+            mock_state.chromadb_adapter = None
+            result = await compare_theories(["clt", "zpd"], related_limit=3)
+
+        assert result["theory_count"] == 2
+        assert all("related" not in t for t in result["theories"])
+        assert result["analysis"]["shared_related"] == []
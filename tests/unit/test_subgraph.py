@@ -0,0 +1,56 @@
+"""Unit Tests: subgraph - サブグラフの列指向エンコードのユニットテスト"""
+
+from tengin_mcp.application.services.subgraph import to_columnar
+
+
+class TestToColumnar:
+    """列指向エンコードのテスト"""
+
+    def test_interned_tables_and_indices(self):
+        """ラベル・タイプをインターンし、エッジはノード番号で参照"""
+        nodes = [
+            ["t1", ["Theory"], ["Theory 1"]],
+            ["c1", ["Concept"], ["Concept 1"]],
+            ["t2", ["Theory"], ["Theory 2"]],
+        ]
+        edges = [
+            ["t1", "c1", "INCLUDES_CONCEPT"],
+            ["t2", "c1", "INCLUDES_CONCEPT"],
+            ["t1", "t2", "INFLUENCED"],
+        ]
+
+        result = to_columnar(nodes, edges, ["name"])
+
+        assert result["labels"] == ["Theory", "Concept"]
+        assert result["types"] == ["INCLUDES_CONCEPT", "INFLUENCED"]
+        assert result["nodes"] == {
+            "id": ["t1", "c1", "t2"],
+            "label": [0, 1, 0],
+            "properties": {"name": ["Theory 1", "Concept 1", "Theory 2"]},
+        }
+        assert result["edges"] == {
+            "source": [0, 2, 0],
+            "target": [1, 1, 2],
+            "type": [0, 0, 1],
+        }
+
+    def test_multiple_labels_share_entry(self):
+        """ラベルの組み合わせは順序に関係なく同じエントリ"""
+        nodes = [["a", ["Person", "Theorist"], []], ["b", ["Theorist", "Person"], []]]
+
+        result = to_columnar(nodes, [], [])
+
+        assert result["labels"] == ["Person:Theorist"]
+        assert result["nodes"]["label"] == [0, 0]
+        assert result["nodes"]["properties"] == {}
+
+    def test_skips_duplicates_and_dangling_edges(self):
+        """重複ノードと端点が含まれないエッジを除外"""
+        nodes = [["a", ["Theory"], ["A"]], ["a", ["Theory"], ["A"]], [None, ["Theory"], [None]]]
+        edges = [["a", "missing", "RELATED_TO"]]
+
+        result = to_columnar(nodes, edges, ["name"])
+
+        assert result["nodes"]["id"] == ["a"]
+        assert result["edges"] == {"source": [], "target": [], "type": []}
+        assert result["types"] == []
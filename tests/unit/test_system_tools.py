@@ -54,36 +54,70 @@ class TestClearCache:
 class TestHealthCheck:
     """health_check のテスト。"""
 
+    @pytest.mark.asyncio
+    async def test_health_check_liveness(self) -> None:
+        """liveness はコンポーネントに触れない。"""
+        from tengin_mcp.tools.system_tools import health_check
+
+        with patch("tengin_mcp.tools.system_tools.app_state") as mock_state:
+            result = await health_check("liveness")
+
+            assert result["status"] == "healthy"
+            assert result["mode"] == "liveness"
+            assert "components" not in result
+            assert not mock_state.method_calls
+
     @pytest.mark.asyncio
     async def test_health_check_not_initialized(self) -> None:
-        """初期化前のヘルスチェック。"""
+        """未初期化のコンポーネント。"""
         from tengin_mcp.tools.system_tools import health_check
 
         with patch("tengin_mcp.tools.system_tools.app_state") as mock_state:
-            mock_state.theory_repository = None
-            mock_state.graph_repository = None
-            mock_state.vector_repository = None
+            mock_state.neo4j_adapter = None
+            mock_state.chromadb_adapter = None
 
             result = await health_check()
 
+            assert result["status"] == "not_ready"
+            assert result["mode"] == "readiness"
+            assert result["components"]["neo4j"]["status"] == "not_initialized"
+            assert result["components"]["chromadb"]["status"] == "not_initialized"
+
+    @pytest.mark.asyncio
+    async def test_health_check_readiness(self) -> None:
+        """readiness は疎通確認のみでデータを読まない。"""
+        from tengin_mcp.tools.system_tools import health_check
+
+        with patch("tengin_mcp.tools.system_tools.app_state") as mock_state:
+            mock_state.neo4j_adapter = AsyncMock()
+            mock_state.chromadb_adapter = AsyncMock()
+            mock_state.theory_repository = AsyncMock()
+            mock_state.graph_repository = AsyncMock()
+
+            result = await health_check("readiness")
+
             assert result["status"] == "healthy"
-            assert "components" in result
-            assert result["components"]["theory_repository"]["status"] == "not_initialized"
-            assert result["components"]["graph_repository"]["status"] == "not_initialized"
-            assert result["components"]["vector_repository"]["status"] == "not_initialized"
+            assert set(result["components"]) == {"neo4j", "chromadb"}
+            assert "latency_ms" not in result["components"]["neo4j"]
+            mock_state.neo4j_adapter.ping.assert_awaited_once()
+            mock_state.chromadb_adapter.heartbeat.assert_awaited_once()
+            mock_state.theory_repository.count_theories.assert_not_awaited()
+            mock_state.graph_repository.get_statistics.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_health_check_healthy(self) -> None:
-        """正常なヘルスチェック。"""
+    async def test_health_check_deep(self) -> None:
+        """deep はコンポーネントごとのレイテンシと件数を返す。"""
         from tengin_mcp.tools.system_tools import health_check
 
         with patch("tengin_mcp.tools.system_tools.app_state") as mock_state:
-            # Theory Repository
+            mock_state.neo4j_adapter = AsyncMock()
+            mock_state.chromadb_adapter = AsyncMock()
+            mock_state.chromadb_adapter.get_count.return_value = 38
+
             mock_theory_repo = AsyncMock()
-            mock_theory_repo.get_all.return_value = [MagicMock(), MagicMock()]
+            mock_theory_repo.count_theories.return_value = 2
             mock_state.theory_repository = mock_theory_repo
 
-            # Graph Repository
             mock_graph_repo = AsyncMock()
             mock_graph_repo.get_statistics.return_value = {
                 "total_nodes": 100,
@@ -91,17 +125,19 @@ class TestHealthCheck:
             }
             mock_state.graph_repository = mock_graph_repo
 
-            # Vector Repository
-            mock_state.vector_repository = MagicMock()
+            mock_state.embedding_adapter = MagicMock(provider="ollama", model="nomic-embed-text")
 
-            result = await health_check()
+            result = await health_check("deep")
+            components = result["components"]
 
             assert result["status"] == "healthy"
-            assert result["components"]["theory_repository"]["status"] == "healthy"
-            assert result["components"]["theory_repository"]["theory_count"] == 2
-            assert result["components"]["graph_repository"]["status"] == "healthy"
-            assert result["components"]["graph_repository"]["node_count"] == 100
-            assert result["components"]["vector_repository"]["status"] == "healthy"
+            assert components["theory_repository"]["theory_count"] == 2
+            assert components["graph_repository"]["node_count"] == 100
+            assert components["graph_repository"]["relationship_count"] == 200
+            assert components["vector_store"]["document_count"] == 38
+            assert components["embedding"]["provider"] == "ollama"
+            for name in ("neo4j", "chromadb", "theory_repository", "graph_repository"):
+                assert components[name]["latency_ms"] >= 0
 
     @pytest.mark.asyncio
     async def test_health_check_degraded(self) -> None:
@@ -109,19 +145,26 @@ class TestHealthCheck:
         from tengin_mcp.tools.system_tools import health_check
 
         with patch("tengin_mcp.tools.system_tools.app_state") as mock_state:
-            # Theory Repository が例外を投げる
-            mock_theory_repo = AsyncMock()
-            mock_theory_repo.get_all.side_effect = Exception("Connection failed")
-            mock_state.theory_repository = mock_theory_repo
-
-            mock_state.graph_repository = None
-            mock_state.vector_repository = None
+            # Neo4j が例外を投げる
+            mock_state.neo4j_adapter = AsyncMock()
+            mock_state.neo4j_adapter.ping.side_effect = Exception("Connection failed")
+            mock_state.chromadb_adapter = AsyncMock()
 
             result = await health_check()
 
             assert result["status"] == "degraded"
-            assert result["components"]["theory_repository"]["status"] == "unhealthy"
-            assert "Connection failed" in result["components"]["theory_repository"]["error"]
+            assert result["components"]["neo4j"]["status"] == "unhealthy"
+            assert "Connection failed" in result["components"]["neo4j"]["error"]
+            assert result["components"]["chromadb"]["status"] == "healthy"
+
+    @pytest.mark.asyncio
+    async def test_health_check_invalid_mode(self) -> None:
+        """不正なモード。"""
+        from tengin_mcp.domain.errors import InvalidQueryError
+        from tengin_mcp.tools.system_tools import health_check
+
+        with pytest.raises(InvalidQueryError):
+            await health_check("full")
 
 
 class TestGetSystemInfo:
@@ -149,6 +192,6 @@ class TestGetSystemInfo:
 
         result = await get_system_info()
 
-        assert result["features"]["tools"] == 23
-        assert result["features"]["resources"] == 5
+        assert result["features"]["tools"] == 30
+        assert result["features"]["resources"] == 6
         assert result["features"]["prompts"] == 3
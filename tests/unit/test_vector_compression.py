@@ -0,0 +1,226 @@
+"""Unit Tests: vector_compression - 埋め込みの次元削減・量子化のユニットテスト"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from tengin_mcp.application.services.vector_indexer import EntityDocument, VectorIndexer
+from tengin_mcp.infrastructure.adapters.local_vector_adapter import LocalVectorAdapter
+from tengin_mcp.infrastructure.vector_compression import (
+    REDUCTION_FILE,
+    VectorReducer,
+    binary_scores,
+    int8_scores,
+    normalize_rows,
+    quantize_binary,
+    quantize_int8,
+    supports_matryoshka,
+)
+
+
+def create_mock_settings(path=None, **kwargs):
+    """テスト用のモックSettings作成"""
+    settings = MagicMock()
+    settings.local_vector_path = str(path)
+    settings.local_vector_hnsw_threshold = 20000
+    settings.vector_reduction = kwargs.get("vector_reduction", "none")
+    settings.vector_dimensions = kwargs.get("vector_dimensions", 0)
+    settings.vector_quantization = kwargs.get("vector_quantization", "none")
+    settings.vector_rescore_factor = kwargs.get("vector_rescore_factor", 4)
+    settings.embedding_model = kwargs.get("embedding_model", "text-embedding-3-small")
+    return settings
+
+
+def random_vectors(n: int, dim: int, seed: int = 0) -> np.ndarray:
+    """再現可能なランダムベクトル"""
+    return np.random.default_rng(seed).normal(size=(n, dim)).astype(np.float32)
+
+
+class TestVectorReducer:
+    """VectorReducer のテスト"""
+
+    def test_from_settings(self):
+        """Matryoshka は対応モデルのみ、次元削減には次元数が必要"""
+        reducer = VectorReducer.from_settings(
+            create_mock_settings(vector_reduction="matryoshka", vector_dimensions=256)
+        )
+
+        assert reducer.id == "matryoshka-256"
+        assert VectorReducer.from_settings(create_mock_settings()).id == "none"
+        assert supports_matryoshka("openai/text-embedding-3-large")
+        assert not supports_matryoshka("voyage-3")
+        with pytest.raises(ValueError, match="pca"):
+            VectorReducer.from_settings(
+                create_mock_settings(
+                    vector_reduction="matryoshka", vector_dimensions=256, embedding_model="voyage-3"
+                )
+            )
+        with pytest.raises(ValueError, match="VECTOR_DIMENSIONS"):
+            VectorReducer.from_settings(create_mock_settings(vector_reduction="pca"))
+
+    def test_matryoshka_truncates_and_normalizes(self):
+        """先頭の次元に切り詰めて再正規化"""
+        reducer = VectorReducer("matryoshka", 2)
+
+        assert reducer.transform([[3.0, 4.0, 12.0]]).tolist() == [pytest.approx([0.6, 0.8])]
+        with pytest.raises(ValueError):
+            reducer.transform([[1.0]])
+
+    def test_pca_preserves_neighbors(self, tmp_path):
+        """低ランクのコーパスでは PCA 後も近傍が変わらず、保存・読み込みできる"""
+        basis = random_vectors(4, 64, seed=1)
+        corpus = random_vectors(50, 4, seed=2) @ basis
+        queries = random_vectors(5, 4, seed=3) @ basis
+
+        reducer = VectorReducer.fit_pca(corpus, 8)
+        exact = normalize_rows(queries) @ normalize_rows(corpus).T
+        reduced = reducer.transform(queries) @ reducer.transform(corpus).T
+
+        assert reducer.transform(corpus).shape == (50, 8)
+        assert (exact.argmax(axis=1) == reduced.argmax(axis=1)).all()
+
+        reducer.save(tmp_path / REDUCTION_FILE)
+        loaded = VectorReducer("pca", 8).load(tmp_path / REDUCTION_FILE)
+        assert loaded.fitted
+        assert np.allclose(loaded.transform(queries), reducer.transform(queries))
+        assert not VectorReducer("pca", 16).load(tmp_path / REDUCTION_FILE).fitted
+
+    def test_pca_requires_fit(self):
+        """未学習の PCA は変換できず、次元数はランクを超えられない"""
+        with pytest.raises(RuntimeError):
+            VectorReducer("pca", 8).transform([[1.0, 0.0]])
+        with pytest.raises(ValueError, match="rank"):
+            VectorReducer.fit_pca(random_vectors(5, 16), 8)
+
+
+class TestQuantization:
+    """量子化のテスト"""
+
+    def test_int8_approximates_inner_product(self):
+        """int8 の近似内積は float の内積に近い"""
+        matrix = normalize_rows(random_vectors(100, 32))
+        queries = normalize_rows(random_vectors(3, 32, seed=1))
+
+        codes, scales = quantize_int8(matrix)
+
+        assert codes.dtype == np.int8
+        assert (
+            np.abs(int8_scores(codes, scales, queries, chunk_size=7) - matrix @ queries.T).max()
+            < 0.02
+        )
+
+    def test_binary_is_sign_inner_product(self):
+        """バイナリのスコアは符号ベクトルの内積"""
+        matrix = random_vectors(20, 12)
+        queries = random_vectors(2, 12, seed=1)
+
+        codes = quantize_binary(matrix)
+
+        assert codes.shape == (20, 2)
+        expected = np.sign(matrix) @ np.sign(queries).T
+        assert np.array_equal(binary_scores(codes, queries, 12), expected)
+
+
+class TestQuantizedLocalStore:
+    """量子化した LocalVectorAdapter のテスト"""
+
+    @pytest.mark.parametrize("quantization", ["int8", "binary"])
+    async def test_rescored_results_match_exact_search(self, tmp_path, quantization):
+        """再スコアリング後の結果・距離は float の全件比較と一致"""
+        corpus = random_vectors(200, 32)
+        queries = (corpus[:5] + 0.1 * random_vectors(5, 32, seed=1)).tolist()
+        ids = [f"d{i}" for i in range(200)]
+
+        exact = LocalVectorAdapter(create_mock_settings(tmp_path / "exact"))
+        quantized = LocalVectorAdapter(
+            create_mock_settings(tmp_path / "quantized", vector_quantization=quantization)
+        )
+        for store in (exact, quantized):
+            await store.connect()
+            await store.upsert_documents(ids, ids, corpus.tolist())
+            await store.flush()
+
+        expected = await exact.search_many(queries, n_results=3)
+        actual = await quantized.search_many(queries, n_results=3)
+
+        assert [row[0] for row in actual["ids"]] == [f"d{i}" for i in range(5)]
+        assert np.allclose(actual["distances"][0][0], expected["distances"][0][0], atol=1e-6)
+        assert quantized._codes is not None
+        assert isinstance(quantized._matrix, np.memmap)
+
+    async def test_quantized_store_reloads(self, tmp_path):
+        """再接続時にコードを作り直し、設定を index.json に記録"""
+        settings = create_mock_settings(tmp_path, vector_quantization="int8")
+        store = LocalVectorAdapter(settings)
+        await store.connect()
+        await store.upsert_documents(["a", "b"], ["a", "b"], [[1.0, 0.0], [0.0, 1.0]])
+        await store.close()
+
+        reloaded = LocalVectorAdapter(settings)
+        await reloaded.connect()
+        results = await reloaded.search([0.1, 1.0], n_results=1, where={"missing": {"$ne": 1}})
+
+        assert results["ids"] == [["b"]]
+        index = json.loads((tmp_path / LocalVectorAdapter.INDEX_FILE).read_text())
+        assert index["compression"]["vector_quantization"] == "int8"
+
+
+class TestIndexerReduction:
+    """VectorIndexer と次元削減のテスト"""
+
+    def create_indexer(self, store: LocalVectorAdapter) -> tuple[VectorIndexer, MagicMock]:
+        """テキストごとに決まった埋め込みを返すインデクサー"""
+        basis = random_vectors(4, 16, seed=1)
+
+        def embed(texts):
+            return [
+                (random_vectors(1, 4, seed=sum(map(ord, t))) @ basis)[0].tolist() for t in texts
+            ]
+
+        embedding = MagicMock(max_batch_size=100, provider="openai", model="m1")
+        embedding.embed_texts = AsyncMock(side_effect=embed)
+        return VectorIndexer(store, embedding, batch_size=4), embedding
+
+    async def test_pca_fitted_at_index_time(self, tmp_path):
+        """PCA はインデックス構築時に学習し、次回の同期では再利用"""
+        settings = create_mock_settings(tmp_path, vector_reduction="pca", vector_dimensions=3)
+        store = LocalVectorAdapter(settings)
+        await store.connect()
+        indexer, embedding = self.create_indexer(store)
+        documents = [
+            EntityDocument(id=f"d{i}", entity_type="Concept", text=f"text {i}", metadata={})
+            for i in range(10)
+        ]
+
+        first = await indexer.sync(documents)
+        second = await indexer.sync(documents)
+
+        assert first.rebuilt and first.indexed == 10
+        assert not second.rebuilt and second.unchanged == 10
+        assert (tmp_path / REDUCTION_FILE).exists()
+        metadatas = await store.get_metadatas()
+        assert metadatas["d0"]["vector_compression"] == "pca-3"
+        query = await embedding.embed_texts(["text 4"])
+        assert (await store.search(query[0], n_results=1))["ids"] == [["d4"]]
+
+    async def test_reduction_change_rebuilds(self, tmp_path):
+        """次元削減の設定が変わるとストアを作り直して全件を埋め込む"""
+        documents = [
+            EntityDocument(id=f"d{i}", entity_type="Concept", text=f"text {i}", metadata={})
+            for i in range(6)
+        ]
+        store = LocalVectorAdapter(create_mock_settings(tmp_path))
+        await store.connect()
+        await self.create_indexer(store)[0].sync(documents)
+
+        reduced = LocalVectorAdapter(
+            create_mock_settings(tmp_path, vector_reduction="matryoshka", vector_dimensions=8)
+        )
+        await reduced.connect()
+        report = await self.create_indexer(reduced)[0].sync(documents)
+
+        assert report.rebuilt
+        assert (report.added, report.unchanged) == (6, 0)
+        assert reduced._matrix.shape == (6, 8)
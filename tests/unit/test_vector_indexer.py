@@ -0,0 +1,304 @@
+"""Unit Tests: vector_indexer - ベクトルインデックス構築のユニットテスト"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from tengin_mcp.application.services.vector_indexer import (
+    EntityDocument,
+    VectorIndexer,
+    build_document,
+    build_documents,
+    build_english_document,
+    content_hash,
+    latin_phrases,
+    plan_sync,
+)
+from tengin_mcp.infrastructure.vector_compression import VectorReducer
+from tengin_mcp.scripts.build_vector_index import DEFAULT_DATA_DIR, load_entities_from_json
+
+
+def create_documents(n: int) -> list[EntityDocument]:
+    """テスト用ドキュメントを作成"""
+    return [
+        EntityDocument(id=f"d{i}", entity_type="Concept", text=f"text {i}", metadata={})
+        for i in range(n)
+    ]
+
+
+class TestBuildDocument:
+    """ドキュメント作成のテスト"""
+
+    def test_theory_document(self):
+        """理論のテキストとメタデータ"""
+        document = build_document(
+            "Theory",
+            {
+                "id": "cognitive-load-theory",
+                "name": "認知負荷理論",
+                "name_en": "Cognitive Load Theory",
+                "description": "ワーキングメモリの制約に基づく理論",
+                "keywords": ["認知負荷", "ワーキングメモリ"],
+                "category": "learning",
+                "evidence_level": "strong",
+                "pagerank": 0.12,
+            },
+        )
+
+        assert document is not None
+        assert document.id == "cognitive-load-theory"
+        assert document.text.splitlines() == [
+            "[Theory] 認知負荷理論 (Cognitive Load Theory)",
+            "ワーキングメモリの制約に基づく理論",
+            "認知負荷、ワーキングメモリ",
+        ]
+        assert document.metadata == {
+            "entity_id": "cognitive-load-theory",
+            "entity_type": "Theory",
+            "name": "認知負荷理論",
+            "category": "learning",
+            "evidence_level": "strong",
+        }
+
+    def test_evidence_uses_title(self):
+        """名前のないエビデンスはタイトルを使用"""
+        document = build_document(
+            "Evidence",
+            {"id": "ev-1", "title": "Meta-analysis", "findings": "d=0.5"},
+        )
+
+        assert document is not None
+        assert document.metadata["name"] == "Meta-analysis"
+        assert "d=0.5" in document.text
+
+    def test_missing_id(self):
+        """IDがないエンティティは対象外"""
+        assert build_document("Concept", {"name": "名前のみ"}) is None
+
+    def test_json_source_covers_all_types(self):
+        """data/theories の全エンティティタイプを読み込む"""
+        documents = build_documents(load_entities_from_json(DEFAULT_DATA_DIR))
+
+        assert {d.entity_type for d in documents} == {
+            "Theory",
+            "Concept",
+            "Principle",
+            "Methodology",
+            "Evidence",
+            "Context",
+            "Theorist",
+        }
+        assert len({d.id for d in documents}) == len(documents)
+
+    def test_latin_phrases(self):
+        """ラテン文字の語句を4文字以上で抽出"""
+        assert latin_phrases("ワーキングメモリ（Working Memory）の制約、Sweller (1988) による") == [
+            "Working Memory",
+            "Sweller",
+        ]
+        assert latin_phrases("ZPD と日本語") == []
+
+    def test_english_document(self):
+        """英語ビューは英語名と本文中の英語の語句から作成"""
+        document = build_english_document(
+            "Theory",
+            {
+                "id": "cognitive-load-theory",
+                "name": "認知負荷理論",
+                "name_en": "Cognitive Load Theory",
+                "description": "Sweller が提唱したワーキングメモリ（working memory）の理論",
+                "keywords": ["認知負荷", "intrinsic load"],
+            },
+        )
+
+        assert document is not None
+        assert document.id == "cognitive-load-theory#en"
+        assert document.text.splitlines() == [
+            "[Theory] Cognitive Load Theory",
+            "Sweller",
+            "working memory",
+            "intrinsic load",
+        ]
+        assert document.metadata["entity_id"] == "cognitive-load-theory"
+        assert document.metadata["language"] == "en"
+        assert build_english_document("Concept", {"id": "c", "name": "内的負荷"}) is None
+
+    def test_build_documents_with_english_views(self):
+        """languages に en を指定すると英語ビューを追加"""
+        entities = load_entities_from_json(DEFAULT_DATA_DIR)
+        japanese = build_documents(entities)
+        english = build_documents(entities, ("en",))
+        both = build_documents(entities, ("ja", "en"))
+
+        assert english
+        assert all(d.id.endswith("#en") for d in english)
+        assert len(both) == len(japanese) + len(english)
+
+
+class TestVectorIndexer:
+    """VectorIndexer のテスト"""
+
+    async def test_batches_and_upserts(self):
+        """バッチごとに埋め込んで upsert"""
+        vector_store = MagicMock()
+        vector_store.upsert_documents = AsyncMock()
+        embedding = MagicMock(max_batch_size=100)
+        embedding.embed_texts = AsyncMock(side_effect=lambda texts: [[0.1] for _ in texts])
+
+        indexer = VectorIndexer(vector_store, embedding, batch_size=2, concurrency=2)
+        report = await indexer.index(create_documents(5))
+
+        assert report.indexed == 5
+        assert report.batches == 3
+        assert embedding.embed_texts.await_count == 3
+        upserted = [
+            i for call in vector_store.upsert_documents.await_args_list for i in call.kwargs["ids"]
+        ]
+        assert sorted(upserted) == ["d0", "d1", "d2", "d3", "d4"]
+
+    async def test_batch_size_capped_by_provider(self):
+        """バッチサイズはプロバイダー上限で制限"""
+        indexer = VectorIndexer(MagicMock(), MagicMock(max_batch_size=16), batch_size=64)
+        assert indexer.batch_size == 16
+
+    async def test_concurrency_window(self):
+        """同時実行バッチ数は concurrency 以下"""
+        in_flight = 0
+        peak = 0
+
+        async def embed_texts(texts):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [[0.0] for _ in texts]
+
+        vector_store = MagicMock()
+        vector_store.upsert_documents = AsyncMock()
+        embedding = MagicMock(max_batch_size=100)
+        embedding.embed_texts = embed_texts
+
+        indexer = VectorIndexer(vector_store, embedding, batch_size=1, concurrency=3)
+        await indexer.index(create_documents(10))
+
+        assert peak == 3
+
+
+class TestIncrementalSync:
+    """差分同期のテスト"""
+
+    def stored(self, document: EntityDocument, model_id: str = "openai/m1") -> dict:
+        """ベクトルストアに格納済みのメタデータ"""
+        return {
+            **document.metadata,
+            "content_hash": content_hash(document),
+            "embedding_model": model_id,
+        }
+
+    def test_content_hash_changes_with_text(self):
+        """本文が変わるとハッシュが変わる"""
+        a, b = create_documents(2)
+        assert content_hash(a) == content_hash(create_documents(1)[0])
+        assert content_hash(a) != content_hash(b)
+
+    def test_plan_sync(self):
+        """新規・変更・変更なし・削除を分類"""
+        d0, d1, d2 = create_documents(3)
+        existing = {
+            "d0": self.stored(d0),
+            "d1": {**self.stored(d1), "content_hash": "stale"},
+            "gone": {"entity_id": "gone"},
+        }
+
+        plan = plan_sync([d0, d1, d2], existing, "openai/m1")
+
+        assert [d.id for d in plan.added] == ["d2"]
+        assert [d.id for d in plan.updated] == ["d1"]
+        assert plan.unchanged == ["d0"]
+        assert plan.removed == ["gone"]
+
+    def test_plan_sync_model_change(self):
+        """埋め込みモデルが変わると全件を再埋め込み"""
+        documents = create_documents(2)
+        existing = {d.id: self.stored(d, "openai/m1") for d in documents}
+
+        plan = plan_sync(documents, existing, "openai/m2")
+
+        assert [d.id for d in plan.updated] == ["d0", "d1"]
+        assert plan.unchanged == []
+
+    async def test_sync_embeds_only_changes(self):
+        """変更分のみ埋め込み、削除分を削除"""
+        d0, d1, d2 = create_documents(3)
+        vector_store = MagicMock()
+        vector_store.get_metadatas = AsyncMock(
+            return_value={"d0": self.stored(d0), "d1": self.stored(d1), "gone": {}}
+        )
+        vector_store.reducer = VectorReducer()
+        vector_store.upsert_documents = AsyncMock()
+        vector_store.delete_documents = AsyncMock()
+        vector_store.flush = AsyncMock()
+        vector_store.requires_rebuild = False
+        embedding = MagicMock(max_batch_size=100, provider="openai", model="m1")
+        embedding.embed_texts = AsyncMock(side_effect=lambda texts: [[0.1] for _ in texts])
+        changed = EntityDocument(id="d1", entity_type="Concept", text="edited", metadata={})
+
+        indexer = VectorIndexer(vector_store, embedding)
+        report = await indexer.sync([d0, changed, d2])
+
+        embedding.embed_texts.assert_awaited_once_with(["text 2", "edited"])
+        metadatas = vector_store.upsert_documents.await_args.kwargs["metadatas"]
+        assert metadatas[1]["content_hash"] == content_hash(changed)
+        assert metadatas[0]["embedding_model"] == "openai/m1"
+        vector_store.delete_documents.assert_awaited_once_with(["gone"])
+        vector_store.flush.assert_awaited_once()
+        assert (report.added, report.updated, report.unchanged, report.deleted) == (1, 1, 1, 1)
+        assert report.indexed == 2
+
+    async def test_sync_scoped_to_entity_types(self):
+        """タイプを指定した同期は他のタイプを削除せず、full でタイプ単位に再埋め込み"""
+        theory = EntityDocument(id="t1", entity_type="Theory", text="theory", metadata={})
+        concept = EntityDocument(
+            id="c1", entity_type="Concept", text="concept", metadata={"entity_type": "Concept"}
+        )
+        vector_store = MagicMock()
+        vector_store.get_metadatas = AsyncMock(
+            return_value={
+                "t1": {**self.stored(theory), "entity_type": "Theory"},
+                "c1": self.stored(concept),
+            }
+        )
+        vector_store.upsert_documents = AsyncMock()
+        vector_store.delete_documents = AsyncMock()
+        vector_store.flush = AsyncMock()
+        vector_store.requires_rebuild = False
+        vector_store.reducer = VectorReducer()
+        embedding = MagicMock(max_batch_size=100, provider="openai", model="m1")
+        embedding.embed_texts = AsyncMock(side_effect=lambda texts: [[0.1] for _ in texts])
+
+        indexer = VectorIndexer(vector_store, embedding)
+        report = await indexer.sync([theory], full=True, entity_types=["Theory"])
+
+        embedding.embed_texts.assert_awaited_once_with(["theory"])
+        vector_store.delete_documents.assert_awaited_once_with([])
+        assert (report.updated, report.deleted) == (1, 0)
+
+    async def test_sync_rebuilds_when_store_requires(self):
+        """ベクトルストアが作り直しを要求する場合（L2 のコレクション）は空にして全件を埋め込む"""
+        (d0,) = create_documents(1)
+        vector_store = MagicMock()
+        vector_store.get_metadatas = AsyncMock(return_value={"d0": self.stored(d0)})
+        vector_store.upsert_documents = AsyncMock()
+        vector_store.delete_documents = AsyncMock()
+        vector_store.reset = AsyncMock()
+        vector_store.flush = AsyncMock()
+        vector_store.requires_rebuild = True
+        vector_store.reducer = VectorReducer()
+        embedding = MagicMock(max_batch_size=100, provider="openai", model="m1")
+        embedding.embed_texts = AsyncMock(side_effect=lambda texts: [[0.1] for _ in texts])
+
+        report = await VectorIndexer(vector_store, embedding).sync([d0])
+
+        vector_store.reset.assert_awaited_once()
+        assert report.rebuilt
+        assert report.indexed == 1
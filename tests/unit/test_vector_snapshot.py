@@ -0,0 +1,165 @@
+"""Unit Tests: vector_snapshot - ベクトルストアのスナップショットのユニットテスト"""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from tengin_mcp.infrastructure.adapters.chromadb_adapter import ChromaDBAdapter
+from tengin_mcp.infrastructure.adapters.local_vector_adapter import LocalVectorAdapter
+from tengin_mcp.infrastructure.vector_compression import VectorReducer
+from tengin_mcp.infrastructure.vector_snapshot import (
+    VectorSnapshot,
+    export_snapshot,
+    import_snapshot,
+)
+
+MODEL_ID = "openai/text-embedding-3-small"
+
+
+def create_mock_settings(path, **kwargs):
+    """テスト用のモックSettings作成（local・ChromaDB 共通）"""
+    settings = MagicMock()
+    settings.local_vector_path = str(path)
+    settings.local_vector_hnsw_threshold = 20000
+    settings.chromadb_path = str(path)
+    settings.chromadb_url = ""
+    settings.chromadb_max_workers = 2
+    settings.chromadb_collection = "education_theories"
+    settings.chromadb_collection_layout = kwargs.get("chromadb_collection_layout", "single")
+    settings.vector_reduction = kwargs.get("vector_reduction", "none")
+    settings.vector_dimensions = kwargs.get("vector_dimensions", 0)
+    settings.vector_quantization = "none"
+    settings.vector_rescore_factor = 4
+    settings.embedding_model = "text-embedding-3-small"
+    return settings
+
+
+async def create_store(path, **kwargs) -> LocalVectorAdapter:
+    """4件のドキュメントを持つローカルストア"""
+    store = LocalVectorAdapter(create_mock_settings(path, **kwargs))
+    await store.connect()
+    vectors = np.random.default_rng(0).normal(size=(4, 8)).tolist()
+    await store.upsert_documents(
+        [f"d{i}" for i in range(4)],
+        [f"本文 {i}" for i in range(4)],
+        vectors,
+        [
+            {"entity_type": "Concept", "content_hash": f"h{i}", "embedding_model": MODEL_ID}
+            for i in range(4)
+        ],
+    )
+    return store
+
+
+class TestVectorSnapshot:
+    """スナップショットのファイル形式のテスト"""
+
+    async def test_save_and_load_memory_mapped(self, tmp_path):
+        """ID・ベクトル・メタデータ・content_hash を保存し、ベクトルはメモリマップで読み込む"""
+        store = await create_store(tmp_path / "store")
+
+        exported = await export_snapshot(store, tmp_path / "index.npz")
+        loaded = VectorSnapshot.load(tmp_path / "index.npz")
+
+        assert loaded.ids == ["d0", "d1", "d2", "d3"]
+        assert loaded.model_id == MODEL_ID
+        assert loaded.content_hashes == ["h0", "h1", "h2", "h3"]
+        assert loaded.documents[1] == "本文 1"
+        assert loaded.metadatas[2]["entity_type"] == "Concept"
+        assert isinstance(loaded.vectors, np.memmap)
+        assert np.array_equal(loaded.vectors, exported.vectors)
+        with np.load(tmp_path / "index.npz") as archive:
+            assert archive["content_hashes"].tolist() == ["h0", "h1", "h2", "h3"]
+
+    async def test_export_requires_single_model(self, tmp_path):
+        """空のストア・複数モデルが混在するストアは書き出さない"""
+        store = await create_store(tmp_path / "store")
+        await store.upsert_documents(["x"], ["x"], [[1.0] * 8], [{"embedding_model": "a/b"}])
+        empty = LocalVectorAdapter(create_mock_settings(tmp_path / "empty"))
+        await empty.connect()
+
+        with pytest.raises(ValueError, match="mixed"):
+            await export_snapshot(store, tmp_path / "index.npz")
+        with pytest.raises(ValueError, match="empty"):
+            await export_snapshot(empty, tmp_path / "index.npz")
+
+
+class TestImportSnapshot:
+    """スナップショットの読み込みのテスト"""
+
+    async def test_local_round_trip_with_pca(self, tmp_path):
+        """PCA の成分ごと読み込み、再埋め込みせずに同じ検索結果を返す"""
+        source = LocalVectorAdapter(
+            create_mock_settings(tmp_path / "source", vector_reduction="pca", vector_dimensions=3)
+        )
+        await source.connect()
+        vectors = np.random.default_rng(0).normal(size=(6, 8))
+        await source.set_reducer(VectorReducer.fit_pca(vectors, 3))
+        await source.upsert_documents(
+            [f"d{i}" for i in range(6)],
+            [f"本文 {i}" for i in range(6)],
+            vectors.tolist(),
+            [{"embedding_model": MODEL_ID} for _ in range(6)],
+        )
+        await export_snapshot(source, tmp_path / "index.npz")
+
+        target = LocalVectorAdapter(
+            create_mock_settings(tmp_path / "target", vector_reduction="pca", vector_dimensions=3)
+        )
+        await target.connect()
+        await import_snapshot(target, tmp_path / "index.npz", MODEL_ID)
+
+        query = vectors[2].tolist()
+        assert target.reducer.fitted
+        assert await target.get_count() == 6
+        assert (await target.search(query, n_results=2))["ids"] == (
+            await source.search(query, n_results=2)
+        )["ids"]
+
+        reloaded = LocalVectorAdapter(
+            create_mock_settings(tmp_path / "target", vector_reduction="pca", vector_dimensions=3)
+        )
+        await reloaded.connect()
+        assert (await reloaded.search(query, n_results=1))["ids"] == [["d2"]]
+
+    async def test_validates_model_and_reduction(self, tmp_path):
+        """埋め込みモデル・次元削減が異なる場合、空でないストアへは replace なしでは読み込まない"""
+        await export_snapshot(await create_store(tmp_path / "source"), tmp_path / "index.npz")
+        target = await create_store(tmp_path / "target")
+        reduced = LocalVectorAdapter(
+            create_mock_settings(
+                tmp_path / "reduced", vector_reduction="matryoshka", vector_dimensions=4
+            )
+        )
+        await reduced.connect()
+
+        with pytest.raises(ValueError, match="embedding model"):
+            await import_snapshot(target, tmp_path / "index.npz", "ollama/nomic-embed-text")
+        with pytest.raises(ValueError, match="reduction"):
+            await import_snapshot(reduced, tmp_path / "index.npz", MODEL_ID)
+        with pytest.raises(ValueError, match="not empty"):
+            await import_snapshot(target, tmp_path / "index.npz", MODEL_ID)
+
+        await target.upsert_documents(["extra"], ["extra"], [[1.0] * 8])
+        await import_snapshot(target, tmp_path / "index.npz", MODEL_ID, replace=True)
+        assert await target.get_count() == 4
+
+    async def test_chromadb_round_trip(self, tmp_path):
+        """ChromaDB（エンティティタイプ別コレクション）へ読み込み、書き出し直しても同じ内容"""
+        await export_snapshot(await create_store(tmp_path / "source"), tmp_path / "index.npz")
+        chroma = ChromaDBAdapter(
+            create_mock_settings(tmp_path / "chroma", chromadb_collection_layout="entity_type")
+        )
+        await chroma.connect()
+        try:
+            await import_snapshot(chroma, tmp_path / "index.npz", MODEL_ID)
+            exported = await export_snapshot(chroma, tmp_path / "chroma.npz")
+        finally:
+            await chroma.close()
+
+        original = VectorSnapshot.load(tmp_path / "index.npz")
+        assert sorted(exported.ids) == original.ids
+        order = [exported.ids.index(doc_id) for doc_id in original.ids]
+        assert np.allclose(exported.vectors[order], original.vectors, atol=1e-6)
+        assert exported.content_hashes[order[0]] == "h0"